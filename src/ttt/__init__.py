@@ -2,46 +2,92 @@
 The Unified AI Library
 
 A single, elegant interface for local and cloud AI models.
+
+Public names are imported on first access (PEP 562), so ``import ttt`` stays
+cheap and the CLI only pays for the backends, tools and plugins it uses.
 """
 
-# ruff: noqa: I001 (import order critical for avoiding circular imports)
-from .core.api import ChatSession, achat, ask, ask_async, chat, stream, stream_async
-from .backends import CloudBackend, LocalBackend
-from .config import configure
-from .core.exceptions import (
-    AIError,
-    APIKeyError,
-    BackendConnectionError,
-    BackendError,
-    BackendNotAvailableError,
-    BackendTimeoutError,
-    ConfigFileError,
-    ConfigurationError,
-    EmptyResponseError,
-    FeatureNotAvailableError,
-    InvalidParameterError,
-    InvalidPromptError,
-    ModelError,
-    ModelNotFoundError,
-    ModelNotSupportedError,
-    MultiModalError,
-    PluginError,
-    PluginLoadError,
-    PluginValidationError,
-    QuotaExceededError,
-    RateLimitError,
-    ResponseError,
-    ResponseParsingError,
-    SessionError,
-    SessionLoadError,
-    SessionNotFoundError,
-    SessionSaveError,
-    ValidationError,
+import importlib
+from typing import Any, Dict, List
+
+# Public name -> module (relative to this package) that defines it
+_LAZY_IMPORTS: Dict[str, str] = {
+    # API
+    "ask": ".core.api",
+    "stream": ".core.api",
+    "chat": ".core.api",
+    "ask_async": ".core.api",
+    "stream_async": ".core.api",
+    "stream_events": ".core.api",
+    "stream_events_async": ".core.api",
+    "achat": ".core.api",
+    "ask_many": ".core.api",
+    "ask_many_async": ".core.api",
+    "ChatSession": ".core.api",
+    # Data models
+    "AIResponse": ".core.models",
+    "BatchResult": ".core.models",
+    "ImageInput": ".core.models",
+    "ConfigModel": ".core.models",
+    "ModelInfo": ".core.models",
+    "StreamEvent": ".core.models",
+    "PersistentChatSession": ".session.chat",
+    "TokenCounter": ".core.tokens",
+    "count_tokens": ".core.tokens",
+    "configure": ".config",
+    # Backends and plugins
+    "LocalBackend": ".backends",
+    "CloudBackend": ".backends",
+    "register_backend": ".plugins",
+    "discover_plugins": ".plugins",
+    "load_plugin": ".plugins",
+}
+_LAZY_IMPORTS.update(
+    (name, ".core.exceptions")
+    for name in (
+        "AIError",
+        "APIKeyError",
+        "BackendConnectionError",
+        "BackendError",
+        "BackendNotAvailableError",
+        "BackendTimeoutError",
+        "ConfigFileError",
+        "ConfigurationError",
+        "EmptyResponseError",
+        "FeatureNotAvailableError",
+        "InvalidParameterError",
+        "InvalidPromptError",
+        "ModelError",
+        "ModelNotFoundError",
+        "ModelNotSupportedError",
+        "MultiModalError",
+        "PluginError",
+        "PluginLoadError",
+        "PluginValidationError",
+        "QuotaExceededError",
+        "RateLimitError",
+        "ResponseError",
+        "ResponseParsingError",
+        "SessionError",
+        "SessionLoadError",
+        "SessionNotFoundError",
+        "SessionSaveError",
+        "ValidationError",
+    )
 )
-from .core.models import AIResponse, ConfigModel, ImageInput, ModelInfo
-from .plugins import discover_plugins, load_plugin, register_backend
-from .session.chat import PersistentChatSession
-from .tools.builtins import load_builtin_tools
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 
 # Import model_registry lazily to avoid import-time initialization
@@ -59,8 +105,6 @@ class _ModelRegistryProxy:
 
 model_registry = _ModelRegistryProxy()
 
-load_builtin_tools()
-
 __version__ = "1.0.3"
 __all__ = [
     "ask",
@@ -68,13 +112,21 @@ __all__ = [
     "chat",
     "ask_async",
     "stream_async",
+    "stream_events",
+    "stream_events_async",
     "achat",
+    "ask_many",
+    "ask_many_async",
     "ChatSession",
     "AIResponse",
+    "BatchResult",
     "ImageInput",
     "ConfigModel",
     "ModelInfo",
+    "StreamEvent",
     "PersistentChatSession",
+    "TokenCounter",
+    "count_tokens",
     "configure",
     "LocalBackend",
     "CloudBackend",
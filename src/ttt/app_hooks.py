@@ -5,21 +5,62 @@ import json as json_module
 import os
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, TextIO, Tuple, Union
 
 import rich_click as click
 from rich.console import Console
 
 import ttt
 from ttt.config.manager import ConfigManager
-from ttt.core.api import ask as ttt_ask
-from ttt.core.api import stream as ttt_stream
 from ttt.session.manager import ChatSessionManager
 
+if TYPE_CHECKING:
+    from ttt.server.client import DaemonClient
+
 # Initialize console
 console = Console()
 
 
+# The API pulls in the backends, so it is imported when a command first needs it.
+# Requests are forwarded to a running `ttt serve` daemon instead when one is listening.
+
+
+def _daemon_for(prompt: Any, kwargs: Dict[str, Any]) -> Optional["DaemonClient"]:
+    """Get a client for a running daemon that can serve this request, if any."""
+    from ttt.server.client import can_forward, find_daemon
+
+    return find_daemon() if can_forward(prompt, kwargs) else None
+
+
+def ttt_ask(prompt: Any, **kwargs: Any) -> Any:
+    """Call ttt.ask() in the daemon if one is running, otherwise in-process."""
+    daemon = _daemon_for(prompt, kwargs)
+    if daemon is not None:
+        return daemon.ask(prompt, **kwargs)
+
+    from ttt.core.api import ask
+
+    return ask(prompt, **kwargs)
+
+
+def ttt_stream(prompt: Any, **kwargs: Any) -> Iterator[str]:
+    """Call ttt.stream() in the daemon if one is running, otherwise in-process."""
+    daemon = _daemon_for(prompt, kwargs)
+    if daemon is not None:
+        return daemon.stream(prompt, **kwargs)
+
+    from ttt.core.api import stream
+
+    return stream(prompt, **kwargs)
+
+
+def cache_enabled(override: Optional[bool] = None) -> bool:
+    """Check whether the response cache is enabled, importing it on first use."""
+    from ttt.core.cache import cache_enabled as _cache_enabled
+
+    return _cache_enabled(override)
+
+
 # Import helper functions we'll need
 
 
@@ -319,6 +360,49 @@ def apply_coding_optimization(kwargs: Dict[str, Any]) -> None:
 # Main hook functions
 
 
+def stream_to_stdout(chunks: Iterator[str]) -> Dict[str, Any]:
+    """Write streamed chunks to stdout as they arrive.
+
+    Each chunk is flushed immediately so piped consumers see output without
+    waiting for the whole generation. Trailing newlines are held back until
+    more text arrives, so the output always ends with exactly one newline.
+
+    Args:
+        chunks: Iterator yielding text chunks
+
+    Returns:
+        Dictionary with time_to_first_token, total_time and chunks count
+    """
+    import time
+
+    start_time = time.perf_counter()
+    first_token_time: Optional[float] = None
+    pending_newlines = ""
+    count = 0
+
+    for chunk in chunks:
+        if not chunk:
+            continue
+        count += 1
+        if first_token_time is None:
+            first_token_time = time.perf_counter() - start_time
+
+        text = pending_newlines + chunk
+        body = text.rstrip("\n")
+        pending_newlines = text[len(body) :]
+        if body:
+            click.echo(body, nl=False)
+            sys.stdout.flush()
+
+    click.echo()  # Always add exactly one newline at the end
+
+    return {
+        "time_to_first_token": first_token_time,
+        "total_time": time.perf_counter() - start_time,
+        "chunks": count,
+    }
+
+
 def on_ask(
     command_name: str,
     prompt: Tuple[str, ...],
@@ -330,6 +414,7 @@ def on_ask(
     system: Optional[str],
     stream: bool,
     json: bool,
+    cache: Optional[bool] = None,
     **kwargs,
 ) -> None:
     """Hook for 'ask' command.
@@ -348,6 +433,7 @@ def on_ask(
         system: System prompt to set context
         stream: Whether to stream response in real-time
         json: Whether to output response in JSON format
+        cache: Use (True) or bypass (False) the response cache, None for config default
 
     Note:
         Handles stdin input, model alias resolution, and various error conditions.
@@ -425,6 +511,7 @@ def on_ask(
     # Get configured default model if not specified via CLI
     if not model:
         from ttt.config.schema import get_config
+
         config = get_config()
         if config.model:
             model = config.model
@@ -447,6 +534,8 @@ def on_ask(
         api_params["session_id"] = session
     if system:
         api_params["system"] = system
+    if cache is not None:
+        api_params["cache"] = cache
 
     try:
         if json:
@@ -462,14 +551,17 @@ def on_ask(
                 "system": api_params.get("system"),
             }
             click.echo(json_module.dumps(output, indent=2))
-        elif stream:
-            chunks = list(ttt_stream(prompt_text, **api_params))
-            for i, chunk in enumerate(chunks):
-                if i == len(chunks) - 1:  # Last chunk
-                    click.echo(chunk.rstrip("\n"), nl=False)
-                else:
-                    click.echo(chunk, nl=False)
-            click.echo()  # Always add exactly one newline at the end
+        elif stream and not cache_enabled(cache):
+            # Cached requests go through ask() below, streams are never cached
+            stats = stream_to_stdout(ttt_stream(prompt_text, **api_params))
+            if kwargs.get("debug", False) or is_verbose_mode():
+                ttft = stats["time_to_first_token"]
+                ttft_text = f"{ttft:.3f}s" if ttft is not None else "n/a"
+                click.echo(
+                    f"⏱  Time to first token: {ttft_text} | total: {stats['total_time']:.3f}s "
+                    f"| chunks: {stats['chunks']}",
+                    err=True,
+                )
         else:
             response = ttt_ask(prompt_text, **api_params)
             click.echo(str(response).strip())
@@ -612,6 +704,119 @@ def on_ask(
         sys.exit(1)
 
 
+def read_batch_requests(lines: Iterator[str]) -> Iterator[Union[str, Dict[str, Any]]]:
+    """Parse JSONL batch input lazily.
+
+    Each non-empty line is either a JSON object with a "prompt" key and
+    optional ask() parameters, a JSON string, or plain prompt text.
+
+    Args:
+        lines: Iterator of raw input lines
+
+    Yields:
+        Prompt strings or request dictionaries
+    """
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            item = json_module.loads(line)
+        except json_module.JSONDecodeError:
+            yield line
+            continue
+
+        if isinstance(item, dict):
+            if isinstance(item.get("model"), str):
+                item["model"] = resolve_model_alias(item["model"])
+            yield item
+        elif isinstance(item, str):
+            yield item
+        else:
+            yield line
+
+
+def on_batch(
+    command_name: str,
+    input: Optional[str] = None,
+    model: Optional[str] = None,
+    system: Optional[str] = None,
+    concurrency: Optional[int] = None,
+    ordered: bool = False,
+    output: Optional[str] = None,
+    cache: Optional[bool] = None,
+    **kwargs,
+) -> None:
+    """Hook for 'batch' command.
+
+    Reads one request per line from a JSONL file or stdin, runs them
+    concurrently and writes one JSON result per line as each request
+    finishes. Failed requests produce an error line instead of stopping
+    the batch.
+
+    Args:
+        input: Path to a JSONL file, or None/'-' to read from stdin
+        model: Default model for requests that do not set one
+        system: Default system prompt for requests that do not set one
+        concurrency: Maximum number of requests in flight
+        ordered: Write results in input order instead of completion order
+        output: Output file path, or None to write to stdout
+        cache: Use (True) or bypass (False) the response cache, None for config default
+    """
+    from ttt.core.api import ask_many
+
+    setup_logging_level(json_output=True)
+
+    defaults: Dict[str, Any] = {}
+    if model:
+        defaults["model"] = resolve_model_alias(model)
+    if system:
+        defaults["system"] = system
+    if cache is not None:
+        defaults["cache"] = cache
+
+    input_stream: TextIO
+    if input and input != "-":
+        input_path = Path(input).expanduser()
+        if not input_path.exists():
+            click.echo(f"Error: Input file '{input}' not found", err=True)
+            sys.exit(1)
+        input_stream = input_path.open(encoding="utf-8")
+    elif sys.stdin.isatty():
+        click.echo("Error: No input provided. Pass a JSONL file or pipe requests on stdin", err=True)
+        sys.exit(1)
+    else:
+        input_stream = sys.stdin
+
+    output_stream = Path(output).expanduser().open("w", encoding="utf-8") if output else None
+    succeeded = failed = 0
+
+    try:
+        for result in ask_many(
+            read_batch_requests(iter(input_stream)), concurrency=concurrency, ordered=ordered, **defaults
+        ):
+            line = json_module.dumps(result.to_dict(), ensure_ascii=False)
+            if output_stream:
+                output_stream.write(line + "\n")
+                output_stream.flush()
+            else:
+                click.echo(line)
+                sys.stdout.flush()
+
+            if result.ok:
+                succeeded += 1
+            else:
+                failed += 1
+    finally:
+        if input_stream is not sys.stdin:
+            input_stream.close()
+        if output_stream:
+            output_stream.close()
+
+    if kwargs.get("debug", False) or is_verbose_mode() or output:
+        click.echo(f"Batch complete: {succeeded} succeeded, {failed} failed", err=True)
+
+
 def on_chat(
     command_name: str, model: Optional[str], session: Optional[str], tools: bool, markdown: bool, **kwargs
 ) -> None:
@@ -857,8 +1062,8 @@ def on_list(
                     "available": list(model_registry.models.keys())[:5],  # First 5 models
                 },
                 "sessions": {
-                    "count": len(session_manager.list_sessions()),
-                    "recent": session_manager.list_sessions()[:3],  # 3 most recent
+                    "count": session_manager.count_sessions(),
+                    "recent": session_manager.list_sessions(limit=3),  # 3 most recent
                 },
                 "tools": {"count": len(tools), "available": [t.name for t in tools[:5]]},  # First 5 tools
             }
@@ -875,8 +1080,7 @@ def on_list(
 
             # Sessions count
             session_manager = ChatSessionManager()
-            sessions = session_manager.list_sessions()
-            console.print(f"[cyan]Sessions:[/cyan] {len(sessions)} saved")
+            console.print(f"[cyan]Sessions:[/cyan] {session_manager.count_sessions()} saved")
             console.print("  Run [green]ttt list sessions[/green] to see all sessions\n")
 
             # Tools count
@@ -1052,6 +1256,152 @@ def on_export(
         click.echo(output_text)
 
 
+def on_cache_stats(command_name: str, json: bool = False, **kwargs) -> None:
+    """Hook for 'cache stats' command.
+
+    Shows entry counts, disk usage and cumulative hit/miss counters for the
+    response cache.
+
+    Args:
+        json: Whether to output statistics in JSON format
+    """
+    from ttt.core.cache import get_response_cache
+
+    stats = get_response_cache().stats()
+    stats["enabled"] = cache_enabled()
+
+    if json:
+        click.echo(json_module.dumps(stats, indent=2))
+        return
+
+    console.print("[bold]Response cache[/bold]")
+    console.print(f"  Enabled by default: {'yes' if stats['enabled'] else 'no (use --cache)'}")
+    console.print(f"  Directory: {stats['directory']}")
+    console.print(f"  Disk entries: {stats['disk_entries']} ({stats['disk_bytes'] / 1024:.1f} KB)")
+    console.print(f"  Hits: {stats['hits']}  Misses: {stats['misses']}  Hit rate: {stats['hit_rate']:.1%}")
+    console.print(f"  Evictions: {stats['evictions']}")
+
+
+def on_cache_clear(command_name: str, **kwargs) -> None:
+    """Hook for 'cache clear' command.
+
+    Removes all cached responses from memory and disk.
+    """
+    from ttt.core.cache import get_response_cache
+
+    removed = get_response_cache().clear()
+    console.print(f"[green]Cleared {removed} cached response(s)[/green]")
+
+
+def on_profile_startup(limit: int = 25) -> None:
+    """Hook for the '--profile-startup' option.
+
+    Imports the CLI in a fresh interpreter and reports the modules that
+    contribute most to cold-start time.
+
+    Args:
+        limit: Number of modules to list
+    """
+    from rich.table import Table
+
+    from ttt.utils.startup import profile_imports
+
+    timings = profile_imports("ttt.cli")
+    total = next((t for t in reversed(timings) if t.module == "ttt.cli"), None)
+
+    table = Table(title="Import time by module (fresh interpreter)")
+    table.add_column("Module")
+    table.add_column("Self (ms)", justify="right")
+    table.add_column("Cumulative (ms)", justify="right")
+    for timing in sorted(timings, key=lambda t: t.self_us, reverse=True)[:limit]:
+        style = "cyan" if timing.module.startswith("ttt") else None
+        table.add_row(timing.module, f"{timing.self_ms:.1f}", f"{timing.cumulative_ms:.1f}", style=style)
+    console.print(table)
+
+    console.print(f"Modules imported: {len(timings)}")
+    if total:
+        console.print(f"Total CLI import time: [bold]{total.cumulative_ms:.0f} ms[/bold]")
+
+
+def on_serve(
+    command_name: str, socket: Optional[str] = None, stop: bool = False, status: bool = False, **kwargs
+) -> None:
+    """Hook for 'serve' command.
+
+    Runs the daemon in the foreground until interrupted. While it is running,
+    `ttt ask` invocations on this machine are forwarded to it.
+
+    Args:
+        socket: Unix socket path (default from TTT_SOCKET or server.socket_path)
+        stop: Stop the running daemon instead of starting one
+        status: Report whether a daemon is running
+    """
+    from ttt.server.client import DaemonClient
+    from ttt.server.protocol import socket_in_use, socket_path
+
+    path = socket_path(socket)
+
+    if stop or status:
+        if not socket_in_use(path):
+            console.print(f"[yellow]No ttt daemon is running on {path}[/yellow]")
+            if stop:
+                sys.exit(1)
+            return
+        client = DaemonClient(str(path))
+        if stop:
+            client.shutdown()
+            console.print("[green]ttt daemon stopped[/green]")
+        else:
+            info = client.ping()
+            console.print(f"[green]ttt daemon running[/green] (pid {info['pid']}) on {info['socket']}")
+            console.print(
+                f"  Uptime: {info['uptime']:.0f}s  Requests: {info['requests']}  "
+                f"Active: {info['active']}  Errors: {info['errors']}"
+            )
+            if info.get("context"):
+                console.print(f"  Directory: {info['context']['cwd']}")
+        return
+
+    from ttt.server.daemon import run_daemon
+
+    setup_logging_level(debug=kwargs.get("debug", False))
+
+    def ready(server: Any) -> None:
+        console.print(f"[green]ttt daemon listening on {server.socket_path}[/green] (Ctrl+C to stop)")
+
+    try:
+        run_daemon(str(path), on_ready=ready)
+    except RuntimeError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
+    console.print("ttt daemon stopped")
+
+
+def on_gateway(command_name: str, host: Optional[str] = None, port: Optional[int] = None, **kwargs) -> None:
+    """Hook for 'gateway' command.
+
+    Serves /v1/chat/completions and /v1/models in the foreground until
+    interrupted, so OpenAI-compatible clients can share one warm process.
+
+    Args:
+        host: Interface to bind (default from server.gateway.host)
+        port: Port to bind (default from server.gateway.port)
+    """
+    from ttt.server.gateway import run_gateway
+
+    setup_logging_level(debug=kwargs.get("debug", False))
+
+    def ready(server: Any) -> None:
+        console.print(f"[green]ttt gateway listening on {server.url}/v1[/green] (Ctrl+C to stop)")
+
+    try:
+        run_gateway(host, port, on_ready=ready)
+    except OSError as e:
+        console.print(f"[red]Error: could not start the gateway: {e}[/red]")
+        sys.exit(1)
+    console.print("ttt gateway stopped")
+
+
 def on_tools_enable(command_name: str, tool_name: str, **kwargs) -> None:
     """Hook for 'tools enable' subcommand.
 
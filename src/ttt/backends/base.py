@@ -3,7 +3,7 @@
 from abc import ABC, abstractmethod
 from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
-from ..core.models import AIResponse, ImageInput
+from ..core.models import AIResponse, ImageInput, StreamEvent
 
 
 class BaseBackend(ABC):
@@ -67,7 +67,7 @@ class BaseBackend(ABC):
         pass
 
     @abstractmethod
-    async def astream(
+    def astream(
         self,
         prompt: Union[str, List[Union[str, ImageInput]]],
         *,
@@ -93,7 +93,49 @@ class BaseBackend(ABC):
         Yields:
             Response chunks as they arrive
         """
-        pass
+        # Declared without async so callers can iterate it directly; implementations are async generators
+        raise NotImplementedError
+
+    async def astream_events(
+        self,
+        prompt: Union[str, List[Union[str, ImageInput]]],
+        *,
+        model: Optional[str] = None,
+        system: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        tools: Optional[List[Any]] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[StreamEvent]:
+        """
+        Stream a response as typed events.
+
+        The default implementation wraps ``astream`` and yields only ``text``
+        events; backends that know token usage override it.
+
+        Args:
+            prompt: The user prompt - can be a string or list of content (text/images)
+            model: Specific model to use (optional)
+            system: System prompt (optional)
+            temperature: Sampling temperature (optional)
+            max_tokens: Maximum tokens to generate (optional)
+            tools: List of functions/tools the AI can call (optional)
+            **kwargs: Additional backend-specific parameters
+
+        Yields:
+            StreamEvent objects
+        """
+        async for chunk in self.astream(
+            prompt,
+            model=model,
+            system=system,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            tools=tools,
+            **kwargs,
+        ):
+            if chunk:
+                yield StreamEvent("text", text=chunk)
 
     @abstractmethod
     async def models(self) -> List[str]:
@@ -1,9 +1,15 @@
 """Cloud backend implementation using LiteLLM for multiple providers."""
 
+import asyncio
+import importlib
+import importlib.util
+import inspect
 import json
+import math
 import os
+import sys
 import time
-from typing import Any, AsyncIterator, Dict, List, NoReturn, Optional, Union, cast
+from typing import Any, AsyncIterator, Callable, Dict, List, NoReturn, Optional, Tuple, Union, cast
 
 # Import model_registry lazily to avoid import-time config loading
 from ..core.exceptions import (
@@ -16,13 +22,200 @@ from ..core.exceptions import (
     QuotaExceededError,
     RateLimitError,
 )
-from ..core.models import AIResponse, ImageInput
+from ..core.models import AIResponse, ImageInput, StreamEvent
 from ..utils import get_logger
 from .base import BaseBackend
 
 logger = get_logger(__name__)
 
 
+def _litellm_installed() -> bool:
+    """Check whether LiteLLM can be imported without importing it."""
+    if "litellm" in sys.modules:
+        return sys.modules["litellm"] is not None
+    return importlib.util.find_spec("litellm") is not None
+
+
+def _tool_message_content(call: Any) -> str:
+    """Render a tool call's outcome as the content of a ``tool`` message."""
+    if not call.succeeded:
+        return f"Error: {call.error}"
+    if isinstance(call.result, str):
+        return call.result
+    try:
+        return json.dumps(call.result, default=str)
+    except (TypeError, ValueError):
+        return str(call.result)
+
+
+def _chunk_usage(chunk: Any) -> Optional[Dict[str, int]]:
+    """Get token usage from a streamed chunk, if the provider reported it."""
+    usage = getattr(chunk, "usage", None)
+    prompt_tokens = getattr(usage, "prompt_tokens", None)
+    completion_tokens = getattr(usage, "completion_tokens", None)
+    if not isinstance(prompt_tokens, int) or not isinstance(completion_tokens, int):
+        return None
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+    }
+
+
+class _StreamedToolCalls:
+    """
+    Assemble tool calls from streamed deltas and run each as soon as its arguments are complete.
+
+    Arguments are complete once they parse as a JSON object, or when the model
+    starts the next call or the stream ends.
+    """
+
+    def __init__(self) -> None:
+        self.calls: List[Dict[str, Any]] = []
+        self._by_index: Dict[int, Dict[str, Any]] = {}
+        self._tasks: Dict["asyncio.Task[Any]", Dict[str, Any]] = {}
+        self._results: Dict[str, Any] = {}
+
+    def add(self, deltas: List[Any]) -> List[Any]:
+        """Add tool-call deltas and return the calls dispatched as a result."""
+        started: List[Any] = []
+        for delta in deltas:
+            index = getattr(delta, "index", None)
+            if not isinstance(index, int):
+                # Providers without indices send an id only on the first delta of each call
+                delta_id = getattr(delta, "id", None)
+                known = [c["index"] for c in self.calls if delta_id and c["id"] == delta_id]
+                if known:
+                    index = known[0]
+                else:
+                    index = len(self.calls) if delta_id or not self.calls else self.calls[-1]["index"]
+            call = self._by_index.get(index)
+            if call is None:
+                # A new call means the earlier ones have all their arguments
+                started.extend(self._dispatch(c) for c in self.calls if c["index"] < index and not c["started"])
+                call = {"index": index, "id": None, "name": "", "arguments": "", "started": False}
+                self._by_index[index] = call
+                self.calls.append(call)
+
+            if getattr(delta, "id", None):
+                call["id"] = delta.id
+            function = getattr(delta, "function", None)
+            if function is not None:
+                if getattr(function, "name", None):
+                    call["name"] = function.name
+                fragment = getattr(function, "arguments", None)
+                if fragment and not call["started"]:
+                    call["arguments"] += fragment
+                    if call["name"] and fragment.rstrip().endswith("}") and _parse_arguments(call["arguments"]):
+                        started.append(self._dispatch(call))
+        return started
+
+    def flush(self) -> List[Any]:
+        """Dispatch every call that has not started yet (the stream has ended)."""
+        return [self._dispatch(call) for call in self.calls if not call["started"]]
+
+    def finished(self) -> List[Any]:
+        """Return results of calls that completed since the last check, without waiting."""
+        done = [task for task in self._tasks if task.done()]
+        return [self._collect(task) for task in done]
+
+    async def remaining(self) -> AsyncIterator[Any]:
+        """Yield the results of the calls still running as they complete."""
+        while self._tasks:
+            done, _ = await asyncio.wait(list(self._tasks), return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield self._collect(task)
+
+    def cancel(self) -> None:
+        """Cancel the calls that are still running."""
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
+
+    def messages(self, content: str) -> List[Dict[str, Any]]:
+        """Build the assistant and ``tool`` messages that report this round to the model."""
+        result: List[Dict[str, Any]] = [
+            {
+                "role": "assistant",
+                "content": content or None,
+                "tool_calls": [
+                    {
+                        "id": call["id"],
+                        "type": "function",
+                        "function": {"name": call["name"], "arguments": call["arguments"] or "{}"},
+                    }
+                    for call in self.calls
+                ],
+            }
+        ]
+        for call in self.calls:
+            tool_call = self._results[call["id"]]
+            result.append(
+                {
+                    "role": "tool",
+                    "tool_call_id": call["id"],
+                    "name": tool_call.name,
+                    "content": _tool_message_content(tool_call),
+                }
+            )
+        return result
+
+    def _dispatch(self, call: Dict[str, Any]) -> Any:
+        from ..tools import ToolCall, execute_tool
+
+        call["started"] = True
+        if not call["id"]:
+            call["id"] = f"call_{call['index']}"
+        arguments = _parse_arguments(call["arguments"]) or {}
+        task = asyncio.ensure_future(execute_tool(call["name"], arguments))
+        self._tasks[task] = call
+        return ToolCall(id=call["id"], name=call["name"], arguments=arguments)
+
+    def _collect(self, task: "asyncio.Task[Any]") -> Any:
+        from ..tools import ToolCall
+
+        call = self._tasks.pop(task)
+        try:
+            result = task.result()
+        except Exception as e:
+            result = ToolCall(id=call["id"], name=call["name"], arguments={}, error=f"Tool execution error: {e}")
+        # Keep the model's call id so the tool message matches its call
+        result.id = call["id"]
+        self._results[call["id"]] = result
+        return result
+
+
+def _parse_arguments(arguments: str) -> Optional[Dict[str, Any]]:
+    """Parse streamed tool arguments, or return None while they are incomplete."""
+    try:
+        parsed = json.loads(arguments or "{}")
+    except json.JSONDecodeError:
+        return None
+    return parsed if isinstance(parsed, dict) else None
+
+
+def _is_rate_limit_error(e: Exception) -> bool:
+    """Check if a provider error is a 429 rate limit."""
+    return type(e).__name__ == "RateLimitError" or "rate limit" in str(e).lower()
+
+
+def _retry_after_of(e: Exception) -> Optional[float]:
+    """Get the seconds a rate-limited provider asked to wait, if it said."""
+    from ..core.ratelimit import parse_retry_after
+
+    headers = getattr(getattr(e, "response", None), "headers", None)
+    if headers is None or not hasattr(headers, "get"):
+        return None
+    return parse_retry_after(headers.get("retry-after"))
+
+
+def _response_headers(response: Any) -> Optional[Dict[str, Any]]:
+    """Get the provider response headers LiteLLM attached to a response."""
+    hidden = getattr(response, "_hidden_params", None)
+    headers = hidden.get("additional_headers") if isinstance(hidden, dict) else None
+    return headers if isinstance(headers, dict) else None
+
+
 class CloudBackend(BaseBackend):
     """
     Cloud backend that uses LiteLLM to access multiple AI providers.
@@ -40,16 +233,13 @@ class CloudBackend(BaseBackend):
         """
         super().__init__(config)
 
-        # Import LiteLLM here to avoid import errors if not installed
-        try:
-            import litellm
-
-            self.litellm = litellm
-        except ImportError as e:
+        # LiteLLM takes a long time to import, so only check it is installed here;
+        # the module is imported on the first request (see __getattr__)
+        if not _litellm_installed():
             raise BackendNotAvailableError(
                 "cloud",
                 "LiteLLM is required for cloud backend. Install with: pip install litellm",
-            ) from e
+            )
 
         # Get cloud-specific config
         cloud_config = self.backend_config.get("cloud", {})
@@ -80,6 +270,20 @@ class CloudBackend(BaseBackend):
         # Configure API keys from environment
         self._configure_api_keys()
 
+    def __getattr__(self, name: str) -> Any:
+        # Only called for missing attributes: import LiteLLM on first use
+        if name != "litellm":
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        try:
+            litellm = importlib.import_module("litellm")
+        except ImportError as e:
+            raise BackendNotAvailableError(
+                "cloud",
+                "LiteLLM is required for cloud backend. Install with: pip install litellm",
+            ) from e
+        self.litellm = litellm
+        return litellm
+
     def _build_messages(
         self,
         prompt: Union[str, List[Union[str, ImageInput]]],
@@ -178,16 +382,8 @@ class CloudBackend(BaseBackend):
             raise APIKeyError(provider, env_vars.get(provider)) from e
         elif "rate limit" in error_msg.lower():
             provider = self._get_provider_from_model(used_model)
-            # Extract retry_after if available
-            retry_after = None
-            if hasattr(e, "response") and hasattr(e.response, "headers"):
-                retry_after = e.response.headers.get("retry-after")
-                if retry_after:
-                    try:
-                        retry_after = int(retry_after)
-                    except (ValueError, TypeError):
-                        retry_after = None
-            raise RateLimitError(provider, retry_after) from e
+            retry_after = _retry_after_of(e)
+            raise RateLimitError(provider, math.ceil(retry_after) if retry_after is not None else None) from e
         elif "quota" in error_msg.lower():
             provider = self._get_provider_from_model(used_model)
             quota_type = "requests"
@@ -267,17 +463,32 @@ class CloudBackend(BaseBackend):
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
         tools: Optional[List[Any]] = None,
+        max_tool_steps: Optional[int] = None,
+        tool_token_budget: Optional[int] = None,
+        on_tool_step: Optional[Callable[[Any], Any]] = None,
+        priority: int = 0,
         **kwargs: Any,
     ) -> AIResponse:
         """
         Send a single prompt to a cloud provider and get a complete response.
 
+        When the model calls tools, the results are sent back as ``tool``
+        messages and the model is asked again, until it answers without
+        calling tools or the step or token budget runs out.
+
         Args:
             prompt: The user prompt - can be a string or list of content (text/images)
             model: Specific model to use (optional)
             system: System prompt (optional)
             temperature: Sampling temperature (optional)
             max_tokens: Maximum tokens to generate (optional)
+            tools: List of functions/tools the AI can call (optional)
+            max_tool_steps: Tool-calling rounds before a final answer is forced
+                (default from ``tools.loop.max_steps``)
+            tool_token_budget: Total tokens across rounds before a final answer is
+                forced; 0 means unlimited (default from ``tools.loop.token_budget``)
+            on_tool_step: Called with each ToolStep as it completes (may be async)
+            priority: Higher priorities leave the provider's rate limit queue first
             **kwargs: Additional parameters
 
         Returns:
@@ -333,7 +544,7 @@ class CloudBackend(BaseBackend):
             if used_model.startswith("openrouter/") and os.getenv("OPENROUTER_API_KEY"):
                 params["api_key"] = os.getenv("OPENROUTER_API_KEY")
 
-            response = await self.litellm.acompletion(**params)
+            response = await self._acompletion(params, priority)
 
             # Handle streaming response if stream=True
             if kwargs.get("stream", False):
@@ -363,66 +574,37 @@ class CloudBackend(BaseBackend):
 
             response_content = response.choices[0].message.content or ""
 
-            # Handle tool calls if present
-            message = response.choices[0].message
-            if hasattr(message, "tool_calls") and message.tool_calls:
-                # Import tool execution here to avoid circular imports
-                from ..tools import execute_tools
-
-                # Build tool calls data
-                tool_calls_data = []
-
-                for tool_call in message.tool_calls:
-                    if tool_call.type == "function":
-                        func_call = tool_call.function
-                        try:
-                            arguments = json.loads(func_call.arguments) if func_call.arguments else {}
-                        except json.JSONDecodeError:
-                            arguments = {}
-
-                        tool_calls_data.append(
-                            {
-                                "id": tool_call.id,
-                                "name": func_call.name,
-                                "arguments": arguments,
-                            }
-                        )
-
-                # Execute tool calls
-                if tool_calls_data and tools:
-                    # The new executor doesn't need tool definitions map
-                    tool_result = await execute_tools(tool_calls_data, parallel=True)
-
-                    # Update content with tool results if content is empty
-                    if not response_content:
-                        # Generate a response based on tool results
-                        results_summary = []
-                        for call in tool_result.calls:
-                            if call.succeeded:
-                                results_summary.append(f"{call.name}: {call.result}")
-                            else:
-                                results_summary.append(f"{call.name}: Error - {call.error}")
-                        response_content = "Tool execution completed:\n" + "\n".join(results_summary)
+            # Run the tool-calling loop if the model asked for tools
+            tokens_in, tokens_out, cost = self._usage_of(response)
+            loop_metadata: Dict[str, Any] = {}
+            if tool_definitions and self._parse_tool_calls(response.choices[0].message):
+                response, tool_result, (tokens_in, tokens_out, cost), loop_metadata = await self._run_tool_loop(
+                    params, response, max_tool_steps, tool_token_budget, on_tool_step, priority
+                )
+                if not response.choices:
+                    raise EmptyResponseError(used_model, self.name)
+                response_content = response.choices[0].message.content or ""
+
+                if not response_content and tool_result.calls:
+                    # Fall back to the raw results if the model gave no final answer
+                    results_summary = []
+                    for call in tool_result.calls:
+                        if call.succeeded:
+                            results_summary.append(f"{call.name}: {call.result}")
+                        else:
+                            results_summary.append(f"{call.name}: Error - {call.error}")
+                    response_content = "Tool execution completed:\n" + "\n".join(results_summary)
 
             if not response_content:
                 raise EmptyResponseError(used_model, self.name)
 
             time_taken = time.time() - start_time
 
-            # Extract usage information
-            usage = response.usage
-            tokens_in = usage.prompt_tokens if usage else None
-            tokens_out = usage.completion_tokens if usage else None
-
-            # Calculate cost if available
-            cost = None
-            if hasattr(response, "_hidden_params"):
-                try:
-                    if isinstance(response._hidden_params, dict) and "response_cost" in response._hidden_params:
-                        cost = response._hidden_params["response_cost"]
-                except (TypeError, AttributeError):
-                    # Handle mocks or other non-dict types
-                    pass
+            metadata: Dict[str, Any] = {
+                "provider": self._get_provider_from_model(used_model),
+                "finish_reason": response.choices[0].finish_reason,
+                **loop_metadata,
+            }
 
             return AIResponse(
                 response_content,
@@ -433,10 +615,7 @@ class CloudBackend(BaseBackend):
                 time_taken=time_taken,
                 tool_result=tool_result,
                 cost=cost,
-                metadata={
-                    "provider": self._get_provider_from_model(used_model),
-                    "finish_reason": response.choices[0].finish_reason,
-                },
+                metadata=metadata,
             )
 
         except EmptyResponseError:
@@ -445,6 +624,224 @@ class CloudBackend(BaseBackend):
         except Exception as e:
             self._handle_request_error(e, used_model)
 
+    async def _acompletion(self, params: Dict[str, Any], priority: int = 0) -> Any:
+        """
+        Call LiteLLM within the provider's rate limits.
+
+        The request waits in the model's and provider's queues until it fits
+        their quotas. A 429 throttles the model and the request is retried
+        after the ``retry-after`` period, up to ``rate_limits.max_retries`` times.
+
+        Args:
+            params: LiteLLM completion parameters
+            priority: Higher priorities leave the rate limit queue first
+
+        Returns:
+            The LiteLLM response (an async iterator for streaming requests)
+        """
+        from ..config.loader import get_config_value
+        from ..core.ratelimit import get_rate_limiter
+
+        scheduler = get_rate_limiter()
+        if not scheduler.enabled:
+            return await self.litellm.acompletion(**params)
+
+        model = params["model"]
+        provider = self._get_provider_from_model(model)
+        estimate = scheduler.estimate_tokens(params)
+        max_retries = int(get_config_value("rate_limits.max_retries", 3))
+        attempt = 0
+        while True:
+            waited = await scheduler.acquire(provider, model, estimate, priority)
+            if waited:
+                logger.debug(f"Waited {waited:.2f}s for the {provider}/{model} rate limit")
+            try:
+                response = await self.litellm.acompletion(**params)
+            except Exception as e:
+                if not _is_rate_limit_error(e) or attempt >= max_retries:
+                    raise
+                scheduler.throttle(provider, model, _retry_after_of(e))
+                attempt += 1
+                continue
+
+            usage = None if params.get("stream") else _chunk_usage(response)
+            actual = usage["total_tokens"] if usage else None
+            scheduler.record(provider, model, estimate, actual, _response_headers(response))
+            return response
+
+    @staticmethod
+    def _parse_tool_calls(message: Any) -> List[Dict[str, Any]]:
+        """Extract function calls from a response message as ``{id, name, arguments, raw_arguments}`` dicts."""
+        calls: List[Dict[str, Any]] = []
+        for tool_call in getattr(message, "tool_calls", None) or []:
+            if tool_call.type != "function":
+                continue
+            func_call = tool_call.function
+            try:
+                arguments = json.loads(func_call.arguments) if func_call.arguments else {}
+            except json.JSONDecodeError:
+                arguments = {}
+            calls.append(
+                {
+                    "id": tool_call.id,
+                    "name": func_call.name,
+                    "arguments": arguments,
+                    "raw_arguments": func_call.arguments or "{}",
+                }
+            )
+        return calls
+
+    @staticmethod
+    def _usage_of(response: Any) -> Tuple[Optional[int], Optional[int], Optional[float]]:
+        """Get (tokens_in, tokens_out, cost) of a completion response."""
+        usage = getattr(response, "usage", None)
+        tokens_in = usage.prompt_tokens if usage else None
+        tokens_out = usage.completion_tokens if usage else None
+
+        # Calculate cost if available
+        cost = None
+        if hasattr(response, "_hidden_params"):
+            try:
+                if isinstance(response._hidden_params, dict) and "response_cost" in response._hidden_params:
+                    cost = response._hidden_params["response_cost"]
+            except (TypeError, AttributeError):
+                # Handle mocks or other non-dict types
+                pass
+        return tokens_in, tokens_out, cost
+
+    def _stream_cost(self, model: str, usage: Dict[str, int]) -> Optional[float]:
+        """Estimate the cost of streamed usage with LiteLLM's price table."""
+        try:
+            prompt_cost, completion_cost = self.litellm.cost_per_token(
+                model=model,
+                prompt_tokens=usage["prompt_tokens"],
+                completion_tokens=usage["completion_tokens"],
+            )
+            return float(prompt_cost + completion_cost)
+        except Exception as e:
+            # Unknown models have no price
+            logger.debug(f"No cost for {model}: {e}")
+            return None
+
+    async def _run_tool_loop(
+        self,
+        params: Dict[str, Any],
+        response: Any,
+        max_steps: Optional[int],
+        token_budget: Optional[int],
+        on_step: Optional[Callable[[Any], Any]],
+        priority: int = 0,
+    ) -> Tuple[Any, Any, Tuple[Optional[int], Optional[int], Optional[float]], Dict[str, Any]]:
+        """
+        Execute tool calls and send the results back until the model answers.
+
+        The calls in each step run concurrently. Once ``max_steps`` rounds have
+        run or ``token_budget`` tokens have been used, the model is asked once
+        more with ``tool_choice="none"`` so it answers from the results so far.
+
+        Args:
+            params: Request parameters of the first completion (not modified)
+            response: The first completion, which contains tool calls
+            max_steps: Tool-calling rounds allowed
+            token_budget: Total tokens allowed across rounds (0 or None for unlimited)
+            on_step: Called with each ToolStep as it completes
+            priority: Rate limit queue priority of the follow-up requests
+
+        Returns:
+            (final response, ToolResult of all calls, summed (tokens_in, tokens_out, cost), metadata)
+        """
+        from ..config.loader import get_config_value
+        from ..tools import ToolResult, ToolStep, execute_tools
+
+        if max_steps is None:
+            max_steps = int(get_config_value("tools.loop.max_steps", 8))
+        if token_budget is None:
+            token_budget = int(get_config_value("tools.loop.token_budget", 0) or 0)
+
+        messages = list(params["messages"])
+        all_calls: List[Any] = []
+        totals: List[Optional[float]] = list(self._usage_of(response))
+        steps = 0
+        budget_exhausted = False
+
+        def add_usage(usage: Tuple[Optional[int], Optional[int], Optional[float]]) -> None:
+            for i, value in enumerate(usage):
+                if value is not None:
+                    totals[i] = (totals[i] or 0) + value
+
+        while True:
+            message = response.choices[0].message if response.choices else None
+            if message is None:
+                break
+            calls = self._parse_tool_calls(message)
+            if not calls:
+                break
+
+            used_tokens = (totals[0] or 0) + (totals[1] or 0)
+            if steps >= max_steps or (token_budget and used_tokens >= token_budget):
+                budget_exhausted = True
+                logger.debug(f"Tool loop budget exhausted after {steps} steps and {used_tokens} tokens")
+                final_params = {**params, "messages": messages, "tool_choice": "none"}
+                response = await self._acompletion(final_params, priority)
+                add_usage(self._usage_of(response))
+                break
+
+            steps += 1
+            result = await execute_tools(calls, parallel=True)
+            # Results come back in call order; keep the model's call ids so tool messages match
+            for call, data in zip(result.calls, calls):
+                call.id = data["id"]
+            all_calls.extend(result.calls)
+
+            messages.append(
+                {
+                    "role": "assistant",
+                    "content": message.content or None,
+                    "tool_calls": [
+                        {
+                            "id": data["id"],
+                            "type": "function",
+                            "function": {"name": data["name"], "arguments": data["raw_arguments"]},
+                        }
+                        for data in calls
+                    ],
+                }
+            )
+            for call in result.calls:
+                messages.append(
+                    {
+                        "role": "tool",
+                        "tool_call_id": call.id,
+                        "name": call.name,
+                        "content": _tool_message_content(call),
+                    }
+                )
+
+            step_usage = self._usage_of(response)
+            if on_step is not None:
+                step = ToolStep(
+                    index=steps,
+                    calls=result.calls,
+                    content=message.content or "",
+                    tokens_in=step_usage[0],
+                    tokens_out=step_usage[1],
+                )
+                outcome = on_step(step)
+                if inspect.isawaitable(outcome):
+                    await outcome
+
+            response = await self._acompletion({**params, "messages": messages}, priority)
+            add_usage(self._usage_of(response))
+
+        tokens_in, tokens_out, cost = totals
+        usage = (
+            int(tokens_in) if tokens_in is not None else None,
+            int(tokens_out) if tokens_out is not None else None,
+            cost,
+        )
+        metadata = {"tool_steps": steps, "tool_budget_exhausted": budget_exhausted}
+        return response, ToolResult(calls=all_calls), usage, metadata
+
     async def astream(
         self,
         prompt: Union[str, List[Union[str, ImageInput]]],
@@ -459,21 +856,77 @@ class CloudBackend(BaseBackend):
         """
         Stream a response from a cloud provider token by token.
 
+        Tool calls are executed while streaming (see ``astream_events``); only
+        the text is yielded.
+
         Args:
             prompt: The user prompt - can be a string or list of content (text/images)
             model: Specific model to use (optional)
             system: System prompt (optional)
             temperature: Sampling temperature (optional)
             max_tokens: Maximum tokens to generate (optional)
+            tools: List of functions/tools the AI can call (optional)
             **kwargs: Additional parameters
 
         Yields:
             Response chunks as they arrive
         """
+        async for event in self.astream_events(
+            prompt,
+            model=model,
+            system=system,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            tools=tools,
+            **kwargs,
+        ):
+            if event.type == "text":
+                yield event.text
+
+    async def astream_events(
+        self,
+        prompt: Union[str, List[Union[str, ImageInput]]],
+        *,
+        model: Optional[str] = None,
+        system: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        tools: Optional[List[Any]] = None,
+        max_tool_steps: Optional[int] = None,
+        tool_token_budget: Optional[int] = None,
+        priority: int = 0,
+        **kwargs: Any,
+    ) -> AsyncIterator[StreamEvent]:
+        """
+        Stream a response as typed events, running tool calls while the model streams.
+
+        Tool calls are assembled from the streamed argument deltas and each one
+        is dispatched as soon as its arguments are complete, so tools run while
+        the model is still generating. Once the stream ends the results are sent
+        back as ``tool`` messages and the next round is streamed, bounded by the
+        same step and token budget as ``ask``.
+
+        Args:
+            prompt: The user prompt - can be a string or list of content (text/images)
+            model: Specific model to use (optional)
+            system: System prompt (optional)
+            temperature: Sampling temperature (optional)
+            max_tokens: Maximum tokens to generate (optional)
+            tools: List of functions/tools the AI can call (optional)
+            max_tool_steps: Tool-calling rounds before a final answer is forced
+                (default from ``tools.loop.max_steps``)
+            tool_token_budget: Total tokens across rounds before a final answer is
+                forced; 0 means unlimited (default from ``tools.loop.token_budget``)
+            priority: Higher priorities leave the provider's rate limit queue first
+            **kwargs: Additional parameters
+
+        Yields:
+            StreamEvent objects: ``text``, ``tool_start``, ``tool_result`` and ``usage``
+        """
         used_model = model or self.default_model
 
         # Build messages
-        messages = self._build_messages(prompt, system)
+        messages = self._build_messages(prompt, system, kwargs)
 
         # Build parameters
         params = {
@@ -488,6 +941,7 @@ class CloudBackend(BaseBackend):
             params["max_tokens"] = max_tokens
 
         # Add tools if provided (same as ask method)
+        tool_definitions: List[Dict[str, Any]] = []
         if tools:
             # Import tools here to avoid circular imports
             from ..tools import resolve_tools
@@ -509,6 +963,18 @@ class CloudBackend(BaseBackend):
         filtered_kwargs = {k: v for k, v in kwargs.items() if v is not None and k != "messages"}
         params.update(filtered_kwargs)
 
+        from ..config.loader import get_config_value
+
+        if get_config_value("backends.cloud.stream_usage", True):
+            # Ask the provider for a final usage chunk
+            params.setdefault("stream_options", {"include_usage": True})
+
+        if tool_definitions:
+            if max_tool_steps is None:
+                max_tool_steps = int(get_config_value("tools.loop.max_steps", 8))
+            if tool_token_budget is None:
+                tool_token_budget = int(get_config_value("tools.loop.token_budget", 0) or 0)
+
         try:
             logger.debug(f"Starting stream request to {used_model}")
             logger.debug(
@@ -520,14 +986,66 @@ class CloudBackend(BaseBackend):
             if used_model.startswith("openrouter/") and os.getenv("OPENROUTER_API_KEY"):
                 params["api_key"] = os.getenv("OPENROUTER_API_KEY")
 
-            response = await self.litellm.acompletion(**params)
-
-            async for chunk in response:
-                if chunk.choices and chunk.choices[0].delta:
-                    content = chunk.choices[0].delta.content
-                    if content:
-                        # Content should be a string in streaming responses
-                        yield str(content)
+            messages = list(messages)
+            steps = 0
+            used_tokens = 0
+            final_round = not tool_definitions
+            while True:
+                response = await self._acompletion({**params, "messages": messages}, priority)
+                pending = None if final_round else _StreamedToolCalls()
+                text_parts: List[str] = []
+                finish_reason = None
+                try:
+                    async for chunk in response:
+                        usage = _chunk_usage(chunk)
+                        if usage is not None:
+                            used_tokens += usage["total_tokens"]
+                            details: Dict[str, Any] = {"cost": self._stream_cost(used_model, usage)}
+                            if finish_reason:
+                                details["finish_reason"] = finish_reason
+                            yield StreamEvent("usage", usage=usage, data=details)
+
+                        if chunk.choices and isinstance(getattr(chunk.choices[0], "finish_reason", None), str):
+                            finish_reason = chunk.choices[0].finish_reason
+
+                        if chunk.choices and chunk.choices[0].delta:
+                            delta = chunk.choices[0].delta
+                            content = delta.content
+                            if content:
+                                # Content should be a string in streaming responses
+                                text_parts.append(str(content))
+                                yield StreamEvent("text", text=str(content))
+
+                            tool_call_deltas = getattr(delta, "tool_calls", None)
+                            if pending is not None and isinstance(tool_call_deltas, list):
+                                for call in pending.add(tool_call_deltas):
+                                    yield StreamEvent("tool_start", tool_call=call)
+
+                        if pending is not None:
+                            for call in pending.finished():
+                                yield StreamEvent("tool_result", tool_call=call)
+
+                    if pending is None or not pending.calls:
+                        break
+
+                    # Dispatch calls whose arguments only ended with the stream, then wait for all
+                    for call in pending.flush():
+                        yield StreamEvent("tool_start", tool_call=call)
+                    async for call in pending.remaining():
+                        yield StreamEvent("tool_result", tool_call=call)
+
+                    steps += 1
+                    messages.extend(pending.messages("".join(text_parts)))
+
+                    if steps >= (max_tool_steps or 0) or (tool_token_budget and used_tokens >= tool_token_budget):
+                        # Ask for a final answer from the results so far
+                        logger.debug(f"Tool loop budget exhausted after {steps} steps and {used_tokens} tokens")
+                        params["tool_choice"] = "none"
+                        final_round = True
+                finally:
+                    # Stop tools still running if the consumer went away or the stream failed
+                    if pending is not None:
+                        pending.cancel()
 
         except Exception as e:
             self._handle_request_error(e, used_model, "streaming request")
@@ -1,7 +1,9 @@
 """Local backend implementation using Ollama."""
 
+import asyncio
 import json
 import time
+import weakref
 from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
 import httpx
@@ -13,12 +15,52 @@ from ..core.exceptions import (
     ModelNotFoundError,
     ResponseParsingError,
 )
-from ..core.models import AIResponse, ImageInput
+from ..core.models import AIResponse, ImageInput, StreamEvent
 from ..utils import get_logger, run_async
+from ..utils.async_utils import register_shutdown_hook
 from .base import BaseBackend
 
 logger = get_logger(__name__)
 
+# Backends with pooled clients that must be closed when the background loop stops
+_live_backends: "weakref.WeakSet[LocalBackend]" = weakref.WeakSet()
+
+
+async def _close_live_backends() -> None:
+    """Close pooled clients of every live LocalBackend on the current loop."""
+    for backend in list(_live_backends):
+        try:
+            await backend.aclose()
+        except Exception as e:
+            logger.debug(f"Error closing Ollama client: {e}")
+
+
+def _final_chunk_usage(data: Dict[str, Any]) -> Optional[StreamEvent]:
+    """Build a usage event from the counters in Ollama's final streamed chunk."""
+    if "eval_count" not in data and "prompt_eval_count" not in data:
+        return None
+    prompt_tokens = int(data.get("prompt_eval_count") or 0)
+    completion_tokens = int(data.get("eval_count") or 0)
+    details: Dict[str, Any] = {"cost": 0.0}
+    if data.get("done_reason"):
+        details["finish_reason"] = data["done_reason"]
+    # Durations are reported in nanoseconds
+    eval_duration = data.get("eval_duration")
+    if eval_duration:
+        details["eval_duration"] = eval_duration / 1e9
+        details["tokens_per_second"] = completion_tokens / (eval_duration / 1e9)
+    if data.get("total_duration"):
+        details["total_duration"] = data["total_duration"] / 1e9
+    return StreamEvent(
+        "usage",
+        usage={
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        },
+        data=details,
+    )
+
 
 class LocalBackend(BaseBackend):
     """
@@ -53,6 +95,64 @@ class LocalBackend(BaseBackend):
             "backends.local.default_model", "llama2"
         )
 
+        # Connection pool settings for the long-lived HTTP client
+        pool_config = {**(get_config_value("backends.local.pool", {}) or {}), **local_config.get("pool", {})}
+        self.pool_max_connections = int(pool_config.get("max_connections", 20))
+        self.pool_max_keepalive = int(pool_config.get("max_keepalive_connections", 10))
+        self.pool_keepalive_expiry = float(pool_config.get("keepalive_expiry", 30.0))
+        self.http2 = bool(pool_config.get("http2", False))
+
+        # httpx clients are bound to the event loop that first uses them, so
+        # keep one pooled client per loop and drop it when the loop goes away
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+        _live_backends.add(self)
+        register_shutdown_hook(_close_live_backends)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get the pooled HTTP client for the running event loop.
+
+        The client is created lazily and reused for every request made on the
+        same loop, so consecutive calls share keep-alive connections.
+
+        Returns:
+            httpx.AsyncClient bound to the current event loop
+        """
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            http2 = self.http2
+            if http2:
+                try:
+                    import h2  # noqa: F401
+                except ImportError:
+                    logger.debug("HTTP/2 requested for Ollama but 'h2' is not installed, using HTTP/1.1")
+                    http2 = False
+
+            client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.pool_max_connections,
+                    max_keepalive_connections=self.pool_max_keepalive,
+                    keepalive_expiry=self.pool_keepalive_expiry,
+                ),
+                http2=http2,
+            )
+            self._clients[loop] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client owned by the running event loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        client = self._clients.pop(loop, None)
+        if client is not None and not client.is_closed:
+            await client.aclose()
+
     @property
     def name(self) -> str:
         """Backend name for identification."""
@@ -61,19 +161,17 @@ class LocalBackend(BaseBackend):
     @property
     def is_available(self) -> bool:
         """Check if Ollama is running and available."""
+        # Use run_async to handle the event loop properly
+        return bool(run_async(self.check_available()))
+
+    async def check_available(self) -> bool:
+        """Check if Ollama is running and available without blocking the event loop."""
         try:
-            # Create a simple sync check
-            async def check() -> bool:
-                from ..config.loader import get_config_value
-
-                availability_timeout = get_config_value("constants.timeouts.availability_check", 5)
-                async with httpx.AsyncClient(timeout=availability_timeout) as client:
-                    response = await client.get(f"{self.base_url}/api/tags")
-                    return response.status_code == 200
-
-            # Use run_async to handle the event loop properly
-            result = run_async(check())
-            return bool(result)
+            from ..config.loader import get_config_value
+
+            availability_timeout = get_config_value("constants.timeouts.availability_check", 5)
+            response = await self._get_client().get(f"{self.base_url}/api/tags", timeout=availability_timeout)
+            return response.status_code == 200
         except Exception as e:
             logger.debug(f"Ollama availability check failed: {e}")
             return False
@@ -139,37 +237,37 @@ class LocalBackend(BaseBackend):
             payload["system"] = system
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                logger.debug(f"Sending request to Ollama: {used_model}")
-
-                response = await client.post(f"{self.base_url}/api/generate", json=payload)
-                response.raise_for_status()
-
-                data = response.json()
-                content = data.get("response", "")
-
-                if not content:
-                    raise EmptyResponseError(used_model, self.name)
-
-                time_taken = time.time() - start_time
-
-                # Extract metadata
-                eval_count = data.get("eval_count", 0)
-                prompt_eval_count = data.get("prompt_eval_count", 0)
-
-                return AIResponse(
-                    content,
-                    model=used_model,
-                    backend=self.name,
-                    tokens_in=prompt_eval_count,
-                    tokens_out=eval_count,
-                    time_taken=time_taken,
-                    metadata={
-                        "eval_duration": data.get("eval_duration"),
-                        "load_duration": data.get("load_duration"),
-                        "total_duration": data.get("total_duration"),
-                    },
-                )
+            client = self._get_client()
+            logger.debug(f"Sending request to Ollama: {used_model}")
+
+            response = await client.post(f"{self.base_url}/api/generate", json=payload)
+            response.raise_for_status()
+
+            data = response.json()
+            content = data.get("response", "")
+
+            if not content:
+                raise EmptyResponseError(used_model, self.name)
+
+            time_taken = time.time() - start_time
+
+            # Extract metadata
+            eval_count = data.get("eval_count", 0)
+            prompt_eval_count = data.get("prompt_eval_count", 0)
+
+            return AIResponse(
+                content,
+                model=used_model,
+                backend=self.name,
+                tokens_in=prompt_eval_count,
+                tokens_out=eval_count,
+                time_taken=time_taken,
+                metadata={
+                    "eval_duration": data.get("eval_duration"),
+                    "load_duration": data.get("load_duration"),
+                    "total_duration": data.get("total_duration"),
+                },
+            )
 
         except httpx.HTTPStatusError as e:
             error_msg = f"HTTP error {e.response.status_code}: {e.response.text}"
@@ -212,6 +310,46 @@ class LocalBackend(BaseBackend):
         Yields:
             Response chunks as they arrive
         """
+        async for event in self.astream_events(
+            prompt,
+            model=model,
+            system=system,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            tools=tools,
+            **kwargs,
+        ):
+            if event.type == "text":
+                yield event.text
+
+    async def astream_events(
+        self,
+        prompt: Union[str, List[Union[str, ImageInput]]],
+        *,
+        model: Optional[str] = None,
+        system: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        tools: Optional[List[Any]] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[StreamEvent]:
+        """
+        Stream a response from Ollama as typed events.
+
+        The final chunk's ``prompt_eval_count``/``eval_count`` and
+        ``eval_duration`` are reported as a ``usage`` event.
+
+        Args:
+            prompt: The user prompt - can be a string or list of content (text/images)
+            model: Specific model to use (optional)
+            system: System prompt (optional)
+            temperature: Sampling temperature (optional)
+            max_tokens: Maximum tokens to generate (optional)
+            **kwargs: Additional parameters
+
+        Yields:
+            ``text`` events as chunks arrive, then one ``usage`` event
+        """
         used_model = model or self.default_model
 
         # Check for multi-modal input
@@ -247,28 +385,31 @@ class LocalBackend(BaseBackend):
             payload["system"] = system
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                logger.debug(f"Starting stream request to Ollama: {used_model}")
+            client = self._get_client()
+            logger.debug(f"Starting stream request to Ollama: {used_model}")
 
-                async with client.stream("POST", f"{self.base_url}/api/generate", json=payload) as response:
-                    response.raise_for_status()
-
-                    async for line in response.aiter_lines():
-                        if line.strip():
-                            try:
-                                data = json.loads(line)
-                                if "response" in data:
-                                    chunk = data["response"]
-                                    if chunk:
-                                        yield chunk
-
-                                # Check if this is the final chunk
-                                if data.get("done", False):
-                                    break
+            async with client.stream("POST", f"{self.base_url}/api/generate", json=payload) as response:
+                response.raise_for_status()
 
-                            except json.JSONDecodeError as e:
-                                logger.warning(f"Failed to parse JSON line: {line}")
-                                raise ResponseParsingError(f"Invalid JSON in stream: {line[:100]}", line) from e
+                async for line in response.aiter_lines():
+                    if line.strip():
+                        try:
+                            data = json.loads(line)
+                            if "response" in data:
+                                chunk = data["response"]
+                                if chunk:
+                                    yield StreamEvent("text", text=chunk)
+
+                            # Check if this is the final chunk
+                            if data.get("done", False):
+                                usage_event = _final_chunk_usage(data)
+                                if usage_event is not None:
+                                    yield usage_event
+                                break
+
+                        except json.JSONDecodeError as e:
+                            logger.warning(f"Failed to parse JSON line: {line}")
+                            raise ResponseParsingError(f"Invalid JSON in stream: {line[:100]}", line) from e
 
         except httpx.HTTPStatusError as e:
             # For streaming responses, read the response body to get error details
@@ -298,15 +439,14 @@ class LocalBackend(BaseBackend):
             from ..config.loader import get_config_value
 
             model_list_timeout = get_config_value("constants.timeouts.model_list", 10)
-            async with httpx.AsyncClient(timeout=model_list_timeout) as client:
-                response = await client.get(f"{self.base_url}/api/tags")
-                response.raise_for_status()
+            response = await self._get_client().get(f"{self.base_url}/api/tags", timeout=model_list_timeout)
+            response.raise_for_status()
 
-                data = response.json()
-                models = [model["name"] for model in data.get("models", [])]
+            data = response.json()
+            models = [model["name"] for model in data.get("models", [])]
 
-                logger.debug(f"Found {len(models)} local models")
-                return models
+            logger.debug(f"Found {len(models)} local models")
+            return models
 
         except httpx.TimeoutException:
             from ..config.loader import get_config_value
@@ -317,6 +457,32 @@ class LocalBackend(BaseBackend):
             logger.error(f"Failed to fetch models: {str(e)}")
             raise BackendConnectionError(self.name, e) from e
 
+    async def model_names(self, timeout: Optional[float] = None) -> List[str]:
+        """
+        Get the names of the models Ollama has, for routing decisions.
+
+        Unlike models(), this does not raise or log errors: an unreachable
+        Ollama simply has no models.
+
+        Args:
+            timeout: Seconds to wait for Ollama (default from constants.timeouts.model_list)
+
+        Returns:
+            List of model names, empty if Ollama could not be queried
+        """
+        if timeout is None:
+            from ..config.loader import get_config_value
+
+            timeout = float(get_config_value("constants.timeouts.model_list", 10))
+        try:
+            response = await self._get_client().get(f"{self.base_url}/api/tags", timeout=timeout)
+            if response.status_code != 200:
+                return []
+            return [model["name"] for model in response.json().get("models", [])]
+        except (httpx.HTTPError, OSError, ValueError, KeyError) as e:
+            logger.debug(f"Could not list Ollama models: {e}")
+            return []
+
     def list_models(self, detailed: bool = False) -> List[Union[str, Dict[str, Any]]]:
         """
         List available models from Ollama, optionally with details.
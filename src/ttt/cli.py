@@ -227,6 +227,17 @@ def get_version():
     return "1.0.0"
 
 
+def show_startup_profile(ctx, param, value):
+    """Callback for --profile-startup option."""
+    if not value or ctx.resilient_parsing:
+        return
+    if app_hooks and hasattr(app_hooks, "on_profile_startup"):
+        app_hooks.on_profile_startup()
+    else:
+        click.echo("Startup profiling not available")
+    ctx.exit()
+
+
 def show_help_json(ctx, param, value):
     """Callback for --help-json option."""
     if not value or ctx.resilient_parsing:
@@ -294,7 +305,17 @@ def show_help_json(ctx, param, value):
     }
   ],
   "footer_note": "📚 For detailed help on a command, run: [color(2)]ttt [COMMAND][/color(2)] [#ff79c6]--help[/#ff79c6]",
-  "options": [],
+  "options": [
+    {
+      "name": "profile-startup",
+      "short": null,
+      "type": "flag",
+      "desc": "Show import time per module for a cold start",
+      "default": null,
+      "choices": null,
+      "multiple": false
+    }
+  ],
   "commands": {
     "ask": {
       "desc": "Quickly ask one-off questions",
@@ -382,6 +403,15 @@ def show_help_json(ctx, param, value):
           "default": null,
           "choices": null,
           "multiple": false
+        },
+        {
+          "name": "cache",
+          "short": null,
+          "type": "flag",
+          "desc": "Serve repeated requests from the response cache (--no-cache to bypass)",
+          "default": null,
+          "choices": null,
+          "multiple": false
         }
       ],
       "subcommands": null
@@ -495,6 +525,71 @@ def show_help_json(ctx, param, value):
       ],
       "subcommands": null
     },
+    "serve": {
+      "desc": "Run a background daemon that keeps models warm",
+      "icon": "🚀",
+      "is_default": false,
+      "lifecycle": "standard",
+      "args": [],
+      "options": [
+        {
+          "name": "socket",
+          "short": null,
+          "type": "str",
+          "desc": "Unix socket path (default: server.socket_path)",
+          "default": null,
+          "choices": null,
+          "multiple": false
+        },
+        {
+          "name": "stop",
+          "short": null,
+          "type": "flag",
+          "desc": "Stop the running daemon",
+          "default": null,
+          "choices": null,
+          "multiple": false
+        },
+        {
+          "name": "status",
+          "short": null,
+          "type": "flag",
+          "desc": "Show whether a daemon is running",
+          "default": null,
+          "choices": null,
+          "multiple": false
+        }
+      ],
+      "subcommands": null
+    },
+    "gateway": {
+      "desc": "Serve an OpenAI-compatible HTTP API",
+      "icon": "🌐",
+      "is_default": false,
+      "lifecycle": "standard",
+      "args": [],
+      "options": [
+        {
+          "name": "host",
+          "short": null,
+          "type": "str",
+          "desc": "Interface to bind (default: server.gateway.host)",
+          "default": null,
+          "choices": null,
+          "multiple": false
+        },
+        {
+          "name": "port",
+          "short": null,
+          "type": "int",
+          "desc": "Port to bind (default: server.gateway.port)",
+          "default": null,
+          "choices": null,
+          "multiple": false
+        }
+      ],
+      "subcommands": null
+    },
     "models": {
       "desc": "View AI models",
       "icon": "🧠",
@@ -590,6 +685,116 @@ def show_help_json(ctx, param, value):
       ],
       "subcommands": null
     },
+    "batch": {
+      "desc": "Run many prompts from JSONL",
+      "icon": "📦",
+      "is_default": false,
+      "lifecycle": "standard",
+      "args": [
+        {
+          "name": "input",
+          "desc": "JSONL file with one request per line (default: stdin)",
+          "nargs": null,
+          "choices": null,
+          "required": false
+        }
+      ],
+      "options": [
+        {
+          "name": "model",
+          "short": "m",
+          "type": "str",
+          "desc": "Default LLM model for requests",
+          "default": null,
+          "choices": null,
+          "multiple": false
+        },
+        {
+          "name": "system",
+          "short": null,
+          "type": "str",
+          "desc": "Default system prompt for requests",
+          "default": null,
+          "choices": null,
+          "multiple": false
+        },
+        {
+          "name": "concurrency",
+          "short": "c",
+          "type": "int",
+          "desc": "Maximum requests in flight",
+          "default": null,
+          "choices": null,
+          "multiple": false
+        },
+        {
+          "name": "ordered",
+          "short": null,
+          "type": "flag",
+          "desc": "Write results in input order instead of as they finish",
+          "default": null,
+          "choices": null,
+          "multiple": false
+        },
+        {
+          "name": "output",
+          "short": "o",
+          "type": "str",
+          "desc": "Output JSONL file path",
+          "default": null,
+          "choices": null,
+          "multiple": false
+        },
+        {
+          "name": "cache",
+          "short": null,
+          "type": "flag",
+          "desc": "Serve repeated requests from the response cache (--no-cache to bypass)",
+          "default": null,
+          "choices": null,
+          "multiple": false
+        }
+      ],
+      "subcommands": null
+    },
+    "cache": {
+      "desc": "Manage the response cache",
+      "icon": "🗄️",
+      "is_default": false,
+      "lifecycle": "standard",
+      "args": [],
+      "options": [],
+      "subcommands": {
+        "stats": {
+          "desc": "Show response cache statistics",
+          "icon": null,
+          "is_default": false,
+          "lifecycle": "standard",
+          "args": [],
+          "options": [
+            {
+              "name": "json",
+              "short": null,
+              "type": "flag",
+              "desc": "Output statistics in JSON format",
+              "default": null,
+              "choices": null,
+              "multiple": false
+            }
+          ],
+          "subcommands": null
+        },
+        "clear": {
+          "desc": "Remove all cached responses",
+          "icon": null,
+          "is_default": false,
+          "lifecycle": "standard",
+          "args": [],
+          "options": [],
+          "subcommands": null
+        }
+      }
+    },
     "config": {
       "desc": "Customize your setup",
       "icon": "⚙️",
@@ -730,6 +935,7 @@ def show_help_json(ctx, param, value):
       "commands": [
         "ask",
         "chat",
+        "batch",
         "list",
         "status"
       ],
@@ -754,7 +960,8 @@ def show_help_json(ctx, param, value):
     {
       "name": "Data Management",
       "commands": [
-        "export"
+        "export",
+        "cache"
       ],
       "icon": null
     }
@@ -854,6 +1061,14 @@ class DefaultGroup(RichGroup):
 )
 @click.option("--help-all", is_flag=True, is_eager=True, help="Show help for all commands.", hidden=True)
 @click.option("--debug", is_flag=True, help="Show full error traces and debug information")
+@click.option(
+    "--profile-startup",
+    is_flag=True,
+    callback=show_startup_profile,
+    is_eager=True,
+    expose_value=False,
+    help="Show import time per module for a cold start",
+)
 def main(ctx, help_json=False, help_all=False, debug=False):
     """🤖 [bold color(6)]GOOBITS TTT CLI v1.0.3[/bold color(6)] - Talk to Transformer
 
@@ -935,7 +1150,7 @@ click.rich_click.COMMAND_GROUPS = {
     "main": [
         {
             "name": "Core Commands",
-            "commands": ["ask", "chat", "list", "status"],
+            "commands": ["ask", "chat", "batch", "list", "status", "serve", "gateway"],
         },
         {
             "name": "Model Management",
@@ -947,7 +1162,7 @@ click.rich_click.COMMAND_GROUPS = {
         },
         {
             "name": "Data Management",
-            "commands": ["export"],
+            "commands": ["export", "cache"],
         },
     ]
 }
@@ -977,7 +1192,12 @@ def upgrade(check, version, pre, dry_run):
 @click.option("--system", type=str, help="System prompt to set AI behavior")
 @click.option("--stream", type=bool, default=True, help="Stream the response")
 @click.option("--json", is_flag=True, help="Output response in JSON format")
-def ask(ctx, prompt, model, temperature, max_tokens, tools, session, system, stream, json):
+@click.option(
+    "--cache/--no-cache",
+    default=None,
+    help="Serve repeated requests from the response cache (--no-cache to bypass)",
+)
+def ask(ctx, prompt, model, temperature, max_tokens, tools, session, system, stream, json, cache):
     """💬 Quickly ask one-off questions"""
 
     # Check for built-in commands first
@@ -1010,6 +1230,8 @@ def ask(ctx, prompt, model, temperature, max_tokens, tools, session, system, str
 
         kwargs["json"] = json
 
+        kwargs["cache"] = cache
+
         # Add global options from context
         if ctx and ctx.obj:
             kwargs["debug"] = ctx.obj.get("debug", False)
@@ -1038,6 +1260,8 @@ def ask(ctx, prompt, model, temperature, max_tokens, tools, session, system, str
 
         click.echo(f"  json: {json}")
 
+        click.echo(f"  cache: {cache}")
+
 
 @main.command()
 @click.pass_context
@@ -1163,6 +1387,87 @@ def status(ctx, json):
         click.echo(f"  json: {json}")
 
 
+@main.command()
+@click.pass_context
+@click.option("--socket", type=str, help="Unix socket path (default: server.socket_path)")
+@click.option("--stop", is_flag=True, help="Stop the running daemon")
+@click.option("--status", is_flag=True, help="Show whether a daemon is running")
+def serve(ctx, socket, stop, status):
+    """🚀 Run a background daemon that keeps models warm"""
+
+    # Check for built-in commands first
+
+    # Standard command - use the existing hook pattern
+    hook_name = "on_serve"
+    if app_hooks and hasattr(app_hooks, hook_name):
+        # Call the hook with all parameters
+        hook_func = getattr(app_hooks, hook_name)
+
+        # Prepare arguments including global options
+        kwargs = {}
+        kwargs["command_name"] = "serve"  # Pass command name for all commands
+
+        kwargs["socket"] = socket
+
+        kwargs["stop"] = stop
+
+        kwargs["status"] = status
+
+        # Add global options from context
+        if ctx and ctx.obj:
+            kwargs["debug"] = ctx.obj.get("debug", False)
+
+        result = hook_func(**kwargs)
+        return result
+    else:
+        # Default placeholder behavior
+        click.echo("Executing serve command...")
+
+        click.echo(f"  socket: {socket}")
+
+        click.echo(f"  stop: {stop}")
+
+        click.echo(f"  status: {status}")
+
+
+@main.command()
+@click.pass_context
+@click.option("--host", type=str, help="Interface to bind (default: server.gateway.host)")
+@click.option("--port", type=int, help="Port to bind (default: server.gateway.port)")
+def gateway(ctx, host, port):
+    """🌐 Serve an OpenAI-compatible HTTP API"""
+
+    # Check for built-in commands first
+
+    # Standard command - use the existing hook pattern
+    hook_name = "on_gateway"
+    if app_hooks and hasattr(app_hooks, hook_name):
+        # Call the hook with all parameters
+        hook_func = getattr(app_hooks, hook_name)
+
+        # Prepare arguments including global options
+        kwargs = {}
+        kwargs["command_name"] = "gateway"  # Pass command name for all commands
+
+        kwargs["host"] = host
+
+        kwargs["port"] = port
+
+        # Add global options from context
+        if ctx and ctx.obj:
+            kwargs["debug"] = ctx.obj.get("debug", False)
+
+        result = hook_func(**kwargs)
+        return result
+    else:
+        # Default placeholder behavior
+        click.echo("Executing gateway command...")
+
+        click.echo(f"  host: {host}")
+
+        click.echo(f"  port: {port}")
+
+
 @main.command()
 @click.pass_context
 @click.option("--json", is_flag=True, help="Output models in JSON format")
@@ -1284,6 +1589,134 @@ def export(ctx, session, format, output, include_metadata):
         click.echo(f"  include-metadata: {include_metadata}")
 
 
+@main.command()
+@click.pass_context
+@click.argument("INPUT", required=False, default=None)
+@click.option("-m", "--model", type=str, help="Default LLM model for requests")
+@click.option("--system", type=str, help="Default system prompt for requests")
+@click.option("-c", "--concurrency", type=int, help="Maximum requests in flight")
+@click.option("--ordered", is_flag=True, help="Write results in input order instead of as they finish")
+@click.option("-o", "--output", type=str, help="Output JSONL file path")
+@click.option(
+    "--cache/--no-cache",
+    default=None,
+    help="Serve repeated requests from the response cache (--no-cache to bypass)",
+)
+def batch(ctx, input, model, system, concurrency, ordered, output, cache):
+    """📦 Run many prompts from JSONL"""
+
+    # Check for built-in commands first
+
+    # Standard command - use the existing hook pattern
+    hook_name = "on_batch"
+    if app_hooks and hasattr(app_hooks, hook_name):
+        # Call the hook with all parameters
+        hook_func = getattr(app_hooks, hook_name)
+
+        # Prepare arguments including global options
+        kwargs = {}
+        kwargs["command_name"] = "batch"  # Pass command name for all commands
+
+        kwargs["input"] = input
+
+        kwargs["model"] = model
+
+        kwargs["system"] = system
+
+        kwargs["concurrency"] = concurrency
+
+        kwargs["ordered"] = ordered
+
+        kwargs["output"] = output
+
+        kwargs["cache"] = cache
+
+        # Add global options from context
+        if ctx and ctx.obj:
+            kwargs["debug"] = ctx.obj.get("debug", False)
+
+        result = hook_func(**kwargs)
+        return result
+    else:
+        # Default placeholder behavior
+        click.echo("Executing batch command...")
+
+        click.echo(f"  input: {input}")
+
+        click.echo(f"  model: {model}")
+
+        click.echo(f"  system: {system}")
+
+        click.echo(f"  concurrency: {concurrency}")
+
+        click.echo(f"  ordered: {ordered}")
+
+        click.echo(f"  output: {output}")
+
+        click.echo(f"  cache: {cache}")
+
+
+@main.group()
+def cache():
+    """🗄️  Manage the response cache"""
+    pass
+
+
+@cache.command()
+@click.pass_context
+@click.option("--json", is_flag=True, help="Output statistics in JSON format")
+def stats(ctx, json):
+    """Show response cache statistics"""
+    # Check if hook function exists
+    hook_name = "on_cache_stats"
+    if app_hooks and hasattr(app_hooks, hook_name):
+        # Call the hook with all parameters
+        hook_func = getattr(app_hooks, hook_name)
+
+        # Prepare arguments including global options
+        kwargs = {}
+        kwargs["command_name"] = "stats"  # Pass command name for all commands
+
+        kwargs["json"] = json
+
+        # Add global options from context
+        if ctx and ctx.obj:
+            kwargs["debug"] = ctx.obj.get("debug", False)
+
+        result = hook_func(**kwargs)
+        return result
+    else:
+        # Default placeholder behavior
+        click.echo("Executing stats command...")
+
+        click.echo(f"  json: {json}")
+
+
+@cache.command()
+@click.pass_context
+def clear(ctx):
+    """Remove all cached responses"""
+    # Check if hook function exists
+    hook_name = "on_cache_clear"
+    if app_hooks and hasattr(app_hooks, hook_name):
+        # Call the hook with all parameters
+        hook_func = getattr(app_hooks, hook_name)
+
+        # Prepare arguments including global options
+        kwargs = {}
+        kwargs["command_name"] = "clear"  # Pass command name for all commands
+
+        # Add global options from context
+        if ctx and ctx.obj:
+            kwargs["debug"] = ctx.obj.get("debug", False)
+
+        result = hook_func(**kwargs)
+        return result
+    else:
+        # Default placeholder behavior
+        click.echo("Executing clear command...")
+
+
 @main.group()
 def config():
     """⚙️  Customize your setup"""
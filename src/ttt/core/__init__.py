@@ -1,6 +1,8 @@
 """Core TTT library functionality."""
 
-from .api import ask, chat, stream
+import importlib
+from typing import Any, Dict
+
 from .exceptions import (
     AIError,
     APIKeyError,
@@ -31,19 +33,51 @@ from .exceptions import (
     SessionSaveError,
     ValidationError,
 )
-from .models import AIResponse, ImageInput, ModelInfo
-from .routing import Router
+
+# Heavier names are imported on first access (PEP 562)
+_LAZY_IMPORTS: Dict[str, str] = {
+    "ask": ".api",
+    "ask_many": ".api",
+    "chat": ".api",
+    "stream": ".api",
+    "stream_events": ".api",
+    "AIResponse": ".models",
+    "BatchResult": ".models",
+    "ImageInput": ".models",
+    "ModelInfo": ".models",
+    "StreamEvent": ".models",
+    "Router": ".routing",
+    "TokenCounter": ".tokens",
+    "count_tokens": ".tokens",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # API functions
     "ask",
+    "ask_many",
     "chat",
     "stream",
+    "stream_events",
     # Data models
     "AIResponse",
+    "BatchResult",
     "ImageInput",
     "ModelInfo",
     "Router",
+    "StreamEvent",
+    # Token counting
+    "TokenCounter",
+    "count_tokens",
     # Exceptions
     "AIError",
     "APIKeyError",
@@ -1,14 +1,20 @@
 """Core API functions providing the main user interface."""
 
+import asyncio
+import functools
+import time
 from contextlib import asynccontextmanager, contextmanager
-from typing import Any, AsyncIterator, Iterator, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Union
 
 from ..backends import BaseBackend
-from ..plugins import discover_plugins
+from ..config.loader import get_config_value
 from ..session.chat import PersistentChatSession
-from ..utils import get_logger, run_async, run_coro_in_background
-from .models import AIResponse, ImageInput
-from .routing import router
+from ..utils import get_logger, iterate_in_background, run_async
+from .cache import cache_enabled, get_response_cache, make_cache_key
+from .exceptions import InvalidPromptError
+from .hedging import ASK, FIRST_TOKEN, Attempt, hedging_enabled, race_ask, race_stream
+from .models import AIResponse, BatchResult, ImageInput, StreamEvent
+from .routing import is_health_error, router
 
 # Backward compatibility alias - prefer PersistentChatSession in new code
 ChatSession = PersistentChatSession
@@ -16,11 +22,124 @@ ChatSession = PersistentChatSession
 
 logger = get_logger(__name__)
 
-# Initialize plugins on module load
-try:
-    discover_plugins()
-except Exception as e:
-    logger.debug(f"Plugin discovery failed: {e}")
+
+async def _call_backend(
+    backend_instance: BaseBackend, prompt: Union[str, List[Union[str, ImageInput]]], **kwargs: Any
+) -> AIResponse:
+    """Call backend.ask(), reporting the outcome to the router's circuit breaker."""
+    try:
+        response = await backend_instance.ask(prompt, **kwargs)
+    except Exception as e:
+        if is_health_error(e):
+            router.record_failure(backend_instance, e)
+        raise
+    if not response.failed:
+        router.record_success(backend_instance)
+    return response
+
+
+async def _ask_backend(
+    backend_instance: BaseBackend,
+    prompt: Union[str, List[Union[str, ImageInput]]],
+    *,
+    model: Optional[str],
+    system: Optional[str] = None,
+    temperature: Optional[float] = None,
+    max_tokens: Optional[int] = None,
+    tools: Optional[List] = None,
+    cache: Optional[bool] = None,
+    **kwargs: Any,
+) -> AIResponse:
+    """Call backend.ask(), serving and storing through the response cache when enabled."""
+    if not cache_enabled(cache):
+        return await _call_backend(
+            backend_instance,
+            prompt,
+            model=model,
+            system=system,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            tools=tools,
+            **kwargs,
+        )
+
+    response_cache = get_response_cache()
+    key = make_cache_key(
+        prompt,
+        backend=backend_instance.name,
+        model=model,
+        system=system,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        tools=tools,
+        **kwargs,
+    )
+
+    cached = response_cache.get(key)
+    if cached is not None:
+        logger.debug(f"Response cache hit ({cached.metadata['cache']['tier']}) for {key[:12]}")
+        return cached
+
+    response = await _call_backend(
+        backend_instance,
+        prompt,
+        model=model,
+        system=system,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        tools=tools,
+        **kwargs,
+    )
+
+    # Responses that executed tools are not replayed, since the tools may have side effects
+    if not response.failed and response.tool_result is None:
+        response_cache.set(key, response)
+    response.metadata["cache"] = {"hit": False, "key": key}
+    return response
+
+
+def _hedge_attempts(
+    prompt: Union[str, List[Union[str, ImageInput]]],
+    backend_instance: BaseBackend,
+    model: str,
+    hedge: Optional[bool],
+    tools: Optional[List],
+) -> List[Attempt]:
+    """Get the backend/model attempts for a request, with alternates when hedging applies."""
+    # Tools may have side effects, so requests that can call them are never duplicated
+    if tools or not hedging_enabled(hedge):
+        return [(backend_instance, model)]
+    return router.hedge_attempts(prompt, backend_instance, model)
+
+
+async def _ask_attempts(
+    attempts: List[Attempt], prompt: Union[str, List[Union[str, ImageInput]]], **kwargs: Any
+) -> AIResponse:
+    """Ask the first attempt, racing it against the others if it is slow."""
+    backend_instance, model = attempts[0]
+    if len(attempts) == 1:
+        return await _ask_backend(backend_instance, prompt, model=model, **kwargs)
+    return await race_ask(
+        attempts,
+        lambda b, m: _ask_backend(b, prompt, model=m, **kwargs),
+        router.latency.hedge_delay(ASK, backend_instance.name, model),
+        router.latency,
+    )
+
+
+def _stream_attempts(
+    attempts: List[Attempt], prompt: Union[str, List[Union[str, ImageInput]]], **kwargs: Any
+) -> AsyncIterator[str]:
+    """Stream from the first attempt, racing it against the others if its first chunk is slow."""
+    backend_instance, model = attempts[0]
+    if len(attempts) == 1:
+        return backend_instance.astream(prompt, model=model, **kwargs)
+    return race_stream(
+        attempts,
+        lambda b, m: b.astream(prompt, model=m, **kwargs),
+        router.latency.hedge_delay(FIRST_TOKEN, backend_instance.name, model),
+        router.latency,
+    )
 
 
 def ask(
@@ -32,6 +151,8 @@ def ask(
     max_tokens: Optional[int] = None,
     backend: Optional[Union[str, BaseBackend]] = None,
     tools: Optional[List] = None,
+    cache: Optional[bool] = None,
+    hedge: Optional[bool] = None,
     **kwargs: Any,
 ) -> AIResponse:
     """
@@ -74,6 +195,8 @@ def ask(
         max_tokens: Maximum tokens to generate (optional)
         backend: Backend to use, "local", "cloud", "auto", or Backend instance (optional)
         tools: List of functions/tools the AI can call (optional)
+        cache: Serve identical requests from the response cache (default from config)
+        hedge: Race a slow request against an alternative backend or model (default from config)
         **kwargs: Additional backend-specific parameters
 
     Returns:
@@ -88,14 +211,17 @@ def ask(
         **kwargs,
     )
 
+    attempts = _hedge_attempts(prompt, backend_instance, resolved_model, hedge, tools)
+
     async def _ask_wrapper() -> AIResponse:
-        return await backend_instance.ask(
+        return await _ask_attempts(
+            attempts,
             prompt,
-            model=resolved_model,
             system=system,
             temperature=temperature,
             max_tokens=max_tokens,
             tools=tools,
+            cache=cache,
             **kwargs,
         )
 
@@ -111,6 +237,7 @@ def stream(
     max_tokens: Optional[int] = None,
     backend: Optional[Union[str, BaseBackend]] = None,
     tools: Optional[List] = None,
+    hedge: Optional[bool] = None,
     **kwargs: Any,
 ) -> Iterator[str]:
     """
@@ -135,6 +262,7 @@ def stream(
         max_tokens: Maximum tokens to generate (optional)
         backend: Backend to use, "local", "cloud", "auto", or Backend instance (optional)
         tools: List of functions/tools the AI can call (optional)
+        hedge: Race a slow first chunk against an alternative backend or model (default from config)
         **kwargs: Additional backend-specific parameters
 
     Yields:
@@ -148,11 +276,13 @@ def stream(
         **kwargs,
     )
 
+    attempts = _hedge_attempts(prompt, backend_instance, resolved_model, hedge, tools)
+
     # This creates an async generator from the backend
     async def _async_generator() -> AsyncIterator[str]:
-        async for chunk in backend_instance.astream(
+        async for chunk in _stream_attempts(
+            attempts,
             prompt,
-            model=resolved_model,
             system=system,
             temperature=temperature,
             max_tokens=max_tokens,
@@ -161,26 +291,8 @@ def stream(
         ):
             yield chunk
 
-    # Get the async generator
-    async_gen = _async_generator()
-
-    # We create a bridge to pull from the async generator synchronously
-    # Using the optimized approach to avoid creating new event loops
-    try:
-        while True:
-            try:
-                # Use the background loop to get the next item
-                chunk = run_coro_in_background(async_gen.__anext__())
-                yield chunk
-            except StopAsyncIteration:
-                # The async generator is exhausted - no cleanup needed
-                break
-    finally:
-        # Note: We deliberately do NOT call async_gen.aclose() here because
-        # it can cause "Task was destroyed but it is pending" errors with aiohttp
-        # connections. The LiteLLM library and aiohttp will handle cleanup
-        # automatically when the generator goes out of scope.
-        pass
+    # Chunks that arrive while the caller is busy are joined into one
+    yield from iterate_in_background(_async_generator(), coalesce=_join_chunks)
 
 
 @contextmanager
@@ -254,6 +366,11 @@ def chat(
         pass
 
 
+def _join_chunks(chunks: List[str]) -> List[str]:
+    """Coalesce buffered text chunks into one."""
+    return ["".join(chunks)]
+
+
 # Async versions for advanced users
 async def ask_async(
     prompt: Union[str, List[Union[str, ImageInput]]],
@@ -264,6 +381,8 @@ async def ask_async(
     max_tokens: Optional[int] = None,
     backend: Optional[Union[str, BaseBackend]] = None,
     tools: Optional[List] = None,
+    cache: Optional[bool] = None,
+    hedge: Optional[bool] = None,
     **kwargs: Any,
 ) -> AIResponse:
     """
@@ -277,6 +396,8 @@ async def ask_async(
         max_tokens: Maximum tokens to generate (optional)
         backend: Backend to use, "local", "cloud", "auto", or Backend instance (optional)
         tools: List of functions/tools the AI can call (optional)
+        cache: Serve identical requests from the response cache (default from config)
+        hedge: Race a slow request against an alternative backend or model (default from config)
         **kwargs: Additional backend-specific parameters
 
     Returns:
@@ -290,13 +411,14 @@ async def ask_async(
         **kwargs,
     )
 
-    return await backend_instance.ask(
+    return await _ask_attempts(
+        _hedge_attempts(prompt, backend_instance, resolved_model, hedge, tools),
         prompt,
-        model=resolved_model,
         system=system,
         temperature=temperature,
         max_tokens=max_tokens,
         tools=tools,
+        cache=cache,
         **kwargs,
     )
 
@@ -310,6 +432,7 @@ async def stream_async(
     max_tokens: Optional[int] = None,
     backend: Optional[Union[str, BaseBackend]] = None,
     tools: Optional[List] = None,
+    hedge: Optional[bool] = None,
     **kwargs: Any,
 ) -> AsyncIterator[str]:
     """
@@ -323,6 +446,7 @@ async def stream_async(
         max_tokens: Maximum tokens to generate (optional)
         backend: Backend to use, "local", "cloud", "auto", or Backend instance (optional)
         tools: List of functions/tools the AI can call (optional)
+        hedge: Race a slow first chunk against an alternative backend or model (default from config)
         **kwargs: Additional backend-specific parameters
 
     Yields:
@@ -336,9 +460,9 @@ async def stream_async(
         **kwargs,
     )
 
-    async for chunk in backend_instance.astream(
+    async for chunk in _stream_attempts(
+        _hedge_attempts(prompt, backend_instance, resolved_model, hedge, tools),
         prompt,
-        model=resolved_model,
         system=system,
         temperature=temperature,
         max_tokens=max_tokens,
@@ -348,6 +472,155 @@ async def stream_async(
         yield chunk
 
 
+def stream_events(
+    prompt: Union[str, List[Union[str, ImageInput]]],
+    *,
+    model: Optional[str] = None,
+    system: Optional[str] = None,
+    temperature: Optional[float] = None,
+    max_tokens: Optional[int] = None,
+    backend: Optional[Union[str, BaseBackend]] = None,
+    tools: Optional[List] = None,
+    **kwargs: Any,
+) -> Iterator[StreamEvent]:
+    """
+    Stream a response as typed events with usage and timing.
+
+    Examples:
+        >>> for event in stream_events("Tell me a story"):
+        ...     if event.type == "text":
+        ...         print(event.text, end="", flush=True)
+        ...     elif event.type == "done":
+        ...         print(event.data["time_to_first_token"], event.usage)
+
+    Args:
+        prompt: Your question - can be a string or list of content (text/images)
+        model: Specific model to use (optional)
+        system: System prompt to set context (optional)
+        temperature: Sampling temperature 0-1 (optional)
+        max_tokens: Maximum tokens to generate (optional)
+        backend: Backend to use, "local", "cloud", "auto", or Backend instance (optional)
+        tools: List of functions/tools the AI can call (optional)
+        **kwargs: Additional backend-specific parameters
+
+    Yields:
+        StreamEvent objects (see stream_events_async)
+    """
+    yield from iterate_in_background(
+        stream_events_async(
+            prompt,
+            model=model,
+            system=system,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            backend=backend,
+            tools=tools,
+            **kwargs,
+        )
+    )
+
+
+async def stream_events_async(
+    prompt: Union[str, List[Union[str, ImageInput]]],
+    *,
+    model: Optional[str] = None,
+    system: Optional[str] = None,
+    temperature: Optional[float] = None,
+    max_tokens: Optional[int] = None,
+    backend: Optional[Union[str, BaseBackend]] = None,
+    tools: Optional[List] = None,
+    **kwargs: Any,
+) -> AsyncIterator[StreamEvent]:
+    """
+    Async version of stream_events().
+
+    Yields the backend's events (``text``, ``usage`` and, with tools,
+    ``tool_start``/``tool_result``) stamped with ``elapsed`` seconds, a
+    ``first_token`` event before the first text, and a final ``done`` event
+    whose ``usage`` sums all usage events and whose ``data`` holds
+    ``model``, ``backend``, ``time_to_first_token``, ``total_time``,
+    ``chunks``, ``inter_token_latency`` (mean/max seconds between text
+    chunks), ``tokens_per_second``, ``cost`` and ``finish_reason``.
+
+    Args:
+        prompt: Your question - can be a string or list of content (text/images)
+        model: Specific model to use (optional)
+        system: System prompt to set context (optional)
+        temperature: Sampling temperature 0-1 (optional)
+        max_tokens: Maximum tokens to generate (optional)
+        backend: Backend to use, "local", "cloud", "auto", or Backend instance (optional)
+        tools: List of functions/tools the AI can call (optional)
+        **kwargs: Additional backend-specific parameters
+
+    Yields:
+        StreamEvent objects as they arrive
+    """
+    start = time.perf_counter()
+    backend_instance, resolved_model = router.smart_route(
+        prompt,
+        model=model,
+        backend=backend,
+        **kwargs,
+    )
+
+    first_token: Optional[float] = None
+    last_text: Optional[float] = None
+    gaps: List[float] = []
+    chunks = 0
+    usage: Optional[Dict[str, int]] = None
+    cost: Optional[float] = None
+    finish_reason: Optional[str] = None
+
+    async for event in backend_instance.astream_events(
+        prompt,
+        model=resolved_model,
+        system=system,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        tools=tools,
+        **kwargs,
+    ):
+        now = time.perf_counter()
+        event.elapsed = now - start
+        if event.type == "text":
+            chunks += 1
+            if first_token is None:
+                first_token = event.elapsed
+                yield StreamEvent("first_token", data={"time_to_first_token": first_token}, elapsed=first_token)
+            elif last_text is not None:
+                gaps.append(now - last_text)
+            last_text = now
+        elif event.type == "usage" and event.usage:
+            usage = usage or {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+            for key in usage:
+                usage[key] += int(event.usage.get(key) or 0)
+            if event.data.get("cost") is not None:
+                cost = (cost or 0.0) + event.data["cost"]
+            finish_reason = event.data.get("finish_reason", finish_reason)
+        yield event
+
+    total_time = time.perf_counter() - start
+    tokens_per_second = None
+    if usage and first_token is not None and total_time > first_token:
+        tokens_per_second = usage["completion_tokens"] / (total_time - first_token)
+    yield StreamEvent(
+        "done",
+        usage=usage,
+        data={
+            "model": resolved_model,
+            "backend": backend_instance.name,
+            "time_to_first_token": first_token,
+            "total_time": total_time,
+            "chunks": chunks,
+            "inter_token_latency": {"mean": sum(gaps) / len(gaps), "max": max(gaps)} if gaps else None,
+            "tokens_per_second": tokens_per_second,
+            "cost": cost,
+            "finish_reason": finish_reason,
+        },
+        elapsed=total_time,
+    )
+
+
 @asynccontextmanager
 async def achat(
     *,
@@ -361,6 +634,16 @@ async def achat(
     """
     Async context manager for chat sessions.
 
+    Use the session's ``aask()`` and ``astream()`` methods inside the block;
+    they run on the caller's event loop, so many sessions can be served
+    concurrently from one loop.
+
+    Examples:
+        >>> async with achat(system="You are concise") as session:
+        ...     response = await session.aask("Hello!")
+        ...     async for chunk in session.astream("Tell me more"):
+        ...         print(chunk, end="")
+
     Args:
         system: System prompt to set the assistant's behavior
         model: Default model to use for this session
@@ -372,16 +655,221 @@ async def achat(
     Yields:
         PersistentChatSession instance
     """
-    # Use PersistentChatSession for consistency with sync version
-    session = PersistentChatSession(
-        system=system,
-        model=model,
-        backend=backend,
-        session_id=session_id,
-        tools=tools,
-        **kwargs,
+    # Routing may load config and probe backends, so keep it off the event loop
+    loop = asyncio.get_running_loop()
+    session = await loop.run_in_executor(
+        None,
+        functools.partial(
+            PersistentChatSession,
+            system=system,
+            model=model,
+            backend=backend,
+            session_id=session_id,
+            tools=tools,
+            **kwargs,
+        ),
     )
+    yield session
+
+
+# Keys of a batch request dict that map to explicit ask() parameters
+_BATCH_ASK_PARAMS = ("system", "temperature", "max_tokens", "tools", "cache")
+
+# In ordered mode, workers read at most this many times `concurrency` items past the oldest unfinished one
+_ORDERED_WINDOW_FACTOR = 4
+
+
+def _normalize_batch_request(item: Any, defaults: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn a batch item into a request dict with defaults applied."""
+    if isinstance(item, (str, list)):
+        request: Dict[str, Any] = {"prompt": item}
+    elif isinstance(item, dict):
+        request = dict(item)
+    else:
+        raise InvalidPromptError(f"Batch items must be prompts or dicts, got {type(item).__name__}")
+
+    if not request.get("prompt"):
+        raise InvalidPromptError("Batch request is missing 'prompt'")
+
+    return {**defaults, **request}
+
+
+async def ask_many_async(
+    requests: Iterable[Union[str, Dict[str, Any]]],
+    *,
+    concurrency: Optional[int] = None,
+    backend_limits: Optional[Dict[str, int]] = None,
+    ordered: bool = True,
+    **defaults: Any,
+) -> AsyncIterator[BatchResult]:
+    """
+    Run many prompts concurrently and yield a result for each one.
+
+    Each item is either a prompt string or a dict with a "prompt" key and any
+    ask() parameters (model, system, temperature, max_tokens, backend, tools, cache).
+    An optional "id" key is passed through to the result. Failures are
+    reported on the individual BatchResult instead of aborting the batch.
+
+    Examples:
+        >>> async for result in ask_many_async(["Hi", "Hello"], concurrency=4):
+        ...     print(result.index, result.response or result.error)
+
+    Args:
+        requests: Iterable of prompt strings or request dicts (consumed lazily)
+        concurrency: Maximum number of requests in flight (default from config)
+        backend_limits: Maximum in-flight requests per backend name, e.g. {"local": 2}
+        ordered: Yield results in input order (True) or as they complete (False)
+        **defaults: Parameters applied to every request unless the item overrides them
+
+    Yields:
+        BatchResult for every input item
+    """
+    limit = concurrency or get_config_value("constants.batch.concurrency", 8)
+    if limit < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    per_backend = {**(get_config_value("constants.batch.backend_limits", {}) or {}), **(backend_limits or {})}
+    backend_semaphores: Dict[str, asyncio.Semaphore] = {
+        name: asyncio.Semaphore(max(1, int(value))) for name, value in per_backend.items()
+    }
+
+    loop = asyncio.get_running_loop()
+    items = enumerate(requests)
+    # Arbitrary iterables (e.g. lines read from stdin) may block, so pull them off the loop
+    lazy_input = not isinstance(requests, (list, tuple))
+    fetch_lock = asyncio.Lock()
+    results: "asyncio.Queue[Optional[BatchResult]]" = asyncio.Queue(maxsize=limit)
+    iteration_errors: List[BaseException] = []
+    # Results finished ahead of the next one to yield wait in `pending`; the window bounds it
+    pending: Dict[int, BatchResult] = {}
+    next_index = 0
+    fetched = 0
+    window = limit * _ORDERED_WINDOW_FACTOR
+    head_advanced = asyncio.Condition()
+
+    async def next_item() -> Optional[Any]:
+        nonlocal fetched
+        async with fetch_lock:
+            if ordered:
+                async with head_advanced:
+                    await head_advanced.wait_for(lambda: fetched - next_index < window)
+            if lazy_input:
+                entry = await loop.run_in_executor(None, next, items, None)
+            else:
+                entry = next(items, None)
+            if entry is not None:
+                fetched += 1
+            return entry
+
+    async def run_one(index: int, item: Any) -> BatchResult:
+        request = item if isinstance(item, dict) else {"prompt": item}
+        try:
+            request = _normalize_batch_request(item, defaults)
+            params = {k: v for k, v in request.items() if k != "id"}
+            prompt = params.pop("prompt")
+            model = params.pop("model", None)
+            backend = params.pop("backend", None)
+            ask_params = {key: params.pop(key, None) for key in _BATCH_ASK_PARAMS}
+
+            # Routing may perform blocking health checks, keep it off the loop
+            backend_instance, resolved_model = await loop.run_in_executor(
+                None, functools.partial(router.smart_route, prompt, model=model, backend=backend, **params)
+            )
+
+            semaphore = backend_semaphores.get(backend_instance.name)
+            if semaphore is None:
+                response = await _ask_backend(backend_instance, prompt, model=resolved_model, **ask_params, **params)
+            else:
+                async with semaphore:
+                    response = await _ask_backend(
+                        backend_instance, prompt, model=resolved_model, **ask_params, **params
+                    )
+            return BatchResult(index=index, request=request, response=response)
+        except Exception as e:
+            logger.debug(f"Batch item {index} failed: {e}")
+            return BatchResult(index=index, request=request, error=e)
+
+    async def worker() -> None:
+        try:
+            # All workers share one iterator, so input is consumed lazily
+            while (entry := await next_item()) is not None:
+                index, item = entry
+                await results.put(await run_one(index, item))
+        except Exception as e:
+            iteration_errors.append(e)
+        finally:
+            await results.put(None)
+
+    workers = [asyncio.create_task(worker()) for _ in range(limit)]
+    finished = 0
+
     try:
-        yield session
+        while finished < len(workers):
+            result = await results.get()
+            if result is None:
+                finished += 1
+                continue
+            if not ordered:
+                yield result
+                continue
+            pending[result.index] = result
+            if next_index in pending:
+                head = next_index
+                while next_index in pending:
+                    next_index += 1
+                async with head_advanced:
+                    head_advanced.notify_all()
+                for index in range(head, next_index):
+                    yield pending.pop(index)
+
+        # Only reachable with gaps if the input iterator itself failed
+        for index in sorted(pending):
+            yield pending.pop(index)
+        if iteration_errors:
+            raise iteration_errors[0]
     finally:
-        pass
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+def ask_many(
+    requests: Iterable[Union[str, Dict[str, Any]]],
+    *,
+    concurrency: Optional[int] = None,
+    backend_limits: Optional[Dict[str, int]] = None,
+    ordered: bool = True,
+    **defaults: Any,
+) -> Iterator[BatchResult]:
+    """
+    Run many prompts concurrently. Synchronous version of ask_many_async().
+
+    Examples:
+        >>> results = list(ask_many(["What is Python?", "What is Rust?"]))
+        >>> for result in results:
+        ...     print(result.response if result.ok else result.error)
+
+        >>> # Process results as soon as each one finishes
+        >>> for result in ask_many(prompts, concurrency=16, ordered=False):
+        ...     print(result.index, result.ok)
+
+    Args:
+        requests: Iterable of prompt strings or request dicts
+        concurrency: Maximum number of requests in flight (default from config)
+        backend_limits: Maximum in-flight requests per backend name, e.g. {"local": 2}
+        ordered: Yield results in input order (True) or as they complete (False)
+        **defaults: Parameters applied to every request unless the item overrides them
+
+    Yields:
+        BatchResult for every input item
+    """
+    # Outstanding requests are cancelled if the caller stops early
+    yield from iterate_in_background(
+        ask_many_async(
+            requests,
+            concurrency=concurrency,
+            backend_limits=backend_limits,
+            ordered=ordered,
+            **defaults,
+        )
+    )
@@ -0,0 +1,466 @@
+"""Response cache for repeated AI requests.
+
+The cache sits between routing and the backend call. Requests are keyed on
+the normalized request (backend, model, prompt, system prompt, sampling
+parameters and tools) and served from an in-memory LRU tier backed by an
+optional on-disk tier.
+
+Cache hits run on the request path, so they do no bookkeeping I/O:
+
+- Disk usage is tracked incrementally after one initial scan. The entry
+  files are only scanned again when the estimate goes over the limit.
+- Hit, miss and eviction counters are kept in memory. They are merged into
+  ``stats.json`` every ``cache.stats_flush_interval`` seconds and at exit,
+  with an atomic replace.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from ..config.loader import get_config_value
+from ..utils import get_logger
+from .models import AIResponse, ImageInput
+
+logger = get_logger(__name__)
+
+_CACHE_VERSION = 1
+
+
+def _normalize_prompt(prompt: Union[str, List[Union[str, ImageInput]]]) -> Any:
+    """Convert a prompt into a JSON-serializable form for hashing."""
+    if isinstance(prompt, str):
+        return prompt
+
+    normalized: List[Any] = []
+    for item in prompt:
+        if isinstance(item, ImageInput):
+            source = item.source
+            entry: Dict[str, Any] = {"mime_type": item.mime_type}
+            if isinstance(source, bytes):
+                entry["image"] = hashlib.sha256(source).hexdigest()
+            else:
+                entry["image"] = str(source)
+                # Local files can change in place, so include their identity
+                path = Path(source)
+                if path.is_file():
+                    stat = path.stat()
+                    entry["mtime"] = stat.st_mtime
+                    entry["size"] = stat.st_size
+            normalized.append(entry)
+        else:
+            normalized.append(item)
+    return normalized
+
+
+def _normalize_tools(tools: Optional[List[Any]]) -> Optional[List[str]]:
+    """Reduce tool definitions to stable names."""
+    if tools is None:
+        return None
+    names = []
+    for tool in tools:
+        if isinstance(tool, str):
+            names.append(tool)
+        else:
+            names.append(str(getattr(tool, "name", None) or getattr(tool, "__name__", repr(tool))))
+    return sorted(names)
+
+
+def make_cache_key(
+    prompt: Union[str, List[Union[str, ImageInput]]],
+    *,
+    backend: str,
+    model: Optional[str],
+    system: Optional[str] = None,
+    temperature: Optional[float] = None,
+    max_tokens: Optional[int] = None,
+    tools: Optional[List[Any]] = None,
+    **kwargs: Any,
+) -> str:
+    """
+    Build a cache key from a normalized request.
+
+    Args:
+        prompt: The request prompt (text or multi-modal content)
+        backend: Name of the backend that will serve the request
+        model: Resolved model name
+        system: System prompt
+        temperature: Sampling temperature
+        max_tokens: Maximum tokens to generate
+        tools: Tools made available to the model
+        **kwargs: Additional backend parameters that affect the response
+
+    Returns:
+        Hex digest identifying the request
+    """
+    payload = {
+        "v": _CACHE_VERSION,
+        "backend": backend,
+        "model": model,
+        "prompt": _normalize_prompt(prompt),
+        "system": system,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        "tools": _normalize_tools(tools),
+        "kwargs": kwargs,
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _serialize_response(response: AIResponse) -> Dict[str, Any]:
+    """Convert an AIResponse into a JSON-serializable entry."""
+    return {
+        "content": str(response),
+        "model": response.model,
+        "backend": response.backend,
+        "tokens_in": response.tokens_in,
+        "tokens_out": response.tokens_out,
+        "time_taken": response.time_taken,
+        "cost": response.cost,
+        "metadata": json.loads(json.dumps(response.metadata or {}, default=str)),
+    }
+
+
+class ResponseCache:
+    """Two-tier (memory + disk) cache for AI responses."""
+
+    def __init__(
+        self,
+        directory: Optional[Union[str, Path]] = None,
+        ttl: Optional[float] = None,
+        memory_max_entries: Optional[int] = None,
+        disk_enabled: Optional[bool] = None,
+        disk_max_bytes: Optional[int] = None,
+    ):
+        """
+        Initialize the response cache.
+
+        Args:
+            directory: Directory for the disk tier (default from config, ~/.ttt/cache)
+            ttl: Seconds an entry stays valid, 0 or None for no expiry
+            memory_max_entries: Maximum number of entries in the memory tier
+            disk_enabled: Whether to persist entries on disk
+            disk_max_bytes: Maximum total size of the disk tier in bytes
+        """
+        self.directory = Path(directory or get_config_value("cache.directory", "~/.ttt/cache")).expanduser()
+        self.ttl = float(ttl if ttl is not None else get_config_value("cache.ttl", 86400))
+        self.memory_max_entries = int(
+            memory_max_entries if memory_max_entries is not None else get_config_value("cache.memory_max_entries", 256)
+        )
+        self.disk_enabled = bool(
+            disk_enabled if disk_enabled is not None else get_config_value("cache.disk_enabled", True)
+        )
+        self.disk_max_bytes = int(
+            disk_max_bytes if disk_max_bytes is not None else get_config_value("cache.disk_max_bytes", 104857600)
+        )
+
+        self.stats_flush_interval = float(get_config_value("cache.stats_flush_interval", 30))
+
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Counter increments not yet merged into stats.json
+        self._pending: Dict[str, int] = {}
+        self._last_flush = time.monotonic()
+        # Estimated size of the disk tier; None until the first scan
+        self._disk_bytes: Optional[int] = None
+
+    @property
+    def _entries_dir(self) -> Path:
+        return self.directory / "entries"
+
+    def _entry_path(self, key: str) -> Path:
+        return self._entries_dir / key[:2] / f"{key}.json"
+
+    def _is_expired(self, entry: Dict[str, Any]) -> bool:
+        return bool(self.ttl) and time.time() - entry.get("created_at", 0) > self.ttl
+
+    def get(self, key: str) -> Optional[AIResponse]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from make_cache_key()
+
+        Returns:
+            AIResponse with cache-hit metadata, or None on a miss
+        """
+        start_time = time.perf_counter()
+        tier = "memory"
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and self._is_expired(entry):
+                del self._memory[key]
+                entry = None
+            if entry is not None:
+                self._memory.move_to_end(key)
+
+        if entry is None and self.disk_enabled:
+            tier = "disk"
+            entry = self._read_disk(key)
+            if entry is not None:
+                self._remember(key, entry)
+
+        if entry is None:
+            self._record("misses")
+            return None
+
+        self._record("hits")
+        data = entry["response"]
+        metadata = dict(data.get("metadata") or {})
+        metadata["cache"] = {
+            "hit": True,
+            "tier": tier,
+            "key": key,
+            "age": time.time() - entry["created_at"],
+            "original_time_taken": data.get("time_taken"),
+            "original_cost": data.get("cost"),
+        }
+        return AIResponse(
+            data["content"],
+            model=data.get("model"),
+            backend=data.get("backend"),
+            tokens_in=data.get("tokens_in"),
+            tokens_out=data.get("tokens_out"),
+            time_taken=time.perf_counter() - start_time,
+            cost=0.0,
+            metadata=metadata,
+        )
+
+    def set(self, key: str, response: AIResponse) -> None:
+        """
+        Store a response in the cache.
+
+        Args:
+            key: Cache key from make_cache_key()
+            response: Response to cache
+        """
+        entry = {"created_at": time.time(), "response": _serialize_response(response)}
+        self._remember(key, entry)
+
+        if self.disk_enabled:
+            self._write_disk(key, entry)
+
+    def clear(self) -> int:
+        """
+        Remove all cached entries from both tiers.
+
+        Returns:
+            Number of entries removed from disk
+        """
+        with self._lock:
+            self._memory.clear()
+            self._pending.clear()
+            self._disk_bytes = 0
+
+        removed = 0
+        if self._entries_dir.exists():
+            for path in self._entries_dir.glob("*/*.json"):
+                try:
+                    path.unlink()
+                    removed += 1
+                except OSError as e:
+                    logger.debug(f"Failed to remove cache entry {path}: {e}")
+        stats_path = self.directory / "stats.json"
+        if stats_path.exists():
+            stats_path.unlink()
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Hit and miss counters are cumulative across processes when the disk
+        tier is enabled; this process's pending counts are flushed first.
+
+        Returns:
+            Dictionary with entry counts, disk usage and hit/miss counters
+        """
+        disk_entries, disk_bytes = self._disk_usage()
+        if self.disk_enabled:
+            self.flush_stats()
+        counters = self._load_counters() if self.disk_enabled else {}
+        hits = counters.get("hits", self.hits)
+        misses = counters.get("misses", self.misses)
+        lookups = hits + misses
+
+        return {
+            "directory": str(self.directory),
+            "memory_entries": len(self._memory),
+            "memory_max_entries": self.memory_max_entries,
+            "disk_enabled": self.disk_enabled,
+            "disk_entries": disk_entries,
+            "disk_bytes": disk_bytes,
+            "disk_max_bytes": self.disk_max_bytes,
+            "ttl": self.ttl,
+            "hits": hits,
+            "misses": misses,
+            "evictions": counters.get("evictions", self.evictions),
+            "hit_rate": hits / lookups if lookups else 0.0,
+        }
+
+    def _remember(self, key: str, entry: Dict[str, Any]) -> None:
+        """Insert into the memory tier, evicting least recently used entries."""
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_max_entries:
+                self._memory.popitem(last=False)
+
+    def _read_disk(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._entry_path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry: Dict[str, Any] = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Discarding unreadable cache entry {path}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+        if self._is_expired(entry):
+            path.unlink(missing_ok=True)
+            return None
+
+        # Touch the file so size-based eviction removes least recently used entries first
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def _write_disk(self, key: str, entry: Dict[str, Any]) -> None:
+        path = self._entry_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            try:
+                replaced = path.stat().st_size
+            except OSError:
+                replaced = 0
+            os.replace(tmp_path, path)
+            written = path.stat().st_size
+        except OSError as e:
+            logger.debug(f"Failed to write cache entry {path}: {e}")
+            return
+
+        with self._lock:
+            if self._disk_bytes is not None:
+                self._disk_bytes += written - replaced
+                over_limit = self._disk_bytes > self.disk_max_bytes
+            else:
+                over_limit = True  # First write: scan once to learn the current usage
+        if over_limit:
+            self._enforce_disk_limit()
+
+    def _disk_files(self) -> List[Tuple[Path, os.stat_result]]:
+        if not self._entries_dir.exists():
+            return []
+        files = []
+        for path in self._entries_dir.glob("*/*.json"):
+            try:
+                files.append((path, path.stat()))
+            except OSError:
+                continue
+        return files
+
+    def _disk_usage(self) -> Tuple[int, int]:
+        files = self._disk_files()
+        return len(files), sum(stat.st_size for _, stat in files)
+
+    def _enforce_disk_limit(self) -> None:
+        """Evict expired entries, then least recently used ones until under the size limit."""
+        files = self._disk_files()
+        total = sum(stat.st_size for _, stat in files)
+        if total <= self.disk_max_bytes:
+            with self._lock:
+                self._disk_bytes = total
+            return
+
+        evicted = 0
+        now = time.time()
+        for path, stat in sorted(files, key=lambda item: item[1].st_mtime):
+            if total <= self.disk_max_bytes and not (self.ttl and now - stat.st_mtime > self.ttl):
+                break
+            try:
+                path.unlink()
+                total -= stat.st_size
+                evicted += 1
+            except OSError:
+                continue
+
+        with self._lock:
+            self._disk_bytes = total
+        if evicted:
+            self._record("evictions", evicted)
+
+    def _load_counters(self) -> Dict[str, int]:
+        try:
+            with open(self.directory / "stats.json", encoding="utf-8") as f:
+                counters: Dict[str, int] = json.load(f)
+                return counters
+        except (OSError, ValueError):
+            return {}
+
+    def _record(self, counter: str, amount: int = 1) -> None:
+        """Update in-process counters; they reach stats.json on the next periodic flush."""
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+            if not self.disk_enabled:
+                return
+            self._pending[counter] = self._pending.get(counter, 0) + amount
+            due = time.monotonic() - self._last_flush >= self.stats_flush_interval
+        if due:
+            self.flush_stats()
+
+    def flush_stats(self) -> None:
+        """Merge pending counter increments into stats.json for `ttt cache stats`."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._last_flush = time.monotonic()
+            if not pending:
+                return
+            counters = self._load_counters()
+            for counter, amount in pending.items():
+                counters[counter] = counters.get(counter, 0) + amount
+            stats_path = self.directory / "stats.json"
+            tmp_path = stats_path.with_suffix(f".{os.getpid()}.tmp")
+            try:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(counters, f)
+                os.replace(tmp_path, stats_path)
+            except OSError as e:
+                logger.debug(f"Failed to persist cache stats: {e}")
+
+
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Get the shared response cache, creating it on first use."""
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache()
+        atexit.register(_response_cache.flush_stats)
+    return _response_cache
+
+
+def cache_enabled(cache: Optional[bool] = None) -> bool:
+    """Resolve whether caching applies, with an explicit flag overriding config."""
+    if cache is not None:
+        return cache
+    return bool(get_config_value("cache.enabled", False))
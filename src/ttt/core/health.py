@@ -0,0 +1,236 @@
+"""Backend health tracking for routing.
+
+Routing needs to know whether a backend is usable on every request, but
+checking (for the local backend, an HTTP request to Ollama) is slow and,
+when the service is down, can cost the full availability timeout. The
+``HealthCache`` answers availability questions from memory:
+
+- Results are cached for ``ttl`` seconds when healthy and ``negative_ttl``
+  seconds when not.
+- A stale result is still returned immediately while a refresh runs in the
+  background on the shared event loop (stale-while-revalidate). Only the
+  very first check of a backend blocks.
+- A per-backend circuit breaker opens after ``failure_threshold``
+  consecutive request failures, marking the backend unavailable for
+  ``reset_timeout`` seconds. After that requests are allowed again
+  (half-open) and the next outcome closes or re-opens the circuit.
+"""
+
+import asyncio
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+from ..config.loader import get_config_value
+from ..utils import get_logger
+from ..utils.async_utils import get_background_loop
+
+logger = get_logger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+@dataclass
+class BackendHealth:
+    """Health state of a single backend."""
+
+    available: Optional[bool] = None
+    checked_at: float = 0.0
+    consecutive_failures: int = 0
+    circuit: str = CLOSED
+    opened_at: float = 0.0
+    last_error: Optional[str] = None
+    refreshing: bool = False
+    backend_ref: Optional[Any] = field(default=None, repr=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "available": self.available,
+            "checked_at": self.checked_at,
+            "consecutive_failures": self.consecutive_failures,
+            "circuit": self.circuit,
+            "last_error": self.last_error,
+        }
+
+
+class HealthCache:
+    """Cached, circuit-broken availability checks for backends."""
+
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        negative_ttl: Optional[float] = None,
+        failure_threshold: Optional[int] = None,
+        reset_timeout: Optional[float] = None,
+        background_refresh: Optional[bool] = None,
+    ):
+        """
+        Initialize the cache. Unset options are read from ``routing.health`` in the config.
+
+        Args:
+            ttl: Seconds a healthy result stays fresh
+            negative_ttl: Seconds an unhealthy result stays fresh
+            failure_threshold: Consecutive request failures that open the circuit
+            reset_timeout: Seconds an open circuit waits before allowing a trial request
+            background_refresh: Refresh stale results in the background instead of blocking
+        """
+        self.ttl = ttl if ttl is not None else get_config_value("routing.health.ttl", 30)
+        self.negative_ttl = (
+            negative_ttl if negative_ttl is not None else get_config_value("routing.health.negative_ttl", 10)
+        )
+        self.failure_threshold = (
+            failure_threshold
+            if failure_threshold is not None
+            else get_config_value("routing.health.failure_threshold", 3)
+        )
+        self.reset_timeout = (
+            reset_timeout if reset_timeout is not None else get_config_value("routing.health.reset_timeout", 30)
+        )
+        self.background_refresh = (
+            background_refresh
+            if background_refresh is not None
+            else get_config_value("routing.health.background_refresh", True)
+        )
+        self._states: Dict[str, BackendHealth] = {}
+        self._lock = threading.Lock()
+
+    def is_available(self, name: str, backend: Any) -> bool:
+        """
+        Check whether a backend is available, answering from memory when possible.
+
+        Args:
+            name: Backend name
+            backend: Backend instance (probed through ``is_available`` / ``check_available``)
+
+        Returns:
+            True if the backend should be used
+        """
+        now = time.monotonic()
+        with self._lock:
+            state = self._state_for(name, backend)
+            if state.circuit == OPEN:
+                if now - state.opened_at < self.reset_timeout:
+                    return False
+                state.circuit = HALF_OPEN
+                logger.debug(f"Circuit for {name} backend half-open; allowing trial requests")
+
+            if state.available is None:
+                probe_now = True
+            else:
+                ttl = self.ttl if state.available else self.negative_ttl
+                stale = now - state.checked_at >= ttl
+                probe_now = stale and not self.background_refresh
+                if stale and self.background_refresh and not state.refreshing:
+                    state.refreshing = self._schedule_refresh(name, backend)
+                    probe_now = not state.refreshing
+                if not probe_now:
+                    return bool(state.available)
+
+        return self._probe(name, backend)
+
+    def record_success(self, name: str) -> None:
+        """Record a successful request, closing the circuit."""
+        with self._lock:
+            state = self._states.setdefault(name, BackendHealth())
+            if state.circuit != CLOSED:
+                logger.info(f"Circuit for {name} backend closed")
+            state.consecutive_failures = 0
+            state.circuit = CLOSED
+            state.available = True
+            state.checked_at = time.monotonic()
+            state.last_error = None
+
+    def record_failure(self, name: str, error: Optional[BaseException] = None) -> None:
+        """Record a failed request, opening the circuit after repeated failures."""
+        with self._lock:
+            state = self._states.setdefault(name, BackendHealth())
+            state.consecutive_failures += 1
+            state.last_error = str(error) if error else None
+            if state.circuit == HALF_OPEN or state.consecutive_failures >= self.failure_threshold:
+                if state.circuit != OPEN:
+                    logger.warning(
+                        f"Circuit for {name} backend opened after {state.consecutive_failures} failures; "
+                        f"retrying in {self.reset_timeout}s"
+                    )
+                state.circuit = OPEN
+                state.opened_at = time.monotonic()
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Forget cached health for one backend, or for all backends."""
+        with self._lock:
+            if name is None:
+                self._states.clear()
+            else:
+                self._states.pop(name, None)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Get the current health state of every tracked backend."""
+        with self._lock:
+            return {name: state.to_dict() for name, state in self._states.items()}
+
+    def _state_for(self, name: str, backend: Any) -> BackendHealth:
+        """Get the state for a backend, resetting it if the backend instance changed."""
+        state = self._states.get(name)
+        if state is None or (state.backend_ref is not None and state.backend_ref() is not backend):
+            state = BackendHealth()
+            self._states[name] = state
+        if state.backend_ref is None:
+            state.backend_ref = self._ref(backend)
+        return state
+
+    @staticmethod
+    def _ref(backend: Any) -> Callable[[], Any]:
+        try:
+            return weakref.ref(backend)
+        except TypeError:
+            return lambda: backend
+
+    def _probe(self, name: str, backend: Any) -> bool:
+        """Check availability synchronously and store the result."""
+        try:
+            available = bool(backend.is_available)
+            error = None
+        except Exception as e:
+            available = False
+            error = str(e)
+        self._store(name, backend, available, error)
+        return available
+
+    def _store(self, name: str, backend: Any, available: bool, error: Optional[str]) -> None:
+        with self._lock:
+            state = self._state_for(name, backend)
+            state.available = available
+            state.checked_at = time.monotonic()
+            state.refreshing = False
+            if error:
+                state.last_error = error
+        logger.debug(f"{name} backend health: {'available' if available else 'unavailable'}")
+
+    def _schedule_refresh(self, name: str, backend: Any) -> bool:
+        """Start refreshing a backend's health on the shared background loop."""
+
+        async def refresh() -> None:
+            try:
+                check = getattr(backend, "check_available", None)
+                if check is not None and asyncio.iscoroutinefunction(check):
+                    available = bool(await check())
+                else:
+                    loop = asyncio.get_running_loop()
+                    available = bool(await loop.run_in_executor(None, lambda: backend.is_available))
+                self._store(name, backend, available, None)
+            except Exception as e:
+                self._store(name, backend, False, str(e))
+
+        try:
+            loop = get_background_loop()
+            asyncio.run_coroutine_threadsafe(refresh(), loop)
+            return True
+        except RuntimeError as e:
+            # Loop unavailable (e.g. during interpreter shutdown); probe synchronously instead
+            logger.debug(f"Could not schedule health refresh for {name}: {e}")
+            return False
@@ -0,0 +1,338 @@
+"""Request hedging: racing a slow request against an alternative.
+
+Falling back only after the primary backend fails does nothing for the
+requests that are merely slow, and an overloaded provider is usually slow
+long before it starts returning errors. With hedging, a request that has
+not answered (or, when streaming, produced its first token) within a
+latency threshold is duplicated to an alternative backend or model, and
+whichever attempt wins is used:
+
+- The threshold is a percentile (p95 by default) of recently observed
+  latencies for the primary backend and model, bounded by ``min_delay``
+  and ``max_delay``. Until enough samples exist, ``delay`` is used.
+- An attempt that fails starts the next alternative immediately.
+- Losing attempts are cancelled. Their spend is recorded: the cost and
+  tokens of losers that completed anyway, and the number cancelled in
+  flight (whose partial spend the provider does not report).
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from ..backends import BaseBackend
+from ..config.loader import get_config_value
+from ..utils import get_logger
+from .models import AIResponse
+
+logger = get_logger(__name__)
+
+Attempt = Tuple[BaseBackend, str]
+
+# Latency kinds: a complete ask() response or the first streamed chunk
+ASK = "ask"
+FIRST_TOKEN = "first_token"
+
+
+def hedging_enabled(hedge: Optional[bool] = None) -> bool:
+    """Resolve whether hedging applies, with an explicit flag overriding config."""
+    if hedge is not None:
+        return hedge
+    return bool(get_config_value("routing.hedging.enabled", False))
+
+
+class LatencyTracker:
+    """Rolling latency samples per backend and model, plus hedging statistics."""
+
+    def __init__(self, window: Optional[int] = None):
+        """
+        Initialize the tracker.
+
+        Args:
+            window: Samples kept per backend/model (default from ``routing.hedging.window``)
+        """
+        self.window = int(window or get_config_value("routing.hedging.window", 200))
+        self._samples: Dict[Tuple[str, str, str], Deque[float]] = {}
+        self._lock = threading.Lock()
+        self.stats: Dict[str, Any] = {
+            "requests": 0,
+            "hedged": 0,
+            "hedge_wins": 0,
+            "cancelled": 0,
+            "wasted_cost": 0.0,
+            "wasted_tokens": 0,
+        }
+
+    def record(self, kind: str, backend: str, model: str, seconds: float) -> None:
+        """Record an observed latency."""
+        with self._lock:
+            samples = self._samples.get((kind, backend, model))
+            if samples is None:
+                samples = self._samples[(kind, backend, model)] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def percentile(self, kind: str, backend: str, model: str, percentile: float) -> Optional[float]:
+        """Get a latency percentile, or None if there are no samples."""
+        with self._lock:
+            samples = sorted(self._samples.get((kind, backend, model), ()))
+        if not samples:
+            return None
+        index = min(int(len(samples) * percentile / 100), len(samples) - 1)
+        return samples[index]
+
+    def sample_count(self, kind: str, backend: str, model: str) -> int:
+        """Get the number of samples held for a backend and model."""
+        with self._lock:
+            return len(self._samples.get((kind, backend, model), ()))
+
+    def hedge_delay(self, kind: str, backend: str, model: str) -> float:
+        """Get the seconds to wait for an attempt before hedging it."""
+        delay = float(get_config_value("routing.hedging.delay", 2.0))
+        if self.sample_count(kind, backend, model) >= int(get_config_value("routing.hedging.min_samples", 20)):
+            observed = self.percentile(kind, backend, model, float(get_config_value("routing.hedging.percentile", 95)))
+            if observed is not None:
+                delay = observed
+        min_delay = float(get_config_value("routing.hedging.min_delay", 0.25))
+        max_delay = float(get_config_value("routing.hedging.max_delay", 10.0))
+        return min(max(delay, min_delay), max_delay)
+
+    def record_race(self, attempts: int, winner: int, cancelled: int, wasted_cost: float, wasted_tokens: int) -> None:
+        """Add the outcome of a race to the statistics."""
+        with self._lock:
+            self.stats["requests"] += 1
+            if attempts > 1:
+                self.stats["hedged"] += 1
+            if winner > 0:
+                self.stats["hedge_wins"] += 1
+            self.stats["cancelled"] += cancelled
+            self.stats["wasted_cost"] += wasted_cost
+            self.stats["wasted_tokens"] += wasted_tokens
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get a copy of the hedging statistics."""
+        with self._lock:
+            return dict(self.stats)
+
+
+def _attempt_name(attempt: Attempt) -> str:
+    backend, model = attempt
+    return f"{backend.name}/{model}"
+
+
+async def _cancel_losers(tasks: Set["asyncio.Task[Any]"]) -> int:
+    """Cancel unfinished attempts and wait for them to unwind, returning how many were cancelled."""
+    cancelled = 0
+    for task in tasks:
+        if not task.done():
+            task.cancel()
+            cancelled += 1
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
+    return cancelled
+
+
+async def race_ask(
+    attempts: List[Attempt],
+    call: Callable[[BaseBackend, str], Awaitable[AIResponse]],
+    delay: float,
+    tracker: LatencyTracker,
+) -> AIResponse:
+    """
+    Run a request, hedging it with the next attempt whenever it is slower than ``delay``.
+
+    Args:
+        attempts: Backend and model pairs, primary first
+        call: Function sending the request to a backend and model
+        delay: Seconds to wait for an attempt before starting the next one
+        tracker: Tracker receiving latencies and the race outcome
+
+    Returns:
+        The first successful response, or the last failure if every attempt failed
+
+    Raises:
+        Exception: The last attempt's exception if every attempt raised
+    """
+
+    async def timed(index: int) -> AIResponse:
+        backend, model = attempts[index]
+        started = time.perf_counter()
+        response = await call(backend, model)
+        if not response.failed:
+            tracker.record(ASK, backend.name, model, time.perf_counter() - started)
+        return response
+
+    tasks: Dict["asyncio.Task[AIResponse]", int] = {}
+
+    def launch(index: int) -> "asyncio.Task[AIResponse]":
+        if index > 0:
+            logger.info(f"Hedging request to {_attempt_name(attempts[0])} with {_attempt_name(attempts[index])}")
+        task = asyncio.ensure_future(timed(index))
+        tasks[task] = index
+        return task
+
+    pending = {launch(0)}
+    launched = 1
+    last_failure: Optional[AIResponse] = None
+    last_error: Optional[BaseException] = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=delay if launched < len(attempts) else None,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not done:
+                pending.add(launch(launched))
+                launched += 1
+                continue
+
+            winner = None
+            for task in done:
+                if task.exception() is not None:
+                    last_error = task.exception()
+                    logger.debug(f"Attempt {_attempt_name(attempts[tasks[task]])} failed: {last_error}")
+                elif task.result().failed:
+                    last_failure = task.result()
+                elif winner is None or tasks[task] < tasks[winner]:
+                    winner = task
+
+            if winner is not None:
+                response = winner.result()
+                wasted = [t.result() for t in done if t is not winner and not t.exception() and not t.result().failed]
+                cancelled = await _cancel_losers(pending)
+                pending = set()
+                wasted_cost = sum(r.cost or 0.0 for r in wasted)
+                wasted_tokens = sum((r.tokens_in or 0) + (r.tokens_out or 0) for r in wasted)
+                tracker.record_race(launched, tasks[winner], cancelled, wasted_cost, wasted_tokens)
+                if launched > 1:
+                    response.metadata["hedge"] = {
+                        "attempts": launched,
+                        "winner": _attempt_name(attempts[tasks[winner]]),
+                        "delay": delay,
+                        "cancelled": cancelled,
+                        "wasted_cost": wasted_cost,
+                        "wasted_tokens": wasted_tokens,
+                    }
+                return response
+
+            # Every finished attempt failed; start the next alternative straight away
+            if launched < len(attempts):
+                pending.add(launch(launched))
+                launched += 1
+    finally:
+        await _cancel_losers(pending)
+
+    tracker.record_race(launched, 0, 0, 0.0, 0)
+    if last_failure is not None:
+        return last_failure
+    assert last_error is not None
+    raise last_error
+
+
+async def race_stream(
+    attempts: List[Attempt],
+    open_stream: Callable[[BaseBackend, str], AsyncIterator[str]],
+    delay: float,
+    tracker: LatencyTracker,
+) -> AsyncIterator[str]:
+    """
+    Stream a response, hedging it with the next attempt whenever its first chunk is slower than ``delay``.
+
+    The first attempt to produce a chunk wins; the others are cancelled and
+    their streams closed.
+
+    Args:
+        attempts: Backend and model pairs, primary first
+        open_stream: Function starting a stream from a backend and model
+        delay: Seconds to wait for a first chunk before starting the next attempt
+        tracker: Tracker receiving first-token latencies and the race outcome
+
+    Yields:
+        String chunks of the winning stream
+
+    Raises:
+        Exception: The last attempt's exception if every attempt failed
+    """
+
+    async def first_chunk(index: int) -> Tuple[AsyncIterator[str], Optional[str]]:
+        backend, model = attempts[index]
+        started = time.perf_counter()
+        chunks = open_stream(backend, model)
+        try:
+            chunk: Optional[str] = await chunks.__anext__()
+        except StopAsyncIteration:
+            chunk = None
+        tracker.record(FIRST_TOKEN, backend.name, model, time.perf_counter() - started)
+        return chunks, chunk
+
+    tasks: Dict["asyncio.Task[Tuple[AsyncIterator[str], Optional[str]]]", int] = {}
+
+    def launch(index: int) -> "asyncio.Task[Tuple[AsyncIterator[str], Optional[str]]]":
+        if index > 0:
+            logger.info(f"Hedging stream from {_attempt_name(attempts[0])} with {_attempt_name(attempts[index])}")
+        task = asyncio.ensure_future(first_chunk(index))
+        tasks[task] = index
+        return task
+
+    pending = {launch(0)}
+    launched = 1
+    last_error: Optional[BaseException] = None
+    winner_stream: Optional[AsyncIterator[str]] = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=delay if launched < len(attempts) else None,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not done:
+                pending.add(launch(launched))
+                launched += 1
+                continue
+
+            successes = sorted((t for t in done if t.exception() is None), key=lambda t: tasks[t])
+            for task in done:
+                if task.exception() is not None:
+                    last_error = task.exception()
+                    logger.debug(f"Stream from {_attempt_name(attempts[tasks[task]])} failed: {last_error}")
+
+            if successes:
+                winner = successes[0]
+                winner_stream, first = winner.result()
+                for loser in successes[1:]:
+                    await _close_stream(loser.result()[0])
+                cancelled = await _cancel_losers(pending)
+                pending = set()
+                tracker.record_race(launched, tasks[winner], cancelled + len(successes) - 1, 0.0, 0)
+                if first is not None:
+                    yield first
+                async for chunk in winner_stream:
+                    yield chunk
+                return
+
+            if launched < len(attempts):
+                pending.add(launch(launched))
+                launched += 1
+    finally:
+        await _cancel_losers(pending)
+        for task in pending:
+            if not task.cancelled() and task.exception() is None:
+                await _close_stream(task.result()[0])
+        if winner_stream is not None:
+            await _close_stream(winner_stream)
+
+    tracker.record_race(launched, 0, 0, 0.0, 0)
+    assert last_error is not None
+    raise last_error
+
+
+async def _close_stream(chunks: AsyncIterator[str]) -> None:
+    """Close an async generator stream if it supports it."""
+    aclose = getattr(chunks, "aclose", None)
+    if aclose is not None:
+        try:
+            await aclose()
+        except Exception as e:
+            logger.debug(f"Error closing losing stream: {e}")
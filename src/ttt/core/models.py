@@ -1,7 +1,7 @@
 """Core data models for the AI library."""
 
 import base64
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union, cast
@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union, cast
 from pydantic import BaseModel, ConfigDict, Field
 
 if TYPE_CHECKING:
-    from ttt.tools.base import ToolResult
+    from ttt.tools.base import ToolCall, ToolResult
 
 
 class AIResponse(str):
@@ -112,6 +112,46 @@ class AIResponse(str):
         )
 
 
+@dataclass
+class StreamEvent:
+    """
+    A typed event from a streaming response.
+
+    Event types:
+        text: A chunk of response text (``text``)
+        tool_start: The model finished a tool call and it was dispatched (``tool_call``)
+        tool_result: A dispatched tool call finished (``tool_call`` with result or error)
+        usage: Token usage reported by the provider (``usage``; ``data`` may hold
+            ``cost`` and ``finish_reason``)
+        first_token: The first text arrived (``data["time_to_first_token"]``)
+        done: The stream finished (``usage`` totals; ``data`` holds timing, model and cost)
+
+    ``elapsed`` is the number of seconds since the request started, set by
+    ``stream_events()``.
+    """
+
+    type: str
+    text: str = ""
+    tool_call: Optional["ToolCall"] = None
+    usage: Optional[Dict[str, Any]] = None
+    data: Dict[str, Any] = field(default_factory=dict)
+    elapsed: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        result: Dict[str, Any] = {"type": self.type}
+        if self.elapsed is not None:
+            result["elapsed"] = self.elapsed
+        if self.text:
+            result["text"] = self.text
+        if self.tool_call is not None:
+            result["tool_call"] = self.tool_call.to_dict()
+        if self.usage is not None:
+            result["usage"] = self.usage
+        result.update(self.data)
+        return result
+
+
 @dataclass
 class ModelInfo:
     """Information about an available AI model."""
@@ -133,6 +173,43 @@ class ModelInfo:
             self.capabilities = []
 
 
+@dataclass
+class BatchResult:
+    """Outcome of a single request in a batch run."""
+
+    index: int
+    request: Dict[str, Any]
+    response: Optional[AIResponse] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """Check if the request succeeded."""
+        return self.error is None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        result: Dict[str, Any] = {"index": self.index, "ok": self.ok}
+        if "id" in self.request:
+            result["id"] = self.request["id"]
+        if self.response is not None:
+            result.update(
+                {
+                    "response": str(self.response),
+                    "model": self.response.model,
+                    "backend": self.response.backend,
+                    "tokens_in": self.response.tokens_in,
+                    "tokens_out": self.response.tokens_out,
+                    "time_taken": self.response.time_taken,
+                    "cost": self.response.cost,
+                }
+            )
+        if self.error is not None:
+            result["error"] = str(self.error)
+            result["error_type"] = self.error.__class__.__name__
+        return result
+
+
 class ConfigModel(BaseModel):
     """Configuration model for the AI library."""
 
@@ -174,11 +251,14 @@ class ConfigModel(BaseModel):
     backends: Dict[str, Any] = Field(default_factory=dict)
     tools: Dict[str, Any] = Field(default_factory=dict)
     chat: Dict[str, Any] = Field(default_factory=dict)
+    cache: Dict[str, Any] = Field(default_factory=dict)
+    server: Dict[str, Any] = Field(default_factory=dict)
     logging: Dict[str, Any] = Field(default_factory=dict)
     paths: Dict[str, Any] = Field(default_factory=dict)
     env_mappings: Dict[str, Any] = Field(default_factory=dict)
     routing: Dict[str, Any] = Field(default_factory=dict)
     files: Dict[str, Any] = Field(default_factory=dict)
+    rate_limits: Dict[str, Any] = Field(default_factory=dict)
     constants: Dict[str, Any] = Field(default_factory=dict)  # Centralized constants
 
     model_config = ConfigDict(extra="forbid")
@@ -0,0 +1,439 @@
+"""Client-side rate limiting for cloud providers.
+
+Providers enforce request and token quotas per minute and answer with 429
+once a client exceeds them. Rather than sending requests until they fail,
+cloud requests pass through a scheduler that keeps them within the quota:
+
+- Every provider and every model has a ``RateLimiter`` with optional
+  requests-per-minute and tokens-per-minute token buckets, configured under
+  ``rate_limits`` and updated from the ``x-ratelimit-*`` (OpenAI) and
+  ``anthropic-ratelimit-*`` response headers.
+- Requests that do not fit the buckets wait in a queue ordered by priority
+  (higher first, then arrival) instead of failing. A request that would
+  wait longer than ``max_wait`` raises ``RateLimitError``.
+- A 429 pauses the model's queue for the ``retry-after`` period and, when
+  a request limit is known, cuts the rate by ``backoff_factor``. Successful
+  requests grow the rate back towards the limit.
+"""
+
+import asyncio
+import heapq
+import itertools
+import math
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from ..config.loader import get_config_value
+from ..utils import get_logger
+from .exceptions import RateLimitError
+
+logger = get_logger(__name__)
+
+# Prefix LiteLLM puts on the provider's response headers
+_PROVIDER_HEADER_PREFIX = "llm_provider-"
+
+# Header names per quota kind: (limit, remaining)
+_LIMIT_HEADERS = {
+    "requests": (
+        ("x-ratelimit-limit-requests", "x-ratelimit-remaining-requests"),
+        ("anthropic-ratelimit-requests-limit", "anthropic-ratelimit-requests-remaining"),
+    ),
+    "tokens": (
+        ("x-ratelimit-limit-tokens", "x-ratelimit-remaining-tokens"),
+        ("anthropic-ratelimit-tokens-limit", "anthropic-ratelimit-tokens-remaining"),
+    ),
+}
+
+
+class TokenBucket:
+    """A per-minute quota that refills continuously."""
+
+    def __init__(self, per_minute: float):
+        """
+        Initialize a full bucket.
+
+        Args:
+            per_minute: Units (requests or tokens) allowed per minute
+        """
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        """Add the units accrued since the last update."""
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Get the seconds until ``amount`` units are available."""
+        self.refill(now)
+        # A request larger than the bucket is let through once the bucket is full
+        needed = min(amount, self.capacity) - self.level
+        return needed / self.rate if needed > 0 else 0.0
+
+    def take(self, amount: float) -> None:
+        """Consume units; the level may go negative when usage is reconciled."""
+        self.level -= amount
+
+    def set_limit(self, per_minute: float, remaining: Optional[float] = None) -> None:
+        """Apply a limit reported by the provider."""
+        self.refill(time.monotonic())
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        if remaining is not None:
+            self.level = min(float(remaining), self.capacity)
+        else:
+            self.level = min(self.level, self.capacity)
+
+
+class _Waiter:
+    """A request queued for a rate limiter."""
+
+    __slots__ = ("event", "loop")
+
+    def __init__(self) -> None:
+        self.loop = asyncio.get_running_loop()
+        self.event = asyncio.Event()
+
+    def wake(self) -> None:
+        """Wake the waiter from any thread."""
+        try:
+            self.loop.call_soon_threadsafe(self.event.set)
+        except RuntimeError:
+            pass  # Its loop is closed
+
+
+class RateLimiter:
+    """Priority queue in front of request and token buckets for one provider or model."""
+
+    def __init__(self, name: str, requests_per_minute: float = 0, tokens_per_minute: float = 0):
+        """
+        Initialize the limiter.
+
+        Args:
+            name: Provider or provider/model the limits apply to
+            requests_per_minute: Request quota, 0 for none until a limit is learned
+            tokens_per_minute: Token quota, 0 for none until a limit is learned
+        """
+        self.name = name
+        self.provider = name.split("/", 1)[0]
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        # Configured quota, which limits reported by the provider never exceed
+        self._configured = float(requests_per_minute) if requests_per_minute else None
+        # Rate the request bucket grows back to after a 429 cut it
+        self._ceiling = self._configured
+        self.blocked_until = 0.0
+        self._queue: List[Tuple[int, int, _Waiter]] = []
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self.stats: Dict[str, Any] = {"requests": 0, "queued": 0, "wait_time": 0.0, "throttled": 0}
+
+    async def acquire(self, tokens: int = 0, priority: int = 0, max_wait: Optional[float] = None) -> float:
+        """
+        Wait until a request of ``tokens`` tokens fits the quota, then consume it.
+
+        Args:
+            tokens: Estimated tokens of the request
+            priority: Higher priorities leave the queue first
+            max_wait: Seconds to wait at most, None for no limit
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            RateLimitError: If the request would wait longer than ``max_wait``
+        """
+        waiter = _Waiter()
+        started = time.monotonic()
+        deadline = started + max_wait if max_wait is not None else None
+        with self._lock:
+            heapq.heappush(self._queue, (-priority, next(self._seq), waiter))
+
+        try:
+            while True:
+                with self._lock:
+                    now = time.monotonic()
+                    delay: Optional[float] = None
+                    if self._queue[0][2] is waiter:
+                        delay = self._delay(tokens, now)
+                        if delay <= 0:
+                            heapq.heappop(self._queue)
+                            self._take(tokens)
+                            self._wake_head()
+                            waited = now - started
+                            self.stats["requests"] += 1
+                            if waited > 0.001:
+                                self.stats["queued"] += 1
+                                self.stats["wait_time"] += waited
+                            return waited
+
+                timeout = delay
+                if deadline is not None:
+                    if now + (delay or 0.0) > deadline:
+                        raise RateLimitError(self.provider, math.ceil(delay or max_wait or 0))
+                    timeout = deadline - now if delay is None else delay
+
+                waiter.event.clear()
+                try:
+                    await asyncio.wait_for(waiter.event.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+        except BaseException:
+            with self._lock:
+                self._queue = [entry for entry in self._queue if entry[2] is not waiter]
+                heapq.heapify(self._queue)
+                self._wake_head()
+            raise
+
+    def refund(self, tokens: int = 0) -> None:
+        """
+        Return the units of a request that was admitted but never sent.
+
+        Args:
+            tokens: Estimated tokens the request took when it was admitted
+        """
+        with self._lock:
+            if self.requests is not None:
+                self.requests.take(-1)
+            if self.tokens is not None:
+                self.tokens.take(-tokens)
+            self.stats["requests"] -= 1
+            self._wake_head()
+
+    def record(self, estimated_tokens: int, actual_tokens: Optional[int], headers: Optional[Mapping[str, Any]]) -> None:
+        """
+        Reconcile a completed request with its real usage and the provider's limit headers.
+
+        Args:
+            estimated_tokens: Tokens taken from the bucket when the request was admitted
+            actual_tokens: Tokens the provider reported, if known
+            headers: Response headers, if available
+        """
+        with self._lock:
+            if self.tokens is not None and actual_tokens is not None:
+                self.tokens.take(actual_tokens - estimated_tokens)
+            if headers:
+                self._apply_headers(headers)
+            if self.requests is not None and self._ceiling and self.requests.capacity < self._ceiling:
+                # Grow back towards the ceiling after a 429 cut the rate
+                recovery = float(get_config_value("rate_limits.recovery", 0.05))
+                self.requests.set_limit(min(self._ceiling, self.requests.capacity * (1 + recovery)))
+
+    def throttle(self, retry_after: Optional[float]) -> None:
+        """
+        React to a 429: pause the queue and cut the request rate.
+
+        Args:
+            retry_after: Seconds the provider asked to wait, if it said
+        """
+        if retry_after is None:
+            retry_after = float(get_config_value("rate_limits.default_backoff", 5))
+        backoff_factor = float(get_config_value("rate_limits.backoff_factor", 0.5))
+        with self._lock:
+            now = time.monotonic()
+            self.stats["throttled"] += 1
+            self.blocked_until = max(self.blocked_until, now + retry_after)
+            if self.requests is not None:
+                self.requests.set_limit(max(self.requests.capacity * backoff_factor, 1.0), remaining=0)
+        logger.info(f"Rate limited by {self.name}; pausing {retry_after:.1f}s")
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get the limits and statistics of this limiter."""
+        with self._lock:
+            return {
+                **self.stats,
+                "requests_per_minute": self.requests.capacity if self.requests else None,
+                "tokens_per_minute": self.tokens.capacity if self.tokens else None,
+                "waiting": len(self._queue),
+            }
+
+    def _delay(self, tokens: int, now: float) -> float:
+        delay = self.blocked_until - now
+        if self.requests is not None:
+            delay = max(delay, self.requests.wait_time(1, now))
+        if self.tokens is not None and tokens:
+            delay = max(delay, self.tokens.wait_time(tokens, now))
+        return delay
+
+    def _take(self, tokens: int) -> None:
+        if self.requests is not None:
+            self.requests.take(1)
+        if self.tokens is not None:
+            self.tokens.take(tokens)
+
+    def _wake_head(self) -> None:
+        if self._queue:
+            self._queue[0][2].wake()
+
+    def _apply_headers(self, headers: Mapping[str, Any]) -> None:
+        normalized = {str(k).lower().replace(_PROVIDER_HEADER_PREFIX, "", 1): v for k, v in headers.items()}
+        for kind, names in _LIMIT_HEADERS.items():
+            for limit_name, remaining_name in names:
+                limit = _header_number(normalized.get(limit_name))
+                if not limit:
+                    continue
+                remaining = _header_number(normalized.get(remaining_name))
+                if kind == "requests":
+                    ceiling = min(limit, self._configured) if self._configured else limit
+                    if self.requests is None:
+                        self.requests = TokenBucket(ceiling)
+                    # Keep a rate cut by a recent 429 in place; it recovers towards the ceiling
+                    self.requests.set_limit(min(self.requests.capacity, ceiling), remaining)
+                    self._ceiling = ceiling
+                else:
+                    if self.tokens is None:
+                        self.tokens = TokenBucket(limit)
+                    self.tokens.set_limit(limit, remaining)
+                break
+
+
+def _header_number(value: Any) -> Optional[float]:
+    """Parse a numeric header value."""
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_retry_after(value: Any) -> Optional[float]:
+    """
+    Parse a ``retry-after`` header: seconds or an HTTP/ISO date.
+
+    Args:
+        value: Header value
+
+    Returns:
+        Seconds to wait, or None if the value cannot be parsed
+    """
+    if value is None:
+        return None
+    seconds = _header_number(value)
+    if seconds is not None:
+        return max(seconds, 0.0)
+    try:
+        from email.utils import parsedate_to_datetime
+
+        when = parsedate_to_datetime(str(value))
+    except (TypeError, ValueError):
+        try:
+            when = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class RateLimitScheduler:
+    """Rate limiters per provider and per model, created from the ``rate_limits`` config."""
+
+    def __init__(self) -> None:
+        self._limiters: Dict[str, RateLimiter] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Check if requests are rate limited."""
+        return bool(get_config_value("rate_limits.enabled", True))
+
+    def limiters(self, provider: str, model: str) -> List[RateLimiter]:
+        """Get the limiters a request to a model must pass: the model's, then the provider's."""
+        return [self._limiter(f"{provider}/{model}", "models", model), self._limiter(provider, "providers", provider)]
+
+    async def acquire(self, provider: str, model: str, tokens: int, priority: int = 0) -> float:
+        """
+        Wait until a request fits the model and provider quotas.
+
+        Args:
+            provider: Provider name
+            model: Model name
+            tokens: Estimated tokens of the request
+            priority: Higher priorities leave the queue first
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            RateLimitError: If the request would wait longer than ``rate_limits.max_wait``
+        """
+        max_wait = get_config_value("rate_limits.max_wait", 60)
+        waited = 0.0
+        acquired: List[RateLimiter] = []
+        try:
+            for limiter in self.limiters(provider, model):
+                waited += await limiter.acquire(tokens, priority, float(max_wait) if max_wait else None)
+                acquired.append(limiter)
+        except BaseException:
+            # The request is not sent, so the quotas already taken for it go back
+            for limiter in acquired:
+                limiter.refund(tokens)
+            raise
+        return waited
+
+    def record(
+        self,
+        provider: str,
+        model: str,
+        estimated_tokens: int,
+        actual_tokens: Optional[int] = None,
+        headers: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        """Reconcile a completed request; limit headers apply to the model's limiter."""
+        model_limiter, provider_limiter = self.limiters(provider, model)
+        model_limiter.record(estimated_tokens, actual_tokens, headers)
+        provider_limiter.record(estimated_tokens, actual_tokens, None)
+
+    def throttle(self, provider: str, model: str, retry_after: Optional[float]) -> None:
+        """Pause and slow down a model after the provider rate limited it."""
+        self.limiters(provider, model)[0].throttle(retry_after)
+
+    def estimate_tokens(self, params: Mapping[str, Any]) -> int:
+        """Estimate the tokens a completion request uses: its prompt plus the completion."""
+        characters = 0
+        for message in params.get("messages") or []:
+            content = message.get("content") if isinstance(message, Mapping) else None
+            if isinstance(content, str):
+                characters += len(content)
+            elif isinstance(content, list):
+                characters += sum(len(str(part.get("text", ""))) for part in content if isinstance(part, Mapping))
+        completion = params.get("max_tokens") or get_config_value("rate_limits.completion_tokens_estimate", 512)
+        return characters // 4 + int(completion)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Get the limits and statistics of every limiter."""
+        with self._lock:
+            limiters = dict(self._limiters)
+        return {name: limiter.snapshot() for name, limiter in limiters.items()}
+
+    def _limiter(self, name: str, section: str, key: str) -> RateLimiter:
+        with self._lock:
+            limiter = self._limiters.get(name)
+            if limiter is None:
+                limits = (get_config_value(f"rate_limits.{section}", {}) or {}).get(key)
+                if limits is None and section == "providers":
+                    limits = get_config_value("rate_limits.default", {})
+                limits = limits or {}
+                limiter = self._limiters[name] = RateLimiter(
+                    name,
+                    requests_per_minute=limits.get("requests_per_minute", 0) or 0,
+                    tokens_per_minute=limits.get("tokens_per_minute", 0) or 0,
+                )
+            return limiter
+
+
+_scheduler: Optional[RateLimitScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimitScheduler:
+    """Get the shared rate limit scheduler."""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = RateLimitScheduler()
+    return _scheduler
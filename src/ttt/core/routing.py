@@ -2,11 +2,15 @@
 
 from typing import Any, Dict, List, Optional, Union, cast
 
+import httpx
+
 from ..backends import HAS_LOCAL_BACKEND, BaseBackend, CloudBackend
 from ..config.schema import get_config
 from ..plugins.loader import plugin_registry
 from ..utils import get_logger
-from .exceptions import BackendNotAvailableError
+from .exceptions import BackendConnectionError, BackendNotAvailableError, BackendTimeoutError
+from .health import HealthCache
+from .hedging import Attempt, LatencyTracker
 from .models import AIResponse, ImageInput
 
 if HAS_LOCAL_BACKEND:
@@ -14,6 +18,57 @@ if HAS_LOCAL_BACKEND:
 
 logger = get_logger(__name__)
 
+# Errors that say something about a backend's health (as opposed to the request)
+HEALTH_ERRORS = (BackendConnectionError, BackendTimeoutError, BackendNotAvailableError, ConnectionError, TimeoutError)
+
+# Provider exception classes (LiteLLM, OpenAI SDK) for transport failures and 5xx responses
+_TRANSPORT_ERROR_NAMES = frozenset(
+    {
+        "APIConnectionError",
+        "APITimeoutError",
+        "Timeout",
+        "ServiceUnavailableError",
+        "InternalServerError",
+        "BadGatewayError",
+    }
+)
+
+
+def _status_code_of(error: BaseException) -> Optional[int]:
+    """Get the HTTP status an exception carries, if any."""
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def is_health_error(error: BaseException) -> bool:
+    """
+    Decide whether a failure should count toward the backend's circuit breaker.
+
+    Only transport failures, timeouts and 5xx responses do. Backends wrap
+    provider errors they do not classify in BackendConnectionError, so its
+    cause decides: a 400, context-length or content-policy error says
+    nothing about the backend's health.
+
+    Args:
+        error: The exception a backend request raised
+
+    Returns:
+        True if the error indicates an unhealthy backend
+    """
+    if not isinstance(error, HEALTH_ERRORS):
+        return False
+    if not isinstance(error, BackendConnectionError):
+        return True
+    cause = error.__cause__
+    if cause is None or isinstance(cause, (ConnectionError, TimeoutError, httpx.TransportError)):
+        return True
+    status = _status_code_of(cause)
+    if status is not None:
+        return status >= 500
+    return type(cause).__name__ in _TRANSPORT_ERROR_NAMES
+
 
 class Router:
     """
@@ -23,6 +78,7 @@ class Router:
     - Backend selection (local vs cloud vs auto)
     - Model resolution (aliases to actual models)
     - Fallback handling when primary backend fails
+    - Hedging slow requests with alternative backends or models
     - Smart routing based on query type
     """
 
@@ -31,10 +87,13 @@ class Router:
         self._backends: Dict[str, BaseBackend] = {}
         self._local_models_cache: Optional[List[str]] = None
         self._cache_timestamp: Optional[float] = None
+        self._local_models_refreshing = False
         # Get cache TTL from constants
         from ..config.loader import get_config_value
 
         self._cache_ttl = get_config_value("constants.timeouts.cache_ttl", 30)  # Cache TTL in seconds
+        self.health = HealthCache()
+        self.latency = LatencyTracker()
 
     def get_backend(self, backend_name: str) -> BaseBackend:
         """Get or create a backend instance."""
@@ -101,7 +160,7 @@ class Router:
         """
         try:
             backend = self.get_backend(backend_name)
-            if backend.is_available:
+            if self.is_backend_available(backend_name, backend):
                 logger.debug(success_message)
                 return backend
         except (BackendNotAvailableError, ImportError, ConnectionError) as e:
@@ -110,6 +169,29 @@ class Router:
             log_level(f"{backend_name.title()} backend not available: {e}")
         return None
 
+    def is_backend_available(self, backend_name: str, backend: Optional[BaseBackend] = None) -> bool:
+        """
+        Check backend availability through the health cache.
+
+        Args:
+            backend_name: Name of the backend
+            backend: Backend instance (looked up by name if not given)
+
+        Returns:
+            True if the backend is healthy and its circuit is not open
+        """
+        if backend is None:
+            backend = self.get_backend(backend_name)
+        return self.health.is_available(backend_name, backend)
+
+    def record_success(self, backend: BaseBackend) -> None:
+        """Record a successful request for the backend's circuit breaker."""
+        self.health.record_success(backend.name)
+
+    def record_failure(self, backend: BaseBackend, error: Optional[BaseException] = None) -> None:
+        """Record a failed request for the backend's circuit breaker."""
+        self.health.record_failure(backend.name, error)
+
     def _auto_select_backend(self) -> BaseBackend:
         """
         Automatically select the best available backend.
@@ -166,6 +248,9 @@ class Router:
         """
         Check if a model is available locally with caching.
 
+        A stale model list is still used while it is refreshed in the
+        background; only the first check blocks on the network.
+
         Args:
             model: Model name to check
             local_backend: Local backend instance
@@ -177,47 +262,16 @@ class Router:
 
         current_time = time.time()
 
-        # Check if cache is still valid
-        if (
-            self._local_models_cache is not None
-            and self._cache_timestamp is not None
-            and current_time - self._cache_timestamp < self._cache_ttl
-        ):
+        if self._local_models_cache is not None and self._cache_timestamp is not None:
+            if current_time - self._cache_timestamp >= self._cache_ttl and not self._local_models_refreshing:
+                self._refresh_local_models_in_background(local_backend)
             return model in self._local_models_cache
 
-        # Cache is stale or missing, refresh it
+        # No model list yet, fetch it now
         try:
-            import httpx
-
             from ..utils import run_async
 
-            async def fetch_local_models() -> List[str]:
-                """Fetch available local models using proper resource management."""
-                if local_backend is None:
-                    return []
-
-                try:
-                    # Use backend health check timeout from constants
-                    from ..config.loader import get_config_value
-
-                    health_check_timeout = get_config_value("constants.timeouts.backend_health_check", 3)
-
-                    # Use async context manager to ensure proper HTTP client cleanup
-                    async with httpx.AsyncClient(timeout=health_check_timeout) as client:
-                        response = await client.get(f"{local_backend.base_url}/api/tags")
-                        try:
-                            if response.status_code == 200:
-                                data = response.json()
-                                return [m["name"] for m in data.get("models", [])]
-                            return []
-                        finally:
-                            # Ensure response is properly closed
-                            await response.aclose()
-
-                except (ConnectionError, TimeoutError, ValueError, httpx.RequestError, httpx.HTTPStatusError):
-                    return []
-
-            available_models = run_async(fetch_local_models())
+            available_models = run_async(self._fetch_local_models(local_backend))
             self._local_models_cache = available_models
             self._cache_timestamp = current_time
 
@@ -227,6 +281,40 @@ class Router:
             logger.debug(f"Failed to fetch local models: {e}")
             return False
 
+    async def _fetch_local_models(self, local_backend: Optional[Any]) -> List[str]:
+        """Fetch available local models; refreshes reuse the backend's pooled connections."""
+        if local_backend is None:
+            return []
+
+        # Use backend health check timeout from constants
+        from ..config.loader import get_config_value
+
+        health_check_timeout = get_config_value("constants.timeouts.backend_health_check", 3)
+        names: List[str] = await local_backend.model_names(timeout=health_check_timeout)
+        return names
+
+    def _refresh_local_models_in_background(self, local_backend: Optional[Any]) -> None:
+        """Refresh the local model list on the shared background loop."""
+        import asyncio
+        import time
+
+        from ..utils.async_utils import get_background_loop
+
+        async def refresh() -> None:
+            try:
+                self._local_models_cache = await self._fetch_local_models(local_backend)
+                self._cache_timestamp = time.time()
+            finally:
+                self._local_models_refreshing = False
+
+        self._local_models_refreshing = True
+        try:
+            loop = get_background_loop()
+            asyncio.run_coroutine_threadsafe(refresh(), loop)
+        except RuntimeError as e:
+            logger.debug(f"Could not schedule local model refresh: {e}")
+            self._local_models_refreshing = False
+
     def resolve_model(self, model: Optional[str] = None, backend: Optional[BaseBackend] = None) -> str:
         """
         Resolve model specification to actual model name.
@@ -351,7 +439,7 @@ class Router:
             if HAS_LOCAL_BACKEND:
                 try:
                     local_backend = self.get_backend("local")
-                    if local_backend.is_available and self._is_local_model(model, local_backend):
+                    if self.is_backend_available("local", local_backend) and self._is_local_model(model, local_backend):
                         logger.debug(f"Detected local model: {model}")
                         selected_model = self.resolve_model(model, local_backend)
                         return local_backend, selected_model
@@ -366,6 +454,60 @@ class Router:
 
         return selected_backend, selected_model
 
+    def hedge_attempts(
+        self,
+        prompt: Union[str, List[Union[str, ImageInput]]],
+        backend: BaseBackend,
+        model: str,
+    ) -> List[Attempt]:
+        """
+        Get the attempts to race for a request: the routed backend and model, then its alternates.
+
+        Alternates come from ``routing.hedging.alternates`` for the model if
+        configured, otherwise from the other available backends in the
+        fallback order with their default models.
+
+        Args:
+            prompt: The user prompt, used to route configured alternate models
+            backend: The routed backend
+            model: The routed model
+
+        Returns:
+            List of (backend, model) pairs, primary first
+        """
+        from ..config.loader import get_config_value
+
+        attempts: List[Attempt] = [(backend, model)]
+        max_hedges = int(get_config_value("routing.hedging.max_hedges", 1))
+        alternates = (get_config_value("routing.hedging.alternates", {}) or {}).get(model)
+
+        candidates: List[Attempt] = []
+        if alternates:
+            for alternate in alternates:
+                try:
+                    candidates.append(self.smart_route(prompt, model=alternate))
+                except (BackendNotAvailableError, ValueError) as e:
+                    logger.debug(f"Skipping hedge model {alternate}: {e}")
+        else:
+            for backend_name in self.config.fallback_order:
+                if backend_name == backend.name:
+                    continue
+                try:
+                    alternate_backend = self.get_backend(backend_name)
+                    candidates.append((alternate_backend, self.resolve_model(None, alternate_backend)))
+                except (BackendNotAvailableError, ValueError) as e:
+                    logger.debug(f"Skipping hedge backend {backend_name}: {e}")
+
+        for candidate_backend, candidate_model in candidates:
+            if len(attempts) > max_hedges:
+                break
+            if (candidate_backend.name, candidate_model) in ((b.name, m) for b, m in attempts):
+                continue
+            if not self.is_backend_available(candidate_backend.name, candidate_backend):
+                continue
+            attempts.append((candidate_backend, candidate_model))
+        return attempts
+
     async def route_with_fallback(
         self,
         prompt: str,
@@ -396,8 +538,12 @@ class Router:
             if method == "ask":
                 response = await backend.ask(prompt, model=model, **kwargs)
                 if not response.failed:
+                    self.record_success(backend)
                     return response
+                self.record_failure(backend)
         except (ConnectionError, TimeoutError, ValueError, RuntimeError) as e:
+            if is_health_error(e):
+                self.record_failure(backend, e)
             logger.warning(f"Primary backend {backend.name} failed: {e}")
 
         # Try fallback backends if enabled
@@ -412,7 +558,7 @@ class Router:
 
             try:
                 fallback_backend = self.get_backend(backend_name)
-                if not fallback_backend.is_available:
+                if not self.is_backend_available(backend_name, fallback_backend):
                     continue
 
                 logger.info(f"Trying fallback backend: {backend_name}")
@@ -423,7 +569,9 @@ class Router:
                 if method == "ask":
                     response = await fallback_backend.ask(prompt, model=fallback_model, **kwargs)
                     if not response.failed:
+                        self.record_success(fallback_backend)
                         return response
+                    self.record_failure(fallback_backend)
 
             except (
                 BackendNotAvailableError,
@@ -431,6 +579,8 @@ class Router:
                 TimeoutError,
                 ValueError,
             ) as e:
+                if is_health_error(e):
+                    self.health.record_failure(backend_name, e)
                 logger.warning(f"Fallback backend {backend_name} failed: {e}")
 
         # All backends failed
@@ -0,0 +1,307 @@
+"""Token counting keyed by model family.
+
+Counts use a real tokenizer (tiktoken) when it is installed and its encoding
+files can be loaded. Otherwise they use a character-based estimate
+calibrated per model family. Families without a public tokenizer
+(Anthropic, Google, Llama, ...) are counted with the OpenAI encoding and
+scaled by a per-family ratio when tiktoken is available.
+
+Text counts are memoized by a hash of the content, so re-counting a chat
+history only pays for messages that were not seen before, and the memo does
+not keep message bodies alive.
+"""
+
+import hashlib
+import math
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from ..config.loader import get_config_value
+from ..utils import get_logger
+from .models import ImageInput
+
+logger = get_logger(__name__)
+
+Content = Union[str, Sequence[Union[str, ImageInput]], None]
+
+
+@dataclass(frozen=True)
+class FamilyProfile:
+    """Token counting parameters for a model family."""
+
+    name: str
+    encoding: str = "cl100k_base"  # tiktoken encoding used directly or as a proxy
+    exact: bool = False  # True if the encoding is the family's own tokenizer
+    tokenizer_ratio: float = 1.0  # family tokens per proxy-encoding token
+    chars_per_token: float = 4.0  # fallback estimate for ASCII text
+    image_tokens: int = 85  # tokens charged per image
+    message_overhead: int = 4  # role and separator tokens per message
+
+
+FAMILIES: Dict[str, FamilyProfile] = {
+    "openai": FamilyProfile("openai", exact=True, chars_per_token=4.0, image_tokens=765, message_overhead=3),
+    "openai-o200k": FamilyProfile(
+        "openai-o200k", encoding="o200k_base", exact=True, chars_per_token=4.2, image_tokens=765, message_overhead=3
+    ),
+    "anthropic": FamilyProfile("anthropic", tokenizer_ratio=1.15, chars_per_token=3.5, image_tokens=1600),
+    "google": FamilyProfile("google", tokenizer_ratio=1.0, chars_per_token=4.0, image_tokens=258),
+    "llama": FamilyProfile("llama", tokenizer_ratio=1.1, chars_per_token=3.7, image_tokens=576),
+    "mistral": FamilyProfile("mistral", tokenizer_ratio=1.15, chars_per_token=3.5, image_tokens=576),
+    "generic": FamilyProfile("generic"),
+}
+
+# Substrings identifying each family, checked in order
+_FAMILY_PATTERNS: List[Tuple[str, Tuple[str, ...]]] = [
+    ("openai-o200k", ("gpt-4o", "gpt-4.1", "gpt-5", "o1", "o3", "o4")),
+    ("openai", ("gpt-", "text-embedding", "davinci")),
+    ("anthropic", ("claude",)),
+    ("google", ("gemini", "gemma", "palm")),
+    ("mistral", ("mistral", "mixtral", "codestral")),
+    ("llama", ("llama", "codellama", "vicuna", "qwen", "phi", "deepseek")),
+]
+
+
+def _content_digest(text: str) -> bytes:
+    """Get the memo key for a text, so the memo holds a digest rather than the text."""
+    return hashlib.blake2b(text.encode("utf-8", errors="surrogatepass"), digest_size=16).digest()
+
+
+def model_family(model: Optional[str]) -> str:
+    """
+    Get the tokenizer family of a model.
+
+    Args:
+        model: Model name, with or without a provider prefix
+
+    Returns:
+        Family name (a key of FAMILIES)
+    """
+    if not model:
+        return "generic"
+    name = model.lower().rsplit("/", 1)[-1]
+    for family, patterns in _FAMILY_PATTERNS:
+        for pattern in patterns:
+            if name.startswith(pattern) if len(pattern) <= 2 else pattern in name:
+                return family
+    return "generic"
+
+
+class TokenCounter:
+    """Counts tokens for text, multi-modal content and chat messages."""
+
+    def __init__(self, use_tokenizer: Optional[bool] = None, cache_size: Optional[int] = None):
+        """
+        Initialize the counter.
+
+        Args:
+            use_tokenizer: Use tiktoken when available (default from config)
+            cache_size: Maximum number of memoized text counts (default from config)
+        """
+        if use_tokenizer is None:
+            use_tokenizer = get_config_value("constants.tokens.use_tokenizer", True)
+        if cache_size is None:
+            cache_size = get_config_value("constants.tokens.cache_size", 8192)
+        self.use_tokenizer = bool(use_tokenizer)
+        self.cache_size = int(cache_size)
+        self._cache: "OrderedDict[Tuple[str, bytes], int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._encodings: Dict[str, Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def count(self, content: Content, model: Optional[str] = None) -> int:
+        """
+        Count tokens in text or multi-modal content.
+
+        Args:
+            content: A string, or a list of strings and ImageInput objects
+            model: Model the content is sent to
+
+        Returns:
+            Token count
+        """
+        profile = FAMILIES[model_family(model)]
+        texts, images = self._split(content)
+        return sum(self._count_texts(profile, texts)) + images * profile.image_tokens
+
+    def count_message(self, message: Dict[str, Any], model: Optional[str] = None) -> int:
+        """Count tokens in one chat message, including per-message overhead."""
+        return self.count_messages([message], model)[0]
+
+    def count_messages(self, messages: Sequence[Dict[str, Any]], model: Optional[str] = None) -> List[int]:
+        """
+        Count tokens for a batch of chat messages.
+
+        Uncached texts are tokenized together, which is considerably faster than
+        counting messages one at a time when a whole history is new (e.g. after
+        loading a session).
+
+        Args:
+            messages: Messages with ``role`` and ``content``
+            model: Model the messages are sent to
+
+        Returns:
+            Token count per message, including per-message overhead
+        """
+        profile = FAMILIES[model_family(model)]
+        split = [self._split(message.get("content")) for message in messages]
+        flat_texts = [text for texts, _ in split for text in texts]
+        flat_counts = iter(self._count_texts(profile, flat_texts))
+
+        counts = []
+        for texts, images in split:
+            tokens = sum(next(flat_counts) for _ in texts)
+            counts.append(tokens + images * profile.image_tokens + profile.message_overhead)
+        return counts
+
+    def count_history(self, messages: Sequence[Dict[str, Any]], model: Optional[str] = None) -> int:
+        """Count the total tokens of a message list as sent in one request."""
+        return sum(self.count_messages(messages, model))
+
+    def stats(self) -> Dict[str, Any]:
+        """Get memoization statistics."""
+        with self._lock:
+            return {
+                "entries": len(self._cache),
+                "hits": self.hits,
+                "misses": self.misses,
+                "tokenizers": sorted(name for name, encoding in self._encodings.items() if encoding is not None),
+            }
+
+    def clear(self) -> None:
+        """Drop memoized counts."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = self.misses = 0
+
+    @staticmethod
+    def _split(content: Content) -> Tuple[List[str], int]:
+        """Split content into text parts and an image count."""
+        if content is None:
+            return [], 0
+        if isinstance(content, str):
+            return [content], 0
+        texts = []
+        images = 0
+        for item in content:
+            if isinstance(item, str):
+                texts.append(item)
+            elif isinstance(item, ImageInput):
+                images += 1
+            elif isinstance(item, dict):
+                # OpenAI-style content parts
+                if item.get("type") == "text":
+                    texts.append(str(item.get("text", "")))
+                elif item.get("type") == "image_url":
+                    images += 1
+        return texts, images
+
+    def _count_texts(self, profile: FamilyProfile, texts: List[str]) -> List[int]:
+        """Count a batch of texts, using memoized counts where possible."""
+        counts: List[Optional[int]] = []
+        missing: Dict[str, List[int]] = {}
+        keys: Dict[str, Tuple[str, bytes]] = {}
+        with self._lock:
+            for index, text in enumerate(texts):
+                if not text:
+                    counts.append(0)
+                    continue
+                key = keys.get(text)
+                if key is None:
+                    key = keys[text] = (profile.name, _content_digest(text))
+                cached = self._cache.get(key)
+                if cached is None:
+                    counts.append(None)
+                    missing.setdefault(text, []).append(index)
+                    self.misses += 1
+                else:
+                    self._cache.move_to_end(key)
+                    counts.append(cached)
+                    self.hits += 1
+
+        if missing:
+            unique_texts = list(missing)
+            computed = self._compute(profile, unique_texts)
+            with self._lock:
+                for text, tokens in zip(unique_texts, computed):
+                    self._cache[keys[text]] = tokens
+                    for index in missing[text]:
+                        counts[index] = tokens
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        return [count or 0 for count in counts]
+
+    def _compute(self, profile: FamilyProfile, texts: List[str]) -> List[int]:
+        """Count texts without the cache."""
+        encoding = self._encoding(profile.encoding) if self.use_tokenizer else None
+        if encoding is None:
+            return [self._estimate(profile, text) for text in texts]
+
+        if len(texts) > 1:
+            token_lists = encoding.encode_ordinary_batch(texts)
+        else:
+            token_lists = [encoding.encode_ordinary(texts[0])]
+        if profile.exact:
+            return [len(tokens) for tokens in token_lists]
+        return [max(1, round(len(tokens) * profile.tokenizer_ratio)) for tokens in token_lists]
+
+    @staticmethod
+    def _estimate(profile: FamilyProfile, text: str) -> int:
+        """Estimate tokens from character counts."""
+        if text.isascii():
+            return max(1, math.ceil(len(text) / profile.chars_per_token))
+        # Non-Latin scripts take roughly one token per character or more
+        non_ascii = sum(1 for char in text if ord(char) > 127)
+        return max(1, math.ceil((len(text) - non_ascii) / profile.chars_per_token) + non_ascii)
+
+    def _encoding(self, name: str) -> Any:
+        """Load a tiktoken encoding once; remember failures so they are not retried."""
+        if name in self._encodings:
+            return self._encodings[name]
+
+        encoding = None
+        try:
+            import tiktoken
+
+            encoding = tiktoken.get_encoding(name)
+        except ImportError:
+            logger.debug("tiktoken not installed; using estimated token counts")
+        except Exception as e:
+            # Encoding files are downloaded on first use and may be unavailable offline
+            logger.debug(f"Could not load tokenizer {name}; using estimated token counts: {e}")
+
+        self._encodings[name] = encoding
+        return encoding
+
+
+_token_counter: Optional[TokenCounter] = None
+
+
+def get_token_counter() -> TokenCounter:
+    """Get the shared token counter."""
+    global _token_counter
+    if _token_counter is None:
+        _token_counter = TokenCounter()
+    return _token_counter
+
+
+def count_tokens(content: Content, model: Optional[str] = None) -> int:
+    """
+    Count tokens in text or multi-modal content with the shared counter.
+
+    Args:
+        content: A string, or a list of strings and ImageInput objects
+        model: Model the content is sent to (selects the tokenizer family)
+
+    Returns:
+        Token count
+    """
+    return get_token_counter().count(content, model)
+
+
+def count_message_tokens(messages: Iterable[Dict[str, Any]], model: Optional[str] = None) -> List[int]:
+    """Count tokens per chat message with the shared counter."""
+    return get_token_counter().count_messages(list(messages), model)
@@ -43,6 +43,7 @@ class PluginRegistry:
     def __init__(self) -> None:
         self.plugins: Dict[str, BackendPlugin] = {}
         self._plugin_paths: List[Path] = []
+        self._discovered = False
         self._setup_default_paths()
 
     def _setup_default_paths(self) -> None:
@@ -98,6 +99,8 @@ class PluginRegistry:
         Returns:
             Backend class or None if not found
         """
+        if name not in self.plugins:
+            self.ensure_discovered()
         plugin = self.plugins.get(name)
         return plugin.backend_class if plugin else None
 
@@ -124,10 +127,25 @@ class PluginRegistry:
         """
         Discover and load plugins from configured paths.
         """
+        self._discovered = True
         for path in self._plugin_paths:
             if path.exists() and path.is_dir():
                 self._load_plugins_from_directory(path)
 
+    def ensure_discovered(self) -> None:
+        """
+        Discover plugins on first use.
+
+        Discovery imports every plugin module, so it is deferred until a
+        plugin is actually looked up rather than run at import time.
+        """
+        if self._discovered:
+            return
+        try:
+            self.discover_plugins()
+        except Exception as e:
+            logger.debug(f"Plugin discovery failed: {e}")
+
     def _load_plugins_from_directory(self, directory: Path) -> None:
         """
         Load all plugins from a directory.
@@ -226,6 +244,7 @@ class PluginRegistry:
         Returns:
             List of plugin information dictionaries
         """
+        self.ensure_discovered()
         return [
             {
                 "name": plugin.name,
@@ -0,0 +1,20 @@
+"""Long-running server modes for TTT.
+
+The daemon (``ttt serve``) keeps the router, backends and caches warm in one
+process; the client forwards CLI requests to it. The gateway (``ttt gateway``)
+serves the same warm process over an OpenAI-compatible HTTP API.
+"""
+
+from .client import DaemonClient, can_forward, find_daemon
+from .daemon import DaemonServer, run_daemon
+from .gateway import GatewayServer, run_gateway
+
+__all__ = [
+    "DaemonClient",
+    "DaemonServer",
+    "GatewayServer",
+    "can_forward",
+    "find_daemon",
+    "run_daemon",
+    "run_gateway",
+]
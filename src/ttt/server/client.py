@@ -0,0 +1,128 @@
+"""Thin client for the ``ttt serve`` daemon.
+
+The client only depends on the standard library and the protocol module, so
+a CLI invocation that forwards its request never imports the router,
+backends or LiteLLM.
+"""
+
+import json
+import os
+import socket
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from ..config.loader import get_config_value
+from ..core.models import AIResponse
+from ..utils import get_logger
+from .protocol import (
+    MAX_LINE_BYTES,
+    decode,
+    encode,
+    error_from_dict,
+    request_context,
+    response_from_dict,
+    socket_in_use,
+    socket_path,
+)
+
+logger = get_logger(__name__)
+
+
+class DaemonClient:
+    """Send requests to a running daemon."""
+
+    def __init__(self, path: Optional[str] = None, timeout: Optional[float] = None):
+        """
+        Initialize the client.
+
+        Args:
+            path: Socket path (default from TTT_SOCKET or ``server.socket_path``)
+            timeout: Seconds to wait for each reply from the daemon (default from config)
+        """
+        self.socket_path = socket_path(path)
+        self.timeout = timeout if timeout is not None else get_config_value("server.timeout", 600)
+        self.context = request_context()
+
+    def ping(self) -> Dict[str, Any]:
+        """Get the daemon's status."""
+        return next(self._request({"op": "ping"}))
+
+    def shutdown(self) -> None:
+        """Ask the daemon to stop."""
+        for _ in self._request({"op": "shutdown"}):
+            pass
+
+    def ask(self, prompt: str, **kwargs: Any) -> AIResponse:
+        """Forward ask() to the daemon."""
+        for event in self._request({"op": "ask", "prompt": prompt, "kwargs": kwargs, "context": self.context}):
+            if event.get("event") == "response":
+                return response_from_dict(event.get("response") or {})
+        raise ConnectionError("ttt daemon closed the connection without a response")
+
+    def stream(self, prompt: str, **kwargs: Any) -> Iterator[str]:
+        """Forward stream() to the daemon, yielding chunks as they arrive."""
+        for event in self._request({"op": "stream", "prompt": prompt, "kwargs": kwargs, "context": self.context}):
+            if event.get("event") == "chunk":
+                yield event.get("text", "")
+
+    def _request(self, message: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Send one request and yield its events until the reply is complete."""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(self.timeout)
+            sock.connect(str(self.socket_path))
+            sock.sendall(encode(message))
+            reader = sock.makefile("rb")
+            while True:
+                line = reader.readline(MAX_LINE_BYTES)
+                if not line:
+                    raise ConnectionError("ttt daemon closed the connection")
+                event = decode(line)
+                kind = event.get("event")
+                if kind == "error":
+                    raise error_from_dict(event)
+                yield event
+                if kind in ("response", "status", "done"):
+                    return
+        finally:
+            # Closing mid-stream tells the daemon to cancel the request
+            sock.close()
+
+
+def can_forward(prompt: Any, kwargs: Dict[str, Any]) -> bool:
+    """Check whether a request can be sent to the daemon (text prompt, JSON-serializable options)."""
+    if not isinstance(prompt, str):
+        return False
+    try:
+        json.dumps(kwargs)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def find_daemon(path: Optional[str] = None) -> Optional[DaemonClient]:
+    """
+    Get a client for a running daemon, if forwarding is enabled and one is listening.
+
+    Forwarding is disabled with ``server.auto_connect: false`` or TTT_NO_DAEMON=1.
+    A daemon started from another directory, or with different configuration
+    files or provider environment variables, is not used: the request would
+    run with its settings and keys instead of this process's.
+    """
+    if os.environ.get("TTT_NO_DAEMON", "").lower() in ("1", "true", "yes"):
+        return None
+    if path is None and not get_config_value("server.auto_connect", True):
+        return None
+    resolved: Path = socket_path(path)
+    if not socket_in_use(resolved):
+        return None
+    client = DaemonClient(str(resolved))
+    try:
+        status = client.ping()
+    except (OSError, ConnectionError, ValueError) as e:
+        logger.debug(f"ttt daemon did not answer ping: {e}")
+        return None
+    if status.get("context") != client.context:
+        logger.debug(f"ttt daemon runs in another context ({status.get('context')}); running in-process")
+        return None
+    return client
@@ -0,0 +1,255 @@
+"""Long-lived ``ttt serve`` daemon.
+
+Every ``ttt`` invocation normally pays for loading the configuration,
+building the router, importing LiteLLM and opening fresh connections before
+the first token arrives. The daemon pays those costs once and keeps the
+router, backend connection pools and response cache warm; the CLI forwards
+requests to it over a Unix domain socket (see ``client.py``).
+
+The server runs on the shared background event loop, so backends and their
+pooled clients live on the same loop they would use in-process. Requests are
+only served when the client's working directory and configuration match the
+daemon's (see ``protocol.request_context``).
+"""
+
+import asyncio
+import concurrent.futures
+import functools
+import os
+import socket
+import time
+from typing import Any, AsyncGenerator, Callable, Dict, Optional, Tuple, cast
+
+from ..utils import get_logger
+from ..utils.async_utils import get_background_loop
+from .protocol import (
+    MAX_LINE_BYTES,
+    decode,
+    encode,
+    error_to_dict,
+    request_context,
+    response_to_dict,
+    socket_in_use,
+    socket_path,
+)
+
+logger = get_logger(__name__)
+
+
+class DaemonServer:
+    """Serve ask and stream requests from a warm process."""
+
+    def __init__(self, path: Optional[str] = None, warm_up: bool = True):
+        """
+        Initialize the server.
+
+        Args:
+            path: Socket path (default from TTT_SOCKET or ``server.socket_path``)
+            warm_up: Import the API and LiteLLM before accepting requests
+        """
+        self.socket_path = socket_path(path)
+        self.warm_up = warm_up
+        self.context = request_context()
+        self.started_at: Optional[float] = None
+        self.requests = 0
+        self.active = 0
+        self.errors = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._stopped: Optional[asyncio.Event] = None
+
+    async def start(self) -> None:
+        """Bind the socket and start accepting connections."""
+        if not hasattr(socket, "AF_UNIX"):
+            raise RuntimeError("ttt serve needs Unix domain sockets, which this platform does not support")
+
+        self._remove_stale_socket()
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if self.warm_up:
+            await asyncio.get_running_loop().run_in_executor(None, _warm_up)
+
+        self._stopped = asyncio.Event()
+        self._server = await asyncio.start_unix_server(self._handle, path=str(self.socket_path), limit=MAX_LINE_BYTES)
+        # Only the owner may send requests (they use the owner's API keys)
+        os.chmod(self.socket_path, 0o600)
+        self.started_at = time.time()
+        logger.info(f"ttt daemon listening on {self.socket_path}")
+
+    async def wait_stopped(self) -> None:
+        """Wait until a shutdown is requested, then close the server."""
+        if self._stopped is not None:
+            await self._stopped.wait()
+        await self.close()
+
+    async def close(self) -> None:
+        """Stop accepting connections and remove the socket."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+            try:
+                self.socket_path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def stop(self) -> None:
+        """Request a shutdown (thread-safe)."""
+        if self._stopped is not None:
+            get_background_loop().call_soon_threadsafe(self._stopped.set)
+
+    def status(self) -> Dict[str, Any]:
+        """Get server statistics."""
+        return {
+            "pid": os.getpid(),
+            "socket": str(self.socket_path),
+            "uptime": time.time() - self.started_at if self.started_at else 0.0,
+            "requests": self.requests,
+            "active": self.active,
+            "errors": self.errors,
+            "context": self.context,
+        }
+
+    def _remove_stale_socket(self) -> None:
+        """Remove a socket left behind by a daemon that did not shut down cleanly."""
+        if socket_in_use(self.socket_path):
+            raise RuntimeError(f"A ttt daemon is already listening on {self.socket_path}")
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve the requests of one connection, one after another."""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = decode(line)
+                except ValueError as e:
+                    await self._send(writer, error_to_dict(e))
+                    continue
+                await self._dispatch(request, writer)
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError) as e:
+            # The client went away (e.g. Ctrl+C during a stream)
+            logger.debug(f"Daemon connection closed: {e}")
+        finally:
+            writer.close()
+
+    async def _dispatch(self, request: Dict[str, Any], writer: asyncio.StreamWriter) -> None:
+        op = request.get("op")
+        if op == "ping":
+            await self._send(writer, {"event": "status", **self.status()})
+            return
+        if op == "shutdown":
+            await self._send(writer, {"event": "done"})
+            if self._stopped is not None:
+                self._stopped.set()
+            return
+
+        from ..core.api import ask_async, stream_async
+
+        self.requests += 1
+        self.active += 1
+        prompt = request.get("prompt", "")
+        kwargs = request.get("kwargs") or {}
+        try:
+            if op in ("ask", "stream"):
+                if request.get("context") != self.context:
+                    raise ValueError(
+                        "Request context does not match the daemon's working directory and configuration "
+                        f"(daemon runs in {self.context['cwd']})"
+                    )
+                kwargs["backend"], kwargs["model"] = await self._route(prompt, kwargs)
+            if op == "ask":
+                response = await ask_async(prompt, **kwargs)
+                await self._send(writer, {"event": "response", "response": response_to_dict(response)})
+            elif op == "stream":
+                chunks = cast(AsyncGenerator[str, None], stream_async(prompt, **kwargs))
+                try:
+                    async for chunk in chunks:
+                        await self._send(writer, {"event": "chunk", "text": chunk})
+                finally:
+                    await chunks.aclose()
+                await self._send(writer, {"event": "done"})
+            else:
+                raise ValueError(f"Unknown daemon operation: {op}")
+        except ConnectionError:
+            raise
+        except Exception as e:
+            self.errors += 1
+            logger.debug(f"Daemon request failed: {e}")
+            await self._send(writer, error_to_dict(e))
+        finally:
+            self.active -= 1
+
+    @staticmethod
+    async def _route(prompt: str, kwargs: Dict[str, Any]) -> Tuple[Any, str]:
+        """Pick a backend and model without blocking the event loop on health checks."""
+        from ..core.api import router
+
+        model, backend = kwargs.pop("model", None), kwargs.pop("backend", None)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(router.smart_route, prompt, model=model, backend=backend, **kwargs)
+        )
+
+    @staticmethod
+    async def _send(writer: asyncio.StreamWriter, message: Dict[str, Any]) -> None:
+        writer.write(encode(message))
+        await writer.drain()
+
+
+def _warm_up() -> None:
+    """Import the request path and check backend health so the first forwarded request is as fast as later ones."""
+    from ..backends.cloud import CloudBackend
+    from ..core.api import router
+
+    try:
+        backend = router.get_backend("cloud")
+        if isinstance(backend, CloudBackend):
+            backend.litellm  # Imports LiteLLM
+    except Exception as e:
+        logger.debug(f"Cloud backend not warmed up: {e}")
+
+    # Fill the health cache so routing the first requests does not wait on checks
+    for name in ("local", "cloud"):
+        try:
+            router.is_backend_available(name)
+        except Exception as e:
+            logger.debug(f"{name.title()} backend health not checked: {e}")
+
+
+def run_daemon(path: Optional[str] = None, on_ready: Optional[Callable[["DaemonServer"], None]] = None) -> None:
+    """
+    Run the daemon until it is asked to shut down or interrupted.
+
+    Args:
+        path: Socket path (default from TTT_SOCKET or ``server.socket_path``)
+        on_ready: Called with the server once it is accepting connections
+    """
+    run_server(DaemonServer(path), on_ready)
+
+
+def run_server(server: Any, on_ready: Optional[Callable[[Any], None]] = None) -> None:
+    """
+    Run a server with ``start``/``wait_stopped``/``stop`` on the background loop until it stops.
+
+    Blocks the calling thread; Ctrl+C requests a graceful shutdown.
+    """
+    loop = get_background_loop()
+    asyncio.run_coroutine_threadsafe(server.start(), loop).result()
+    if on_ready is not None:
+        on_ready(server)
+
+    stopped = asyncio.run_coroutine_threadsafe(server.wait_stopped(), loop)
+    try:
+        while True:
+            # Wait in short slices so KeyboardInterrupt reaches the main thread promptly
+            try:
+                stopped.result(timeout=0.5)
+                break
+            except concurrent.futures.TimeoutError:
+                continue
+    except KeyboardInterrupt:
+        server.stop()
+        stopped.result(timeout=5)
@@ -0,0 +1,583 @@
+"""OpenAI-compatible HTTP gateway (``ttt gateway``).
+
+Serves ``POST /v1/chat/completions`` (with SSE streaming) and
+``GET /v1/models`` on top of the router, so services can share one warm
+process with pooled connections, the response cache and routing instead of
+embedding the library in every worker.
+
+The HTTP layer is a small HTTP/1.1 implementation on asyncio streams
+(keep-alive, Content-Length request bodies, chunked responses for streams),
+which keeps the gateway free of extra dependencies and async end to end.
+
+Admission control:
+
+- At most ``max_concurrency`` requests run at once; further requests wait in a
+  queue of up to ``max_queue`` entries for at most ``queue_timeout`` seconds.
+- Each client (API key, or remote address when no key is sent) may have at
+  most ``per_client_limit`` requests in flight; more are rejected with 429.
+"""
+
+import asyncio
+import functools
+import json
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from ..config.loader import get_config_value
+from ..core import exceptions
+from ..utils import get_logger
+from ..utils.async_utils import get_background_loop
+
+logger = get_logger(__name__)
+
+REASONS = {
+    200: "OK",
+    204: "No Content",
+    400: "Bad Request",
+    401: "Unauthorized",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    411: "Length Required",
+    413: "Payload Too Large",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+    502: "Bad Gateway",
+    503: "Service Unavailable",
+    504: "Gateway Timeout",
+}
+
+# Model names that mean "let the router choose"
+AUTO_MODELS = ("", "auto", "ttt", "default")
+
+
+class GatewayError(Exception):
+    """An error returned to the client as an OpenAI-style error object."""
+
+    def __init__(self, status: int, message: str, error_type: str = "invalid_request_error", code: Any = None):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.error_type = error_type
+        self.code = code
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"error": {"message": self.message, "type": self.error_type, "code": self.code}}
+
+    @classmethod
+    def from_exception(cls, error: BaseException) -> "GatewayError":
+        """Map library exceptions to HTTP status codes."""
+        if isinstance(error, GatewayError):
+            return error
+        message = getattr(error, "message", None) or str(error)
+        if isinstance(error, (exceptions.RateLimitError, exceptions.QuotaExceededError)):
+            return cls(429, message, "rate_limit_error", type(error).__name__)
+        if isinstance(error, exceptions.ValidationError):
+            return cls(400, message, "invalid_request_error", type(error).__name__)
+        if isinstance(error, exceptions.ModelNotFoundError):
+            return cls(404, message, "invalid_request_error", "model_not_found")
+        if isinstance(error, exceptions.BackendTimeoutError):
+            return cls(504, message, "api_error", type(error).__name__)
+        if isinstance(error, (exceptions.BackendNotAvailableError, exceptions.BackendConnectionError)):
+            return cls(503, message, "api_error", type(error).__name__)
+        if isinstance(error, exceptions.AIError):
+            return cls(502, message, "api_error", type(error).__name__)
+        return cls(500, message or type(error).__name__, "server_error", None)
+
+
+@dataclass
+class HTTPRequest:
+    """A parsed HTTP request."""
+
+    method: str
+    path: str
+    headers: Dict[str, str]
+    body: bytes = b""
+    client: str = "unknown"
+
+    @property
+    def keep_alive(self) -> bool:
+        return self.headers.get("connection", "").lower() != "close"
+
+    def json(self) -> Dict[str, Any]:
+        try:
+            payload = json.loads(self.body or b"{}")
+        except ValueError as e:
+            raise GatewayError(400, f"Request body is not valid JSON: {e}") from e
+        if not isinstance(payload, dict):
+            raise GatewayError(400, "Request body must be a JSON object")
+        return payload
+
+
+@dataclass
+class GatewayStats:
+    """Counters reported by ``GET /health``."""
+
+    active: int = 0
+    queued: int = 0
+    served: int = 0
+    rejected: int = 0
+    errors: int = 0
+    per_client: Dict[str, int] = field(default_factory=dict)
+
+
+class GatewayServer:
+    """OpenAI-compatible HTTP server backed by the router."""
+
+    def __init__(
+        self,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        queue_timeout: Optional[float] = None,
+        per_client_limit: Optional[int] = None,
+        api_keys: Optional[List[str]] = None,
+    ):
+        """
+        Initialize the gateway. Unset options are read from ``server.gateway`` in the config.
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            max_concurrency: Requests processed at once
+            max_queue: Requests allowed to wait for a slot
+            queue_timeout: Seconds a request may wait for a slot
+            per_client_limit: Requests in flight per client
+            api_keys: Accepted bearer tokens (empty allows unauthenticated access)
+        """
+
+        def option(value: Any, key: str, default: Any) -> Any:
+            return value if value is not None else get_config_value(f"server.gateway.{key}", default)
+
+        self.host = option(host, "host", "127.0.0.1")
+        self.port = int(option(port, "port", 8765))
+        self.max_concurrency = int(option(max_concurrency, "max_concurrency", 16))
+        self.max_queue = int(option(max_queue, "max_queue", 64))
+        self.queue_timeout = float(option(queue_timeout, "queue_timeout", 30))
+        self.per_client_limit = int(option(per_client_limit, "per_client_limit", 4))
+        self.api_keys = set(option(api_keys, "api_keys", None) or [])
+        self.max_body_bytes = int(get_config_value("server.gateway.max_body_bytes", 10485760))
+        self.stats = GatewayStats()
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._stopped: Optional[asyncio.Event] = None
+
+    # Lifecycle
+
+    async def start(self) -> None:
+        """Bind the port and start accepting connections."""
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+        self._stopped = asyncio.Event()
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        # Report the real port when an ephemeral one was requested
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"ttt gateway listening on http://{self.host}:{self.port}")
+
+    async def wait_stopped(self) -> None:
+        """Wait until a shutdown is requested, then close the server."""
+        if self._stopped is not None:
+            await self._stopped.wait()
+        await self.close()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def stop(self) -> None:
+        """Request a shutdown (thread-safe)."""
+        if self._stopped is not None:
+            get_background_loop().call_soon_threadsafe(self._stopped.set)
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    # HTTP
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        peer = writer.get_extra_info("peername")
+        client = peer[0] if isinstance(peer, tuple) else "local"
+        try:
+            while True:
+                try:
+                    request = await self._read_request(reader, client)
+                except GatewayError as e:
+                    await self._send_json(writer, e.status, e.to_dict(), keep_alive=False)
+                    break
+                if request is None:
+                    break
+                await self._dispatch(request, writer)
+                if not request.keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError) as e:
+            logger.debug(f"Gateway connection closed: {e}")
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader, client: str) -> Optional[HTTPRequest]:
+        """Read one request, or return None when the client closed the connection."""
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError as e:
+            if e.partial.strip():
+                raise GatewayError(400, "Incomplete request") from e
+            return None
+        except asyncio.LimitOverrunError as e:
+            raise GatewayError(413, "Request headers too large") from e
+
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, _version = lines[0].split(" ", 2)
+        except ValueError as e:
+            raise GatewayError(400, "Malformed request line") from e
+
+        headers: Dict[str, str] = {}
+        for line in lines[1:]:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            raise GatewayError(411, "Chunked request bodies are not supported; send Content-Length")
+        content_length = headers.get("content-length") or "0"
+        if not content_length.isdigit():
+            raise GatewayError(400, f"Invalid Content-Length: {content_length}")
+        length = int(content_length)
+        if length > self.max_body_bytes:
+            raise GatewayError(413, f"Request body exceeds {self.max_body_bytes} bytes")
+        try:
+            body = await reader.readexactly(length) if length else b""
+        except asyncio.IncompleteReadError as e:
+            raise GatewayError(400, "Request body shorter than Content-Length") from e
+        return HTTPRequest(method.upper(), target.split("?", 1)[0], headers, body, client)
+
+    async def _dispatch(self, request: HTTPRequest, writer: asyncio.StreamWriter) -> None:
+        try:
+            self._authorize(request)
+            if request.path == "/v1/chat/completions":
+                if request.method != "POST":
+                    raise GatewayError(405, "Use POST for /v1/chat/completions")
+                await self._admitted(request, writer, self._chat_completions)
+            elif request.path == "/v1/models":
+                await self._send_json(writer, 200, await self._models(), request.keep_alive)
+            elif request.path == "/health":
+                await self._send_json(writer, 200, self._health(), request.keep_alive)
+            else:
+                raise GatewayError(404, f"Unknown endpoint: {request.path}")
+        except ConnectionError:
+            raise
+        except Exception as e:
+            error = GatewayError.from_exception(e)
+            if error.status >= 500:
+                self.stats.errors += 1
+                logger.debug(f"Gateway request failed: {e}")
+            await self._send_json(writer, error.status, error.to_dict(), request.keep_alive)
+
+    def _authorize(self, request: HTTPRequest) -> None:
+        if not self.api_keys:
+            return
+        scheme, _, token = request.headers.get("authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or token.strip() not in self.api_keys:
+            raise GatewayError(401, "Invalid or missing API key", "authentication_error", "invalid_api_key")
+
+    def _client_id(self, request: HTTPRequest) -> str:
+        _, _, token = request.headers.get("authorization", "").partition(" ")
+        return f"key:{token.strip()[-8:]}" if token.strip() else f"addr:{request.client}"
+
+    async def _admitted(self, request: HTTPRequest, writer: asyncio.StreamWriter, handler: Any) -> None:
+        """Run a handler once the per-client limit and the global queue allow it."""
+        client = self._client_id(request)
+        in_flight = self.stats.per_client.get(client, 0)
+        if in_flight >= self.per_client_limit:
+            self.stats.rejected += 1
+            raise GatewayError(429, f"Too many concurrent requests (limit {self.per_client_limit})", "rate_limit_error")
+        assert self._slots is not None
+
+        self.stats.per_client[client] = in_flight + 1
+        try:
+            if self._slots.locked():
+                if self.stats.queued >= self.max_queue:
+                    self.stats.rejected += 1
+                    raise GatewayError(503, "Gateway queue is full, retry later", "server_error", "overloaded")
+                self.stats.queued += 1
+                try:
+                    await asyncio.wait_for(self._slots.acquire(), self.queue_timeout)
+                except asyncio.TimeoutError:
+                    self.stats.rejected += 1
+                    raise GatewayError(503, "Timed out waiting in the gateway queue", "server_error", "overloaded")
+                finally:
+                    self.stats.queued -= 1
+            else:
+                await self._slots.acquire()
+
+            self.stats.active += 1
+            try:
+                await handler(request, writer)
+                self.stats.served += 1
+            finally:
+                self.stats.active -= 1
+                self._slots.release()
+        finally:
+            remaining = self.stats.per_client[client] - 1
+            if remaining:
+                self.stats.per_client[client] = remaining
+            else:
+                del self.stats.per_client[client]
+
+    # Endpoints
+
+    async def _chat_completions(self, request: HTTPRequest, writer: asyncio.StreamWriter) -> None:
+        body = request.json()
+        messages = body.get("messages")
+        if not isinstance(messages, list) or not messages:
+            raise GatewayError(400, "'messages' must be a non-empty list")
+
+        requested_model = body.get("model") or ""
+        backend, model = await self._route(messages, None if requested_model in AUTO_MODELS else requested_model)
+        prompt, system, history = _prepare_prompt(backend, messages)
+
+        params: Dict[str, Any] = {"model": model, "backend": backend}
+        if system is not None:
+            params["system"] = system
+        if history is not None:
+            params["messages"] = history
+        if body.get("temperature") is not None:
+            params["temperature"] = body["temperature"]
+        max_tokens = body.get("max_completion_tokens") or body.get("max_tokens")
+        if max_tokens:
+            params["max_tokens"] = max_tokens
+        if isinstance(body.get("cache"), bool):
+            # ttt extension: bypass or force the response cache per request
+            params["cache"] = body["cache"]
+
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        if body.get("stream"):
+            include_usage = bool((body.get("stream_options") or {}).get("include_usage"))
+            await self._stream_completion(writer, completion_id, messages, prompt, params, include_usage)
+        else:
+            await self._completion(writer, request.keep_alive, completion_id, messages, prompt, params)
+
+    async def _route(self, messages: List[Dict[str, Any]], model: Optional[str]) -> Tuple[Any, str]:
+        """Pick a backend and model without blocking the event loop on health checks."""
+        from ..core.api import router
+
+        prompt = _message_text(messages[-1].get("content"))
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(router.smart_route, prompt, model=model))
+
+    async def _completion(
+        self,
+        writer: asyncio.StreamWriter,
+        keep_alive: bool,
+        completion_id: str,
+        messages: List[Dict[str, Any]],
+        prompt: str,
+        params: Dict[str, Any],
+    ) -> None:
+        from ..core.api import ask_async
+
+        response = await ask_async(prompt, **params)
+        if response.failed:
+            raise GatewayError(502, response.error or "Backend request failed", "api_error")
+
+        prompt_tokens, completion_tokens = response.tokens_in, response.tokens_out
+        if prompt_tokens is None or completion_tokens is None:
+            prompt_tokens, completion_tokens = _count_usage(messages, str(response), params["model"])
+        payload = {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": response.model or params["model"],
+            "choices": [
+                {"index": 0, "message": {"role": "assistant", "content": str(response)}, "finish_reason": "stop"}
+            ],
+            "usage": _usage(prompt_tokens, completion_tokens),
+        }
+        await self._send_json(writer, 200, payload, keep_alive)
+
+    async def _stream_completion(
+        self,
+        writer: asyncio.StreamWriter,
+        completion_id: str,
+        messages: List[Dict[str, Any]],
+        prompt: str,
+        params: Dict[str, Any],
+        include_usage: bool,
+    ) -> None:
+        from ..core.api import stream_async
+
+        chunks: AsyncIterator[str] = stream_async(prompt, **params)
+        created = int(time.time())
+
+        def event(delta: Dict[str, Any], finish_reason: Optional[str] = None) -> Dict[str, Any]:
+            return {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": params["model"],
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+            }
+
+        # Fail with a regular HTTP error if the stream cannot start
+        try:
+            first: Optional[str] = await chunks.__anext__()
+        except StopAsyncIteration:
+            first = None
+
+        writer.write(
+            _response_head(
+                200,
+                {"Content-Type": "text/event-stream", "Cache-Control": "no-cache", "Transfer-Encoding": "chunked"},
+                keep_alive=True,
+            )
+        )
+        await self._send_event(writer, event({"role": "assistant", "content": ""}))
+
+        parts: List[str] = []
+        try:
+            if first is not None:
+                parts.append(first)
+                await self._send_event(writer, event({"content": first}))
+                async for chunk in chunks:
+                    parts.append(chunk)
+                    await self._send_event(writer, event({"content": chunk}))
+            await self._send_event(writer, event({}, "stop"))
+            if include_usage:
+                usage_event = event({})
+                usage_event["choices"] = []
+                usage_event["usage"] = _usage(*_count_usage(messages, "".join(parts), params["model"]))
+                await self._send_event(writer, usage_event)
+        except ConnectionError:
+            raise
+        except Exception as e:
+            # Headers are already sent; report the error in-band as OpenAI does
+            await self._send_event(writer, GatewayError.from_exception(e).to_dict())
+        finally:
+            await chunks.aclose()  # type: ignore[attr-defined]
+
+        await self._send_chunk(writer, b"data: [DONE]\n\n")
+        await self._send_chunk(writer, b"")
+
+    async def _models(self) -> Dict[str, Any]:
+        from ..config.schema import get_model_registry
+
+        registry = get_model_registry()
+        data = [
+            {"id": name, "object": "model", "created": 0, "owned_by": info.provider}
+            for name, info in sorted(registry.models.items())
+        ]
+        return {"object": "list", "data": data}
+
+    def _health(self) -> Dict[str, Any]:
+        return {
+            "status": "ok",
+            "active": self.stats.active,
+            "queued": self.stats.queued,
+            "served": self.stats.served,
+            "rejected": self.stats.rejected,
+            "errors": self.stats.errors,
+            "clients": len(self.stats.per_client),
+            "max_concurrency": self.max_concurrency,
+        }
+
+    # Writing
+
+    @staticmethod
+    async def _send_json(writer: asyncio.StreamWriter, status: int, payload: Dict[str, Any], keep_alive: bool) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        headers = {"Content-Type": "application/json", "Content-Length": str(len(body))}
+        writer.write(_response_head(status, headers, keep_alive) + body)
+        await writer.drain()
+
+    async def _send_event(self, writer: asyncio.StreamWriter, payload: Dict[str, Any]) -> None:
+        await self._send_chunk(writer, f"data: {json.dumps(payload)}\n\n".encode("utf-8"))
+
+    @staticmethod
+    async def _send_chunk(writer: asyncio.StreamWriter, data: bytes) -> None:
+        writer.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+        await writer.drain()
+
+
+def _response_head(status: int, headers: Dict[str, str], keep_alive: bool) -> bytes:
+    lines = [f"HTTP/1.1 {status} {REASONS.get(status, 'Unknown')}"]
+    lines.extend(f"{name}: {value}" for name, value in headers.items())
+    lines.append(f"Connection: {'keep-alive' if keep_alive else 'close'}")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+def _message_text(content: Any) -> str:
+    """Get the text of OpenAI message content (a string or a list of content parts)."""
+    if content is None:
+        return ""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return " ".join(
+            str(part.get("text", "")) for part in content if isinstance(part, dict) and part.get("type") == "text"
+        )
+    return str(content)
+
+
+def _prepare_prompt(
+    backend: Any, messages: List[Dict[str, Any]]
+) -> Tuple[str, Optional[str], Optional[List[Dict[str, Any]]]]:
+    """
+    Map OpenAI messages onto the backend interface.
+
+    Returns:
+        (prompt, system, messages) where messages is the full list for backends
+        that accept message history and None otherwise
+    """
+    prompt = _message_text(messages[-1].get("content"))
+    if getattr(backend, "supports_messages", False):
+        return prompt, None, messages
+
+    system_parts = [_message_text(m.get("content")) for m in messages if m.get("role") == "system"]
+    system = "\n\n".join(system_parts) if system_parts else None
+    turns = [m for m in messages if m.get("role") != "system"]
+    if len(turns) <= 1:
+        return prompt, system, None
+
+    # Single-prompt backends get the whole conversation as text
+    rendered = []
+    for message in turns:
+        speaker = "Human" if message.get("role") == "user" else "Assistant"
+        rendered.append(f"{speaker}: {_message_text(message.get('content'))}")
+    return "\n\n".join(rendered), system, None
+
+
+def _count_usage(messages: List[Dict[str, Any]], completion: str, model: Optional[str]) -> Tuple[int, int]:
+    from ..core.tokens import get_token_counter
+
+    counter = get_token_counter()
+    return counter.count_history(messages, model), counter.count(completion, model)
+
+
+def _usage(prompt_tokens: int, completion_tokens: int) -> Dict[str, int]:
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+    }
+
+
+def run_gateway(host: Optional[str] = None, port: Optional[int] = None, on_ready: Optional[Any] = None) -> None:
+    """
+    Run the gateway until interrupted.
+
+    Args:
+        host: Interface to bind (default from ``server.gateway.host``)
+        port: Port to bind (default from ``server.gateway.port``)
+        on_ready: Called with the server once it is accepting connections
+    """
+    from .daemon import run_server
+
+    if get_config_value("server.gateway.warm_up", True):
+        from .daemon import _warm_up
+
+        _warm_up()
+    run_server(GatewayServer(host=host, port=port), on_ready)
@@ -0,0 +1,207 @@
+"""Wire protocol shared by the ``ttt serve`` daemon and its client.
+
+Messages are newline-delimited JSON objects sent over a Unix domain socket.
+A request names an operation::
+
+    {"op": "ask", "prompt": "...", "kwargs": {"model": "gpt-4"}}
+
+and is answered by one or more events::
+
+    {"event": "response", "response": {...}}                    # ask
+    {"event": "chunk", "text": "..."} ... {"event": "done"}      # stream
+    {"event": "status", ...}                                     # ping
+    {"event": "error", "type": "RateLimitError", "message": "...", "details": {...}}
+
+Configuration, ``.env`` files and API keys are resolved from the working
+directory and environment of the process that loads them. Requests therefore
+carry the client's context (see ``request_context``), ``ping`` reports the
+daemon's, and a request is only served by a daemon whose context matches.
+"""
+
+import builtins
+import hashlib
+import json
+import os
+import socket
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..config.loader import get_config_value
+from ..core import exceptions
+from ..core.models import AIResponse
+
+# Longest accepted request or event line (prompts can be large)
+MAX_LINE_BYTES = 16 * 1024 * 1024
+
+# Environment variables that select providers, keys or settings for a request
+_CONTEXT_ENV_PREFIXES = (
+    "TTT_",
+    "OLLAMA_",
+    "LITELLM_",
+    "OPENAI_",
+    "ANTHROPIC_",
+    "OPENROUTER_",
+    "GOOGLE_",
+    "GEMINI_",
+    "AZURE_",
+    "AWS_",
+)
+_CONTEXT_ENV_SUFFIXES = ("_API_KEY", "_API_BASE", "_BASE_URL")
+# Variables that only change how the client itself behaves
+_CLIENT_ONLY_ENV = frozenset({"TTT_SOCKET", "TTT_NO_DAEMON", "TTT_JSON_MODE", "TTT_VERBOSE", "TTT_DEBUG"})
+
+
+def socket_path(path: Optional[str] = None) -> Path:
+    """Resolve the daemon socket path from an explicit path, TTT_SOCKET or the config."""
+    path = path or os.environ.get("TTT_SOCKET") or get_config_value("server.socket_path", "~/.ttt/ttt.sock")
+    return Path(path).expanduser()
+
+
+def socket_in_use(path: Optional[Path] = None) -> bool:
+    """Check whether a daemon is accepting connections on a socket."""
+    path = path or socket_path()
+    if not hasattr(socket, "AF_UNIX") or not path.exists():
+        return False
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(str(path))
+        return True
+    except OSError:
+        return False
+    finally:
+        probe.close()
+
+
+def _context_files(cwd: Path) -> List[Path]:
+    """Files the configuration is read from, in the order the loaders look for them."""
+    home = Path.home()
+    files = [cwd / "config.yaml"]
+    files += [cwd / name for name in ("ai.yaml", "ai.yml", ".ai.yaml", ".ai.yml")]
+    files += [home / ".config" / "ai" / "config.yaml", home / ".config" / "ai" / "config.yml"]
+    files += [home / ".ai.yaml", home / ".ai.yml"]
+    files += [Path(__file__).parent.parent / ".env"] + [parent / ".env" for parent in [cwd, *cwd.parents]]
+    return files
+
+
+def _is_context_variable(name: str) -> bool:
+    if name in _CLIENT_ONLY_ENV:
+        return False
+    return name.startswith(_CONTEXT_ENV_PREFIXES) or name.endswith(_CONTEXT_ENV_SUFFIXES)
+
+
+def request_context() -> Dict[str, str]:
+    """
+    Describe the working directory and configuration a request would run with here.
+
+    The fingerprint covers the config and ``.env`` files (path, size and
+    mtime) and the provider-related environment variables, including those a
+    ``.env`` file would supply, so a daemon that loaded ``.env`` and a client
+    that has not yet agree. Values are hashed, never sent.
+
+    Returns:
+        Dictionary with the working directory and a fingerprint of the rest
+    """
+    cwd = Path.cwd()
+    digest = hashlib.sha256()
+    dotenv: Optional[Path] = None
+    for path in _context_files(cwd):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        digest.update(f"{path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+        if path.name == ".env" and dotenv is None:
+            dotenv = path
+
+    # Only the first .env found is loaded, and it never overrides the environment
+    environment = {}
+    if dotenv is not None:
+        from dotenv import dotenv_values
+
+        environment = {name: value or "" for name, value in dotenv_values(dotenv).items()}
+    environment.update(os.environ)
+    for name in sorted(name for name in environment if _is_context_variable(name)):
+        digest.update(f"{name}={environment[name]}\n".encode("utf-8", errors="surrogatepass"))
+
+    return {"cwd": str(cwd), "fingerprint": digest.hexdigest()}
+
+
+def encode(message: Dict[str, Any]) -> bytes:
+    """Encode a message as one line of JSON."""
+    return json.dumps(message, ensure_ascii=False, default=str).encode("utf-8") + b"\n"
+
+
+def decode(line: bytes) -> Dict[str, Any]:
+    """Decode one line of JSON into a message."""
+    message = json.loads(line.decode("utf-8"))
+    if not isinstance(message, dict):
+        raise ValueError("Message must be a JSON object")
+    return message
+
+
+def response_to_dict(response: AIResponse) -> Dict[str, Any]:
+    """Convert an AIResponse into a JSON-serializable dictionary."""
+    return {
+        "content": str(response),
+        "model": response.model,
+        "backend": response.backend,
+        "tokens_in": response.tokens_in,
+        "tokens_out": response.tokens_out,
+        "time_taken": response.time_taken,
+        "cost": response.cost,
+        "error": response.error,
+        "metadata": json.loads(json.dumps(response.metadata or {}, default=str)),
+    }
+
+
+def response_from_dict(data: Dict[str, Any]) -> AIResponse:
+    """Rebuild an AIResponse sent by the daemon."""
+    return AIResponse(
+        data.get("content", ""),
+        model=data.get("model"),
+        backend=data.get("backend"),
+        tokens_in=data.get("tokens_in"),
+        tokens_out=data.get("tokens_out"),
+        time_taken=data.get("time_taken"),
+        cost=data.get("cost"),
+        error=data.get("error"),
+        metadata=data.get("metadata"),
+    )
+
+
+def error_to_dict(error: BaseException) -> Dict[str, Any]:
+    """Describe an exception so the client can raise an equivalent one."""
+    return {
+        "event": "error",
+        "type": type(error).__name__,
+        "message": getattr(error, "message", None) or str(error),
+        "details": json.loads(json.dumps(getattr(error, "details", None) or {}, default=str)),
+    }
+
+
+def error_from_dict(data: Dict[str, Any]) -> Exception:
+    """
+    Rebuild an exception reported by the daemon.
+
+    Library exceptions keep their type, message and details so callers can
+    handle them as if the request had run in-process. Built-in exceptions keep
+    their type; anything else becomes an AIError.
+    """
+    name = str(data.get("type", ""))
+    message = str(data.get("message", "Daemon request failed"))
+    details = data.get("details") or {}
+
+    error_class = getattr(exceptions, name, None)
+    if isinstance(error_class, type) and issubclass(error_class, exceptions.AIError):
+        # Subclasses take varying constructor arguments; restore the common state directly
+        error = error_class.__new__(error_class)
+        exceptions.AIError.__init__(error, message, details)
+        return error
+
+    builtin_class = getattr(builtins, name, None)
+    if isinstance(builtin_class, type) and issubclass(builtin_class, Exception):
+        try:
+            return builtin_class(message)
+        except TypeError:
+            pass
+    return exceptions.AIError(f"{name}: {message}" if name else message, details)
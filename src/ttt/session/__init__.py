@@ -1,6 +1,37 @@
 """Session management for TTT."""
 
-from .chat import PersistentChatSession
-from .manager import ChatMessage, ChatSession, ChatSessionManager
+import importlib
+from typing import Any, Dict
 
-__all__ = ["PersistentChatSession", "ChatMessage", "ChatSession", "ChatSessionManager"]
+# Names are imported on first access (PEP 562)
+_LAZY_IMPORTS: Dict[str, str] = {
+    "PersistentChatSession": ".chat",
+    "ChatMessage": ".manager",
+    "ChatSession": ".manager",
+    "ChatSessionManager": ".manager",
+    "ContextStrategy": ".context",
+    "FullHistoryStrategy": ".context",
+    "SlidingWindowStrategy": ".context",
+    "SummarizingStrategy": ".context",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+__all__ = [
+    "PersistentChatSession",
+    "ChatMessage",
+    "ChatSession",
+    "ChatSessionManager",
+    "ContextStrategy",
+    "FullHistoryStrategy",
+    "SlidingWindowStrategy",
+    "SummarizingStrategy",
+]
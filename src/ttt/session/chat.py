@@ -5,33 +5,27 @@ import json
 import pickle
 from datetime import datetime
 from pathlib import Path
-from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
 
 from ..backends import BaseBackend
+from ..config.loader import get_config_value
 from ..core.exceptions import InvalidParameterError, SessionLoadError, SessionSaveError
 from ..core.models import AIResponse, ImageInput
 from ..core.routing import router
-from ..utils import get_logger, run_async
+from ..core.tokens import get_token_counter
+from ..utils import get_logger, iterate_in_background, run_async
+from .context import (
+    SUMMARY_SYSTEM_PROMPT,
+    ContextStrategy,
+    ContextWindow,
+    SummarizingStrategy,
+    create_context_strategy,
+    lookup_context_length,
+)
 
 logger = get_logger(__name__)
 
 
-def _estimate_tokens(content: Union[str, List]) -> int:
-    """Estimate token count for content."""
-    if isinstance(content, str):
-        # Rough estimate: ~1 token per 4 characters
-        return max(len(content) // 4, 0)
-    elif isinstance(content, list):
-        tokens = 0
-        for item in content:
-            if isinstance(item, str):
-                tokens += len(item) // 4
-            elif isinstance(item, ImageInput):
-                # Images typically use more tokens
-                tokens += 85  # Base64 encoded images use significant tokens
-        return tokens
-
-
 class PersistentChatSession:
     """
     Chat session with conversation memory and persistence support.
@@ -42,6 +36,7 @@ class PersistentChatSession:
     - Multiple persistence formats (JSON, pickle)
     - Session resumption
     - Tool persistence and execution
+    - Async turns (``aask``/``astream``) that are serialized per session
     """
 
     def __init__(
@@ -52,6 +47,7 @@ class PersistentChatSession:
         backend: Optional[Union[str, BaseBackend]] = None,
         session_id: Optional[str] = None,
         tools: Optional[List] = None,
+        context_strategy: Union[str, ContextStrategy, None] = None,
         **kwargs: Any,
     ):
         """
@@ -63,6 +59,8 @@ class PersistentChatSession:
             backend: Backend to use for this session
             session_id: Unique identifier for this session
             tools: List of functions/tools the AI can call
+            context_strategy: How history is fit into the model's context window -
+                "full", "sliding", "summarize" or a ContextStrategy (default from config)
             **kwargs: Additional parameters passed to each request
         """
         self.system = system
@@ -79,7 +77,19 @@ class PersistentChatSession:
             "model_usage": {},
             "backend_usage": {},
             "tools_used": {},
+            "context": {"truncated_requests": 0, "tokens_saved": 0, "summaries": 0},
         }
+        self.context_strategy = create_context_strategy(context_strategy, summarizer=self._summarize_history)
+
+        # Serializes async turns (see _turn_lock); created on first use inside a loop
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Incrementally maintained views of the history (see api_messages)
+        self._api_synced: int
+        self._conversation: str
+        self._conversation_synced: int
+        self._reset_message_view()
 
         # Resolve backend using router
         if backend is None:
@@ -113,6 +123,128 @@ class PersistentChatSession:
         """Get the message history (alias for history)."""
         return self.history
 
+    @property
+    def api_messages(self) -> List[Dict[str, Any]]:
+        """
+        Get the history in API message format, including the system prompt.
+
+        The list is maintained incrementally: entries appended to ``history``
+        since the last call are converted, everything before is reused. The
+        same list object is returned (and handed to backends) on every turn,
+        so callers must treat it as read-only.
+        """
+        self._sync_message_view()
+        for msg in self._slice_new(self._api_synced):
+            self._api_messages.append({"role": msg["role"], "content": msg["content"]})
+        self._api_synced = len(self.history)
+        return self._api_messages
+
+    def _conversation_text(self) -> str:
+        """Get the history rendered as a conversation, extending the cached rendering."""
+        self._sync_message_view()
+        new_parts = [self._render_message(msg) for msg in self._slice_new(self._conversation_synced)]
+        if new_parts:
+            if self._conversation:
+                new_parts.insert(0, self._conversation)
+            self._conversation = "\n\n".join(new_parts)
+        self._conversation_synced = len(self.history)
+        return self._conversation
+
+    def _reset_message_view(self) -> None:
+        """Drop the cached message views so they are rebuilt from the history."""
+        self._view_source: Optional[List[Dict[str, Any]]] = self.history
+        self._view_system = self.system
+        self._api_messages: List[Dict[str, Any]] = []
+        self._api_synced = 0
+        self._conversation = ""
+        self._conversation_synced = 0
+        if self.system:
+            system_message = {"role": "system", "content": self.system}
+            self._api_messages.append(system_message)
+            self._conversation = self._render_message(system_message)
+
+    def _sync_message_view(self) -> None:
+        """Invalidate the cached views if the history was replaced, truncated or the system prompt changed."""
+        if (
+            self.history is not self._view_source
+            or self.system != self._view_system
+            or len(self.history) < max(self._api_synced, self._conversation_synced)
+        ):
+            self._reset_message_view()
+
+    def _slice_new(self, synced: int) -> List[Dict[str, Any]]:
+        """Get the history entries added after the first ``synced`` entries."""
+        return self.history[synced:] if synced < len(self.history) else []
+
+    def _prepare_request(
+        self, prompt: Union[str, List[Union[str, ImageInput]]], model: Optional[str], params: Dict[str, Any]
+    ) -> Tuple[Union[str, List[Union[str, ImageInput]]], Optional[List[Dict[str, Any]]]]:
+        """Get the prompt and message list to send to the backend for the current turn."""
+        if not hasattr(self.backend, "supports_messages"):
+            # Backend keeps no message history; send only the new prompt
+            return prompt, None
+
+        window = self._fit_context(model, params)
+        if not self.backend.supports_messages:
+            # Backend takes a single prompt; send the whole conversation as text
+            if window.messages is self._api_messages:
+                return self._conversation_text(), window.messages
+            return self._messages_to_conversation(window.messages), window.messages
+        # Use last message as prompt (backend will handle history)
+        return prompt, window.messages
+
+    def _fit_context(self, model: Optional[str], params: Dict[str, Any]) -> ContextWindow:
+        """Select the part of the history that fits the model's context window."""
+        counter = get_token_counter()
+        window = self.context_strategy.fit(
+            self.api_messages,
+            self._context_budget(model, params),
+            lambda messages: counter.count_messages(messages, model),
+        )
+        if window.truncated:
+            context_stats = self.metadata.setdefault("context", {})
+            context_stats["strategy"] = self.context_strategy.name
+            context_stats["truncated_requests"] = context_stats.get("truncated_requests", 0) + 1
+            context_stats["tokens_saved"] = context_stats.get("tokens_saved", 0) + max(window.tokens_saved, 0)
+            logger.debug(
+                f"Sending {len(window.messages)} of {len(self._api_messages)} messages "
+                f"({window.total_tokens} tokens, {window.tokens_saved} saved)"
+            )
+        return window
+
+    def _context_budget(self, model: Optional[str], params: Dict[str, Any]) -> Optional[int]:
+        """Get the input token budget for a request, or None if it is unknown."""
+        max_input_tokens = get_config_value("chat.context.max_input_tokens")
+        if max_input_tokens:
+            return int(max_input_tokens)
+
+        context_length = lookup_context_length(model)
+        if not context_length:
+            return None
+        reserve = params.get("max_tokens") or get_config_value("chat.context.reserve_tokens", 1024)
+        return max(context_length - int(reserve), 0)
+
+    def _summarize_history(self, prompt: str) -> str:
+        """Summarize dropped turns, using the configured summary model if set."""
+        summary_model = get_config_value("chat.context.summary_model")
+        if summary_model:
+            backend, summary_model = router.smart_route(prompt, model=summary_model)
+        else:
+            backend, summary_model = self.backend, self.model
+
+        response = run_async(
+            backend.ask(
+                prompt,
+                model=summary_model,
+                system=SUMMARY_SYSTEM_PROMPT,
+                max_tokens=getattr(self.context_strategy, "summary_max_tokens", None),
+            )
+        )
+        self._update_metadata(response)
+        context_stats = self.metadata.setdefault("context", {})
+        context_stats["summaries"] = context_stats.get("summaries", 0) + 1
+        return str(response)
+
     def ask(
         self,
         prompt: Union[str, List[Union[str, ImageInput]]],
@@ -131,58 +263,164 @@ class PersistentChatSession:
         Returns:
             AIResponse with the assistant's reply
         """
-        # Record timestamp
-        timestamp = datetime.now().isoformat()
+        full_prompt, request = self._begin_turn(prompt, model, kwargs)
+        response = run_async(self.backend.ask(full_prompt, **request))
+        self._record_response(response)
+        return response
 
-        # Add user message to history
-        self.history.append({"role": "user", "content": prompt, "timestamp": timestamp})
+    async def aask(
+        self,
+        prompt: Union[str, List[Union[str, ImageInput]]],
+        *,
+        model: Optional[str] = None,
+        **kwargs: Any,
+    ) -> AIResponse:
+        """
+        Ask a question in this chat session from async code.
 
-        # Track multimodal usage
-        if isinstance(prompt, list):
-            # Count images in the prompt
-            image_count = sum(1 for item in prompt if isinstance(item, ImageInput))
-            if image_count > 0:
-                if "multimodal_messages" not in self.metadata:
-                    self.metadata["multimodal_messages"] = 0
-                if "total_images" not in self.metadata:
-                    self.metadata["total_images"] = 0
-                self.metadata["multimodal_messages"] += 1
-                self.metadata["total_images"] += image_count
-
-        # Build messages for API
-        messages = []
-        if self.system:
-            messages.append({"role": "system", "content": self.system})
+        The request runs on the caller's event loop. Concurrent turns on the
+        same session are serialized so each one sees the previous reply in
+        its history; turns on different sessions run concurrently.
 
-        for msg in self.history:
-            messages.append({"role": msg["role"], "content": msg["content"]})
+        Args:
+            prompt: Your message - can be text or multi-modal content
+            model: Override the session's default model
+            **kwargs: Additional parameters for this request
 
-        # For backends that don't support message format, convert to string
-        if hasattr(self.backend, "supports_messages") and not self.backend.supports_messages:
-            # Convert to conversation format
-            conversation = self._messages_to_conversation(messages)
-            full_prompt: Union[str, List[Union[str, ImageInput]]] = conversation
-        else:
-            # Use last message as prompt (backend will handle history)
-            full_prompt = prompt
+        Returns:
+            AIResponse with the assistant's reply
+        """
+        async with self._turn_lock():
+            full_prompt, request = await self._abegin_turn(prompt, model, kwargs)
+            response = await self.backend.ask(full_prompt, **request)
+            self._record_response(response)
+            return response
+
+    def stream(
+        self,
+        prompt: Union[str, List[Union[str, ImageInput]]],
+        *,
+        model: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Iterator[str]:
+        """
+        Stream a response in this chat session.
+
+        Args:
+            prompt: Your message - can be text or multi-modal content
+            model: Override the session's default model
+            **kwargs: Additional parameters for this request
+
+        Yields:
+            String chunks as they arrive
+        """
+        full_prompt, request = self._begin_turn(prompt, model, kwargs)
+
+        # Collect response for history
+        response_chunks = []
+
+        # Stream the response
+        async def _async_stream() -> AsyncIterator[str]:
+            async for chunk in self.backend.astream(full_prompt, **request):
+                response_chunks.append(chunk)
+                yield chunk
+
+        # Run on the shared background loop so pooled backend connections are reused
+        yield from iterate_in_background(_async_stream())
+
+        self._record_streamed_response("".join(response_chunks), request["model"])
+
+    async def astream(
+        self,
+        prompt: Union[str, List[Union[str, ImageInput]]],
+        *,
+        model: Optional[str] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a response in this chat session from async code.
+
+        The session stays locked until the stream is exhausted or closed, so
+        a concurrent turn on the same session waits for this reply.
+
+        Args:
+            prompt: Your message - can be text or multi-modal content
+            model: Override the session's default model
+            **kwargs: Additional parameters for this request
+
+        Yields:
+            String chunks as they arrive
+        """
+        async with self._turn_lock():
+            full_prompt, request = await self._abegin_turn(prompt, model, kwargs)
+            response_chunks = []
+            async for chunk in self.backend.astream(full_prompt, **request):
+                response_chunks.append(chunk)
+                yield chunk
+            self._record_streamed_response("".join(response_chunks), request["model"])
+
+    def _turn_lock(self) -> asyncio.Lock:
+        """Get the lock serializing async turns, bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._lock_loop is not loop:
+            # asyncio locks belong to one loop; a session reused from another loop gets a new one
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        assert self._lock is not None
+        return self._lock
+
+    def _begin_turn(
+        self,
+        prompt: Union[str, List[Union[str, ImageInput]]],
+        model: Optional[str],
+        kwargs: Dict[str, Any],
+    ) -> Tuple[Union[str, List[Union[str, ImageInput]]], Dict[str, Any]]:
+        """Add the user message to the history and build the backend request for this turn."""
+        self._record_prompt(prompt)
 
         # Merge parameters
         params = {**self.kwargs, **kwargs}
+        full_prompt, messages = self._prepare_request(prompt, model or self.model, params)
+        return full_prompt, self._request_kwargs(model, messages, params)
 
-        # Make the request
-        async def _ask_wrapper() -> AIResponse:
-            return await self.backend.ask(
-                full_prompt,
-                model=model or self.model,
-                system=self.system if len(self.history) == 1 else None,
-                messages=(messages if hasattr(self.backend, "supports_messages") else None),
-                tools=self.tools,
-                **params,
-            )
+    async def _abegin_turn(
+        self,
+        prompt: Union[str, List[Union[str, ImageInput]]],
+        model: Optional[str],
+        kwargs: Dict[str, Any],
+    ) -> Tuple[Union[str, List[Union[str, ImageInput]]], Dict[str, Any]]:
+        """Async version of _begin_turn that keeps summarization off the event loop."""
+        if not isinstance(self.context_strategy, SummarizingStrategy):
+            return self._begin_turn(prompt, model, kwargs)
+        # Summarizing dropped turns makes a blocking model request
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._begin_turn, prompt, model, kwargs)
+
+    def _record_prompt(self, prompt: Union[str, List[Union[str, ImageInput]]]) -> None:
+        """Add a user message to the history and track multimodal usage."""
+        self.history.append({"role": "user", "content": prompt, "timestamp": datetime.now().isoformat()})
+
+        if isinstance(prompt, list):
+            # Count images in the prompt
+            image_count = sum(1 for item in prompt if isinstance(item, ImageInput))
+            if image_count > 0:
+                self.metadata["multimodal_messages"] = self.metadata.get("multimodal_messages", 0) + 1
+                self.metadata["total_images"] = self.metadata.get("total_images", 0) + image_count
 
-        response = run_async(_ask_wrapper())
+    def _request_kwargs(
+        self, model: Optional[str], messages: Optional[List[Dict[str, Any]]], params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Get the keyword arguments for the backend call of the current turn."""
+        return {
+            "model": model or self.model,
+            "system": self.system if len(self.history) == 1 else None,
+            "messages": messages,
+            "tools": self.tools,
+            **params,
+        }
 
-        # Add assistant response to history
+    def _record_response(self, response: AIResponse) -> None:
+        """Add the assistant's reply to the history and update the session metadata."""
         response_entry: Dict[str, Any] = {
             "role": "assistant",
             "content": str(response),
@@ -215,99 +453,23 @@ class PersistentChatSession:
                 self.metadata["tools_used"][call.name] += 1
 
         self.history.append(response_entry)
-
-        # Update metadata
         self._update_metadata(response)
 
-        return response
-
-    def stream(
-        self,
-        prompt: Union[str, List[Union[str, ImageInput]]],
-        *,
-        model: Optional[str] = None,
-        **kwargs: Any,
-    ) -> Iterator[str]:
-        """
-        Stream a response in this chat session.
-
-        Args:
-            prompt: Your message - can be text or multi-modal content
-            model: Override the session's default model
-            **kwargs: Additional parameters for this request
-
-        Yields:
-            String chunks as they arrive
-        """
-        # Record timestamp
-        timestamp = datetime.now().isoformat()
-
-        # Add user message to history
-        self.history.append({"role": "user", "content": prompt, "timestamp": timestamp})
-
-        # Build messages for API
-        messages = []
-        if self.system:
-            messages.append({"role": "system", "content": self.system})
-
-        for msg in self.history:
-            messages.append({"role": msg["role"], "content": msg["content"]})
-
-        # Prepare prompt
-        if hasattr(self.backend, "supports_messages") and not self.backend.supports_messages:
-            conversation = self._messages_to_conversation(messages)
-            full_prompt: Union[str, List[Union[str, ImageInput]]] = conversation
-        else:
-            full_prompt = prompt
-
-        # Merge parameters
-        params = {**self.kwargs, **kwargs}
-
-        # Collect response for history
-        response_chunks = []
-
-        # Stream the response
-        async def _async_stream() -> AsyncIterator[str]:
-            async for chunk in self.backend.astream(
-                full_prompt,
-                model=model or self.model,
-                system=self.system if len(self.history) == 1 else None,
-                messages=(messages if hasattr(self.backend, "supports_messages") else None),
-                tools=self.tools,
-                **params,
-            ):
-                response_chunks.append(chunk)
-                yield chunk
-
-        # Run async generator in sync context
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            async_gen = _async_stream()
-            while True:
-                try:
-                    chunk = loop.run_until_complete(async_gen.__anext__())
-                    yield chunk
-                except StopAsyncIteration:
-                    break
-        finally:
-            loop.close()
-            asyncio.set_event_loop(None)
-
-        # Add complete response to history
-        full_response = "".join(response_chunks)
+    def _record_streamed_response(self, content: str, model: Optional[str]) -> None:
+        """Add a streamed reply to the history."""
         self.history.append(
             {
                 "role": "assistant",
-                "content": full_response,
+                "content": content,
                 "timestamp": datetime.now().isoformat(),
-                "model": model or self.model,
+                "model": model,
             }
         )
 
     def clear(self) -> None:
         """Clear conversation history while preserving session metadata."""
         self.history.clear()
+        self._reset_message_view()
         # Reset message count
         self.metadata["message_count"] = 0
         logger.debug(f"Cleared history for session {self.metadata['session_id']}")
@@ -449,6 +611,7 @@ class PersistentChatSession:
         # Support both 'messages' and 'history' for compatibility
         session.history = session_data.get("messages", session_data.get("history", []))
         session.metadata.update(session_data.get("metadata", {}))
+        session._reset_message_view()
 
         logger.info(f"Loaded session from {path} ({len(session.history)} messages)")
         return session
@@ -543,20 +706,22 @@ class PersistentChatSession:
 
     def _messages_to_conversation(self, messages: List[Dict[str, Any]]) -> str:
         """Convert messages to conversation format for backends that need it."""
-        conversation = []
-        for msg in messages:
-            if msg["role"] == "system":
-                conversation.append(f"System: {msg['content']}")
-            elif msg["role"] == "user":
-                content = msg["content"]
-                if isinstance(content, list):
-                    # Extract text from multi-modal content
-                    text_parts = [item for item in content if isinstance(item, str)]
-                    content = " ".join(text_parts)
-                conversation.append(f"Human: {content}")
-            else:
-                conversation.append(f"Assistant: {msg['content']}")
-        return "\n\n".join(conversation)
+        return "\n\n".join(self._render_message(msg) for msg in messages)
+
+    @staticmethod
+    def _render_message(msg: Dict[str, Any]) -> str:
+        """Render a single message as a conversation line."""
+        if msg["role"] == "system":
+            return f"System: {msg['content']}"
+        elif msg["role"] == "user":
+            content = msg["content"]
+            if isinstance(content, list):
+                # Extract text from multi-modal content
+                text_parts = [item for item in content if isinstance(item, str)]
+                content = " ".join(text_parts)
+            return f"Human: {content}"
+        else:
+            return f"Assistant: {msg['content']}"
 
     def _update_metadata(self, response: AIResponse) -> None:
         """Update session metadata with response information."""
@@ -0,0 +1,313 @@
+"""Context window management for chat sessions.
+
+Long conversations eventually exceed a model's context window, and well
+before that they spend most of each request re-sending old turns. The
+strategies here decide which part of the history is sent on each turn:
+
+- ``full``: send everything (the historical behaviour)
+- ``sliding``: keep the system prompt and the most recent turns that fit the
+  token budget, dropping the oldest turns first
+- ``summarize``: like ``sliding``, but fold dropped turns into a running
+  summary produced by a (preferably cheap) model
+
+Strategies are stateful. Chat histories only grow between resets, so token
+counts are cached per message and the window start only moves forward,
+keeping the per-turn work proportional to the new messages rather than to
+the whole history.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from ..config.loader import get_config_value
+from ..utils import get_logger
+
+logger = get_logger(__name__)
+
+Message = Dict[str, Any]
+CountTokens = Callable[[List[Message]], List[int]]
+Summarizer = Callable[[str], str]
+
+SUMMARY_PREFIX = "Summary of the earlier conversation:"
+SUMMARY_SYSTEM_PROMPT = (
+    "You summarize conversations. Preserve facts, names, decisions, open questions and "
+    "anything the user asked to remember. Be concise and write in the third person."
+)
+
+
+@dataclass
+class ContextWindow:
+    """The part of a conversation selected for a request."""
+
+    messages: List[Message]
+    total_tokens: int
+    dropped_messages: int = 0
+    tokens_saved: int = 0
+    summarized: bool = False
+
+    @property
+    def truncated(self) -> bool:
+        """Check if any history was left out of the request."""
+        return self.dropped_messages > 0
+
+
+class ContextStrategy(ABC):
+    """Base class for context window strategies."""
+
+    name = "base"
+
+    def __init__(self, pin_recent_turns: int = 2):
+        """
+        Initialize the strategy.
+
+        Args:
+            pin_recent_turns: Number of most recent user/assistant turns that are always sent
+        """
+        self.pin_recent_turns = max(pin_recent_turns, 0)
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget cached counts, e.g. after the history was cleared or replaced."""
+        self._source: Optional[List[Message]] = None
+        self._counts: List[int] = []
+        self._total = 0
+
+    @abstractmethod
+    def fit(self, messages: List[Message], budget: Optional[int], count_tokens: CountTokens) -> ContextWindow:
+        """
+        Select the messages to send.
+
+        Args:
+            messages: Full API message list, optionally starting with the system prompt
+            budget: Maximum input tokens, or None if unknown
+            count_tokens: Function returning the token count of each message in a list
+
+        Returns:
+            ContextWindow with the messages to send
+        """
+
+    def _sync_counts(self, messages: List[Message], count_tokens: CountTokens) -> None:
+        """Count tokens for messages added since the last call."""
+        self._count_tokens = count_tokens
+        if messages is not self._source or len(messages) < len(self._counts):
+            self.reset()
+            self._source = messages
+        if len(messages) > len(self._counts):
+            new_counts = count_tokens(messages[len(self._counts) :])
+            self._counts.extend(new_counts)
+            self._total += sum(new_counts)
+
+
+class FullHistoryStrategy(ContextStrategy):
+    """Send the whole history every turn."""
+
+    name = "full"
+
+    def fit(self, messages: List[Message], budget: Optional[int], count_tokens: CountTokens) -> ContextWindow:
+        self._sync_counts(messages, count_tokens)
+        return ContextWindow(messages=messages, total_tokens=self._total)
+
+
+class SlidingWindowStrategy(ContextStrategy):
+    """Drop the oldest turns until the history fits the token budget."""
+
+    name = "sliding"
+
+    def reset(self) -> None:
+        super().reset()
+        self._start = 0
+        self._prefix_tokens = 0
+        self._budget: Optional[int] = None
+
+    def fit(self, messages: List[Message], budget: Optional[int], count_tokens: CountTokens) -> ContextWindow:
+        self._sync_counts(messages, count_tokens)
+        if budget is None or self._total <= budget:
+            return ContextWindow(messages=messages, total_tokens=self._total)
+
+        pinned = self._pinned_prefix(messages)
+        start = self._advance_window(messages, pinned, budget - sum(self._counts[:pinned]) - self._reserved_tokens())
+        return self._build_window(messages, pinned, start)
+
+    def _reserved_tokens(self) -> int:
+        """Tokens kept free inside the budget for content added by the strategy."""
+        return 0
+
+    def _pinned_prefix(self, messages: List[Message]) -> int:
+        """Number of leading system messages that are always sent."""
+        pinned = 0
+        while pinned < len(messages) and messages[pinned].get("role") == "system":
+            pinned += 1
+        return pinned
+
+    def _latest_start(self, messages: List[Message], pinned: int) -> int:
+        """Latest window start that still keeps the pinned recent turns (and always the newest prompt)."""
+        wanted = max(self.pin_recent_turns, 1)
+        user_turns = 0
+        for index in range(len(messages) - 1, pinned - 1, -1):
+            if messages[index].get("role") == "user":
+                user_turns += 1
+                if user_turns == wanted:
+                    return index
+        return pinned
+
+    def _advance_window(self, messages: List[Message], pinned: int, budget: int) -> int:
+        """Move the window start forward until the remaining history fits the budget."""
+        if budget != self._budget or self._start < pinned:
+            # Budget changed (e.g. a model override): recompute the window from scratch
+            self._budget = budget
+            self._start = pinned
+            self._prefix_tokens = sum(self._counts[:pinned])
+
+        latest = self._latest_start(messages, pinned)
+        while self._total - self._prefix_tokens > budget and self._start < latest:
+            self._prefix_tokens += self._counts[self._start]
+            self._start += 1
+
+        # Never start the window on an assistant reply without its question
+        while self._start < latest and messages[self._start].get("role") != "user":
+            self._prefix_tokens += self._counts[self._start]
+            self._start += 1
+
+        if self._total - self._prefix_tokens > budget:
+            logger.warning(
+                f"Pinned recent turns need {self._total - self._prefix_tokens} tokens, over the budget of {budget}"
+            )
+        return self._start
+
+    def _build_window(self, messages: List[Message], pinned: int, start: int) -> ContextWindow:
+        kept = messages[:pinned] + messages[start:]
+        kept_tokens = sum(self._counts[:pinned]) + self._total - self._prefix_tokens
+        return ContextWindow(
+            messages=kept,
+            total_tokens=kept_tokens,
+            dropped_messages=start - pinned,
+            tokens_saved=self._total - kept_tokens,
+        )
+
+
+class SummarizingStrategy(SlidingWindowStrategy):
+    """Sliding window that replaces dropped turns with a running summary."""
+
+    name = "summarize"
+
+    def __init__(self, summarizer: Summarizer, pin_recent_turns: int = 2, summary_max_tokens: int = 512):
+        """
+        Initialize the strategy.
+
+        Args:
+            summarizer: Function that returns a summary for a prompt
+            pin_recent_turns: Number of most recent user/assistant turns that are always sent
+            summary_max_tokens: Token budget set aside for the summary
+        """
+        self.summarizer = summarizer
+        self.summary_max_tokens = summary_max_tokens
+        super().__init__(pin_recent_turns=pin_recent_turns)
+
+    def reset(self) -> None:
+        super().reset()
+        self.summary: Optional[str] = None
+        self._summarized_upto = 0
+
+    def _reserved_tokens(self) -> int:
+        return self.summary_max_tokens
+
+    def _build_window(self, messages: List[Message], pinned: int, start: int) -> ContextWindow:
+        window = super()._build_window(messages, pinned, start)
+        if start <= pinned:
+            return window
+
+        if start > self._summarized_upto:
+            try:
+                prompt = self._summary_prompt(messages, max(self._summarized_upto, pinned), start)
+                self.summary = self.summarizer(prompt)
+                self._summarized_upto = start
+            except Exception as e:
+                # Keep the previous summary (if any) rather than failing the turn
+                logger.warning(f"Could not summarize earlier conversation: {e}")
+
+        if not self.summary:
+            return window
+
+        summary_message: Message = {"role": "system", "content": f"{SUMMARY_PREFIX}\n{self.summary}"}
+        summary_tokens = self._count_tokens([summary_message])[0]
+        window.messages.insert(pinned, summary_message)
+        window.total_tokens += summary_tokens
+        window.tokens_saved -= summary_tokens
+        window.summarized = True
+        return window
+
+    def _summary_prompt(self, messages: List[Message], begin: int, end: int) -> str:
+        """Build the prompt folding newly dropped turns into the running summary."""
+        lines = []
+        if self.summary:
+            lines.append(f"Existing summary:\n{self.summary}\n")
+        lines.append("Conversation to add to the summary:")
+        for message in messages[begin:end]:
+            content = message.get("content")
+            if isinstance(content, list):
+                content = " ".join(item for item in content if isinstance(item, str))
+            lines.append(f"{str(message.get('role', '')).capitalize()}: {content}")
+        lines.append("\nWrite an updated summary of the whole conversation so far.")
+        return "\n".join(lines)
+
+
+def lookup_context_length(model: Optional[str]) -> Optional[int]:
+    """
+    Find the context window size of a model in the model registry.
+
+    Provider-prefixed names (``openrouter/openai/gpt-4``) and provider model
+    names (``claude-3-opus-20240229``) are matched as well as registry names
+    and aliases.
+    """
+    if not model:
+        return None
+
+    from ..config.schema import get_model_registry
+
+    registry = get_model_registry()
+    info = registry.get_model(model) or registry.get_model(model.rsplit("/", 1)[-1])
+    if info is None:
+        short_name = model.rsplit("/", 1)[-1]
+        info = next((m for m in registry.models.values() if m.provider_name in (model, short_name)), None)
+    return info.context_length if info else None
+
+
+def create_context_strategy(
+    strategy: Union[str, ContextStrategy, None] = None,
+    *,
+    summarizer: Optional[Summarizer] = None,
+    **options: Any,
+) -> ContextStrategy:
+    """
+    Create a context strategy by name, using configured defaults for unset options.
+
+    Args:
+        strategy: Strategy name ("full", "sliding", "summarize"), an instance, or None for the configured default
+        summarizer: Summary function, required by the "summarize" strategy
+        **options: Strategy options (pin_recent_turns, summary_max_tokens)
+
+    Returns:
+        ContextStrategy instance
+    """
+    if isinstance(strategy, ContextStrategy):
+        return strategy
+
+    name = strategy or get_config_value("chat.context.strategy", "sliding")
+    pin_recent_turns = options.get("pin_recent_turns", get_config_value("chat.context.pin_recent_turns", 2))
+
+    if name == "full":
+        return FullHistoryStrategy(pin_recent_turns=pin_recent_turns)
+    if name == "sliding":
+        return SlidingWindowStrategy(pin_recent_turns=pin_recent_turns)
+    if name == "summarize":
+        if summarizer is None:
+            raise ValueError("The summarize context strategy needs a summarizer")
+        return SummarizingStrategy(
+            summarizer,
+            pin_recent_turns=pin_recent_turns,
+            summary_max_tokens=options.get(
+                "summary_max_tokens", get_config_value("chat.context.summary_max_tokens", 512)
+            ),
+        )
+    raise ValueError(f"Unknown context strategy: {name}")
@@ -0,0 +1,214 @@
+"""SQLite index of chat sessions.
+
+The index keeps one row per session with the fields needed for listing
+(timestamps, message count, model and a preview of the last message), so
+listing sessions does not have to open every session file. Rows also record
+the size and mtime of the session file they were built from, which lets the
+index detect and repair drift when files are changed outside the manager.
+"""
+
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from ..utils import get_logger
+
+logger = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id TEXT PRIMARY KEY,
+    created_at TEXT,
+    updated_at TEXT,
+    message_count INTEGER NOT NULL DEFAULT 0,
+    model TEXT,
+    last_message TEXT,
+    file_name TEXT NOT NULL,
+    file_size INTEGER NOT NULL,
+    file_mtime_ns INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_updated_at ON sessions (updated_at);
+CREATE INDEX IF NOT EXISTS idx_sessions_model ON sessions (model);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+_SET_META = "INSERT INTO meta (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value"
+
+_SUMMARY_COLUMNS = ("id", "created_at", "updated_at", "message_count", "last_message", "model")
+
+
+def _as_timestamp(value: Optional[Union[str, datetime]]) -> Optional[str]:
+    """Normalize a date filter to the ISO format used for stored timestamps."""
+    if value is None or isinstance(value, str):
+        return value
+    return value.isoformat()
+
+
+class SessionIndex:
+    """Sidecar SQLite index of session summaries."""
+
+    def __init__(self, path: Path):
+        """
+        Open (and create if needed) the session index.
+
+        Args:
+            path: Path of the SQLite database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=5.0, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        # Per-turn updates should not pay for a full fsync of the rollback journal
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def upsert(self, summary: Dict[str, Any], session_file: Path, meta: Optional[Dict[str, str]] = None) -> None:
+        """
+        Insert or update the row for a session.
+
+        Args:
+            summary: Session summary with id, timestamps, message_count, model and last_message
+            session_file: File the summary was read from
+            meta: Metadata values to store in the same transaction
+        """
+        stat = session_file.stat()
+        with self._lock, self._conn:
+            if meta:
+                self._conn.executemany(_SET_META, meta.items())
+            self._conn.execute(
+                """
+                INSERT INTO sessions
+                    (id, created_at, updated_at, message_count, model, last_message,
+                     file_name, file_size, file_mtime_ns)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    created_at = excluded.created_at,
+                    updated_at = excluded.updated_at,
+                    message_count = excluded.message_count,
+                    model = excluded.model,
+                    last_message = excluded.last_message,
+                    file_name = excluded.file_name,
+                    file_size = excluded.file_size,
+                    file_mtime_ns = excluded.file_mtime_ns
+                """,
+                (
+                    summary["id"],
+                    summary.get("created_at"),
+                    summary.get("updated_at"),
+                    summary.get("message_count", 0),
+                    summary.get("model"),
+                    summary.get("last_message"),
+                    session_file.name,
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                ),
+            )
+
+    def delete(self, session_id: str) -> None:
+        """Remove a session from the index."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
+
+    def clear(self) -> None:
+        """Remove all rows from the index."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM sessions")
+            self._conn.execute("DELETE FROM meta")
+
+    def query(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        model: Optional[str] = None,
+        since: Optional[Union[str, datetime]] = None,
+        until: Optional[Union[str, datetime]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Query session summaries, newest first.
+
+        Args:
+            limit: Maximum number of sessions to return
+            offset: Number of sessions to skip (for paging)
+            model: Only sessions using this model
+            since: Only sessions updated at or after this time
+            until: Only sessions updated at or before this time
+
+        Returns:
+            List of session summary dictionaries
+        """
+        where, params = self._filters(model, since, until)
+        sql = f"SELECT {', '.join(_SUMMARY_COLUMNS)} FROM sessions{where} ORDER BY updated_at DESC, id DESC"
+        if limit is not None or offset:
+            sql += " LIMIT ? OFFSET ?"
+            params.extend([-1 if limit is None else limit, offset])
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def count(
+        self,
+        model: Optional[str] = None,
+        since: Optional[Union[str, datetime]] = None,
+        until: Optional[Union[str, datetime]] = None,
+    ) -> int:
+        """Count sessions matching the given filters."""
+        where, params = self._filters(model, since, until)
+        with self._lock:
+            row = self._conn.execute(f"SELECT COUNT(*) FROM sessions{where}", params).fetchone()
+        return int(row[0])
+
+    def latest_id(self) -> Optional[str]:
+        """Get the ID of the most recently updated session."""
+        with self._lock:
+            row = self._conn.execute("SELECT id FROM sessions ORDER BY updated_at DESC, id DESC LIMIT 1").fetchone()
+        return row["id"] if row else None
+
+    def file_states(self) -> Dict[str, Dict[str, Any]]:
+        """Get the indexed file name, size and mtime for every session."""
+        with self._lock:
+            rows = self._conn.execute("SELECT id, file_name, file_size, file_mtime_ns FROM sessions").fetchall()
+        return {row["id"]: dict(row) for row in rows}
+
+    def get_meta(self, key: str) -> Optional[str]:
+        """Read a metadata value."""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        """Store a metadata value."""
+        with self._lock, self._conn:
+            self._conn.execute(_SET_META, (key, value))
+
+    @staticmethod
+    def _filters(
+        model: Optional[str],
+        since: Optional[Union[str, datetime]],
+        until: Optional[Union[str, datetime]],
+    ) -> Tuple[str, List[Any]]:
+        clauses = []
+        params: List[Any] = []
+        if model is not None:
+            clauses.append("model = ?")
+            params.append(model)
+        if since is not None:
+            clauses.append("updated_at >= ?")
+            params.append(_as_timestamp(since))
+        if until is not None:
+            clauses.append("updated_at <= ?")
+            params.append(_as_timestamp(until))
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
@@ -1,16 +1,37 @@
-"""Chat session management for TTT CLI."""
+"""Chat session management for TTT CLI.
+
+Sessions are stored as append-only JSONL logs: the first line is a header
+record with the session fields, followed by one record per message and
+occasional header updates. Saving a session only appends what changed, and
+the log is compacted back into a snapshot when it diverges from memory
+(e.g. after /clear) or accumulates too many header updates. Sessions in the
+legacy single-JSON format are migrated the first time they are loaded.
+"""
 
 import json
+import os
+import sqlite3
 import uuid
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from rich.console import Console
 from rich.table import Table
 
+from ..config.loader import get_config_value
+from ..utils import get_logger
+from .index import SessionIndex
+
 console = Console()
+logger = get_logger(__name__)
+
+# Version of the JSONL session log format
+SESSION_LOG_VERSION = 2
+
+# Session fields stored in the header record
+_HEADER_FIELDS = ("model", "system_prompt", "tools")
 
 
 @dataclass
@@ -65,16 +86,49 @@ class ChatSession:
 class ChatSessionManager:
     """Manages chat session persistence."""
 
-    def __init__(self, sessions_dir: Optional[Path] = None):
-        """Initialize the session manager."""
+    def __init__(self, sessions_dir: Optional[Path] = None, compact_threshold: Optional[int] = None):
+        """Initialize the session manager.
+
+        Args:
+            sessions_dir: Directory holding session logs (default ~/.ttt/sessions)
+            compact_threshold: Number of header-update records after which a log is compacted
+        """
         if sessions_dir is None:
             self.sessions_dir = Path.home() / ".ttt" / "sessions"
         else:
             self.sessions_dir = Path(sessions_dir)
 
+        self.compact_threshold = compact_threshold or get_config_value("chat.session_compact_threshold", 100)
+
+        # Per-session view of what is already on disk: message count, header fields
+        # and number of header-update records since the last compaction
+        self._log_state: Dict[str, Dict[str, Any]] = {}
+
         # Ensure sessions directory exists
         self.sessions_dir.mkdir(parents=True, exist_ok=True)
 
+        # Session index, opened on first use; None if it cannot be used
+        self._index: Optional[SessionIndex] = None
+        self._index_unavailable = False
+
+    @property
+    def index(self) -> Optional[SessionIndex]:
+        """Get the session index, or None if it cannot be opened (listing then scans files)."""
+        if self._index is None and not self._index_unavailable:
+            try:
+                # Kept in a subdirectory so index writes do not change the sessions directory mtime
+                self._index = SessionIndex(self.sessions_dir / ".index" / "sessions.db")
+            except (sqlite3.Error, OSError) as e:
+                logger.debug(f"Session index unavailable, falling back to scanning files: {e}")
+                self._index_unavailable = True
+        return self._index
+
+    def _log_path(self, session_id: str) -> Path:
+        return self.sessions_dir / f"{session_id}.jsonl"
+
+    def _legacy_path(self, session_id: str) -> Path:
+        return self.sessions_dir / f"{session_id}.json"
+
     def create_session(
         self,
         model: Optional[str] = None,
@@ -99,23 +153,40 @@ class ChatSessionManager:
         return session
 
     def load_session(self, session_id: str) -> Optional[ChatSession]:
-        """Load a session by ID."""
-        session_file = self.sessions_dir / f"{session_id}.json"
-
-        if not session_file.exists():
-            return None
+        """Load a session by ID, migrating legacy JSON sessions to the log format."""
+        log_file = self._log_path(session_id)
+        legacy_file = self._legacy_path(session_id)
 
         try:
-            with open(session_file) as f:
+            if log_file.exists():
+                session, state = self._read_log(log_file)
+                self._log_state[session.id] = state
+                return session
+
+            if not legacy_file.exists():
+                return None
+
+            with open(legacy_file) as f:
                 data = json.load(f)
-            return ChatSession.from_dict(data)
+            session = ChatSession.from_dict(data)
+            self._write_snapshot(session)
+            return session
         except Exception as e:
             console.print(f"[red]Error loading session {session_id}: {e}[/red]")
             return None
 
     def load_last_session(self) -> Optional[ChatSession]:
         """Load the most recently modified session."""
-        session_files = list(self.sessions_dir.glob("*.json"))
+        index = self.index
+        if index is not None:
+            try:
+                self._reconcile_index(index)
+                latest_id = index.latest_id()
+                return self.load_session(latest_id) if latest_id else None
+            except sqlite3.Error as e:
+                logger.debug(f"Session index lookup failed, scanning files: {e}")
+
+        session_files = self._session_files()
 
         if not session_files:
             return None
@@ -132,12 +203,31 @@ class ChatSessionManager:
         self._save_session(session)
 
     def _save_session(self, session: ChatSession) -> None:
-        """Internal method to save session."""
-        session_file = self.sessions_dir / f"{session.id}.json"
+        """Internal method to save session.
+
+        Appends new messages and header changes to the session log when the
+        on-disk log is a prefix of the in-memory session, otherwise rewrites
+        the log as a compact snapshot.
+        """
+        session_file = self._log_path(session.id)
 
         try:
-            with open(session_file, "w") as f:
-                json.dump(session.to_dict(), f, indent=2)
+            state = self._log_state.get(session.id)
+            if state is None and session_file.exists():
+                # Session was written by another manager instance, recover what is on disk
+                _, state = self._read_log(session_file)
+                self._log_state[session.id] = state
+
+            if (
+                state is None
+                or not session_file.exists()
+                or len(session.messages) < state["messages"]
+                or state["updates"] >= self.compact_threshold
+                or state.get("corrupt")
+            ):
+                self._write_snapshot(session)
+            else:
+                self._append_changes(session, state)
         except PermissionError:
             console.print(f"[red]Error: Permission denied saving session to {session_file}[/red]")
             raise
@@ -148,6 +238,235 @@ class ChatSessionManager:
             console.print(f"[red]Error: Unexpected error saving session {session.id}: {e}[/red]")
             raise
 
+    def _header_record(self, session: ChatSession) -> Dict[str, Any]:
+        return {
+            "type": "header",
+            "version": SESSION_LOG_VERSION,
+            "id": session.id,
+            "created_at": session.created_at,
+            "updated_at": session.updated_at,
+            **{field: getattr(session, field) for field in _HEADER_FIELDS},
+        }
+
+    def _write_snapshot(self, session: ChatSession) -> None:
+        """Rewrite the session log as a header followed by all messages."""
+        session_file = self._log_path(session.id)
+        tmp_file = session_file.with_suffix(".jsonl.tmp")
+
+        with open(tmp_file, "w") as f:
+            f.write(json.dumps(self._header_record(session)) + "\n")
+            for message in session.messages:
+                f.write(json.dumps({"type": "message", **asdict(message)}) + "\n")
+        os.replace(tmp_file, session_file)
+
+        legacy_file = self._legacy_path(session.id)
+        if legacy_file.exists():
+            legacy_file.unlink()
+
+        self._log_state[session.id] = {
+            "messages": len(session.messages),
+            "header": {field: getattr(session, field) for field in _HEADER_FIELDS},
+            "updates": 0,
+        }
+        self._index_session(session)
+
+    def _append_changes(self, session: ChatSession, state: Dict[str, Any]) -> None:
+        """Append messages and header changes not yet in the session log."""
+        records = [
+            {"type": "message", "updated_at": session.updated_at, **asdict(message)}
+            for message in session.messages[state["messages"] :]
+        ]
+
+        header = {field: getattr(session, field) for field in _HEADER_FIELDS}
+        if header != state["header"] or not records:
+            records.append({"type": "update", "updated_at": session.updated_at, **header})
+            state["updates"] += 1
+
+        with open(self._log_path(session.id), "a") as f:
+            f.write("".join(json.dumps(record) + "\n" for record in records))
+
+        state["messages"] = len(session.messages)
+        state["header"] = header
+        self._index_session(session)
+
+    def _read_log(self, session_file: Path) -> Tuple[ChatSession, Dict[str, Any]]:
+        """Replay a session log into a ChatSession and its on-disk state."""
+        session: Optional[ChatSession] = None
+        updates = 0
+        corrupt = False
+
+        with open(session_file) as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn final line from an interrupted write is dropped, and the
+                    # log is rewritten on the next save so appends stay line-aligned
+                    corrupt = True
+                    console.print(
+                        f"[yellow]Warning: Skipping corrupt record {line_number} in {session_file.name}[/yellow]"
+                    )
+                    continue
+
+                record_type = record.pop("type", None)
+                if session is None:
+                    if record_type != "header":
+                        raise ValueError(f"Session log {session_file.name} does not start with a header")
+                    session = ChatSession(
+                        id=record["id"],
+                        created_at=record["created_at"],
+                        updated_at=record["updated_at"],
+                        messages=[],
+                        **{field: record.get(field) for field in _HEADER_FIELDS},
+                    )
+                elif record_type == "message":
+                    session.updated_at = record.pop("updated_at", session.updated_at)
+                    session.messages.append(ChatMessage(**record))
+                elif record_type == "update":
+                    session.updated_at = record.pop("updated_at", session.updated_at)
+                    for field in _HEADER_FIELDS:
+                        setattr(session, field, record.get(field))
+                    updates += 1
+
+        if session is None:
+            raise ValueError(f"Session log {session_file.name} is empty")
+
+        state = {
+            "messages": len(session.messages),
+            "header": {field: getattr(session, field) for field in _HEADER_FIELDS},
+            "updates": updates,
+            "corrupt": corrupt,
+        }
+        return session, state
+
+    def _session_files(self) -> List[Path]:
+        """Get one file per session, preferring the log over a legacy JSON file."""
+        log_files = {path.stem: path for path in self.sessions_dir.glob("*.jsonl")}
+        legacy_files = [path for path in self.sessions_dir.glob("*.json") if path.stem not in log_files]
+        return list(log_files.values()) + legacy_files
+
+    @staticmethod
+    def _summary_from_dict(session_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the listing summary for a session."""
+        messages = data.get("messages", [])
+        last_message = messages[-1] if messages else None
+
+        return {
+            "id": session_id,
+            "created_at": data.get("created_at", "Unknown"),
+            "updated_at": data.get("updated_at", "Unknown"),
+            "message_count": len(messages),
+            "last_message": (last_message.get("content", "")[:50] + "..." if last_message else "Empty session"),
+            "model": data.get("model", "default"),
+        }
+
+    @staticmethod
+    def _summary_from_session(session: ChatSession) -> Dict[str, Any]:
+        """Build the listing summary for a session from its header fields and last message."""
+        last_message = session.messages[-1] if session.messages else None
+
+        return {
+            "id": session.id,
+            "created_at": session.created_at,
+            "updated_at": session.updated_at,
+            "message_count": len(session.messages),
+            "last_message": (last_message.content[:50] + "..." if last_message else "Empty session"),
+            "model": session.model,
+        }
+
+    def _summarize_file(self, session_file: Path) -> Dict[str, Any]:
+        """Read a session file of either format and summarize it."""
+        if session_file.suffix == ".jsonl":
+            return self._summary_from_session(self._read_log(session_file)[0])
+        else:
+            with open(session_file) as f:
+                data = json.load(f)
+        return self._summary_from_dict(session_file.stem, data)
+
+    def _index_session(self, session: ChatSession) -> None:
+        """Update the index row of a session that was just written."""
+        index = self.index
+        if index is None:
+            return
+        try:
+            # The directory mtime is recorded in the same transaction as the row
+            index.upsert(
+                self._summary_from_session(session),
+                self._log_path(session.id),
+                meta={"dir_mtime_ns": str(self.sessions_dir.stat().st_mtime_ns)},
+            )
+        except (sqlite3.Error, OSError) as e:
+            # The next listing reconciles the index with the files on disk
+            logger.debug(f"Failed to update session index for {session.id}: {e}")
+
+    def _mark_index_current(self, index: SessionIndex) -> None:
+        """Record that the index reflects the current contents of the sessions directory."""
+        index.set_meta("dir_mtime_ns", str(self.sessions_dir.stat().st_mtime_ns))
+
+    def _reconcile_index(self, index: SessionIndex, force: bool = False) -> None:
+        """Bring the index in line with the session files if the directory changed behind its back.
+
+        Adding, replacing or removing session files changes the directory mtime,
+        so an unchanged mtime means the index is current and no files are read.
+        Otherwise only files whose size or mtime differ from their row are re-read.
+        """
+        if not force and index.get_meta("dir_mtime_ns") == str(self.sessions_dir.stat().st_mtime_ns):
+            return
+
+        indexed = index.file_states()
+        seen = set()
+        for session_file in self._session_files():
+            session_id = session_file.stem
+            seen.add(session_id)
+            try:
+                stat = session_file.stat()
+                row = indexed.get(session_id)
+                if (
+                    row
+                    and row["file_name"] == session_file.name
+                    and row["file_size"] == stat.st_size
+                    and row["file_mtime_ns"] == stat.st_mtime_ns
+                ):
+                    continue
+                index.upsert(self._summarize_file(session_file), session_file)
+            except Exception as e:
+                console.print(f"[yellow]Warning: Could not read session {session_file.name}: {e}[/yellow]")
+
+        for session_id in set(indexed) - seen:
+            index.delete(session_id)
+
+        self._mark_index_current(index)
+
+    def rebuild_index(self) -> int:
+        """Rebuild the session index from the session files.
+
+        Returns:
+            Number of indexed sessions
+        """
+        index = self.index
+        if index is None:
+            return len(self._session_files())
+        index.clear()
+        self._reconcile_index(index, force=True)
+        return index.count()
+
+    def compact_session(self, session_id: str) -> bool:
+        """Rewrite a session log as a single snapshot.
+
+        Args:
+            session_id: ID of the session to compact
+
+        Returns:
+            True if the session was found and compacted
+        """
+        session = self.load_session(session_id)
+        if session is None:
+            return False
+        self._write_snapshot(session)
+        return True
+
     def add_message(self, session: ChatSession, role: str, content: str, model: Optional[str] = None) -> None:
         """Add a message to a session and save it."""
         message = ChatMessage(
@@ -159,54 +478,89 @@ class ChatSessionManager:
         session.messages.append(message)
         self.save_session(session)
 
-    def list_sessions(self) -> List[Dict[str, Any]]:
-        """List all available sessions with metadata."""
-        sessions = []
+    def list_sessions(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        model: Optional[str] = None,
+        since: Optional[Union[str, datetime]] = None,
+        until: Optional[Union[str, datetime]] = None,
+    ) -> List[Dict[str, Any]]:
+        """List available sessions with metadata, newest first.
+
+        Args:
+            limit: Maximum number of sessions to return
+            offset: Number of sessions to skip (for paging)
+            model: Only sessions using this model
+            since: Only sessions updated at or after this time (datetime or ISO string)
+            until: Only sessions updated at or before this time (datetime or ISO string)
+
+        Returns:
+            List of session summaries with id, timestamps, message count, model and last message
+        """
+        index = self.index
+        if index is not None:
+            try:
+                self._reconcile_index(index)
+                return index.query(limit=limit, offset=offset, model=model, since=since, until=until)
+            except sqlite3.Error as e:
+                logger.debug(f"Session index query failed, scanning files: {e}")
 
-        for session_file in self.sessions_dir.glob("*.json"):
+        sessions = []
+        for session_file in self._session_files():
             try:
-                # Get basic info without loading full session
-                session_file.stat()
-                session_id = session_file.stem
-
-                # Load just enough to get message count and last message
-                with open(session_file) as f:
-                    data = json.load(f)
-
-                messages = data.get("messages", [])
-                last_message = messages[-1] if messages else None
-
-                sessions.append(
-                    {
-                        "id": session_id,
-                        "created_at": data.get("created_at", "Unknown"),
-                        "updated_at": data.get("updated_at", "Unknown"),
-                        "message_count": len(messages),
-                        "last_message": (
-                            last_message.get("content", "")[:50] + "..." if last_message else "Empty session"
-                        ),
-                        "model": data.get("model", "default"),
-                    }
-                )
+                sessions.append(self._summarize_file(session_file))
             except Exception as e:
                 console.print(f"[yellow]Warning: Could not read session {session_file.name}: {e}[/yellow]")
 
+        since_value = since.isoformat() if isinstance(since, datetime) else since
+        until_value = until.isoformat() if isinstance(until, datetime) else until
+        sessions = [
+            session
+            for session in sessions
+            if (model is None or session["model"] == model)
+            and (since_value is None or session["updated_at"] >= since_value)
+            and (until_value is None or session["updated_at"] <= until_value)
+        ]
+
         # Sort by updated_at, newest first
-        sessions.sort(key=lambda x: x["updated_at"], reverse=True)
-        return sessions
+        sessions.sort(key=lambda x: (x["updated_at"], x["id"]), reverse=True)
+        end_index = None if limit is None else offset + limit
+        return sessions[offset:end_index]
+
+    def count_sessions(self, model: Optional[str] = None) -> int:
+        """Count available sessions, optionally only those using a model."""
+        index = self.index
+        if index is not None:
+            try:
+                self._reconcile_index(index)
+                return index.count(model=model)
+            except sqlite3.Error as e:
+                logger.debug(f"Session index count failed, scanning files: {e}")
+        return len(self.list_sessions(model=model))
 
     def delete_session(self, session_id: str) -> bool:
         """Delete a session."""
-        session_file = self.sessions_dir / f"{session_id}.json"
+        self._log_state.pop(session_id, None)
 
-        if session_file.exists():
-            session_file.unlink()
-            return True
-        return False
+        deleted = False
+        for session_file in (self._log_path(session_id), self._legacy_path(session_id)):
+            if session_file.exists():
+                session_file.unlink()
+                deleted = True
+
+        index = self.index
+        if deleted and index is not None:
+            try:
+                index.delete(session_id)
+                self._mark_index_current(index)
+            except sqlite3.Error as e:
+                logger.debug(f"Failed to remove {session_id} from session index: {e}")
+        return deleted
 
     def display_sessions_table(self) -> None:
         """Display all sessions in a nice table format."""
-        sessions = self.list_sessions()
+        sessions = self.list_sessions(limit=20)
 
         if not sessions:
             console.print("[yellow]No chat sessions found.[/yellow]")
@@ -219,7 +573,7 @@ class ChatSessionManager:
         table.add_column("Model", style="blue")
         table.add_column("Last Message", style="white")
 
-        for session in sessions[:20]:  # Show max 20 sessions
+        for session in sessions:  # Show max 20 sessions
             created = session["created_at"]
             if "T" in created:
                 # Parse and format the timestamp nicely
@@ -240,5 +594,6 @@ class ChatSessionManager:
 
         console.print(table)
 
-        if len(sessions) > 20:
-            console.print(f"\n[dim]Showing 20 of {len(sessions)} sessions[/dim]")
+        total = self.count_sessions()
+        if total > 20:
+            console.print(f"\n[dim]Showing 20 of {total} sessions[/dim]")
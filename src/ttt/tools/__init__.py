@@ -23,11 +23,13 @@ from functools import wraps
 from typing import Any, Callable, Optional, cast
 
 from .base import (
+    ExecutionMode,
     ToolCall,
     ToolDefinition,
     ToolParameter,
     ToolParameterType,
     ToolResult,
+    ToolStep,
     create_tool_definition,
 )
 from .executor import (
@@ -60,6 +62,7 @@ def tool(
     description: Optional[str] = None,
     category: str = "general",
     register: bool = True,
+    execution: Optional[str] = None,
 ) -> Callable:
     """
     Decorator to mark a function as a tool.
@@ -74,12 +77,18 @@ def tool(
     def complex_tool(arg: str) -> str:
         return f"Result: {arg}"
 
+    @tool(execution="process")
+    def cpu_heavy_tool(n: int) -> str:
+        return str(sum(i * i for i in range(n)))
+
     Args:
         func: The function to decorate (when used without parentheses)
         name: Custom name for the tool (defaults to function name)
         description: Custom description (defaults to function docstring)
         category: Category for organizing tools
         register: Whether to register in the global registry
+        execution: Where a sync tool runs: "inline" on the event loop, "thread"
+            or "process" (default: tools.executor.default_execution)
 
     Returns:
         Either the decorated function (retains original behavior) or ToolDefinition
@@ -87,12 +96,12 @@ def tool(
 
     def decorator(f: Callable) -> Callable:
         # Create tool definition
-        tool_def = create_tool_definition(f, name, description, category)
+        tool_def = create_tool_definition(f, name, description, category, execution)
 
         # Register in global registry if requested
         if register:
             try:
-                register_tool(f, name, description, category)
+                register_tool(f, name, description, category, execution)
             except ValueError:
                 # Tool already registered, that's okay
                 pass
@@ -155,8 +164,10 @@ __all__ = [
     "ToolDefinition",
     "ToolCall",
     "ToolResult",
+    "ToolStep",
     "ToolParameter",
     "ToolParameterType",
+    "ExecutionMode",
     "create_tool_definition",
     # Registry functions
     "ToolRegistry",
@@ -3,7 +3,7 @@
 import inspect
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Union
 
 
 class ToolParameterType(str, Enum):
@@ -17,6 +17,14 @@ class ToolParameterType(str, Enum):
     OBJECT = "object"
 
 
+class ExecutionMode(str, Enum):
+    """Where ToolExecutor runs a sync tool function."""
+
+    INLINE = "inline"  # On the event loop thread
+    THREAD = "thread"  # In a bounded thread pool
+    PROCESS = "process"  # In a bounded pool of worker processes that can be killed
+
+
 @dataclass
 class ToolParameter:
     """Represents a single tool parameter."""
@@ -38,6 +46,7 @@ class ToolDefinition:
     parameters: List[ToolParameter]
     function: Callable
     category: str = "general"
+    execution: Optional[ExecutionMode] = None  # None: tools.executor.default_execution
 
     def to_openai_schema(self) -> Dict[str, Any]:
         """Convert to OpenAI function calling schema.
@@ -194,6 +203,32 @@ class ToolResult:
         }
 
 
+@dataclass
+class ToolStep:
+    """One round of a multi-turn tool-calling loop: the model's tool calls and their results."""
+
+    index: int
+    calls: List[ToolCall] = field(default_factory=list)
+    content: str = ""
+    tokens_in: Optional[int] = None
+    tokens_out: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization.
+
+        Returns:
+            A dictionary with the step index, any text the model sent
+            alongside the calls, token usage and the executed calls.
+        """
+        return {
+            "index": self.index,
+            "content": self.content,
+            "tokens_in": self.tokens_in,
+            "tokens_out": self.tokens_out,
+            "calls": [call.to_dict() for call in self.calls],
+        }
+
+
 def extract_parameter_info(func: Callable) -> List[ToolParameter]:
     """Extract parameter information from a function using type hints and docstring.
 
@@ -285,6 +320,7 @@ def create_tool_definition(
     name: Optional[str] = None,
     description: Optional[str] = None,
     category: str = "general",
+    execution: Optional[Union[str, ExecutionMode]] = None,
 ) -> ToolDefinition:
     """Create a ToolDefinition from a function.
 
@@ -297,6 +333,8 @@ def create_tool_definition(
         name: Override name for the tool (defaults to function name)
         description: Override description (defaults to first line of docstring)
         category: Category for organizing tools (default: "general")
+        execution: Where sync functions run: "inline", "thread" or "process"
+            (default: tools.executor.default_execution)
 
     Returns:
         A complete ToolDefinition ready for use with AI function calling
@@ -324,4 +362,5 @@ def create_tool_definition(
         parameters=parameters,
         function=func,
         category=category,
+        execution=ExecutionMode(execution) if execution is not None else None,
     )
@@ -12,6 +12,10 @@ Usage:
 
     # Or import specific tools
     from ttt.tools.builtins import web_search, read_file
+
+The web tools are async (``web_search_async``, ``http_request_async``) and
+that is what the registry runs, so parallel tool calls overlap their
+network time; ``web_search`` and ``http_request`` are blocking wrappers.
 """
 
 import ast
@@ -19,46 +23,27 @@ import datetime
 import json
 import math
 import operator
-import os
-import subprocess
-import tempfile
-import urllib.error
 import urllib.parse
-import urllib.request
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional, Union
+from typing import Any, Awaitable, Callable, Dict, Optional, Union, cast
 
+import httpx
 import zoneinfo
 
 from ttt.config.schema import get_config
 from ttt.tools import tool
 
+from ..utils.async_utils import run_coro_in_background
+from .file_reader import read_chunk
+from .http_pool import fetch
 from .recovery import ErrorRecoverySystem, InputSanitizer, RetryConfig
+from .sandbox import get_python_pool
 
 # Initialize recovery system
 recovery_system = ErrorRecoverySystem(RetryConfig())
 
 
 # Get configuration settings
-def _get_max_file_size() -> int:
-    """Get maximum file size from configuration."""
-
-    def empty_dict() -> Dict[str, Any]:
-        return {}
-
-    try:
-        config = get_config()
-        # Try tools config first, then constants, then hardcoded fallback
-        size = config.tools_config.get("max_file_size")
-        if size is None:
-            # Try to get from constants section
-            constants = getattr(config, "model_dump", empty_dict)().get("constants", {})
-            size = constants.get("file_sizes", {}).get("max_file_size")
-        return int(size or 10485760)  # 10MB fallback from constants
-    except (AttributeError, KeyError, ValueError, TypeError):
-        return 10485760  # Fallback to constants value
-
-
 def _get_code_timeout() -> int:
     """Get code execution timeout from configuration."""
 
@@ -97,53 +82,82 @@ def _get_web_timeout() -> int:
         return 10  # Fallback to constants value
 
 
+def _sanitize_kwargs(kwargs: Dict[str, Any]) -> Union[Dict[str, Any], str]:
+    """Sanitize tool arguments, returning an error message for invalid ones."""
+    # Sanitize arguments, unless the executor already did for this call
+    sanitized_kwargs: Dict[str, Any] = {}
+    for key, value in kwargs.items():
+        if InputSanitizer.are_arguments_sanitized():
+            sanitized_kwargs[key] = value
+        elif key in ["file_path", "path"] and isinstance(value, str):
+            try:
+                sanitized_kwargs[key] = str(InputSanitizer.sanitize_path(value))
+            except ValueError as e:
+                return f"Error: Invalid path '{value}': {e}"
+        elif key in ["url"] and isinstance(value, str):
+            try:
+                sanitized_kwargs[key] = InputSanitizer.sanitize_url(value)
+            except ValueError as e:
+                return f"Error: Invalid URL '{value}': {e}"
+        elif key in ["query", "code", "expression", "content"] and isinstance(value, str):
+            try:
+                # Allow code for these contexts
+                allow_code = key in ["code", "expression"]
+                sanitized_kwargs[key] = InputSanitizer.sanitize_string(value, allow_code=allow_code)
+            except ValueError as e:
+                return f"Error: Invalid input '{key}': {e}"
+        else:
+            sanitized_kwargs[key] = value
+    return sanitized_kwargs
+
+
+def _format_error(func_name: str, e: Exception) -> str:
+    """Turn a tool failure into a user-friendly message."""
+    # Classify error and provide helpful message
+    error_pattern = recovery_system.classify_error(str(e))
+
+    # Create user-friendly error message
+    if error_pattern.error_type.value == "network_error":
+        return f"🌐 Network Error: {error_pattern.message}\n💡 {error_pattern.suggested_action}"
+    elif error_pattern.error_type.value == "permission_error":
+        return f"🔒 Permission Error: {error_pattern.message}\n💡 {error_pattern.suggested_action}"
+    elif error_pattern.error_type.value == "resource_error":
+        return f"📁 Resource Error: {error_pattern.message}\n💡 {error_pattern.suggested_action}"
+    elif error_pattern.error_type.value == "timeout_error":
+        return f"⏱️ Timeout Error: {error_pattern.message}\n💡 {error_pattern.suggested_action}"
+    elif error_pattern.error_type.value == "validation_error":
+        return f"⚠️ Validation Error: {error_pattern.message}\n💡 {error_pattern.suggested_action}"
+    else:
+        return f"❌ Error in {func_name}: {str(e)}\n💡 {error_pattern.suggested_action}"
+
+
 def _safe_execute(func_name: str, func: Callable[..., Any], **kwargs: Any) -> str:
     """Execute a function with error recovery and input sanitization."""
     try:
-        # Sanitize arguments
-        sanitized_kwargs = {}
-        for key, value in kwargs.items():
-            if key in ["file_path", "path"] and isinstance(value, str):
-                try:
-                    sanitized_kwargs[key] = str(InputSanitizer.sanitize_path(value))
-                except ValueError as e:
-                    return f"Error: Invalid path '{value}': {e}"
-            elif key in ["url"] and isinstance(value, str):
-                try:
-                    sanitized_kwargs[key] = InputSanitizer.sanitize_url(value)
-                except ValueError as e:
-                    return f"Error: Invalid URL '{value}': {e}"
-            elif key in ["query", "code", "expression", "content"] and isinstance(value, str):
-                try:
-                    # Allow code for these contexts
-                    allow_code = key in ["code", "expression"]
-                    sanitized_kwargs[key] = InputSanitizer.sanitize_string(value, allow_code=allow_code)
-                except ValueError as e:
-                    return f"Error: Invalid input '{key}': {e}"
-            else:
-                sanitized_kwargs[key] = value
+        sanitized_kwargs = _sanitize_kwargs(kwargs)
+        if isinstance(sanitized_kwargs, str):
+            return sanitized_kwargs
 
         # Execute with enhanced error handling
         result = func(**sanitized_kwargs)
         return str(result)
 
     except Exception as e:
-        # Classify error and provide helpful message
-        error_pattern = recovery_system.classify_error(str(e))
-
-        # Create user-friendly error message
-        if error_pattern.error_type.value == "network_error":
-            return f"🌐 Network Error: {error_pattern.message}\n💡 {error_pattern.suggested_action}"
-        elif error_pattern.error_type.value == "permission_error":
-            return f"🔒 Permission Error: {error_pattern.message}\n💡 {error_pattern.suggested_action}"
-        elif error_pattern.error_type.value == "resource_error":
-            return f"📁 Resource Error: {error_pattern.message}\n💡 {error_pattern.suggested_action}"
-        elif error_pattern.error_type.value == "timeout_error":
-            return f"⏱️ Timeout Error: {error_pattern.message}\n💡 {error_pattern.suggested_action}"
-        elif error_pattern.error_type.value == "validation_error":
-            return f"⚠️ Validation Error: {error_pattern.message}\n💡 {error_pattern.suggested_action}"
-        else:
-            return f"❌ Error in {func_name}: {str(e)}\n💡 {error_pattern.suggested_action}"
+        return _format_error(func_name, e)
+
+
+async def _safe_execute_async(func_name: str, func: Callable[..., Awaitable[Any]], **kwargs: Any) -> str:
+    """Await a coroutine function with error recovery and input sanitization."""
+    try:
+        sanitized_kwargs = _sanitize_kwargs(kwargs)
+        if isinstance(sanitized_kwargs, str):
+            return sanitized_kwargs
+
+        result = await func(**sanitized_kwargs)
+        return str(result)
+
+    except Exception as e:
+        return _format_error(func_name, e)
 
 
 ALLOWED_MATH_NAMES = {
@@ -183,8 +197,8 @@ ALLOWED_MATH_OPERATORS = {
 }
 
 
-@tool(category="web", description="Search the web for information using a search engine")
-def web_search(query: str, num_results: int = 5) -> str:
+@tool(name="web_search", category="web", description="Search the web for information using a search engine")
+async def web_search_async(query: str, num_results: int = 5) -> str:
     """Search the web for information.
 
     Args:
@@ -195,7 +209,7 @@ def web_search(query: str, num_results: int = 5) -> str:
         Search results as formatted text
     """
 
-    def _web_search_impl(query: str, num_results: int = 5) -> str:
+    async def _web_search_impl(query: str, num_results: int = 5) -> str:
         # Validate inputs
         if not query or not query.strip():
             raise ValueError("Search query cannot be empty")
@@ -208,11 +222,16 @@ def web_search(query: str, num_results: int = 5) -> str:
         # Using DuckDuckGo's API for simplicity (no API key needed)
         url = f"https://api.duckduckgo.com/?q={encoded_query}&format=json&no_html=1&skip_disambig=1"
 
-        # Make request with timeout
-        req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0 (compatible; AI-Library/1.0)"})
-
-        with urllib.request.urlopen(req, timeout=_get_web_timeout()) as response:
-            data = json.loads(response.read().decode("utf-8"))
+        # Make request with timeout on the pooled client
+        response = await fetch(
+            "GET",
+            url,
+            headers={"User-Agent": "Mozilla/5.0 (compatible; AI-Library/1.0)"},
+            timeout=_get_web_timeout(),
+        )
+        if response.status_code >= 400:
+            raise ConnectionError(f"HTTP Error {response.status_code}: {response.reason}")
+        data = json.loads(response.text)
 
         # Extract results
         results = []
@@ -239,22 +258,63 @@ def web_search(query: str, num_results: int = 5) -> str:
 
         return "\n".join(results)
 
-    return _safe_execute("web_search", _web_search_impl, query=query, num_results=num_results)
+    return await _safe_execute_async("web_search", _web_search_impl, query=query, num_results=num_results)
+
+
+@tool(category="web", description="Search the web for information using a search engine", register=False)
+def web_search(query: str, num_results: int = 5) -> str:
+    """Search the web for information.
 
+    Args:
+        query: The search query
+        num_results: Number of results to return (max 10)
 
-@tool(category="file", description="Read the contents of a file")
-def read_file(file_path: str, encoding: str = "utf-8") -> str:
+    Returns:
+        Search results as formatted text
+    """
+    # @tool erases the coroutine's type
+    return cast(str, run_coro_in_background(web_search_async(query, num_results)))
+
+
+@tool(category="file", description="Read a file, or part of it: a byte or line range, head, tail or grep")
+def read_file(
+    file_path: str,
+    encoding: str = "utf-8",
+    offset: int = 0,
+    length: int = 0,
+    start_line: int = 0,
+    end_line: int = 0,
+    mode: str = "full",
+    lines: int = 50,
+    pattern: str = "",
+    continuation: str = "",
+) -> str:
     """Read contents of a file.
 
+    Long results are split into chunks; a chunk that does not reach the end
+    of the selection ends with a continuation token for the next one.
+
     Args:
         file_path: Path to the file to read
         encoding: File encoding (default: utf-8)
+        offset: Byte offset to start reading at in full mode (default: 0)
+        length: Number of bytes to read from offset, 0 for the rest of the file
+        start_line: First line to read in full mode, counting from 1 (0: no line range)
+        end_line: Last line to read in full mode, inclusive (0: to the end of the file)
+        mode: full, head (first lines), tail (last lines) or grep (lines matching pattern)
+        lines: Number of lines for head and tail, or of matches per chunk for grep (default: 50)
+        pattern: Regular expression to search for in grep mode
+        continuation: Token from a previous chunk, to read the next one
 
     Returns:
         File contents or error message
     """
 
-    def _read_file_impl(file_path: str, encoding: str = "utf-8") -> str:
+    def _read_file_impl(file_path: str, encoding: str = "utf-8", **options: Any) -> str:
+        # Models sometimes send numbers as strings
+        for key in ("offset", "length", "start_line", "end_line", "lines"):
+            options[key] = int(options[key])
+
         # Validate file path
         path = Path(file_path).resolve()
 
@@ -264,19 +324,22 @@ def read_file(file_path: str, encoding: str = "utf-8") -> str:
         if not path.is_file():
             raise ValueError(f"Not a file: {file_path}")
 
-        # Check file size
-        file_size = path.stat().st_size
-        max_file_size = _get_max_file_size()
-        if file_size > max_file_size:
-            raise ValueError(f"File too large ({file_size} bytes). Maximum size is {max_file_size} bytes.")
-
-        # Read file
-        with open(path, encoding=encoding) as f:
-            content = f.read()
-
-        return content
+        return read_chunk(path, encoding, **options).render()
 
-    return _safe_execute("read_file", _read_file_impl, file_path=file_path, encoding=encoding)
+    return _safe_execute(
+        "read_file",
+        _read_file_impl,
+        file_path=file_path,
+        encoding=encoding,
+        offset=offset,
+        length=length,
+        start_line=start_line,
+        end_line=end_line,
+        mode=mode,
+        lines=lines,
+        pattern=pattern,
+        continuation=continuation,
+    )
 
 
 @tool(category="file", description="Write content to a file")
@@ -364,45 +427,24 @@ def run_python(code: str, timeout: Optional[int] = None) -> str:
 
         timeout = min(max(min_timeout, timeout), max_timeout)
 
-        # Create temporary file for code
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write(code)
-            temp_file = f.name
+        # Run in a warm, sandboxed worker interpreter
+        returncode, stdout, stderr = get_python_pool().run(code, timeout)
 
-        try:
-            # Run code in subprocess with timeout
-            # Try python3 first, then python
-            python_cmd = (
-                "python3" if subprocess.run(["which", "python3"], capture_output=True).returncode == 0 else "python"
-            )
-
-            result = subprocess.run(
-                [python_cmd, temp_file],
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                check=False,
-            )
-
-            output = []
-            if result.stdout:
-                output.append(result.stdout)
-            if result.stderr:
-                output.append(f"Errors:\n{result.stderr}")
-
-            if result.returncode != 0:
-                output.append(f"Exit code: {result.returncode}")
-
-            return "\n".join(output) if output else "Code executed successfully (no output)"
-
-        finally:
-            # Clean up
-            os.unlink(temp_file)
+        output = []
+        if stdout:
+            output.append(stdout)
+        if stderr:
+            output.append(f"Errors:\n{stderr}")
+
+        if returncode != 0:
+            output.append(f"Exit code: {returncode}")
+
+        return "\n".join(output) if output else "Code executed successfully (no output)"
 
     return _safe_execute("run_python", _run_python_impl, code=code, timeout=timeout)
 
 
-@tool(category="time", description="Get the current time in a specified timezone")
+@tool(category="time", description="Get the current time in a specified timezone", execution="inline")
 def get_current_time(timezone: str = "UTC", format: str = "%Y-%m-%d %H:%M:%S %Z") -> str:
     """Get current time in specified timezone.
 
@@ -430,8 +472,8 @@ def get_current_time(timezone: str = "UTC", format: str = "%Y-%m-%d %H:%M:%S %Z"
         return f"Error getting time: {str(e)}"
 
 
-@tool(category="web", description="Make HTTP requests to APIs or websites")
-def http_request(
+@tool(name="http_request", category="web", description="Make HTTP requests to APIs or websites")
+async def http_request_async(
     url: str,
     method: str = "GET",
     headers: Optional[Dict[str, str]] = None,
@@ -509,29 +551,51 @@ def http_request(
             else:
                 body_data = str(data).encode("utf-8")
 
-        # Create request
-        req = urllib.request.Request(url, data=body_data, headers=normalized_headers, method=method.upper())
+        # Make request on the pooled client; large bodies are cut off
+        response = await fetch(method, url, headers=normalized_headers, content=body_data, timeout=timeout)
+        if response.status_code >= 400:
+            return f"HTTP Error {response.status_code}: {response.reason}"
 
-        # Make request
-        with urllib.request.urlopen(req, timeout=timeout) as response:
-            # Read response
-            content = response.read().decode("utf-8", errors="replace")
+        content = response.text
+        if response.truncated:
+            return f"{content}\n\n[Response truncated after {len(response.body)} bytes]"
 
-            # Try to parse JSON if possible
-            try:
-                parsed = json.loads(content)
-                return json.dumps(parsed, indent=2)
-            except json.JSONDecodeError:
-                return str(content)
-
-    except urllib.error.HTTPError as e:
-        return f"HTTP Error {e.code}: {e.reason}"
-    except urllib.error.URLError as e:
-        return f"Network error: {str(e)}"
+        # Try to parse JSON if possible
+        try:
+            parsed = json.loads(content)
+            return json.dumps(parsed, indent=2)
+        except json.JSONDecodeError:
+            return str(content)
+
+    except httpx.RequestError as e:
+        return f"Network error: {str(e) or type(e).__name__}"
     except Exception as e:
         return f"Error making request: {str(e)}"
 
 
+@tool(category="web", description="Make HTTP requests to APIs or websites", register=False)
+def http_request(
+    url: str,
+    method: str = "GET",
+    headers: Optional[Dict[str, str]] = None,
+    data: Optional[Union[str, Dict[str, Any]]] = None,
+    timeout: Optional[int] = None,
+) -> str:
+    """Make HTTP requests.
+
+    Args:
+        url: The URL to request
+        method: HTTP method (GET, POST, PUT, DELETE, etc.)
+        headers: Optional headers dictionary
+        data: Optional data to send (for POST/PUT requests)
+        timeout: Request timeout in seconds (default: from config)
+
+    Returns:
+        Response text or error message
+    """
+    return cast(str, run_coro_in_background(http_request_async(url, method, headers, data, timeout)))
+
+
 class MathEvaluator(ast.NodeVisitor):
     """Safe math expression evaluator."""
 
@@ -803,11 +867,13 @@ load_builtin_tools()
 
 __all__ = [
     "web_search",
+    "web_search_async",
     "read_file",
     "write_file",
     "run_python",
     "get_current_time",
     "http_request",
+    "http_request_async",
     "calculate",
     "list_directory",
     "load_builtin_tools",
@@ -3,11 +3,13 @@
 import asyncio
 import logging
 import time
+from contextlib import nullcontext
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Union
 
 from ..utils import get_logger
-from .base import ToolCall, ToolDefinition, ToolResult
+from .base import ExecutionMode, ToolCall, ToolDefinition, ToolResult
+from .pools import get_tool_pools
 from .recovery import ErrorRecoverySystem, InputSanitizer, RetryConfig
 from .registry import get_tool, list_tools, register_tool
 
@@ -23,6 +25,7 @@ class ExecutionConfig:
     enable_fallbacks: bool = True
     enable_input_sanitization: bool = True
     log_level: str = "INFO"
+    default_execution: Optional[str] = None
 
     def __post_init__(self) -> None:
         """Load defaults from config if not set."""
@@ -32,6 +35,8 @@ class ExecutionConfig:
             self.max_retries = get_config_value("tools.executor.max_retries", 3)
         if self.timeout_seconds is None:
             self.timeout_seconds = get_config_value("tools.executor.timeout_seconds", 30.0)
+        if self.default_execution is None:
+            self.default_execution = get_config_value("tools.executor.default_execution", "thread")
 
 
 class ToolExecutor:
@@ -167,11 +172,12 @@ class ToolExecutor:
     ) -> ToolCall:
         """Execute tool with recovery and retry logic."""
         try:
-            # Execute the tool function
-            if asyncio.iscoroutinefunction(tool.function):
-                result = await tool.function(**arguments)
-            else:
-                result = tool.function(**arguments)
+            # Execute the tool function; arguments sanitized above are not scanned again by the tool
+            with InputSanitizer.arguments_sanitized() if self.config.enable_input_sanitization else nullcontext():
+                if asyncio.iscoroutinefunction(tool.function):
+                    result = await tool.function(**arguments)
+                else:
+                    result = await get_tool_pools().run(self._execution_mode(tool), tool.function, arguments)
 
             return ToolCall(id=call_id, name=tool.name, arguments=arguments, result=result)
 
@@ -225,7 +231,9 @@ class ToolExecutor:
                 if asyncio.iscoroutinefunction(fallback_tool.function):
                     result = await fallback_tool.function(**suggestion.arguments)
                 else:
-                    result = fallback_tool.function(**suggestion.arguments)
+                    result = await get_tool_pools().run(
+                        self._execution_mode(fallback_tool), fallback_tool.function, suggestion.arguments
+                    )
 
                 # Add fallback notification to result
                 fallback_notice = (
@@ -331,9 +339,17 @@ class ToolExecutor:
                 current_avg * (total_calls - 1) + execution_time
             ) / total_calls
 
+    def _execution_mode(self, tool: ToolDefinition) -> ExecutionMode:
+        """Get where a sync tool runs: its own policy, or the configured default."""
+        execution = getattr(tool, "execution", None)
+        if isinstance(execution, ExecutionMode):
+            return execution
+        return ExecutionMode(self.config.default_execution)
+
     def get_execution_stats(self) -> Dict[str, Any]:
         """Get execution statistics."""
-        stats = self.execution_stats.copy()
+        stats: Dict[str, Any] = self.execution_stats.copy()
+        stats["pools"] = get_tool_pools().snapshot()
 
         # Add calculated metrics
         total = stats["total_calls"]
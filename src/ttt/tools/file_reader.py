@@ -0,0 +1,283 @@
+"""Bounded reads for the read_file tool.
+
+A model only uses part of a large file, so read_file returns at most
+``tools.read_file.max_chunk_bytes`` per call:
+
+- A read selects a byte range (``offset``/``length``), a line range
+  (``start_line``/``end_line``), the first or last lines (``head``/``tail``),
+  or the lines matching a regular expression (``grep``).
+- Large files are memory-mapped rather than loaded, so a selection costs
+  only the pages it touches. Line positions are found by counting
+  newlines block by block.
+- A selection larger than a chunk is cut at a line boundary. The read then
+  ends with a continuation token, and passing that token back returns the
+  next chunk.
+
+Line handling assumes an encoding in which newline is the byte ``\\n``,
+as UTF-8, Latin-1 and other ASCII-compatible encodings are.
+"""
+
+import base64
+import binascii
+import json
+import mmap
+import re
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from ..config.loader import get_config_value
+
+MODES = ("full", "head", "tail", "grep")
+
+# Bytes examined per step when counting newlines
+_BLOCK_SIZE = 1024 * 1024
+
+Buffer = Union[bytes, mmap.mmap]
+
+
+@dataclass
+class FileChunk:
+    """The part of a file returned by one read."""
+
+    text: str
+    start: int
+    end: int
+    size: int
+    continuation: Optional[str] = None
+    matches: Optional[int] = None  # grep only
+    line: Optional[int] = None  # grep only: the line scanning stopped at
+
+    def render(self) -> str:
+        """Format the chunk as the tool's result."""
+        if self.matches is None:
+            if self.continuation is None:
+                return self.text
+            return (
+                f"{self.text}\n\n[Showed bytes {self.start}-{self.end} of {self.size}. "
+                f'Call read_file with continuation="{self.continuation}" for more.]'
+            )
+        text = self.text if self.matches else "No matching lines"
+        if self.continuation is None:
+            return text
+        return (
+            f"{text}\n\n[Stopped after {self.matches} matches at line {self.line}. "
+            f'Call read_file with continuation="{self.continuation}" for more.]'
+        )
+
+
+def _encode_token(state: Dict[str, Any]) -> str:
+    return base64.urlsafe_b64encode(json.dumps(state, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def _decode_token(token: str) -> Dict[str, Any]:
+    try:
+        state = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+    except (binascii.Error, ValueError) as e:
+        raise ValueError(f"Invalid continuation token: {e}") from None
+    if not isinstance(state, dict) or state.get("mode") not in MODES:
+        raise ValueError("Invalid continuation token")
+    return state
+
+
+@contextmanager
+def _open_buffer(path: Path, size: int) -> Iterator[Buffer]:
+    """Map files of at least ``tools.read_file.mmap_threshold`` bytes and read smaller ones."""
+    if size == 0 or size < int(get_config_value("tools.read_file.mmap_threshold", 1048576)):
+        yield path.read_bytes()
+        return
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        yield buffer
+
+
+def _skip_lines(buffer: Buffer, pos: int, count: int, size: int) -> int:
+    """Get the offset just past the ``count``-th newline at or after ``pos`` (``size`` if there are fewer)."""
+    while count > 0 and pos < size:
+        block_end = min(pos + _BLOCK_SIZE, size)
+        newlines = buffer[pos:block_end].count(b"\n")
+        if newlines < count:
+            count -= newlines
+            pos = block_end
+            continue
+        while count > 0:
+            pos = buffer.find(b"\n", pos, block_end) + 1
+            count -= 1
+    return min(pos, size)
+
+
+def _count_lines(buffer: Buffer, start: int, end: int) -> int:
+    """Count newlines in ``buffer[start:end]`` without copying it whole."""
+    total = 0
+    for pos in range(start, end, _BLOCK_SIZE):
+        total += buffer[pos : min(pos + _BLOCK_SIZE, end)].count(b"\n")
+    return total
+
+
+def _tail_offset(buffer: Buffer, size: int, count: int) -> int:
+    """Get the offset where the last ``count`` lines start."""
+    pos = size - 1 if size and buffer[size - 1 : size] == b"\n" else size
+    while count > 0 and pos > 0:
+        pos = buffer.rfind(b"\n", 0, pos)
+        if pos < 0:
+            return 0
+        count -= 1
+    return pos + 1 if count == 0 else 0
+
+
+def _cut(buffer: Buffer, start: int, end: int, max_bytes: int) -> int:
+    """Get where a chunk from ``start`` ends: at the last line break that fits, else mid-line."""
+    if end - start <= max_bytes:
+        return end
+    limit = start + max_bytes
+    newline = buffer.rfind(b"\n", start, limit)
+    if newline >= start:
+        return newline + 1
+    # No line break fits; avoid splitting a UTF-8 sequence
+    while limit > start + 1 and buffer[limit] & 0xC0 == 0x80:
+        limit -= 1
+    return limit
+
+
+def _select_range(
+    buffer: Buffer,
+    size: int,
+    mode: str,
+    offset: int,
+    length: int,
+    start_line: int,
+    end_line: int,
+    lines: int,
+) -> Tuple[int, int]:
+    """Resolve the read arguments to a byte range."""
+    if mode == "head":
+        return 0, _skip_lines(buffer, 0, lines, size)
+    if mode == "tail":
+        return _tail_offset(buffer, size, lines), size
+    if start_line > 0 or end_line > 0:
+        start = _skip_lines(buffer, 0, max(start_line, 1) - 1, size)
+        end = _skip_lines(buffer, start, end_line - max(start_line, 1) + 1, size) if end_line > 0 else size
+        return start, max(start, end)
+    start = min(offset, size)
+    return start, min(start + length, size) if length > 0 else size
+
+
+def _grep(
+    buffer: Buffer,
+    size: int,
+    regex: "re.Pattern[bytes]",
+    pos: int,
+    line: int,
+    max_matches: int,
+    max_bytes: int,
+    encoding: str,
+) -> Tuple[List[str], int, int, bool]:
+    """Collect matching lines from ``pos``, which is the start of line ``line``.
+
+    Returns:
+        Tuple of (numbered lines, offset to resume at, its line number, whether the scan finished)
+    """
+    found: List[str] = []
+    used = 0
+    while pos < size:
+        match = regex.search(buffer, pos)
+        if match is None:
+            return found, size, line, True
+        line_start = buffer.rfind(b"\n", pos, match.start()) + 1 or pos
+        line += _count_lines(buffer, pos, line_start)
+        line_end = buffer.find(b"\n", match.start())
+        line_end = size if line_end < 0 else line_end
+        # A single long line is cut to the chunk size
+        text = buffer[line_start : min(line_end, line_start + max_bytes)].decode(encoding, errors="replace")
+        text = text.rstrip("\r")
+        entry = f"{line}: {text}"
+        if found and used + len(entry) > max_bytes:
+            return found, line_start, line, False
+        found.append(entry)
+        used += len(entry) + 1
+        pos = min(line_end + 1, size)
+        line += 1
+        if len(found) >= max_matches:
+            return found, pos, line, pos >= size
+    return found, size, line, True
+
+
+def read_chunk(
+    path: Path,
+    encoding: str = "utf-8",
+    *,
+    offset: int = 0,
+    length: int = 0,
+    start_line: int = 0,
+    end_line: int = 0,
+    mode: str = "full",
+    lines: int = 50,
+    pattern: str = "",
+    continuation: str = "",
+    max_bytes: Optional[int] = None,
+) -> FileChunk:
+    """
+    Read part of a file.
+
+    Args:
+        path: File to read
+        encoding: Text encoding of the file
+        offset: First byte to read in ``full`` mode
+        length: Bytes to read from ``offset``, 0 for the rest of the file
+        start_line: First line to read in ``full`` mode (1-based, 0 for none)
+        end_line: Last line to read in ``full`` mode (inclusive, 0 for none)
+        mode: ``full``, ``head``, ``tail`` or ``grep``
+        lines: Lines for ``head`` and ``tail``, matches per chunk for ``grep``
+        pattern: Regular expression for ``grep``
+        continuation: Token from a previous chunk; the other selection arguments are ignored
+        max_bytes: Chunk size (default from ``tools.read_file.max_chunk_bytes``)
+
+    Returns:
+        The selected chunk
+
+    Raises:
+        ValueError: If the arguments or the continuation token are invalid
+    """
+    if max_bytes is None:
+        max_bytes = int(get_config_value("tools.read_file.max_chunk_bytes", 131072))
+    max_bytes = max(max_bytes, 1)
+    state = _decode_token(continuation) if continuation else None
+    if state is not None:
+        mode, pattern, lines = state["mode"], state.get("pattern", ""), int(state.get("lines", lines))
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode '{mode}'. Use one of: {', '.join(MODES)}")
+    if mode == "grep" and not pattern:
+        raise ValueError("grep mode needs a pattern")
+    if min(offset, length, start_line, end_line) < 0 or lines < 1:
+        raise ValueError("offset, length and line numbers must not be negative, and lines must be positive")
+    if end_line and start_line > end_line:
+        raise ValueError(f"start_line {start_line} is after end_line {end_line}")
+
+    size = path.stat().st_size
+    if state is not None and size < state.get("end", 0):
+        raise ValueError("File was truncated since the continuation token was issued; read it again")
+
+    with _open_buffer(path, size) as buffer:
+        if mode == "grep":
+            try:
+                regex = re.compile(pattern.encode(encoding), re.MULTILINE)
+            except re.error as e:
+                raise ValueError(f"Invalid pattern '{pattern}': {e}") from None
+            pos, line = (state["pos"], state["line"]) if state is not None else (0, 1)
+            found, next_pos, next_line, done = _grep(buffer, size, regex, pos, line, lines, max_bytes, encoding)
+            token = None
+            if not done:
+                token = _encode_token(
+                    {"mode": mode, "pattern": pattern, "lines": lines, "pos": next_pos, "line": next_line}
+                )
+            return FileChunk(
+                "\n".join(found), pos, next_pos, size, continuation=token, matches=len(found), line=next_line
+            )
+
+        if state is not None:
+            start, end = state["pos"], state["end"]
+        else:
+            start, end = _select_range(buffer, size, mode, offset, length, start_line, end_line, lines)
+        stop = _cut(buffer, start, end, max_bytes)
+        token = _encode_token({"mode": mode, "pos": stop, "end": end}) if stop < end else None
+        return FileChunk(buffer[start:stop].decode(encoding, errors="replace"), start, stop, size, continuation=token)
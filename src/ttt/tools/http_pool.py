@@ -0,0 +1,287 @@
+"""Pooled async HTTP for the web tools.
+
+The web tools share one ``httpx.AsyncClient`` per event loop, so repeated
+requests reuse keep-alive connections and parallel tool calls overlap
+their network time instead of blocking the loop:
+
+- Connections per host are capped (``max_connections_per_host``) on top of
+  the client's overall pool limits.
+- Bodies are streamed and cut off at ``max_response_bytes``.
+- GET responses are cached when the server allows it: entries are fresh
+  for ``Cache-Control: max-age`` (or until ``Expires``), and stale entries
+  with an ``ETag`` or ``Last-Modified`` are revalidated with a conditional
+  request. ``no-store`` responses are never cached.
+"""
+
+import asyncio
+import email.utils
+import hashlib
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Dict, Optional
+
+import httpx
+
+from ..config.loader import get_config_value
+from ..utils import get_logger
+from ..utils.async_utils import register_shutdown_hook
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class HttpResponse:
+    """A response read by the web tools."""
+
+    status_code: int
+    reason: str
+    headers: httpx.Headers
+    body: bytes
+    truncated: bool = False
+    from_cache: bool = False
+
+    @property
+    def text(self) -> str:
+        """Get the body decoded with the response charset, replacing undecodable bytes."""
+        charset = "utf-8"
+        for param in self.headers.get("content-type", "").split(";")[1:]:
+            key, _, value = param.strip().partition("=")
+            if key.lower() == "charset" and value:
+                charset = value.strip('"')
+        try:
+            return self.body.decode(charset, errors="replace")
+        except LookupError:
+            return self.body.decode("utf-8", errors="replace")
+
+
+@dataclass
+class _CacheEntry:
+    response: HttpResponse
+    expires_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+
+def _freshness(headers: httpx.Headers) -> Optional[float]:
+    """Get seconds a response may be reused without revalidation, or None if it must not be stored."""
+    directives: Dict[str, str] = {}
+    for part in headers.get("cache-control", "").split(","):
+        key, _, value = part.strip().partition("=")
+        if key:
+            directives[key.lower()] = value.strip('"')
+
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0.0
+    for name in ("s-maxage", "max-age"):
+        if name in directives:
+            try:
+                return max(0.0, float(directives[name]))
+            except ValueError:
+                return 0.0
+    if "expires" in headers:
+        try:
+            expires = email.utils.parsedate_to_datetime(headers["expires"]).timestamp()
+        except (TypeError, ValueError):
+            return 0.0
+        return max(0.0, expires - time.time())
+    return 0.0
+
+
+class ResponseCache:
+    """LRU cache of GET responses honoring ETag, Last-Modified and Cache-Control."""
+
+    def __init__(self, max_entries: Optional[int] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Responses kept (default from ``tools.http.cache.max_entries``)
+        """
+        self.max_entries = int(max_entries or get_config_value("tools.http.cache.max_entries", 128))
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats: Dict[str, int] = {"hits": 0, "revalidated": 0, "misses": 0}
+
+    @staticmethod
+    def key(url: str, headers: Dict[str, str]) -> str:
+        """Build the cache key of a GET request; request headers are part of it."""
+        digest = hashlib.sha256(repr(sorted((k.lower(), v) for k, v in headers.items())).encode()).hexdigest()
+        return f"{url} {digest}"
+
+    def get(self, key: str) -> Optional[_CacheEntry]:
+        """Get an entry, fresh or stale."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def store(self, key: str, response: HttpResponse) -> None:
+        """Store a complete 200 response if its headers allow it."""
+        freshness = _freshness(response.headers)
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if freshness is None or (freshness == 0.0 and not etag and not last_modified):
+            return
+        entry = _CacheEntry(response, time.time() + freshness, etag, last_modified)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def refresh(self, key: str, entry: _CacheEntry, headers: httpx.Headers) -> None:
+        """Extend an entry after a 304 Not Modified."""
+        freshness = _freshness(headers)
+        if freshness is None:
+            with self._lock:
+                self._entries.pop(key, None)
+            return
+        entry.expires_at = time.time() + freshness
+
+    def record(self, outcome: str) -> None:
+        """Count a hit, revalidation or miss."""
+        with self._lock:
+            self.stats[outcome] += 1
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+class _LoopPool:
+    """The pooled client and per-host connection slots of one event loop."""
+
+    def __init__(self) -> None:
+        self.client = _create_client()
+        self.max_per_host = int(get_config_value("tools.http.max_connections_per_host", 6))
+        self._hosts: Dict[str, asyncio.Semaphore] = {}
+
+    def host_slot(self, host: str) -> asyncio.Semaphore:
+        semaphore = self._hosts.get(host)
+        if semaphore is None:
+            semaphore = self._hosts[host] = asyncio.Semaphore(self.max_per_host)
+        return semaphore
+
+
+def _create_client() -> httpx.AsyncClient:
+    """Create the pooled client from ``tools.http`` settings."""
+    return httpx.AsyncClient(
+        follow_redirects=True,
+        limits=httpx.Limits(
+            max_connections=int(get_config_value("tools.http.max_connections", 20)),
+            max_keepalive_connections=int(get_config_value("tools.http.max_keepalive_connections", 10)),
+            keepalive_expiry=float(get_config_value("tools.http.keepalive_expiry", 30.0)),
+        ),
+    )
+
+
+# httpx clients are bound to the loop that first uses them, so keep one per loop
+_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopPool]" = weakref.WeakKeyDictionary()
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def _get_pool() -> _LoopPool:
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None or pool.client.is_closed:
+        pool = _pools[loop] = _LoopPool()
+        register_shutdown_hook(aclose)
+    return pool
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Get the shared response cache, or None when ``tools.http.cache.enabled`` is off."""
+    global _cache
+    if not get_config_value("tools.http.cache.enabled", True):
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ResponseCache()
+    return _cache
+
+
+async def aclose() -> None:
+    """Close the pooled client of the running event loop."""
+    pool = _pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None and not pool.client.is_closed:
+        await pool.client.aclose()
+
+
+async def fetch(
+    method: str,
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    content: Optional[bytes] = None,
+    timeout: Optional[float] = None,
+    max_bytes: Optional[int] = None,
+) -> HttpResponse:
+    """
+    Send a request on the pooled client and read the body up to a byte cap.
+
+    Args:
+        method: HTTP method
+        url: Request URL
+        headers: Request headers
+        content: Request body
+        timeout: Seconds allowed for connecting and for each read
+        max_bytes: Body bytes kept (default from ``tools.http.max_response_bytes``)
+
+    Returns:
+        The response; ``truncated`` is set if the body was cut off
+
+    Raises:
+        httpx.RequestError: On connection errors and timeouts
+    """
+    headers = dict(headers or {})
+    if max_bytes is None:
+        max_bytes = int(get_config_value("tools.http.max_response_bytes", 1048576))
+
+    cache = get_response_cache() if method.upper() == "GET" and content is None else None
+    key = ResponseCache.key(url, headers) if cache is not None else ""
+    entry = cache.get(key) if cache is not None else None
+    if cache is not None and entry is not None:
+        if entry.is_fresh():
+            cache.record("hits")
+            return replace(entry.response, from_cache=True)
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+
+    pool = _get_pool()
+    async with pool.host_slot(httpx.URL(url).host):
+        async with pool.client.stream(method.upper(), url, headers=headers, content=content, timeout=timeout) as r:
+            if r.status_code == 304 and cache is not None and entry is not None:
+                cache.refresh(key, entry, r.headers)
+                cache.record("revalidated")
+                return replace(entry.response, from_cache=True)
+
+            chunks = []
+            size = 0
+            truncated = False
+            async for chunk in r.aiter_bytes():
+                if size + len(chunk) > max_bytes:
+                    chunks.append(chunk[: max_bytes - size])
+                    truncated = True
+                    break
+                chunks.append(chunk)
+                size += len(chunk)
+
+    response = HttpResponse(r.status_code, r.reason_phrase, r.headers, b"".join(chunks), truncated)
+    if cache is not None:
+        cache.record("misses")
+        if response.status_code == 200 and not truncated:
+            cache.store(key, response)
+    return response
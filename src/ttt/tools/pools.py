@@ -0,0 +1,276 @@
+"""Execution pools for sync tool functions.
+
+A sync tool called directly from ToolExecutor's coroutine blocks the event
+loop for as long as it runs, and ``asyncio.wait_for`` cannot interrupt it.
+Each tool therefore has an execution mode (see ``ExecutionMode``):
+
+- ``inline`` runs on the event loop thread, for tools that return at once.
+- ``thread`` runs in a bounded thread pool. A timeout releases the caller,
+  but Python cannot stop a running thread, so the call is counted as
+  abandoned and finishes in the background.
+- ``process`` runs in a bounded pool of worker processes. Cancelling the
+  call (which is how timeouts reach it) kills the worker, and a fresh one
+  is started for the next call. The tool function must be importable by
+  module and name, and its arguments and result picklable.
+"""
+
+import asyncio
+import atexit
+import contextvars
+import functools
+import importlib
+import inspect
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from ..config.loader import get_config_value
+from ..utils import get_logger
+from .base import ExecutionMode
+
+logger = get_logger(__name__)
+
+
+def _new_stats(size: int) -> Dict[str, Any]:
+    return {
+        "size": size,
+        "calls": 0,
+        "active": 0,
+        "completed": 0,
+        "failed": 0,
+        "cancelled": 0,
+        "total_time": 0.0,
+    }
+
+
+def _function_ref(func: Callable[..., Any]) -> Tuple[str, str]:
+    """Get the (module, qualified name) a worker process imports a tool function by."""
+    func = inspect.unwrap(func)
+    module = getattr(func, "__module__", None)
+    qualname = getattr(func, "__qualname__", "")
+    if not module or not qualname or "<locals>" in qualname or "<lambda>" in qualname:
+        raise ValueError(f"{func!r} must be a module-level function to run in a process pool")
+    return module, qualname
+
+
+def _resolve_function(module: str, qualname: str) -> Callable[..., Any]:
+    """Import a tool function in a worker process, unwrapping the @tool wrapper."""
+    obj: Any = importlib.import_module(module)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    resolved: Callable[..., Any] = inspect.unwrap(obj)
+    return resolved
+
+
+def _process_worker_main(conn: Any) -> None:
+    """Worker process loop: run (module, qualname, kwargs) jobs until the pipe closes."""
+    while True:
+        try:
+            module, qualname, kwargs = conn.recv()
+        except (EOFError, OSError):
+            return
+        try:
+            result = _resolve_function(module, qualname)(**kwargs)
+            reply: Tuple[str, Any] = ("ok", result)
+        except BaseException as e:
+            reply = ("error", e)
+        try:
+            conn.send(reply)
+        except Exception as e:
+            # The result or exception could not be pickled
+            conn.send(("error", RuntimeError(f"Tool result could not be sent back: {e}")))
+
+
+class _ProcessWorker:
+    """A worker process and the parent's end of its pipe."""
+
+    def __init__(self, context: Any):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_process_worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+
+    def call(self, module: str, qualname: str, kwargs: Dict[str, Any]) -> Tuple[str, Any]:
+        self.conn.send((module, qualname, kwargs))
+        return self.conn.recv()  # type: ignore[no-any-return]
+
+    def kill(self) -> None:
+        """Send SIGKILL without waiting, so it is safe to call on the event loop."""
+        if self.process.is_alive():
+            self.process.kill()
+
+    def close(self) -> None:
+        """Kill the process, reap it and close the pipe. Blocks for up to a second."""
+        self.kill()
+        self.process.join(timeout=1)
+        self.conn.close()
+
+
+class _ProcessJob:
+    """Tracks the worker running a call so a cancelled caller can kill it."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.worker: Optional[_ProcessWorker] = None
+        self.cancelled = False
+
+
+class ToolPools:
+    """Thread and process pools shared by all tool executors."""
+
+    def __init__(self, thread_pool_size: Optional[int] = None, process_pool_size: Optional[int] = None):
+        """
+        Initialize the pools. Threads and processes are started on demand.
+
+        Args:
+            thread_pool_size: Threads for ``thread`` tools (default from ``tools.executor.thread_pool_size``)
+            process_pool_size: Worker processes for ``process`` tools
+                (default from ``tools.executor.process_pool_size``)
+        """
+        self.thread_pool_size = int(thread_pool_size or get_config_value("tools.executor.thread_pool_size", 8))
+        self.process_pool_size = int(process_pool_size or get_config_value("tools.executor.process_pool_size", 2))
+        self._threads = ThreadPoolExecutor(self.thread_pool_size, thread_name_prefix="ttt-tool")
+        # One worker process per waiter thread bounds the process pool at process_pool_size
+        self._process_waiters = ThreadPoolExecutor(self.process_pool_size, thread_name_prefix="ttt-tool-process")
+        self._local = threading.local()
+        self._workers: Set[_ProcessWorker] = set()
+        self._context = multiprocessing.get_context("spawn")
+        self._lock = threading.Lock()
+        self.stats: Dict[str, Dict[str, Any]] = {
+            ExecutionMode.INLINE.value: _new_stats(0),
+            ExecutionMode.THREAD.value: dict(_new_stats(self.thread_pool_size), abandoned=0),
+            ExecutionMode.PROCESS.value: dict(_new_stats(self.process_pool_size), killed=0),
+        }
+
+    async def run(self, mode: ExecutionMode, func: Callable[..., Any], arguments: Dict[str, Any]) -> Any:
+        """
+        Run a sync tool function according to its execution mode.
+
+        Args:
+            mode: Where to run the function
+            func: The tool function
+            arguments: Keyword arguments for the function
+
+        Returns:
+            The function's result
+
+        Raises:
+            Exception: Whatever the function raised
+            asyncio.CancelledError: If the call was cancelled, e.g. by a timeout
+        """
+        stats = self.stats[mode.value]
+        self._count(stats, calls=1, active=1)
+        started = time.perf_counter()
+        try:
+            if mode is ExecutionMode.PROCESS:
+                result = await self._run_in_process(func, arguments)
+            elif mode is ExecutionMode.THREAD:
+                result = await self._run_in_thread(func, arguments)
+            else:
+                result = func(**arguments)
+        except asyncio.CancelledError:
+            self._count(stats, cancelled=1)
+            raise
+        except Exception:
+            self._count(stats, failed=1)
+            raise
+        else:
+            self._count(stats, completed=1)
+            return result
+        finally:
+            self._count(stats, active=-1, total_time=time.perf_counter() - started)
+
+    async def _run_in_thread(self, func: Callable[..., Any], arguments: Dict[str, Any]) -> Any:
+        # Carry context variables (e.g. the sanitized-arguments flag) into the thread
+        call = functools.partial(contextvars.copy_context().run, func, **arguments)
+        future = asyncio.get_running_loop().run_in_executor(self._threads, call)
+        try:
+            return await future
+        except asyncio.CancelledError:
+            # A started thread cannot be stopped; it runs to completion and its result is dropped
+            self._count(self.stats[ExecutionMode.THREAD.value], abandoned=1)
+            raise
+
+    async def _run_in_process(self, func: Callable[..., Any], arguments: Dict[str, Any]) -> Any:
+        module, qualname = _function_ref(func)
+        job = _ProcessJob()
+        future = asyncio.get_running_loop().run_in_executor(
+            self._process_waiters, self._call_worker, job, module, qualname, arguments
+        )
+        try:
+            status, payload = await future
+        except asyncio.CancelledError:
+            with job.lock:
+                job.cancelled = True
+                worker = job.worker
+            if worker is not None:
+                # The waiter thread sees the pipe close, reaps the worker and replaces it
+                worker.kill()
+                self._count(self.stats[ExecutionMode.PROCESS.value], killed=1)
+            raise
+        if status == "error":
+            raise payload
+        return payload
+
+    def _call_worker(self, job: _ProcessJob, module: str, qualname: str, arguments: Dict[str, Any]) -> Tuple[str, Any]:
+        """Run a job on this waiter thread's worker process, starting one if needed."""
+        with job.lock:
+            if job.cancelled:
+                return "error", RuntimeError("Cancelled before start")
+            worker: Optional[_ProcessWorker] = getattr(self._local, "worker", None)
+            if worker is None or not worker.process.is_alive():
+                if worker is not None:
+                    # Killed by a cancellation that came after it had already answered
+                    worker.close()
+                    with self._lock:
+                        self._workers.discard(worker)
+                worker = self._local.worker = _ProcessWorker(self._context)
+                with self._lock:
+                    self._workers.add(worker)
+            job.worker = worker
+        try:
+            return worker.call(module, qualname, arguments)
+        except (EOFError, OSError, BrokenPipeError) as e:
+            # Killed on cancellation, or crashed; the next job on this thread starts a new worker
+            logger.debug(f"Tool worker process {worker.process.pid} exited: {e!r}")
+            self._local.worker = None
+            with self._lock:
+                self._workers.discard(worker)
+            worker.close()
+            return "error", RuntimeError(f"Tool worker process exited: {e or 'killed'}")
+
+    def _count(self, stats: Dict[str, Any], **deltas: Any) -> None:
+        with self._lock:
+            for key, delta in deltas.items():
+                stats[key] += delta
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-pool statistics."""
+        with self._lock:
+            return {mode: dict(stats) for mode, stats in self.stats.items()}
+
+    def shutdown(self) -> None:
+        """Kill worker processes and stop the pools without waiting for running calls."""
+        with self._lock:
+            workers, self._workers = self._workers, set()
+        for worker in workers:
+            worker.close()
+        self._threads.shutdown(wait=False, cancel_futures=True)
+        self._process_waiters.shutdown(wait=False, cancel_futures=True)
+
+
+_pools: Optional[ToolPools] = None
+_pools_lock = threading.Lock()
+
+
+def get_tool_pools() -> ToolPools:
+    """Get the shared tool execution pools."""
+    global _pools
+    if _pools is None:
+        with _pools_lock:
+            if _pools is None:
+                _pools = ToolPools()
+                atexit.register(_pools.shutdown)
+    return _pools
@@ -1,15 +1,18 @@
 """Smart error recovery and fallback system for AI tools."""
 
 import asyncio
+import functools
 import json
 import logging
 import random
 import re
 import time
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, cast
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, cast
 
 import bleach
 import validators
@@ -75,6 +78,58 @@ class FallbackSuggestion:
     confidence: float
 
 
+# Set while a tool runs with arguments the executor has already sanitized
+_arguments_sanitized: ContextVar[bool] = ContextVar("ttt_arguments_sanitized", default=False)
+
+_CONTROL_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]")
+
+
+def _relax_pattern(pattern: str) -> str:
+    """
+    Rewrite a case-insensitive pattern to run against lowercased, newline-prefixed ASCII text.
+
+    Letters outside escapes are lowercased so the pattern compiles without
+    re.IGNORECASE, ``^`` becomes ``\\n`` and a leading ``\\b`` is dropped. Every
+    pattern then starts with a literal the regex engine can skip ahead to.
+    On ASCII text the result matches a superset of what the original
+    matches; casefolding non-ASCII text (``İ`` becomes ``i`` plus a combining
+    dot) breaks that, so such text is not prefiltered.
+    """
+    relaxed = re.sub(r"\\.|[A-Z]", lambda m: m.group() if len(m.group()) > 1 else m.group().lower(), pattern)
+    if relaxed.startswith("^"):
+        relaxed = "\n" + relaxed[1:]
+    elif relaxed.startswith("\\b"):
+        relaxed = relaxed[2:]
+    return relaxed
+
+
+class _PatternScanner:
+    """Precompiled scanner reporting the first of a fixed list of patterns that matches."""
+
+    def __init__(self, patterns: Sequence[str], flags: int):
+        self._exact = [re.compile(pattern, flags) for pattern in patterns]
+        self._relaxed = [re.compile(_relax_pattern(pattern)) for pattern in patterns]
+
+    def search(self, value: str) -> int:
+        """
+        Get the index of the first matching pattern, or -1 if none match.
+
+        ASCII text is lowercased once and searched with the relaxed patterns;
+        only their rare hits are confirmed with the exact pattern. Other text
+        is searched with the exact patterns alone.
+        """
+        if not value.isascii():
+            for index, exact in enumerate(self._exact):
+                if exact.search(value):
+                    return index
+            return -1
+        folded = "\n" + value.lower()
+        for index, relaxed in enumerate(self._relaxed):
+            if relaxed.search(folded) and self._exact[index].search(value):
+                return index
+        return -1
+
+
 class InputSanitizer:
     """Professional input sanitization using battle-tested libraries."""
 
@@ -137,6 +192,11 @@ class InputSanitizer:
         r"chr\s*\(\s*\d+\s*\)\s*\+.*chr\s*\(",  # Character concatenation
     ]
 
+    # Compiled once; patterns past len(DANGEROUS_PATTERNS) are code patterns
+    _TEXT_SCANNER = _PatternScanner(DANGEROUS_PATTERNS, re.IGNORECASE | re.MULTILINE)
+    _CODE_SCANNER = _PatternScanner(DANGEROUS_PATTERNS + CODE_DANGEROUS_PATTERNS, re.IGNORECASE | re.MULTILINE)
+    _URL_SCANNER = _PatternScanner(DANGEROUS_PATTERNS, re.IGNORECASE)
+
     @classmethod
     def sanitize_string(cls, value: str, max_length: int = 10000, allow_code: bool = True) -> str:
         """Sanitize string input using professional bleach library."""
@@ -147,24 +207,25 @@ class InputSanitizer:
         if len(value) > max_length:
             raise ValueError(f"String too long: {len(value)} > {max_length}")
 
-        # Check for truly dangerous patterns (much more targeted now)
-        for pattern in cls.DANGEROUS_PATTERNS:
-            if re.search(pattern, value, re.IGNORECASE | re.MULTILINE):
-                raise ValueError("Potentially dangerous content detected")
+        error, sanitized = _sanitize_string(value, allow_code)
+        if error:
+            raise ValueError(error)
+        return sanitized
 
-        if allow_code:
-            # For code content, check code-specific dangerous patterns
-            for pattern in cls.CODE_DANGEROUS_PATTERNS:
-                if re.search(pattern, value, re.IGNORECASE | re.MULTILINE):
-                    raise ValueError("Dangerous code pattern detected")
+    @staticmethod
+    @contextmanager
+    def arguments_sanitized() -> Iterator[None]:
+        """Mark tool arguments as already sanitized while a tool runs, so they are not scanned twice."""
+        token = _arguments_sanitized.set(True)
+        try:
+            yield
+        finally:
+            _arguments_sanitized.reset(token)
 
-            # Remove null bytes and other control characters
-            sanitized = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]", "", value)
-            return sanitized.strip()
-        else:
-            # For HTML/text content, use bleach for proper sanitization
-            sanitized = bleach.clean(value, strip=True)
-            return str(sanitized)
+    @staticmethod
+    def are_arguments_sanitized() -> bool:
+        """Check whether the running tool's arguments were already sanitized."""
+        return _arguments_sanitized.get()
 
     @classmethod
     def sanitize_path(cls, path: str) -> Path:
@@ -225,9 +286,8 @@ class InputSanitizer:
             raise ValueError("Only HTTP and HTTPS URLs are allowed")
 
         # Check for dangerous patterns in URL
-        for pattern in cls.DANGEROUS_PATTERNS:
-            if re.search(pattern, url, re.IGNORECASE):
-                raise ValueError("Potentially dangerous URL content detected")
+        if cls._URL_SCANNER.search(url) >= 0:
+            raise ValueError("Potentially dangerous URL content detected")
 
         return url
 
@@ -259,6 +319,25 @@ class InputSanitizer:
             raise ValueError(f"Invalid JSON: {e}") from e
 
 
+@functools.lru_cache(maxsize=256)
+def _sanitize_string(value: str, allow_code: bool) -> Tuple[Optional[str], str]:
+    """Scan and clean a string, returning (error, sanitized); cached since tool loops resend the same payloads."""
+    if allow_code:
+        index = InputSanitizer._CODE_SCANNER.search(value)
+        if index >= len(InputSanitizer.DANGEROUS_PATTERNS):
+            return "Dangerous code pattern detected", value
+    else:
+        index = InputSanitizer._TEXT_SCANNER.search(value)
+    if index >= 0:
+        return "Potentially dangerous content detected", value
+
+    if allow_code:
+        # Remove null bytes and other control characters
+        return None, _CONTROL_CHARS.sub("", value).strip()
+    # For HTML/text content, use bleach for proper sanitization
+    return None, str(bleach.clean(value, strip=True))
+
+
 class ErrorRecoverySystem:
     """Smart error recovery and fallback system."""
 
@@ -3,7 +3,7 @@
 import threading
 from typing import Callable, Dict, List, Optional, Set, Union
 
-from .base import ToolDefinition, create_tool_definition
+from .base import ExecutionMode, ToolDefinition, create_tool_definition
 
 
 class ToolRegistry:
@@ -20,10 +20,11 @@ class ToolRegistry:
         name: Optional[str] = None,
         description: Optional[str] = None,
         category: str = "general",
+        execution: Optional[Union[str, ExecutionMode]] = None,
     ) -> ToolDefinition:
         """Register a function as a tool."""
         with self._lock:
-            tool_def = create_tool_definition(func, name, description, category)
+            tool_def = create_tool_definition(func, name, description, category, execution)
 
             if tool_def.name in self._tools:
                 raise ValueError(f"Tool '{tool_def.name}' is already registered")
@@ -116,6 +117,15 @@ class ToolRegistry:
 
 # Global registry instance
 _global_registry = ToolRegistry()
+_builtins_loaded = False
+
+
+def _ensure_builtins() -> None:
+    """Register the built-in tools on first lookup instead of at package import."""
+    global _builtins_loaded
+    if not _builtins_loaded:
+        _builtins_loaded = True
+        from . import builtins  # noqa: F401  (tools register via @tool)
 
 
 def register_tool(
@@ -123,9 +133,10 @@ def register_tool(
     name: Optional[str] = None,
     description: Optional[str] = None,
     category: str = "general",
+    execution: Optional[Union[str, ExecutionMode]] = None,
 ) -> ToolDefinition:
     """Register a tool in the global registry."""
-    return _global_registry.register(func, name, description, category)
+    return _global_registry.register(func, name, description, category, execution)
 
 
 def unregister_tool(name: str) -> bool:
@@ -135,16 +146,19 @@ def unregister_tool(name: str) -> bool:
 
 def get_tool(name: str) -> Optional[ToolDefinition]:
     """Get a tool from the global registry."""
+    _ensure_builtins()
     return _global_registry.get(name)
 
 
 def list_tools(category: Optional[str] = None) -> List[ToolDefinition]:
     """List tools from the global registry."""
+    _ensure_builtins()
     return _global_registry.list_tools(category)
 
 
 def get_categories() -> List[str]:
     """Get all categories from the global registry."""
+    _ensure_builtins()
     return _global_registry.get_categories()
 
 
@@ -152,14 +166,18 @@ def resolve_tools(
     tools: Union[List[str], List[Callable], List[ToolDefinition]],
 ) -> List[ToolDefinition]:
     """Resolve tool references using the global registry."""
+    _ensure_builtins()
     return _global_registry.resolve_tools(tools)
 
 
 def clear_registry() -> None:
-    """Clear the global registry."""
+    """Clear the global registry (built-in tools are not reloaded afterwards)."""
+    global _builtins_loaded
+    _builtins_loaded = True
     _global_registry.clear()
 
 
 def get_registry() -> ToolRegistry:
     """Get the global registry instance for advanced usage."""
+    _ensure_builtins()
     return _global_registry
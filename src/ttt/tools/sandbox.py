@@ -0,0 +1,232 @@
+"""Warm Python interpreters for the run_python tool.
+
+Starting an interpreter costs tens of milliseconds before any user code
+runs, and code-executing agents call run_python many times per task. The
+pool keeps a few interpreters started and blocked reading their stdin:
+
+- A run takes an idle worker and starts a replacement once it finishes,
+  so the next run finds one warm as well.
+- Each worker runs exactly one job and exits, so no state leaks between
+  runs; the code goes in over stdin and the output comes back over the
+  stdout and stderr pipes.
+- Before running the code the worker applies resource limits (CPU time
+  from the timeout, no core dumps and, if ``memory_limit_mb`` is set, an
+  address space limit) where the platform supports them, and a run that
+  exceeds its timeout is killed along with anything it started.
+- Workers run the ``python3`` found on PATH, as run_python always has, so
+  user code sees that interpreter's packages rather than ttt's own
+  environment. ``tools.python_workers.interpreter`` overrides it.
+"""
+
+import atexit
+import json
+import os
+import shutil
+import signal
+import subprocess
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..config.loader import get_config_value
+from ..utils import get_logger
+
+logger = get_logger(__name__)
+
+# Runs in each worker: read a JSON header line and the code from stdin, apply limits, run the code
+_WORKER_SOURCE = r"""
+import json, linecache, os, sys
+header = sys.stdin.buffer.readline()
+if not header:
+    sys.exit(0)
+job = json.loads(header)
+code = sys.stdin.buffer.read().decode("utf-8")
+sys.stdin = open(os.devnull)
+try:
+    import resource
+except ImportError:
+    resource = None
+if resource is not None:
+    for name, value in job["limits"].items():
+        if value is not None and hasattr(resource, name):
+            try:
+                resource.setrlimit(getattr(resource, name), (value, value))
+            except (ValueError, OSError):
+                pass
+if job.get("cwd"):
+    try:
+        os.chdir(job["cwd"])
+    except OSError:
+        pass
+filename = "<run_python>"
+linecache.cache[filename] = (len(code), None, code.splitlines(True), filename)
+sys.argv = [filename]
+namespace = {"__name__": "__main__", "__builtins__": __builtins__}
+try:
+    exec(compile(code, filename, "exec"), namespace)
+except SystemExit:
+    raise
+except BaseException as e:
+    import traceback
+    traceback.print_exception(type(e), e, e.__traceback__.tb_next)
+    sys.exit(1)
+"""
+
+
+def _python_executable() -> str:
+    """Get the interpreter used for workers, resolved on PATH."""
+    interpreter = str(get_config_value("tools.python_workers.interpreter", "python3"))
+    return shutil.which(interpreter) or shutil.which("python") or interpreter
+
+
+class PythonWorkerPool:
+    """Pool of pre-started, single-use Python interpreters."""
+
+    def __init__(self, size: Optional[int] = None, memory_limit_mb: Optional[int] = None):
+        """
+        Initialize the pool. Workers are started on the first run.
+
+        Args:
+            size: Idle workers kept started (default from ``tools.python_workers.pool_size``)
+            memory_limit_mb: Address space limit per run, 0 for none. Libraries that
+                reserve large virtual mappings (numpy with OpenBLAS, for one) fail to
+                import under a low limit
+                (default from ``tools.python_workers.memory_limit_mb``)
+        """
+        self.size = int(size if size is not None else get_config_value("tools.python_workers.pool_size", 2))
+        self.memory_limit_mb = int(
+            memory_limit_mb
+            if memory_limit_mb is not None
+            else get_config_value("tools.python_workers.memory_limit_mb", 0)
+        )
+        self._idle: List["subprocess.Popen[bytes]"] = []
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self.stats: Dict[str, int] = {"runs": 0, "warm_starts": 0, "timeouts": 0}
+
+    def run(self, code: str, timeout: float, cwd: Optional[str] = None) -> Tuple[int, str, str]:
+        """
+        Run code in a fresh worker.
+
+        Args:
+            code: Python source to execute
+            timeout: Seconds before the run is killed
+            cwd: Working directory for the run (default: the current directory)
+
+        Returns:
+            Tuple of (exit code, stdout, stderr)
+
+        Raises:
+            TimeoutError: If the run exceeds the timeout
+        """
+        worker, warm = self._checkout()
+        job = {
+            "cwd": cwd or os.getcwd(),
+            "limits": {
+                "RLIMIT_CPU": int(timeout) + 1,
+                "RLIMIT_AS": self.memory_limit_mb * 1024 * 1024 if self.memory_limit_mb > 0 else None,
+                "RLIMIT_CORE": 0,
+            },
+        }
+        payload = json.dumps(job).encode("utf-8") + b"\n" + code.encode("utf-8")
+        with self._lock:
+            self.stats["runs"] += 1
+            self.stats["warm_starts"] += int(warm)
+
+        try:
+            stdout, stderr = worker.communicate(payload, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self._kill(worker)
+            worker.communicate()
+            with self._lock:
+                self.stats["timeouts"] += 1
+            raise TimeoutError(f"Code execution timed out after {timeout} seconds") from None
+        finally:
+            # Start replacements after the run so they do not compete with it for CPU
+            self._replenish()
+
+        return (
+            worker.returncode,
+            stdout.decode("utf-8", errors="replace"),
+            stderr.decode("utf-8", errors="replace"),
+        )
+
+    def shutdown(self) -> None:
+        """Stop all idle workers."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            self._kill(worker)
+            try:
+                worker.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                pass
+
+    def _checkout(self) -> Tuple["subprocess.Popen[bytes]", bool]:
+        """Take a live idle worker, or start one if there is none."""
+        with self._lock:
+            if os.getpid() != self._pid:
+                # Forked: the idle workers belong to the parent process
+                self._idle = []
+                self._pid = os.getpid()
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.poll() is None:
+                    return worker, True
+        return self._spawn(), False
+
+    def _replenish(self) -> None:
+        """Start workers until ``size`` are idle."""
+        while True:
+            with self._lock:
+                if len(self._idle) >= self.size:
+                    return
+            try:
+                worker = self._spawn()
+            except OSError as e:
+                logger.debug(f"Could not start Python worker: {e}")
+                return
+            with self._lock:
+                self._idle.append(worker)
+
+    def _spawn(self) -> "subprocess.Popen[bytes]":
+        """Start a worker; it blocks reading its job until one is sent."""
+        env = dict(os.environ, PYTHONIOENCODING="utf-8")
+        return subprocess.Popen(
+            [_python_executable(), "-c", _WORKER_SOURCE],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=env,
+            start_new_session=os.name == "posix",
+        )
+
+    @staticmethod
+    def _kill(worker: "subprocess.Popen[bytes]") -> None:
+        """Kill a worker and, on POSIX, the processes it started."""
+        try:
+            if os.name == "posix":
+                os.killpg(worker.pid, signal.SIGKILL)
+            else:
+                worker.kill()
+        except (ProcessLookupError, PermissionError, OSError):
+            pass
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get pool statistics."""
+        with self._lock:
+            return dict(self.stats, idle=len(self._idle), size=self.size)
+
+
+_pool: Optional[PythonWorkerPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_python_pool() -> PythonWorkerPool:
+    """Get the shared Python worker pool."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = PythonWorkerPool()
+                atexit.register(_pool.shutdown)
+    return _pool
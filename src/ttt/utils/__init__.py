@@ -4,7 +4,7 @@ from typing import TypeVar
 
 from rich.console import Console
 
-from .async_utils import optimized_run_async, run_coro_in_background
+from .async_utils import iterate_in_background, optimized_run_async, run_coro_in_background
 from .logger import get_logger
 
 console = Console()
@@ -20,5 +20,6 @@ __all__ = [
     "console",
     "run_async",
     "run_coro_in_background",
+    "iterate_in_background",
     "optimized_run_async",
 ]
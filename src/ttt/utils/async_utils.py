@@ -4,7 +4,8 @@ import asyncio
 import atexit
 import concurrent.futures
 import threading
-from typing import Awaitable, TypeVar, cast
+from collections import deque
+from typing import AsyncIterator, Awaitable, Callable, Deque, Generic, Iterator, List, Optional, TypeVar
 
 T = TypeVar("T")
 
@@ -14,6 +15,9 @@ _background_thread = None
 _executor = None
 _lock = threading.Lock()
 
+# Async cleanup callbacks run on the background loop before it stops
+_shutdown_hooks: List[Callable[[], Awaitable[None]]] = []
+
 
 def _start_background_loop() -> None:
     """Start the background event loop in a dedicated thread.
@@ -91,6 +95,17 @@ def _stop_background_loop() -> None:
     """
     global _background_loop, _background_thread, _executor
 
+    if _background_loop is not None and _shutdown_hooks:
+        # Let long-lived resources (HTTP pools, etc.) close on their own loop first
+        try:
+            from ..config.loader import get_config_value
+
+            hook_timeout = get_config_value("constants.timeouts.async_thread_join", 2.0)
+            asyncio.run_coroutine_threadsafe(_run_shutdown_hooks(), _background_loop).result(timeout=hook_timeout)
+        except Exception:
+            pass
+        _shutdown_hooks.clear()
+
     if _background_loop is not None:
         # Cancel all pending tasks more gracefully
         def cancel_tasks() -> None:
@@ -130,6 +145,52 @@ def _stop_background_loop() -> None:
 atexit.register(_stop_background_loop)
 
 
+async def _run_shutdown_hooks() -> None:
+    """Run registered cleanup callbacks on the running loop, ignoring individual failures."""
+    for hook in list(_shutdown_hooks):
+        try:
+            await hook()
+        except Exception:
+            pass
+
+
+def register_shutdown_hook(hook: Callable[[], Awaitable[None]]) -> None:
+    """
+    Register an async cleanup callback for the background loop.
+
+    Hooks are awaited on the background loop, in registration order, when
+    the loop is stopped at interpreter exit. Use this for resources such as
+    pooled HTTP clients that must be closed on the loop that created them.
+
+    Args:
+        hook: Zero-argument callable returning an awaitable
+    """
+    with _lock:
+        if hook not in _shutdown_hooks:
+            _shutdown_hooks.append(hook)
+
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the shared background event loop, starting it if necessary.
+
+    Returns:
+        The running background event loop
+    """
+    with _lock:
+        if _background_loop is None:
+            _start_background_loop()
+
+    if _background_loop is None:
+        raise RuntimeError("Background loop not initialized")
+    return _background_loop
+
+
+def in_background_thread() -> bool:
+    """Return True if the caller is running on the background loop's thread."""
+    return _background_thread is not None and threading.current_thread() is _background_thread
+
+
 def run_coro_in_background(coro: Awaitable[T]) -> T:
     """
     Run a coroutine in the shared background event loop.
@@ -143,6 +204,21 @@ def run_coro_in_background(coro: Awaitable[T]) -> T:
     Returns:
         The result of the coroutine
     """
+    if in_background_thread():
+        # Blocking on the background loop from its own thread would deadlock,
+        # so run the coroutine to completion on a short-lived helper thread.
+        helper: concurrent.futures.Future[T] = concurrent.futures.Future()
+
+        def run_isolated() -> None:
+            """Run the coroutine in a fresh loop and forward its outcome."""
+            try:
+                helper.set_result(asyncio.run(_run_and_close_loop_resources(coro)))
+            except BaseException as e:
+                helper.set_exception(e)
+
+        threading.Thread(target=run_isolated, daemon=True).start()
+        return helper.result()
+
     with _lock:
         if _background_loop is None:
             _start_background_loop()
@@ -165,14 +241,23 @@ def run_coro_in_background(coro: Awaitable[T]) -> T:
     return result
 
 
+async def _run_and_close_loop_resources(awaitable: Awaitable[T]) -> T:
+    """Await on a short-lived loop, then close pooled clients the awaitable created on it."""
+    try:
+        return await awaitable
+    finally:
+        # The shutdown hooks close resources bound to the running loop only
+        await _run_shutdown_hooks()
+
+
 def optimized_run_async(coro: Awaitable[T]) -> T:
     """
     Optimized version of run_async that reuses a background event loop.
 
     This function provides better performance by avoiding the overhead
-    of creating new event loops for every call. It intelligently chooses
-    between using the background loop or creating a new one based on
-    the current execution context.
+    of creating new event loops for every call. Every coroutine runs on the
+    shared background loop, so loop-bound resources such as pooled HTTP
+    connections survive between synchronous calls.
 
     Args:
         coro: The coroutine or awaitable to execute
@@ -189,22 +274,124 @@ def optimized_run_async(coro: Awaitable[T]) -> T:
         >>> result = optimized_run_async(my_async_function())
         >>> print(result)  # "Hello, World!"
     """
+    return run_coro_in_background(coro)
+
+
+class _BackgroundStream(Generic[T]):
+    """
+    Buffer between an async iterator running on the background loop and a sync consumer.
+
+    The producer task appends items under a lock and only awaits when the
+    buffer is full; the consumer takes everything buffered at once, so there
+    is no per-item cross-thread future.
+    """
+
+    def __init__(self, aiterator: AsyncIterator[T], max_buffer: int, loop: asyncio.AbstractEventLoop):
+        self._items: Deque[T] = deque()
+        self._cond = threading.Condition()
+        self._finished = False
+        self._error: Optional[BaseException] = None
+        self._max_buffer = max(1, max_buffer)
+        self._space: Optional[asyncio.Event] = None  # Set while the producer waits for room
+        self._loop = loop
+        self._future = asyncio.run_coroutine_threadsafe(self._produce(aiterator), loop)
+
+    async def _produce(self, aiterator: AsyncIterator[T]) -> None:
+        try:
+            async for item in aiterator:
+                space = None
+                with self._cond:
+                    self._items.append(item)
+                    self._cond.notify()
+                    if len(self._items) >= self._max_buffer:
+                        space = self._space = asyncio.Event()
+                if space is not None:
+                    await space.wait()
+        except Exception as e:
+            self._error = e
+        finally:
+            aclose = getattr(aiterator, "aclose", None)
+            if aclose is not None:
+                try:
+                    await aclose()
+                except Exception:
+                    pass
+            with self._cond:
+                self._finished = True
+                self._cond.notify()
+
+    def take(self) -> List[T]:
+        """
+        Wait for items and return everything buffered.
+
+        Returns:
+            The buffered items, or an empty list once the stream has ended
+
+        Raises:
+            The producer's exception, after all items before it were taken
+        """
+        with self._cond:
+            while not self._items and not self._finished:
+                self._cond.wait()
+            batch = list(self._items)
+            self._items.clear()
+            space, self._space = self._space, None
+            if not batch and self._error is not None:
+                raise self._error
+        if space is not None:
+            self._loop.call_soon_threadsafe(space.set)
+        return batch
+
+    def cancel(self) -> None:
+        """Cancel the producer task; the async iterator is closed on the loop."""
+        if not self._finished:
+            self._future.cancel()
+
+
+def iterate_in_background(
+    aiterator: AsyncIterator[T],
+    *,
+    max_buffer: Optional[int] = None,
+    coalesce: Optional[Callable[[List[T]], List[T]]] = None,
+) -> Iterator[T]:
+    """
+    Consume an async iterator from synchronous code.
+
+    The iterator runs as a single task on the shared background loop and
+    pushes items into a bounded buffer. If the caller stops early, the task
+    is cancelled and the iterator closed with ``aclose()``.
+
+    Args:
+        aiterator: Async iterator (usually an async generator) to consume
+        max_buffer: Items buffered before the producer waits (default from
+            ``constants.streaming.max_buffer``)
+        coalesce: Called with every batch of more than one buffered item; may
+            merge them (e.g. join text chunks)
+
+    Yields:
+        Items in order
+    """
+    if in_background_thread():
+        # Consuming on the loop's own thread cannot wait for a task on it; pull items one at a time
+        while True:
+            try:
+                yield run_coro_in_background(aiterator.__anext__())
+            except StopAsyncIteration:
+                return
+
+    if max_buffer is None:
+        from ..config.loader import get_config_value
+
+        max_buffer = int(get_config_value("constants.streaming.max_buffer", 256))
+
+    stream = _BackgroundStream(aiterator, max_buffer, get_background_loop())
     try:
-        # Check if an event loop is already running in the current thread
-        asyncio.get_running_loop()
-        # If we get here, we're already in an async context
-        # Use the background loop approach
-        return run_coro_in_background(coro)
-    except RuntimeError:
-        # No running loop, so we can create and run a new one
-        # For the main thread, still use asyncio.run for simplicity
-        # Convert Awaitable to coroutine if needed
-        if asyncio.iscoroutine(coro):
-            result = asyncio.run(coro)
-            return cast(T, result)
-        else:
-            # If it's not a coroutine but an awaitable, wrap it
-            async def _wrapper() -> T:
-                return await coro
-
-            return asyncio.run(_wrapper())
+        while True:
+            batch = stream.take()
+            if not batch:
+                return
+            if coalesce is not None and len(batch) > 1:
+                batch = coalesce(batch)
+            yield from batch
+    finally:
+        stream.cancel()
@@ -0,0 +1,78 @@
+"""Import-time profiling for CLI cold starts.
+
+Runs a fresh interpreter with ``python -X importtime`` so the measurement
+reflects a real cold start rather than the (already warm) current process.
+"""
+
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import List, Optional
+
+
+@dataclass
+class ImportTiming:
+    """Import time of a single module, in microseconds."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+    @property
+    def self_ms(self) -> float:
+        return self.self_us / 1000
+
+    @property
+    def cumulative_ms(self) -> float:
+        return self.cumulative_us / 1000
+
+
+def parse_importtime(output: str) -> List[ImportTiming]:
+    """
+    Parse the stderr of ``python -X importtime``.
+
+    Args:
+        output: Lines of the form ``import time: self [us] | cumulative | module``
+
+    Returns:
+        One ImportTiming per imported module, in import completion order
+    """
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(fields[0]), int(fields[1])
+        except ValueError:
+            continue  # Header line
+        name = fields[2].rstrip()
+        stripped = name.lstrip()
+        timings.append(ImportTiming(stripped, self_us, cumulative_us, (len(name) - len(stripped) - 1) // 2))
+    return timings
+
+
+def profile_imports(module: str = "ttt.cli", timeout: Optional[float] = 60) -> List[ImportTiming]:
+    """
+    Measure the import time of a module in a fresh interpreter.
+
+    Args:
+        module: Module to import
+        timeout: Seconds to wait for the interpreter
+
+    Returns:
+        Import timings of every module loaded by the import
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+    )
+    if result.returncode != 0:
+        lines = result.stderr.strip().splitlines()
+        raise RuntimeError(f"Importing {module} failed: {lines[-1] if lines else result.returncode}")
+    return parse_importtime(result.stderr)
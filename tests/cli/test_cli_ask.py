@@ -1,5 +1,8 @@
 """Tests for the ask CLI command functionality."""
 
+import sys
+from unittest.mock import patch
+
 import pytest
 
 from ttt.cli import main
@@ -60,6 +63,49 @@ class TestAskCommand(IntegrationTestBase):
         # which would indicate the CLI argument parsing failed
         assert result.exit_code != 2
 
+    def test_ask_stream_writes_chunks_incrementally(self):
+        """Test that --stream prints each chunk before the next one is produced."""
+        seen_output = []
+
+        def fake_stream(prompt, **kwargs):
+            for chunk in ["Hello", " world", "\n\n"]:
+                yield chunk
+                seen_output.append(sys.stdout.buffer.getvalue().decode())
+
+        with patch("ttt.app_hooks.ttt_stream", side_effect=fake_stream):
+            result = self.runner.invoke(main, ["ask", "--stream", "true", "hi"])
+
+        assert result.exit_code == 0
+        assert result.output == "Hello world\n"
+        # Output was already visible while the generator was still running
+        assert seen_output[0] == "Hello"
+
+    def test_ask_is_forwarded_to_running_daemon(self):
+        """Test that a running `ttt serve` daemon handles the request instead of the local API."""
+        from ttt.core.models import AIResponse
+
+        class FakeDaemon:
+            def ask(self, prompt, **kwargs):
+                return AIResponse(f"daemon: {prompt}", model=kwargs.get("model"))
+
+        with patch("ttt.server.client.find_daemon", return_value=FakeDaemon()), patch(
+            "ttt.core.api.ask", side_effect=AssertionError("ran in-process")
+        ):
+            result = self.runner.invoke(main, ["ask", "--stream", "false", "-m", "gpt-4", "hi"])
+
+        assert result.exit_code == 0, result.output
+        assert result.output.strip() == "daemon: hi"
+
+    def test_stream_to_stdout_keeps_inner_newlines(self, capsys):
+        """Test newline handling and time-to-first-token stats."""
+        from ttt.app_hooks import stream_to_stdout
+
+        stats = stream_to_stdout(iter(["a\n", "", "\nb\n", "\n"]))
+
+        assert capsys.readouterr().out == "a\n\nb\n"
+        assert stats["chunks"] == 3
+        assert stats["time_to_first_token"] is not None
+
     # Parameter-specific tests have been consolidated into TestCLIParameterValidation
     # in test_cli_modern.py to eliminate redundancy and improve test organization.
     # Basic ask command functionality tests remain here for command-specific validation.
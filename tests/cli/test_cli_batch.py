@@ -0,0 +1,59 @@
+"""Tests for the batch CLI command functionality."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+from ttt.cli import main
+from tests.cli.conftest import IntegrationTestBase
+from tests.utils import MockBackend
+
+
+class TestBatchCommand(IntegrationTestBase):
+    """Test the batch command functionality."""
+
+    def test_batch_command_exists(self):
+        """Test that batch command is available and accepts --help."""
+        result = self.runner.invoke(main, ["batch", "--help"])
+        assert result.exit_code == 0
+
+    def test_batch_reads_jsonl_from_stdin(self):
+        """Test that each input line produces one JSON result line."""
+        input_lines = "\n".join(
+            [
+                json.dumps({"id": "a", "prompt": "Hello"}),
+                "plain text prompt",
+                "",
+                json.dumps({"id": "c"}),
+            ]
+        )
+
+        with patch("ttt.core.routing.router.smart_route", return_value=(MockBackend(), "mock-model")):
+            result = self.runner.invoke(main, ["batch", "--ordered"], input=input_lines)
+
+        assert result.exit_code == 0
+        lines = [json.loads(line) for line in result.output.strip().splitlines()]
+        assert [line["index"] for line in lines] == [0, 1, 2]
+        assert lines[0]["id"] == "a"
+        assert lines[0]["response"] == "Mock response"
+        assert lines[1]["ok"] is True
+        assert lines[2]["ok"] is False
+        assert lines[2]["id"] == "c"
+
+    def test_batch_reads_file_and_writes_output(self):
+        """Test reading requests from a file and writing results to a file."""
+        input_file = Path(self.temp_dir) / "requests.jsonl"
+        output_file = Path(self.temp_dir) / "results.jsonl"
+        input_file.write_text('{"prompt": "one"}\n{"prompt": "two"}\n')
+
+        with patch("ttt.core.routing.router.smart_route", return_value=(MockBackend(), "mock-model")):
+            result = self.runner.invoke(main, ["batch", str(input_file), "-o", str(output_file)])
+
+        assert result.exit_code == 0
+        results = [json.loads(line) for line in output_file.read_text().splitlines()]
+        assert sorted(r["index"] for r in results) == [0, 1]
+
+    def test_batch_missing_file(self):
+        """Test error for a missing input file."""
+        result = self.runner.invoke(main, ["batch", "does-not-exist.jsonl"])
+        assert result.exit_code == 1
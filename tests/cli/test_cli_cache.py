@@ -0,0 +1,51 @@
+"""Tests for the cache CLI commands."""
+
+import json
+from unittest.mock import patch
+
+from ttt import AIResponse
+from ttt.cli import main
+from ttt.core.cache import ResponseCache
+from tests.cli.conftest import IntegrationTestBase
+
+
+class TestCacheCommand(IntegrationTestBase):
+    """Test the cache command group."""
+
+    def setup_method(self):
+        """Use a response cache inside the isolated temp directory."""
+        super().setup_method()
+        self.cache = ResponseCache(directory=self.config_dir / "cache")
+        self.patcher = patch("ttt.core.cache._response_cache", self.cache)
+        self.patcher.start()
+
+    def teardown_method(self):
+        """Restore the shared response cache."""
+        self.patcher.stop()
+        super().teardown_method()
+
+    def test_cache_stats_json(self):
+        """Test that stats reports disk entries."""
+        self.cache.set("key", AIResponse("cached"))
+
+        result = self.runner.invoke(main, ["cache", "stats", "--json"])
+
+        assert result.exit_code == 0
+        stats = json.loads(result.output)
+        assert stats["disk_entries"] == 1
+
+    def test_cache_clear(self):
+        """Test that clear removes cached entries."""
+        self.cache.set("key", AIResponse("cached"))
+
+        result = self.runner.invoke(main, ["cache", "clear"])
+
+        assert result.exit_code == 0
+        assert "Cleared 1" in result.output
+        assert self.cache.stats()["disk_entries"] == 0
+
+    def test_ask_accepts_cache_flags(self):
+        """Test that --cache and --no-cache are accepted by ask."""
+        for flag in ("--cache", "--no-cache"):
+            result = self.runner.invoke(main, ["ask", flag, "--help"])
+            assert result.exit_code == 0
@@ -2,6 +2,7 @@
 
 import os
 from pathlib import Path
+from unittest.mock import patch
 
 from ttt.cli import main
 from tests.cli.conftest import IntegrationTestBase
@@ -138,5 +139,24 @@ class TestDebugFlag(IntegrationTestBase):
         assert result.exit_code == 0, f"Command failed without debug: {result.output}"
 
 
+class TestProfileStartupFlag(IntegrationTestBase):
+    """Test the --profile-startup flag."""
+
+    def test_profile_startup_reports_module_times(self):
+        """Test that the report lists modules and the total import time."""
+        from ttt.utils.startup import ImportTiming
+
+        timings = [
+            ImportTiming("pydantic", 30000, 30000, 1),
+            ImportTiming("ttt.cli", 5000, 45000, 0),
+        ]
+        with patch("ttt.utils.startup.profile_imports", return_value=timings):
+            result = self.runner.invoke(main, ["--profile-startup"])
+
+        assert result.exit_code == 0, result.output
+        assert "pydantic" in result.output
+        assert "Total CLI import time: 45 ms" in result.output
+
+
 # TestCLIParameterPassing class has been consolidated into TestCLIParameterValidation
 # in test_cli_modern.py to eliminate redundancy and improve test organization.
@@ -328,6 +328,34 @@ def _should_use_real_api(config=None, env_override=None):
     return False
 
 
+@pytest.fixture(autouse=True)
+def fresh_rate_limiter(monkeypatch):
+    """Give each test its own cloud rate limit scheduler so throttling does not leak between tests."""
+    monkeypatch.setattr("ttt.core.ratelimit._scheduler", None)
+
+
+@pytest.fixture
+def mock_http(monkeypatch):
+    """Route the web tools' pooled HTTP client to a handler, with an empty response cache.
+
+    Call the fixture with a function taking an ``httpx.Request`` and returning an
+    ``httpx.Response`` (or a coroutine function doing so).
+    """
+    import weakref
+
+    import httpx
+
+    def install(handler):
+        monkeypatch.setattr("ttt.tools.http_pool._pools", weakref.WeakKeyDictionary())
+        monkeypatch.setattr("ttt.tools.http_pool._cache", None)
+        monkeypatch.setattr(
+            "ttt.tools.http_pool._create_client",
+            lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler), follow_redirects=True),
+        )
+
+    return install
+
+
 @pytest.fixture(autouse=True)
 def smart_integration_mocking(request, monkeypatch):
     """Automatically mock HTTP calls for integration tests unless real APIs are requested.
@@ -407,6 +435,10 @@ def pytest_collection_modifyitems(config, items):
         if "integration" in item.nodeid or "test_integration" in item.module.__name__:
             item.add_marker(pytest.mark.integration)
 
+        # Timing assertions are flaky on loaded machines, so benchmarks are opt-in
+        if "benchmark" in item.keywords and not config.getoption("--run-benchmarks"):
+            item.add_marker(pytest.mark.skip(reason="Benchmark; pass --run-benchmarks to run"))
+
 
 # Command line options
 def pytest_addoption(parser):
@@ -423,6 +455,12 @@ def pytest_addoption(parser):
         default=None,
         help="Override default rate limit delay (in seconds)",
     )
+    parser.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        default=False,
+        help="Run timing benchmarks marked with @pytest.mark.benchmark",
+    )
     parser.addoption(
         "--fast",
         action="store_true",
@@ -1,5 +1,7 @@
 """Advanced tests for the API module to increase coverage."""
 
+import asyncio
+import threading
 from unittest.mock import patch
 
 import pytest
@@ -10,8 +12,12 @@ from ttt import (
     achat,
     ask,
     ask_async,
+    ask_many,
+    ask_many_async,
+    StreamEvent,
     stream,
     stream_async,
+    stream_events,
 )
 from ttt.session.chat import PersistentChatSession as ChatSession
 from tests.utils import MockBackend
@@ -104,9 +110,50 @@ class TestStreamFunction:
 
             chunks = list(stream("Test prompt"))
 
-            assert chunks == ["Hello ", "world ", "test "]
+            # Chunks buffered while the consumer is busy may be coalesced
+            assert "".join(chunks) == "Hello world test "
             assert mock_backend.last_prompt == "Test prompt"
 
+    def test_stream_closes_backend_stream_when_consumer_stops(self):
+        """Test abandoning a stream cancels the producer and closes the backend generator."""
+        closed = threading.Event()
+
+        class EndlessBackend(MockBackend):
+            async def astream(self, prompt, **kwargs):
+                try:
+                    while True:
+                        yield "tick "
+                        await asyncio.sleep(0)
+                finally:
+                    closed.set()
+
+        with patch("ttt.core.routing.router.smart_route") as mock_route:
+            mock_route.return_value = (EndlessBackend(), "mock-model")
+
+            chunks = stream("Test prompt")
+            assert next(chunks).startswith("tick ")
+            chunks.close()
+
+        assert closed.wait(timeout=5)
+
+    def test_stream_raises_backend_error_after_earlier_chunks(self):
+        """Test chunks produced before a failure are delivered before the error."""
+
+        class FailingBackend(MockBackend):
+            async def astream(self, prompt, **kwargs):
+                yield "partial "
+                raise BackendNotAvailableError("mock", "went away")
+
+        with patch("ttt.core.routing.router.smart_route") as mock_route:
+            mock_route.return_value = (FailingBackend(), "mock-model")
+
+            chunks = []
+            with pytest.raises(BackendNotAvailableError):
+                for chunk in stream("Test prompt"):
+                    chunks.append(chunk)
+
+        assert chunks == ["partial "]
+
     def test_stream_with_parameters(self):
         """Test streaming with all parameters."""
         mock_backend = MockBackend()
@@ -141,6 +188,55 @@ class TestStreamFunction:
             assert len(chunks) > 0
 
 
+class TestStreamEvents:
+    """Test the typed event stream."""
+
+    def test_stream_events_report_timing_and_usage(self):
+        """Test text events are followed by a done event summarizing timing, usage and cost."""
+
+        class UsageBackend(MockBackend):
+            async def astream_events(self, prompt, **kwargs):
+                async for event in super().astream_events(prompt, **kwargs):
+                    yield event
+                usage = {"prompt_tokens": 5, "completion_tokens": 3, "total_tokens": 8}
+                yield StreamEvent("usage", usage=usage, data={"cost": 0.002, "finish_reason": "stop"})
+
+        backend = UsageBackend()
+        backend.response_text = "Hello world test"
+        with patch("ttt.core.routing.router.smart_route") as mock_route:
+            mock_route.return_value = (backend, "mock-model")
+
+            events = list(stream_events("Test prompt", temperature=0.5))
+
+        assert [event.type for event in events] == ["first_token", "text", "text", "text", "usage", "done"]
+        assert "".join(event.text for event in events) == "Hello world test "
+        assert backend.last_kwargs["temperature"] == 0.5
+
+        done = events[-1]
+        assert done.usage == {"prompt_tokens": 5, "completion_tokens": 3, "total_tokens": 8}
+        assert done.data["model"] == "mock-model"
+        assert done.data["backend"] == "mock"
+        assert done.data["cost"] == 0.002
+        assert done.data["finish_reason"] == "stop"
+        assert done.data["chunks"] == 3
+        assert done.data["time_to_first_token"] == events[0].elapsed
+        assert done.data["inter_token_latency"]["max"] >= done.data["inter_token_latency"]["mean"] >= 0
+        assert all(event.elapsed is not None for event in events)
+        assert done.to_dict()["type"] == "done"
+
+    def test_stream_events_without_usage(self):
+        """Test backends that only stream text still get timing."""
+        with patch("ttt.core.routing.router.smart_route") as mock_route:
+            mock_route.return_value = (MockBackend(), "mock-model")
+
+            done = list(stream_events("Test prompt"))[-1]
+
+        assert done.type == "done"
+        assert done.usage is None
+        assert done.data["tokens_per_second"] is None
+        assert done.data["time_to_first_token"] is not None
+
+
 class TestChatSession:
     """Test ChatSession class."""
 
@@ -314,6 +410,107 @@ class TestAsyncFunctions:
                 # but the context manager itself works
 
 
+class SlowBackend(MockBackend):
+    """Mock backend that sleeps per prompt and tracks concurrency."""
+
+    def __init__(self, name: str = "mock"):
+        super().__init__(name)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def ask(self, prompt, **kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.05 if prompt == "slow" else 0.01)
+            return await super().ask(prompt, **kwargs)
+        finally:
+            self.in_flight -= 1
+
+
+class TestAskMany:
+    """Test batch execution with ask_many."""
+
+    def test_ask_many_returns_results_in_input_order_with_item_errors(self):
+        """Test ordered delivery and per-item errors."""
+        mock_backend = MockBackend()
+
+        def route(prompt, **kwargs):
+            if prompt == "bad":
+                raise BackendNotAvailableError("mock", "down")
+            return mock_backend, "mock-model"
+
+        with patch("ttt.core.routing.router.smart_route", side_effect=route):
+            results = list(ask_many(["one", {"prompt": "bad", "id": "x"}, {"system": "no prompt"}, "two"]))
+
+        assert [r.index for r in results] == [0, 1, 2, 3]
+        assert [r.ok for r in results] == [True, False, False, True]
+        assert str(results[0].response) == "Mock response"
+        assert isinstance(results[1].error, BackendNotAvailableError)
+        assert results[1].to_dict()["id"] == "x"
+        assert results[2].to_dict()["error_type"] == "InvalidPromptError"
+
+    def test_ask_many_as_completed(self):
+        """Test that unordered delivery yields fast results first."""
+        backend = SlowBackend()
+        with patch("ttt.core.routing.router.smart_route", return_value=(backend, "mock-model")):
+            results = list(ask_many(["slow", "fast"], ordered=False, concurrency=2))
+
+        assert [r.index for r in results] == [1, 0]
+
+    @pytest.mark.asyncio
+    async def test_ask_many_async_respects_limits(self):
+        """Test global and per-backend concurrency limits."""
+        backend = SlowBackend("local")
+        with patch("ttt.core.routing.router.smart_route", return_value=(backend, "mock-model")):
+            results = [r async for r in ask_many_async(iter(["a"] * 6), concurrency=4)]
+            assert backend.max_in_flight <= 2  # backend_limits.local from config
+
+            backend.max_in_flight = 0
+            results += [r async for r in ask_many_async(["a"] * 6, concurrency=4, backend_limits={"local": 4})]
+            assert backend.max_in_flight == 4
+
+        assert len(results) == 12
+        assert all(r.ok for r in results)
+
+    @pytest.mark.asyncio
+    async def test_ordered_ask_many_does_not_read_far_past_a_slow_item(self):
+        """Test that ordered delivery stops reading input while the oldest item is still running."""
+
+        class StuckHeadBackend(SlowBackend):
+            async def ask(self, prompt, **kwargs):
+                if prompt == "head":
+                    await asyncio.sleep(0.3)
+                return await super().ask(prompt, **kwargs)
+
+        read = []
+
+        def prompts():
+            for index in range(100):
+                read.append(index)
+                yield "head" if index == 0 else "a"
+
+        backend = StuckHeadBackend()
+        with patch("ttt.core.routing.router.smart_route", return_value=(backend, "mock-model")):
+            results = ask_many_async(prompts(), concurrency=2)
+            first = await results.__anext__()
+            read_before_head = len(read)
+            remaining = [r async for r in results]
+
+        assert first.index == 0
+        assert read_before_head <= 2 * 4 + 1
+        assert [r.index for r in remaining] == list(range(1, 100))
+
+    def test_ask_many_passes_defaults(self):
+        """Test that defaults apply unless the item overrides them."""
+        mock_backend = MockBackend()
+        with patch("ttt.core.routing.router.smart_route", return_value=(mock_backend, "mock-model")):
+            list(ask_many([{"prompt": "hi", "temperature": 0.1}], system="Be brief", temperature=0.9))
+
+        assert mock_backend.last_kwargs["system"] == "Be brief"
+        assert mock_backend.last_kwargs["temperature"] == 0.1
+
+
 class TestErrorHandling:
     """Test error handling in API functions."""
 
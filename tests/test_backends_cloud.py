@@ -176,13 +176,28 @@ class TestCloudBackendAsk:
 
     @pytest.mark.asyncio
     async def test_ask_rate_limit_error(self, cloud_backend, mock_litellm):
-        """Test ask with rate limit error."""
+        """Test ask with rate limit error once the retries are used up."""
         mock_litellm.acompletion.side_effect = Exception("Rate limit exceeded")
 
-        with pytest.raises(RateLimitError) as exc_info:
+        with patch("ttt.core.ratelimit.RateLimiter.throttle"), pytest.raises(RateLimitError) as exc_info:
             await cloud_backend.ask("Test", model="claude-3-sonnet-20240229")
 
         assert exc_info.value.details["provider"] == "anthropic"
+        assert mock_litellm.acompletion.call_count == 4  # First attempt and three retries
+
+    @pytest.mark.asyncio
+    async def test_ask_retries_after_rate_limit(self, cloud_backend, mock_litellm):
+        """Test that a 429 pauses the model for retry-after and the request is retried."""
+        rate_limited = Exception("Rate limit exceeded")
+        rate_limited.response = Mock(headers={"retry-after": "0.05"})
+        mock_litellm.acompletion.side_effect = [rate_limited, MockLiteLLM.MockResponse("Recovered")]
+
+        response = await cloud_backend.ask("Test", model="gpt-4")
+
+        assert str(response) == "Recovered"
+        from ttt.core.ratelimit import get_rate_limiter
+
+        assert get_rate_limiter().snapshot()["openai/gpt-4"]["throttled"] == 1
 
     @pytest.mark.asyncio
     async def test_ask_model_not_found(self, cloud_backend, mock_litellm):
@@ -240,6 +255,95 @@ class TestCloudBackendStream:
 
         assert "".join(chunks) == "Image description"
 
+    @pytest.mark.asyncio
+    async def test_stream_events_runs_tools_while_streaming(self, cloud_backend, mock_litellm):
+        """Test streamed tool calls are dispatched once complete and their results sent back."""
+        from ttt.tools.registry import register_tool, unregister_tool
+
+        tool_running = asyncio.Event()
+
+        async def lookup_key(key: str) -> str:
+            """Look up a key."""
+            tool_running.set()
+            return f"value of {key}"
+
+        register_tool(lookup_key, "lookup_key", "Look up a key", "test")
+
+        def tool_delta(arguments, **fields):
+            delta = Mock(index=0, id=fields.get("id"), function=Mock(arguments=arguments))
+            delta.function.name = fields.get("name")
+            return Mock(choices=[Mock(delta=Mock(content=None, tool_calls=[delta]))])
+
+        async def tool_round(*args, **kwargs):
+            yield tool_delta('{"key": ', id="call_a", name="lookup_key")
+            yield tool_delta('"x"}')
+            # The tool runs before the model finishes streaming
+            await asyncio.wait_for(tool_running.wait(), timeout=5)
+            yield Mock(choices=[Mock(delta=Mock(content=None, tool_calls=None))])
+
+        async def answer_round(*args, **kwargs):
+            yield Mock(choices=[Mock(delta=Mock(content="Found it"))])
+            yield Mock(choices=[], usage=Mock(prompt_tokens=40, completion_tokens=3))
+
+        mock_litellm.acompletion.side_effect = [tool_round(), answer_round()]
+
+        try:
+            events = [event async for event in cloud_backend.astream_events("Find x", tools=["lookup_key"])]
+        finally:
+            unregister_tool("lookup_key")
+
+        assert [event.type for event in events] == ["tool_start", "tool_result", "text", "usage"]
+        assert events[0].tool_call.arguments == {"key": "x"}
+        assert events[1].tool_call.id == "call_a"
+        assert events[1].tool_call.result == "value of x"
+        assert events[3].usage["total_tokens"] == 43
+
+        followup = mock_litellm.acompletion.call_args_list[1].kwargs["messages"]
+        assert followup[-2]["tool_calls"][0]["function"] == {"name": "lookup_key", "arguments": '{"key": "x"}'}
+        assert followup[-1] == {
+            "role": "tool",
+            "tool_call_id": "call_a",
+            "name": "lookup_key",
+            "content": "value of x",
+        }
+
+    @pytest.mark.asyncio
+    async def test_stream_events_cancels_running_tools_when_closed(self, cloud_backend, mock_litellm):
+        """Test that tools dispatched during a stream stop when the consumer closes it early."""
+        from ttt.tools.registry import register_tool, unregister_tool
+
+        tool_started = asyncio.Event()
+        tool_cancelled = asyncio.Event()
+
+        async def wait_forever(key: str) -> str:
+            """Never finish."""
+            tool_started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                tool_cancelled.set()
+                raise
+            return "unreachable"
+
+        register_tool(wait_forever, "wait_forever", "Never finish", "test")
+
+        async def tool_round(*args, **kwargs):
+            delta = Mock(index=0, id="call_a", function=Mock(arguments='{"key": "x"}'))
+            delta.function.name = "wait_forever"
+            yield Mock(choices=[Mock(delta=Mock(content=None, tool_calls=[delta]))])
+            yield Mock(choices=[Mock(delta=Mock(content="still streaming", tool_calls=None))])
+
+        mock_litellm.acompletion.side_effect = [tool_round()]
+
+        try:
+            events = cloud_backend.astream_events("Wait", tools=["wait_forever"])
+            assert (await events.__anext__()).type == "tool_start"
+            await asyncio.wait_for(tool_started.wait(), timeout=5)
+            await events.aclose()
+            await asyncio.wait_for(tool_cancelled.wait(), timeout=5)
+        finally:
+            unregister_tool("wait_forever")
+
 
 class TestCloudBackendModels:
     """Test CloudBackend model listing."""
@@ -50,7 +50,7 @@ class TestLocalBackend:
             mock_response.json.return_value = mock_response_data
             mock_response.raise_for_status = MagicMock()
 
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(return_value=mock_response)
+            mock_client.return_value.post = AsyncMock(return_value=mock_response)
 
             result = await local_backend.ask("Test prompt")
 
@@ -72,7 +72,7 @@ class TestLocalBackend:
             mock_response.json.return_value = mock_response_data
             mock_response.raise_for_status = MagicMock()
 
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(return_value=mock_response)
+            mock_client.return_value.post = AsyncMock(return_value=mock_response)
 
             await local_backend.ask(
                 "Test prompt",
@@ -83,7 +83,7 @@ class TestLocalBackend:
             )
 
             # Check that the request was made with correct parameters
-            call_args = mock_client.return_value.__aenter__.return_value.post.call_args
+            call_args = mock_client.return_value.post.call_args
             request_data = call_args[1]["json"]
 
             assert request_data["model"] == "custom-model"
@@ -102,7 +102,7 @@ class TestLocalBackend:
             mock_response.status_code = 404
             mock_response.text = "Model not found"
 
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 side_effect=httpx.HTTPStatusError("404", request=MagicMock(), response=mock_response)
             )
 
@@ -134,7 +134,7 @@ class TestLocalBackend:
             mock_stream.__aenter__ = AsyncMock(return_value=mock_response)
             mock_stream.__aexit__ = AsyncMock(return_value=None)
 
-            mock_client.return_value.__aenter__.return_value.stream = MagicMock(return_value=mock_stream)
+            mock_client.return_value.stream = MagicMock(return_value=mock_stream)
 
             chunks = []
             async for chunk in local_backend.astream("Test prompt"):
@@ -142,6 +142,37 @@ class TestLocalBackend:
 
             assert chunks == ["Hello", " world", "!"]
 
+    @pytest.mark.asyncio
+    async def test_astream_events_reports_final_chunk_usage(self, local_backend):
+        """Test Ollama's final counters become a usage event."""
+        mock_lines = [
+            '{"response": "Hi", "done": false}',
+            '{"response": "", "done": true, "done_reason": "stop", "prompt_eval_count": 12, '
+            '"eval_count": 40, "eval_duration": 2000000000}',
+        ]
+
+        async def mock_aiter_lines():
+            for line in mock_lines:
+                yield line
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_response = MagicMock()
+            mock_response.aiter_lines = mock_aiter_lines
+            mock_response.raise_for_status = MagicMock()
+
+            mock_stream = MagicMock()
+            mock_stream.__aenter__ = AsyncMock(return_value=mock_response)
+            mock_stream.__aexit__ = AsyncMock(return_value=None)
+
+            mock_client.return_value.stream = MagicMock(return_value=mock_stream)
+
+            events = [event async for event in local_backend.astream_events("Test prompt")]
+
+        assert [event.type for event in events] == ["text", "usage"]
+        assert events[1].usage == {"prompt_tokens": 12, "completion_tokens": 40, "total_tokens": 52}
+        assert events[1].data["tokens_per_second"] == 20.0
+        assert events[1].data["finish_reason"] == "stop"
+
     @pytest.mark.asyncio
     async def test_models_lists_available_ollama_models(self, local_backend):
         """Test successful models listing."""
@@ -152,7 +183,7 @@ class TestLocalBackend:
             mock_response.json.return_value = mock_response_data
             mock_response.raise_for_status = MagicMock()
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
             models = await local_backend.models()
 
@@ -164,7 +195,7 @@ class TestLocalBackend:
         from ttt import BackendConnectionError
 
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(side_effect=Exception("Connection failed"))
+            mock_client.return_value.get = AsyncMock(side_effect=Exception("Connection failed"))
 
             with pytest.raises(BackendConnectionError) as exc_info:
                 await local_backend.models()
@@ -189,3 +220,68 @@ class TestLocalBackend:
                 assert status["available"] is True
                 assert status["models_count"] == 2
                 assert status["default_model"] == "test-model"
+
+    @pytest.mark.asyncio
+    async def test_http_client_is_pooled_and_reused(self, local_backend):
+        """Test that requests on the same loop share one pooled client."""
+        client = local_backend._get_client()
+
+        assert local_backend._get_client() is client
+        assert not client.is_closed
+
+        await local_backend.aclose()
+
+        assert client.is_closed
+        assert local_backend._get_client() is not client
+        await local_backend.aclose()
+
+    def test_pool_settings_from_config(self):
+        """Test that pool limits are read from the backend config."""
+        backend = LocalBackend({"local": {"pool": {"max_connections": 5, "keepalive_expiry": 2.5, "http2": True}}})
+
+        assert backend.pool_max_connections == 5
+        assert backend.pool_keepalive_expiry == 2.5
+        assert backend.http2 is True
+
+    @pytest.mark.asyncio
+    async def test_router_lists_models_over_the_pooled_client(self, local_backend):
+        """Test that the router's local model refresh reuses the backend's client."""
+        from ttt.core.routing import Router
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.json.return_value = {"models": [{"name": "llama2"}]}
+            mock_client.return_value.is_closed = False
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
+
+            router = Router()
+            assert await router._fetch_local_models(local_backend) == ["llama2"]
+            assert await router._fetch_local_models(local_backend) == ["llama2"]
+
+        assert mock_client.call_count == 1
+        assert mock_client.return_value.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_model_names_is_empty_when_ollama_is_unreachable(self, local_backend):
+        """Test that routing sees no local models, rather than an error, when Ollama is down."""
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_client.return_value.is_closed = False
+            mock_client.return_value.get = AsyncMock(side_effect=httpx.ConnectError("refused"))
+
+            assert await local_backend.model_names(timeout=1) == []
+
+    def test_clients_made_on_isolated_loops_are_closed(self, local_backend):
+        """Test that a sync call made from the background thread does not leak a pooled client."""
+        from ttt.utils.async_utils import run_coro_in_background
+
+        async def get_client():
+            return local_backend._get_client()
+
+        async def call_from_background_thread():
+            # Runs on a throwaway loop in a helper thread, since the background loop is busy here
+            return run_coro_in_background(get_client())
+
+        client = run_coro_in_background(call_from_background_thread())
+
+        assert client.is_closed
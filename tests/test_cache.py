@@ -0,0 +1,165 @@
+"""Tests for the response cache."""
+
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from ttt import AIResponse, ask
+from ttt.core.cache import ResponseCache, make_cache_key
+from tests.utils import MockBackend
+
+
+@pytest.fixture
+def response_cache(tmp_path):
+    """Provide an isolated response cache."""
+    return ResponseCache(directory=tmp_path / "cache", ttl=60, memory_max_entries=2, disk_max_bytes=10_000)
+
+
+@pytest.fixture
+def shared_cache(response_cache):
+    """Install the isolated cache as the shared cache used by ask()."""
+    with patch("ttt.core.cache._response_cache", response_cache):
+        yield response_cache
+
+
+class TestCacheKey:
+    """Test request normalization for cache keys."""
+
+    def test_key_is_stable_and_sensitive_to_parameters(self):
+        """Test that identical requests share a key and different ones do not."""
+        base = make_cache_key("Hello", backend="cloud", model="gpt-4", temperature=0)
+
+        assert make_cache_key("Hello", backend="cloud", model="gpt-4", temperature=0) == base
+        assert make_cache_key("Hello", backend="cloud", model="gpt-4", temperature=0.5) != base
+        assert make_cache_key("Hello", backend="cloud", model="gpt-4", temperature=0, system="x") != base
+        assert make_cache_key("Hello", backend="local", model="gpt-4", temperature=0) != base
+
+    def test_tool_order_does_not_change_key(self):
+        """Test that tools are normalized by name."""
+        key_a = make_cache_key("Hi", backend="cloud", model="m", tools=["b", "a"])
+        key_b = make_cache_key("Hi", backend="cloud", model="m", tools=["a", "b"])
+
+        assert key_a == key_b
+
+
+class TestResponseCache:
+    """Test the two-tier response cache."""
+
+    def test_memory_hit_has_metadata(self, response_cache):
+        """Test that hits carry cache metadata and zero cost."""
+        response_cache.set("k1", AIResponse("cached", model="m", backend="mock", cost=0.5, time_taken=2.0))
+
+        hit = response_cache.get("k1")
+
+        assert str(hit) == "cached"
+        assert hit.cost == 0.0
+        assert hit.metadata["cache"]["hit"] is True
+        assert hit.metadata["cache"]["tier"] == "memory"
+        assert hit.metadata["cache"]["original_cost"] == 0.5
+        assert response_cache.get("missing") is None
+        assert (response_cache.hits, response_cache.misses) == (1, 1)
+
+    def test_disk_tier_survives_new_instance(self, response_cache):
+        """Test that entries persist across cache instances."""
+        response_cache.set("k1", AIResponse("persisted", model="m", backend="mock"))
+
+        fresh = ResponseCache(directory=response_cache.directory, ttl=60)
+        hit = fresh.get("k1")
+
+        assert str(hit) == "persisted"
+        assert hit.metadata["cache"]["tier"] == "disk"
+        assert fresh.stats()["hits"] == 1
+
+    def test_ttl_expiry(self, response_cache):
+        """Test that expired entries are treated as misses."""
+        with patch("ttt.core.cache.time.time", return_value=time.time() - 120):
+            response_cache.set("k1", AIResponse("old"))
+
+        assert response_cache.get("k1") is None
+        assert not response_cache._entry_path("k1").exists()
+
+    def test_memory_lru_eviction(self, response_cache):
+        """Test that the memory tier keeps only the most recently used entries."""
+        response_cache.disk_enabled = False
+        for key in ("a", "b"):
+            response_cache.set(key, AIResponse(key))
+        response_cache.get("a")
+        response_cache.set("c", AIResponse("c"))
+
+        assert list(response_cache._memory) == ["a", "c"]
+
+    def test_disk_size_eviction(self, response_cache):
+        """Test that the disk tier evicts least recently used entries over the size limit."""
+        response_cache.disk_max_bytes = 1500
+        for index in range(5):
+            response_cache.set(f"key{index}", AIResponse("x" * 400))
+            path = response_cache._entry_path(f"key{index}")
+            os.utime(path, (time.time() - 100 + index, time.time() - 100 + index))
+
+        stats = response_cache.stats()
+
+        assert stats["disk_bytes"] <= 1500
+        assert stats["evictions"] > 0
+        assert response_cache._entry_path("key4").exists()
+
+    def test_disk_is_scanned_only_when_over_the_limit(self, response_cache):
+        """Test that writes under the size limit track usage without listing the cache directory."""
+        with patch.object(response_cache, "_disk_files", wraps=response_cache._disk_files) as disk_files:
+            for index in range(10):
+                response_cache.set(f"key{index}", AIResponse("x"))
+                response_cache.get(f"key{index}")
+
+        assert disk_files.call_count == 1
+        assert response_cache._disk_bytes == response_cache._disk_usage()[1]
+
+    def test_counters_are_flushed_periodically(self, response_cache):
+        """Test that hit/miss counters stay in memory until the flush interval passes."""
+        response_cache.set("k1", AIResponse("a"))
+        response_cache.get("k1")
+        response_cache.get("missing")
+
+        assert not (response_cache.directory / "stats.json").exists()
+
+        response_cache.stats_flush_interval = 0
+        response_cache.get("k1")
+
+        counters = ResponseCache(directory=response_cache.directory)._load_counters()
+        assert (counters["hits"], counters["misses"]) == (2, 1)
+
+    def test_clear(self, response_cache):
+        """Test clearing both tiers."""
+        response_cache.set("k1", AIResponse("a"))
+
+        assert response_cache.clear() == 1
+        assert response_cache.get("k1") is None
+        assert response_cache.stats()["disk_entries"] == 0
+
+
+class TestAskWithCache:
+    """Test cache integration in ask()."""
+
+    def test_ask_serves_repeat_requests_from_cache(self, shared_cache):
+        """Test that the second identical request does not reach the backend."""
+        backend = MockBackend()
+        with patch("ttt.core.routing.router.smart_route", return_value=(backend, "mock-model")):
+            with patch.object(backend, "ask", wraps=backend.ask) as backend_ask:
+                first = ask("Same prompt", temperature=0, cache=True)
+                second = ask("Same prompt", temperature=0, cache=True)
+
+        assert backend_ask.call_count == 1
+        assert first.metadata["cache"]["hit"] is False
+        assert second.metadata["cache"]["hit"] is True
+        assert str(second) == str(first)
+
+    def test_cache_disabled_by_default(self, shared_cache):
+        """Test that caching is opt-in."""
+        backend = MockBackend()
+        with patch("ttt.core.routing.router.smart_route", return_value=(backend, "mock-model")):
+            with patch.object(backend, "ask", wraps=backend.ask) as backend_ask:
+                ask("Same prompt")
+                response = ask("Same prompt")
+
+        assert backend_ask.call_count == 2
+        assert "cache" not in response.metadata
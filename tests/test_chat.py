@@ -1,5 +1,6 @@
 """Tests for chat functionality including persistent sessions and streaming."""
 
+import asyncio
 import json
 import pickle
 import tempfile
@@ -15,9 +16,10 @@ from ttt import (
     InvalidParameterError,
     SessionLoadError,
     SessionSaveError,
+    achat,
     chat,
 )
-from ttt.session.chat import PersistentChatSession, _estimate_tokens
+from ttt.session.chat import PersistentChatSession
 from tests.utils import MockBackend
 
 
@@ -585,27 +587,135 @@ class TestDurationCalculation:
         assert summary["duration_minutes"] == 60.0
 
 
-class TestTokenEstimation:
-    """Test token estimation functionality."""
+class TestIncrementalMessageView:
+    """Test the incrementally maintained API message view."""
 
-    def test_estimate_tokens_text(self):
-        """Test token estimation for text."""
-        # Estimate is len(text) // 4
-        assert _estimate_tokens("Hello world") == len("Hello world") // 4  # 11 // 4 = 2
-        assert (
-            _estimate_tokens("This is a longer sentence with more words")
-            == len("This is a longer sentence with more words") // 4
-        )
+    def test_message_list_is_reused_across_turns(self, mock_router, mock_backend):
+        """Test that backends receive the same, extended message list every turn."""
+        mock_backend.supports_messages = True
+        session = PersistentChatSession(system="Be brief", backend=mock_backend)
+
+        session.ask("First")
+        first_messages = mock_backend.last_kwargs["messages"]
+        first_entry = first_messages[1]
+        session.ask("Second")
+
+        assert mock_backend.last_kwargs["messages"] is first_messages
+        assert first_messages[1] is first_entry
+        assert [m["role"] for m in first_messages] == ["system", "user", "assistant", "user"]
+        assert first_messages[-1]["content"] == "Second"
+
+    def test_conversation_prompt_matches_full_rendering(self, mock_router, mock_backend):
+        """Test that the cached conversation equals a full re-render."""
+        mock_backend.supports_messages = False
+        session = PersistentChatSession(system="Be brief", backend=mock_backend)
+
+        for prompt in ["One", ["Two", ImageInput(b"\x89PNG")], "Three"]:
+            session.ask(prompt)
+            expected = session._messages_to_conversation(
+                [{"role": "system", "content": "Be brief"}] + session.history[:-1]
+            )
+            assert mock_backend.last_prompt == expected
+
+        assert mock_backend.last_prompt.endswith("Human: Three")
+
+    def test_view_tracks_direct_history_changes(self, mock_router, mock_backend):
+        """Test that appends are picked up and replacement or clearing rebuilds the view."""
+        session = PersistentChatSession(backend=mock_backend)
+        session.history.append({"role": "user", "content": "Hi"})
+        assert [m["content"] for m in session.api_messages] == ["Hi"]
+
+        session.history.append({"role": "assistant", "content": "Hello"})
+        assert [m["content"] for m in session.api_messages] == ["Hi", "Hello"]
+
+        session.history = [{"role": "user", "content": "Replaced"}]
+        assert [m["content"] for m in session.api_messages] == ["Replaced"]
+
+        session.system = "New system"
+        assert session.api_messages[0] == {"role": "system", "content": "New system"}
+
+        session.clear()
+        assert session.api_messages == [{"role": "system", "content": "New system"}]
+        assert session._conversation_text() == "System: New system"
+
+    def test_loaded_session_builds_view_from_saved_history(self, mock_router, tmp_path):
+        """Test that loading starts from the restored history."""
+        session = PersistentChatSession(system="Saved system")
+        session.history = [{"role": "user", "content": "Stored"}]
+        path = session.save(tmp_path / "session.json")
+
+        loaded = PersistentChatSession.load(path)
 
-    def test_estimate_tokens_multimodal(self):
-        """Test token estimation for multimodal content."""
-        content = ["What's in this image?", ImageInput("test.jpg")]
+        assert [m["content"] for m in loaded.api_messages] == ["Saved system", "Stored"]
 
-        # Should estimate text tokens + fixed amount for image
-        tokens = _estimate_tokens(content)
-        assert tokens > 50  # Images add significant tokens
 
-    def test_estimate_tokens_empty(self):
-        """Test token estimation for empty input."""
-        assert _estimate_tokens("") == 0
-        assert _estimate_tokens([]) == 0
+class TurnTrackingBackend(MockBackend):
+    """Mock backend that yields to the loop mid-request and records the history it was sent."""
+
+    supports_messages = True
+
+    def __init__(self):
+        super().__init__()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.seen_messages = []
+
+    async def ask(self, prompt, **kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.seen_messages.append([m["content"] for m in kwargs.get("messages") or []])
+        try:
+            await asyncio.sleep(0.01)
+            return AIResponse(f"Reply to {prompt}", model="mock-model", backend=self.name)
+        finally:
+            self.in_flight -= 1
+
+
+class TestAsyncChatSession:
+    """Test the async-native session methods."""
+
+    async def test_aask_updates_history(self, mock_backend):
+        """Test that aask() records both turns and the metadata."""
+        session = PersistentChatSession(backend=mock_backend, model="mock-model")
+
+        response = await session.aask("Hello")
+
+        assert str(response) == "Response 1"
+        assert [m["role"] for m in session.history] == ["user", "assistant"]
+        assert session.history[1]["content"] == "Response 1"
+        assert session.metadata["model_usage"]["mock-model"]["count"] == 1
+
+    async def test_concurrent_turns_are_serialized_per_session(self):
+        """Test that concurrent turns on one session see each other while sessions run in parallel."""
+        backend = TurnTrackingBackend()
+        first = PersistentChatSession(backend=backend, model="mock-model")
+        second = PersistentChatSession(backend=backend, model="mock-model")
+
+        await asyncio.gather(first.aask("one"), first.aask("two"), second.aask("three"))
+
+        assert [m["content"] for m in first.history] == ["one", "Reply to one", "two", "Reply to two"]
+        assert ["one", "Reply to one", "two"] in backend.seen_messages
+        assert backend.max_in_flight == 2
+
+    async def test_astream_records_response(self, mock_backend):
+        """Test that astream() yields chunks and adds the full reply to the history."""
+        session = PersistentChatSession(backend=mock_backend, model="mock-model")
+
+        chunks = [chunk async for chunk in session.astream("Hello")]
+
+        assert "".join(chunks) == "Response 1 "
+        assert session.history[-1] == {
+            "role": "assistant",
+            "content": "Response 1 ",
+            "timestamp": session.history[-1]["timestamp"],
+            "model": "mock-model",
+        }
+
+    async def test_achat_yields_async_session(self, mock_backend):
+        """Test that achat() sessions answer with aask()."""
+        with patch("ttt.core.routing.router.smart_route", return_value=(mock_backend, "mock-model")):
+            async with achat(system="Be brief") as session:
+                response = await session.aask("Hi")
+
+        assert str(response) == "Response 1"
+        assert mock_backend.last_kwargs["system"] == "Be brief"
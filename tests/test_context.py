@@ -0,0 +1,183 @@
+"""Tests for context window strategies in chat sessions."""
+
+from unittest.mock import patch
+
+import pytest
+
+from ttt.session.chat import PersistentChatSession
+from ttt.session.context import (
+    FullHistoryStrategy,
+    SlidingWindowStrategy,
+    SummarizingStrategy,
+    create_context_strategy,
+    lookup_context_length,
+)
+from tests.utils import MockBackend
+
+
+def count_words(messages):
+    """Count one token per word so budgets are easy to reason about."""
+    return [len(message["content"].split()) for message in messages]
+
+
+def conversation(turns, system="sys"):
+    """Build an API message list with the given number of user/assistant turns."""
+    messages = [{"role": "system", "content": system}] if system else []
+    for turn in range(turns):
+        messages.append({"role": "user", "content": f"question {turn} " + "x " * 8})
+        messages.append({"role": "assistant", "content": f"answer {turn} " + "y " * 8})
+    return messages
+
+
+class TestSlidingWindowStrategy:
+    """Test dropping the oldest turns to fit a token budget."""
+
+    def test_history_within_budget_is_sent_unchanged(self):
+        """Test that no copy is made when everything fits."""
+        messages = conversation(3)
+        window = SlidingWindowStrategy().fit(messages, 1000, count_words)
+
+        assert window.messages is messages
+        assert not window.truncated
+
+    def test_oldest_turns_are_dropped_and_system_is_pinned(self):
+        """Test that the window keeps the system prompt and the newest turns."""
+        messages = conversation(6)
+        messages.append({"role": "user", "content": "latest"})
+
+        window = SlidingWindowStrategy(pin_recent_turns=1).fit(messages, 45, count_words)
+
+        assert window.messages[0]["role"] == "system"
+        assert window.messages[1]["role"] == "user"
+        assert window.messages[-1]["content"] == "latest"
+        assert window.total_tokens <= 45
+        assert window.dropped_messages > 0
+        assert window.tokens_saved == sum(count_words(messages)) - window.total_tokens
+
+    def test_recent_turns_are_pinned_even_over_budget(self):
+        """Test that pinned turns are always sent."""
+        messages = conversation(4)
+        window = SlidingWindowStrategy(pin_recent_turns=2).fit(messages, 5, count_words)
+
+        assert [m["content"].split()[:2] for m in window.messages[1:]] == [
+            ["question", "2"],
+            ["answer", "2"],
+            ["question", "3"],
+            ["answer", "3"],
+        ]
+
+    def test_counts_only_new_messages(self):
+        """Test that token counts are cached across turns."""
+        messages = conversation(5)
+        calls = []
+
+        def counting(batch):
+            calls.extend(batch)
+            return count_words(batch)
+
+        strategy = SlidingWindowStrategy()
+        strategy.fit(messages, 40, counting)
+        messages.append({"role": "user", "content": "next"})
+        strategy.fit(messages, 40, counting)
+
+        assert len(calls) == len(messages)
+
+
+class TestSummarizingStrategy:
+    """Test folding dropped turns into a running summary."""
+
+    def test_dropped_turns_are_summarized(self):
+        """Test that a summary message replaces the dropped turns."""
+        prompts = []
+
+        def summarizer(prompt):
+            prompts.append(prompt)
+            return "They talked about questions."
+
+        strategy = SummarizingStrategy(summarizer, pin_recent_turns=1, summary_max_tokens=10)
+        messages = conversation(6)
+
+        window = strategy.fit(messages, 50, count_words)
+
+        assert window.summarized
+        assert window.messages[0]["content"] == "sys"
+        assert window.messages[1]["role"] == "system"
+        assert "They talked about questions." in window.messages[1]["content"]
+        assert "question 0" in prompts[0]
+
+        # Unchanged window does not summarize again
+        strategy.fit(messages, 50, count_words)
+        assert len(prompts) == 1
+
+    def test_summarizer_failure_falls_back_to_sliding(self):
+        """Test that a failed summary does not fail the request."""
+
+        def summarizer(prompt):
+            raise RuntimeError("summary model unavailable")
+
+        window = SummarizingStrategy(summarizer, pin_recent_turns=1).fit(conversation(6), 600, count_words)
+        assert not window.summarized
+
+        window = SummarizingStrategy(summarizer, pin_recent_turns=1, summary_max_tokens=10).fit(
+            conversation(6), 50, count_words
+        )
+        assert window.truncated
+        assert not window.summarized
+
+
+class TestStrategyFactory:
+    """Test creating strategies and looking up context sizes."""
+
+    def test_create_by_name(self):
+        """Test strategy names and the summarizer requirement."""
+        assert isinstance(create_context_strategy("full"), FullHistoryStrategy)
+        assert isinstance(create_context_strategy("sliding", pin_recent_turns=3), SlidingWindowStrategy)
+        assert isinstance(create_context_strategy("summarize", summarizer=str), SummarizingStrategy)
+        with pytest.raises(ValueError):
+            create_context_strategy("summarize")
+        with pytest.raises(ValueError):
+            create_context_strategy("unknown")
+
+    def test_lookup_context_length(self):
+        """Test matching registry names, prefixed names and provider names."""
+        assert lookup_context_length("gpt-4") == 8192
+        assert lookup_context_length("openrouter/openai/gpt-4") == 8192
+        assert lookup_context_length("claude-3-opus-20240229") == 200000
+        assert lookup_context_length("no-such-model") is None
+
+
+class TestSessionContext:
+    """Test context management in PersistentChatSession."""
+
+    @pytest.fixture
+    def backend(self):
+        backend = MockBackend(response_text="ok")
+        backend.supports_messages = True
+        return backend
+
+    def test_long_session_is_truncated_and_savings_recorded(self, backend):
+        """Test that sessions send a bounded window and track tokens saved."""
+        session = PersistentChatSession(system="Be brief", backend=backend, model="mock-model")
+
+        def config_value(key, default=None):
+            return 60 if key == "chat.context.max_input_tokens" else default
+
+        with patch("ttt.session.chat.get_config_value", side_effect=config_value):
+            for turn in range(10):
+                session.ask(f"Turn {turn} " + "padding " * 20)
+
+        sent = backend.last_kwargs["messages"]
+        assert sent[0] == {"role": "system", "content": "Be brief"}
+        assert sent[-1]["content"].startswith("Turn 9")
+        assert len(sent) < len(session.api_messages)
+        assert session.metadata["context"]["truncated_requests"] > 0
+        assert session.metadata["context"]["tokens_saved"] > 0
+
+    def test_full_strategy_sends_everything(self, backend):
+        """Test opting out of truncation."""
+        session = PersistentChatSession(backend=backend, model="gpt-3.5-turbo", context_strategy="full")
+        for turn in range(3):
+            session.ask("word " * 2000)
+
+        assert backend.last_kwargs["messages"] is session.api_messages
+        assert session.metadata["context"]["truncated_requests"] == 0
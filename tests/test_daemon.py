@@ -0,0 +1,128 @@
+"""Tests for the ttt serve daemon and its client."""
+
+import asyncio
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from ttt.core.exceptions import RateLimitError
+from ttt.server.client import DaemonClient, can_forward, find_daemon
+from ttt.server.daemon import DaemonServer
+from ttt.utils.async_utils import get_background_loop
+from tests.utils import MockBackend
+
+
+async def _current_thread():
+    return threading.current_thread()
+
+
+@pytest.fixture
+def backend():
+    return MockBackend(response_text="warm answer from daemon")
+
+
+@pytest.fixture
+def daemon(tmp_path, backend):
+    """Run a daemon on a temporary socket with routing patched to a mock backend."""
+    server = DaemonServer(str(tmp_path / "ttt.sock"), warm_up=False)
+    loop = get_background_loop()
+    with patch("ttt.core.routing.router.smart_route", return_value=(backend, "mock-model")):
+        asyncio.run_coroutine_threadsafe(server.start(), loop).result(timeout=5)
+        stopped = asyncio.run_coroutine_threadsafe(server.wait_stopped(), loop)
+        yield server
+        server.stop()
+        stopped.result(timeout=5)
+
+
+class TestDaemon:
+    """Test forwarding requests through the daemon."""
+
+    def test_ask_round_trip(self, daemon, backend):
+        """Test that responses come back with their metadata."""
+        client = DaemonClient(str(daemon.socket_path))
+
+        response = client.ask("Hello", temperature=0.2)
+
+        assert str(response) == "warm answer from daemon"
+        assert response.model == "mock-model"
+        assert response.backend == "mock"
+        assert backend.last_kwargs["temperature"] == 0.2
+        assert daemon.requests == 1
+
+    def test_stream_round_trip(self, daemon):
+        """Test that streamed chunks are forwarded in order."""
+        chunks = list(DaemonClient(str(daemon.socket_path)).stream("Hello"))
+        assert "".join(chunks) == "warm answer from daemon "
+        assert len(chunks) == 4
+
+    def test_routing_runs_off_the_event_loop(self, daemon, backend):
+        """Test that routing, which may check backend health, does not block the shared loop."""
+        threads = []
+
+        def smart_route(prompt, **kwargs):
+            threads.append(threading.current_thread())
+            return backend, "mock-model"
+
+        with patch("ttt.core.routing.router.smart_route", side_effect=smart_route):
+            DaemonClient(str(daemon.socket_path)).ask("Hello", model="mock-model")
+
+        loop_thread = asyncio.run_coroutine_threadsafe(_current_thread(), get_background_loop()).result(timeout=5)
+        assert threads[0] is not loop_thread
+        assert backend.last_kwargs["model"] == "mock-model"
+
+    def test_errors_keep_their_type(self, daemon, backend):
+        """Test that library exceptions are re-raised by the client."""
+        error = RateLimitError("openai", retry_after=5)
+        with patch.object(backend, "ask", side_effect=error):
+            with pytest.raises(RateLimitError) as raised:
+                DaemonClient(str(daemon.socket_path)).ask("Hello")
+
+        assert raised.value.message == error.message
+        assert raised.value.details["retry_after"] == 5
+        assert daemon.errors == 1
+
+    def test_ping_and_detection(self, daemon, monkeypatch):
+        """Test status reporting and auto-detection of a running daemon."""
+        client = find_daemon(str(daemon.socket_path))
+        assert client is not None
+        assert client.ping()["active"] == 0
+
+        monkeypatch.setenv("TTT_NO_DAEMON", "1")
+        assert find_daemon(str(daemon.socket_path)) is None
+
+    def test_other_directory_runs_in_process(self, daemon, tmp_path, monkeypatch):
+        """Test that a daemon started elsewhere is not used and rejects the request."""
+        monkeypatch.chdir(tmp_path)
+        assert find_daemon(str(daemon.socket_path)) is None
+
+        with pytest.raises(ValueError, match="does not match"):
+            DaemonClient(str(daemon.socket_path)).ask("Hello")
+        assert daemon.requests == 1
+
+    def test_other_environment_runs_in_process(self, daemon, monkeypatch):
+        """Test that a client with different provider settings does not forward."""
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-other-key")
+        assert find_daemon(str(daemon.socket_path)) is None
+
+    def test_refuses_second_daemon(self, daemon):
+        """Test that a live socket is not taken over."""
+        second = DaemonServer(str(daemon.socket_path), warm_up=False)
+        with pytest.raises(RuntimeError):
+            asyncio.run_coroutine_threadsafe(second.start(), get_background_loop()).result(timeout=5)
+
+
+class TestClientDetection:
+    """Test deciding whether to forward a request."""
+
+    def test_no_daemon(self, tmp_path):
+        """Test that a missing or stale socket means no daemon."""
+        assert find_daemon(str(tmp_path / "missing.sock")) is None
+        (tmp_path / "stale.sock").write_text("")
+        assert find_daemon(str(tmp_path / "stale.sock")) is None
+
+    def test_can_forward(self):
+        """Test that only text prompts with JSON options are forwarded."""
+        assert can_forward("Hello", {"model": "gpt-4", "tools": None})
+        assert not can_forward(["Hello"], {})
+        assert not can_forward("Hello", {"tools": [print]})
@@ -100,9 +100,7 @@ class TestBackendExceptions:
         from ttt.backends.local import LocalBackend
 
         # Mock connection error
-        mock_client.return_value.__aenter__.return_value.post = AsyncMock(
-            side_effect=httpx.ConnectError("Connection refused")
-        )
+        mock_client.return_value.post = AsyncMock(side_effect=httpx.ConnectError("Connection refused"))
 
         backend = LocalBackend()
 
@@ -127,9 +125,7 @@ class TestBackendExceptions:
         from ttt.backends.local import LocalBackend
 
         # Mock timeout
-        mock_client.return_value.__aenter__.return_value.post = AsyncMock(
-            side_effect=httpx.TimeoutException("Request timed out")
-        )
+        mock_client.return_value.post = AsyncMock(side_effect=httpx.TimeoutException("Request timed out"))
 
         backend = LocalBackend()
 
@@ -178,7 +174,7 @@ class TestBackendExceptions:
         mock_response.status_code = 404
         mock_response.text = "model not found"
 
-        mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+        mock_client.return_value.post = AsyncMock(
             side_effect=httpx.HTTPStatusError("Not found", request=Mock(), response=mock_response)
         )
 
@@ -243,7 +239,8 @@ class TestCloudBackendExceptions:
         # Mock the instance's litellm.acompletion method
         backend.litellm.acompletion = AsyncMock(side_effect=Exception("Rate limit exceeded"))
 
-        with pytest.raises(RateLimitError) as exc_info:
+        # Skip the pauses between the retries of the rate-limited request
+        with patch("ttt.core.ratelimit.RateLimiter.throttle"), pytest.raises(RateLimitError) as exc_info:
             import asyncio
 
             loop = asyncio.new_event_loop()
@@ -351,6 +348,94 @@ class TestInputSanitizer:
         # bleach should have cleaned the script tag
         assert "<script>" not in result["script"]
 
+    def test_compiled_scanner_matches_pattern_by_pattern_search(self):
+        """Test that the compiled scanner flags exactly what re.search over each pattern flags."""
+        import re
+
+        patterns = InputSanitizer.DANGEROUS_PATTERNS + InputSanitizer.CODE_DANGEROUS_PATTERNS
+        samples = [
+            "hello world",
+            "  SUDO apt install",
+            "please rm -rf /",
+            "firm -rf /tmp",
+            "format d:",
+            "..\\windows",
+            "line one\nMZ header",
+            "c:\\windows\\system32\\drivers",
+            "import os as o",
+            "OS.System('ls')",
+            "os.\u017fystem('ls')",
+            "getattr(os, 'system')",
+            "chr(101) + chr(118)",
+            "x = evaluate(3)",
+            "compiled_result = 1",
+        ]
+
+        for sample in samples:
+            expected = next(
+                (i for i, p in enumerate(patterns) if re.search(p, sample, re.IGNORECASE | re.MULTILINE)), -1
+            )
+            assert InputSanitizer._CODE_SCANNER.search(sample) == expected, sample
+
+    def test_compiled_scanner_matches_pattern_by_pattern_search_on_non_ascii(self):
+        """Test that casefolding non-ASCII text does not let the scanner miss a pattern."""
+        import re
+
+        patterns = InputSanitizer.DANGEROUS_PATTERNS + InputSanitizer.CODE_DANGEROUS_PATTERNS
+        samples = [
+            "x = comp\u0130le('1','a','exec')",
+            "__\u0130mport__('os')",
+            "from os \u0130mport system",
+            "\u0130mport subprocess as sp",
+            "STRA\u00dfE eval(1)",
+            "\u212aelvin os.system('ls')",
+            "caf\u00e9 au lait",
+            "\u00fcber harmless text",
+        ]
+
+        for sample in samples:
+            expected = next(
+                (i for i, p in enumerate(patterns) if re.search(p, sample, re.IGNORECASE | re.MULTILINE)), -1
+            )
+            assert InputSanitizer._CODE_SCANNER.search(sample) == expected, sample
+        with pytest.raises(ValueError):
+            InputSanitizer.sanitize_string("x = comp\u0130le('1','a','exec')")
+
+    def test_sanitize_string_results_are_cached(self):
+        """Test that repeated payloads are scanned once."""
+        payload = "print('cached payload')"
+        InputSanitizer.sanitize_string(payload)
+
+        with patch.object(InputSanitizer._CODE_SCANNER, "search") as search:
+            assert InputSanitizer.sanitize_string(payload) == payload
+            with pytest.raises(ValueError, match="too long"):
+                InputSanitizer.sanitize_string(payload, max_length=5)
+
+        search.assert_not_called()
+
+    @pytest.mark.benchmark
+    def test_compiled_scanner_benchmark(self):
+        """Benchmark the compiled scanner against searching each pattern in turn."""
+        import re
+        import time
+
+        patterns = InputSanitizer.DANGEROUS_PATTERNS + InputSanitizer.CODE_DANGEROUS_PATTERNS
+        payload = "def area(radius):\n    return 3.14159 * radius ** 2  # circle area\n" * 120
+
+        def best_of(fn):
+            timings = []
+            for _ in range(5):
+                started = time.perf_counter()
+                for _ in range(10):
+                    fn()
+                timings.append(time.perf_counter() - started)
+            return min(timings)
+
+        naive = best_of(lambda: [re.search(p, payload, re.IGNORECASE | re.MULTILINE) for p in patterns])
+        compiled = best_of(lambda: InputSanitizer._CODE_SCANNER.search(payload))
+
+        assert compiled < naive / 2
+
 
 # =============================================================================
 # ERROR RECOVERY SYSTEM TESTS
@@ -529,6 +614,23 @@ class TestToolExecutor:
             assert result.succeeded
             mock_tool.function.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_builtin_does_not_resanitize_executor_arguments(self, executor):
+        """Test that arguments the executor sanitized are not scanned again by the tool."""
+        from ttt.tools.builtins import _safe_execute
+
+        mock_tool = Mock()
+        mock_tool.name = "test_tool"
+        mock_tool.function = lambda **kwargs: _safe_execute("test_tool", lambda **kw: kw["query"], **kwargs)
+
+        with patch("ttt.tools.executor.get_tool", return_value=mock_tool), patch.object(
+            InputSanitizer, "sanitize_string", wraps=InputSanitizer.sanitize_string
+        ) as sanitize_string:
+            result = await executor.execute_tool("test_tool", {"query": "a query scanned once"})
+
+        assert result.result == "a query scanned once"
+        assert sanitize_string.call_count == 1
+
     @pytest.mark.asyncio
     async def test_timeout_handling(self, executor):
         """Test timeout handling."""
@@ -0,0 +1,173 @@
+"""Tests for the OpenAI-compatible gateway."""
+
+import asyncio
+import json
+import socket
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from ttt.core.exceptions import RateLimitError
+from ttt.server.gateway import GatewayServer
+from ttt.utils.async_utils import get_background_loop
+from tests.utils import MockBackend
+
+
+@pytest.fixture
+def backend():
+    return MockBackend(response_text="hello from the gateway")
+
+
+def run_gateway(backend, **options):
+    server = GatewayServer(host="127.0.0.1", port=0, **options)
+    loop = get_background_loop()
+    asyncio.run_coroutine_threadsafe(server.start(), loop).result(timeout=5)
+    stopped = asyncio.run_coroutine_threadsafe(server.wait_stopped(), loop)
+    return server, stopped
+
+
+@pytest.fixture
+def gateway(backend):
+    """Run a gateway on a free port with routing patched to a mock backend."""
+    with patch("ttt.core.routing.router.smart_route", return_value=(backend, "mock-model")):
+        server, stopped = run_gateway(backend, api_keys=[])
+        yield server
+        server.stop()
+        stopped.result(timeout=5)
+
+
+def chat(url, stream=False, **extra):
+    body = {"model": "auto", "messages": [{"role": "user", "content": "Hi there"}], "stream": stream, **extra}
+    return {"url": f"{url}/v1/chat/completions", "json": body, "timeout": 10}
+
+
+class TestGateway:
+    """Test the HTTP endpoints."""
+
+    def test_chat_completion(self, gateway, backend):
+        """Test a non-streaming completion in OpenAI format."""
+        response = httpx.post(**chat(gateway.url, temperature=0.3, max_tokens=50, cache=False))
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["object"] == "chat.completion"
+        assert data["id"].startswith("chatcmpl-")
+        assert data["choices"][0]["message"] == {"role": "assistant", "content": "hello from the gateway"}
+        assert data["usage"]["total_tokens"] == data["usage"]["prompt_tokens"] + data["usage"]["completion_tokens"]
+        assert backend.last_kwargs["temperature"] == 0.3
+        assert backend.last_kwargs["max_tokens"] == 50
+
+    def test_streaming_completion(self, gateway):
+        """Test server-sent events end with a stop chunk, usage and [DONE]."""
+        with httpx.stream("POST", **chat(gateway.url, stream=True, stream_options={"include_usage": True})) as r:
+            assert r.headers["content-type"] == "text/event-stream"
+            events = [line[len("data: ") :] for line in r.iter_lines() if line.startswith("data: ")]
+
+        assert events[-1] == "[DONE]"
+        chunks = [json.loads(event) for event in events[:-1]]
+        assert chunks[0]["choices"][0]["delta"]["role"] == "assistant"
+        text = "".join(c["choices"][0]["delta"].get("content", "") for c in chunks if c["choices"])
+        assert text == "hello from the gateway "
+        assert chunks[-2]["choices"][0]["finish_reason"] == "stop"
+        assert chunks[-1]["usage"]["completion_tokens"] > 0
+
+    def test_models(self, gateway):
+        """Test the model list comes from the registry."""
+        data = httpx.get(f"{gateway.url}/v1/models", timeout=10).json()
+        assert data["object"] == "list"
+        assert data["data"] and all(model["object"] == "model" for model in data["data"])
+
+    def test_conversation_for_single_prompt_backend(self, gateway, backend):
+        """Test multi-turn history is rendered for backends without message support."""
+        messages = [
+            {"role": "system", "content": "Be brief"},
+            {"role": "user", "content": "One"},
+            {"role": "assistant", "content": "Two"},
+            {"role": "user", "content": "Three"},
+        ]
+        response = httpx.post(**chat(gateway.url, messages=messages))
+
+        assert response.status_code == 200
+        assert backend.last_kwargs["system"] == "Be brief"
+        assert backend.last_prompt == "Human: One\n\nAssistant: Two\n\nHuman: Three"
+
+    def test_errors(self, gateway, backend):
+        """Test validation and backend errors use OpenAI error objects and status codes."""
+        response = httpx.post(f"{gateway.url}/v1/chat/completions", json={"messages": []}, timeout=10)
+        assert response.status_code == 400
+        assert "messages" in response.json()["error"]["message"]
+
+        with patch.object(backend, "ask", side_effect=RateLimitError("openai", retry_after=5)):
+            response = httpx.post(**chat(gateway.url))
+        assert response.status_code == 429
+        assert response.json()["error"]["type"] == "rate_limit_error"
+
+        assert httpx.get(f"{gateway.url}/v1/unknown", timeout=10).status_code == 404
+
+    @pytest.mark.parametrize("content_length", ["abc", "-1"])
+    def test_invalid_content_length(self, gateway, content_length):
+        """Test that a bad Content-Length header gets a 400 instead of dropping the connection."""
+        host, port = gateway.url.rsplit("/", 1)[-1].split(":")
+        with socket.create_connection((host, int(port)), timeout=10) as conn:
+            conn.sendall(f"POST /v1/chat/completions HTTP/1.1\r\nContent-Length: {content_length}\r\n\r\n".encode())
+            response = conn.makefile("rb").read().decode()
+
+        assert response.startswith("HTTP/1.1 400")
+        assert "Invalid Content-Length" in response
+
+
+class TestAdmission:
+    """Test authentication and concurrency limits."""
+
+    def test_api_key_required(self, backend):
+        with patch("ttt.core.routing.router.smart_route", return_value=(backend, "mock-model")):
+            server, stopped = run_gateway(backend, api_keys=["secret"])
+            try:
+                assert httpx.get(f"{server.url}/v1/models", timeout=10).status_code == 401
+                headers = {"Authorization": "Bearer secret"}
+                assert httpx.get(f"{server.url}/v1/models", headers=headers, timeout=10).status_code == 200
+            finally:
+                server.stop()
+                stopped.result(timeout=5)
+
+    def test_per_client_limit_and_queue(self, backend):
+        """Test one client is limited while others queue for the shared slots."""
+        release = asyncio.Event()
+
+        async def slow_ask(prompt, **kwargs):
+            await release.wait()
+            return await MockBackend.ask(backend, prompt, **kwargs)
+
+        async def scenario(url):
+            async with httpx.AsyncClient(timeout=10) as client:
+                first = asyncio.ensure_future(client.post(**chat(url, cache=False)))
+                while server.stats.active < 1:
+                    await asyncio.sleep(0.01)
+
+                # Same client, over its limit of one
+                limited = await client.post(**chat(url, cache=False))
+
+                # Different client waits in the queue for the single slot
+                other = {"Authorization": "Bearer other-client"}
+                queued = asyncio.ensure_future(client.post(**chat(url, cache=False), headers=other))
+                while server.stats.queued < 1:
+                    await asyncio.sleep(0.01)
+
+                get_background_loop().call_soon_threadsafe(release.set)
+                return limited, await first, await queued
+
+        with patch("ttt.core.routing.router.smart_route", return_value=(backend, "mock-model")):
+            with patch.object(backend, "ask", side_effect=slow_ask):
+                server, stopped = run_gateway(backend, max_concurrency=1, per_client_limit=1, api_keys=[])
+                try:
+                    limited, first, queued = asyncio.run(scenario(server.url))
+                finally:
+                    server.stop()
+                    stopped.result(timeout=5)
+
+        assert limited.status_code == 429
+        assert first.status_code == 200
+        assert queued.status_code == 200
+        assert server.stats.rejected == 1
+        assert server.stats.served == 2
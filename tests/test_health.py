@@ -0,0 +1,209 @@
+"""Tests for the backend health cache and circuit breaker."""
+
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from ttt.core.exceptions import BackendConnectionError, BackendTimeoutError
+from ttt.core.health import CLOSED, HALF_OPEN, OPEN, HealthCache
+from ttt.core.routing import Router, is_health_error
+from tests.utils import MockBackend
+
+
+class CountingBackend(MockBackend):
+    """Backend that counts availability checks."""
+
+    def __init__(self, available=True):
+        super().__init__("counting")
+        self._is_available = available
+        self.checks = 0
+
+    @property
+    def is_available(self):
+        self.checks += 1
+        return self._is_available
+
+
+@pytest.fixture
+def health():
+    """Provide a health cache with short timings and synchronous refresh."""
+    return HealthCache(ttl=60, negative_ttl=5, failure_threshold=2, reset_timeout=30, background_refresh=False)
+
+
+class TestHealthCache:
+    """Test cached availability checks."""
+
+    def test_results_are_cached(self, health):
+        """Test that repeated checks are answered from memory."""
+        backend = CountingBackend()
+
+        assert health.is_available("counting", backend)
+        assert health.is_available("counting", backend)
+        assert backend.checks == 1
+
+    def test_negative_results_use_shorter_ttl(self, health):
+        """Test negative caching and re-checking after it expires."""
+        backend = CountingBackend(available=False)
+        assert not health.is_available("counting", backend)
+        assert not health.is_available("counting", backend)
+        assert backend.checks == 1
+
+        backend._is_available = True
+        with patch("ttt.core.health.time.monotonic", return_value=time.monotonic() + 6):
+            assert health.is_available("counting", backend)
+        assert backend.checks == 2
+
+    def test_new_backend_instance_is_rechecked(self, health):
+        """Test that cached health belongs to a backend instance."""
+        health.is_available("counting", CountingBackend(available=False))
+
+        assert health.is_available("counting", CountingBackend(available=True))
+
+    def test_stale_result_refreshes_in_background(self):
+        """Test stale-while-revalidate on the shared loop."""
+        health = HealthCache(ttl=0, negative_ttl=0, background_refresh=True)
+        backend = CountingBackend(available=True)
+        assert health.is_available("counting", backend)
+
+        backend._is_available = False
+        # Stale value is returned immediately while the refresh runs
+        assert health.is_available("counting", backend)
+
+        deadline = time.time() + 5
+        while health.snapshot()["counting"]["available"] and time.time() < deadline:
+            time.sleep(0.01)
+        assert health.snapshot()["counting"]["available"] is False
+
+
+class TestCircuitBreaker:
+    """Test the per-backend circuit breaker."""
+
+    def test_circuit_opens_and_recovers(self, health):
+        """Test open, half-open and closed transitions."""
+        backend = CountingBackend()
+        assert health.is_available("counting", backend)
+
+        health.record_failure("counting", ConnectionError("refused"))
+        assert health.snapshot()["counting"]["circuit"] == CLOSED
+        health.record_failure("counting", ConnectionError("refused"))
+        assert health.snapshot()["counting"]["circuit"] == OPEN
+        assert not health.is_available("counting", backend)
+
+        later = time.monotonic() + 31
+        with patch("ttt.core.health.time.monotonic", return_value=later):
+            assert health.is_available("counting", backend)
+            assert health.snapshot()["counting"]["circuit"] == HALF_OPEN
+
+            # A failure while half-open re-opens immediately
+            health.record_failure("counting")
+            assert not health.is_available("counting", backend)
+
+        health.record_success("counting")
+        assert health.snapshot()["counting"]["circuit"] == CLOSED
+        assert health.is_available("counting", backend)
+
+
+class TestRouterHealth:
+    """Test routing decisions through the health cache."""
+
+    def test_auto_selection_does_not_recheck_unavailable_backends(self):
+        """Test that a down backend is not probed on every request."""
+        router = Router()
+        router.health = HealthCache(ttl=60, negative_ttl=60, background_refresh=False)
+        router.config.default_backend = "local"
+        local = CountingBackend(available=False)
+        router._backends["local"] = local
+
+        for _ in range(3):
+            with pytest.raises(Exception):
+                router._auto_select_backend()
+
+        assert local.checks == 1
+
+    def test_open_circuit_skips_backend(self):
+        """Test that request failures take a backend out of auto-selection."""
+        router = Router()
+        router.health = HealthCache(failure_threshold=1, background_refresh=False)
+        router.config.default_backend = "auto"
+        cloud = CountingBackend()
+        cloud.name_value = "cloud"
+        local = CountingBackend()
+        local.name_value = "local"
+        router._backends.update({"cloud": cloud, "local": local})
+
+        assert router._auto_select_backend() is cloud
+        router.record_failure(cloud, ConnectionError("refused"))
+
+        assert router._auto_select_backend() is local
+
+
+class BadRequestError(Exception):
+    """Stand-in for a provider's 400 error."""
+
+    status_code = 400
+
+
+class ServiceUnavailableError(Exception):
+    """Stand-in for a provider's 503 error."""
+
+    status_code = 503
+
+
+def _wrapped(cause):
+    """Wrap a provider error the way CloudBackend does for errors it does not classify."""
+    try:
+        raise BackendConnectionError("cloud", cause) from cause
+    except BackendConnectionError as e:
+        return e
+
+
+class TestHealthErrorClassification:
+    """Test which request failures count toward the circuit breaker."""
+
+    @pytest.mark.parametrize(
+        "error, expected",
+        [
+            (ConnectionError("refused"), True),
+            (BackendTimeoutError("cloud", 30), True),
+            (_wrapped(ServiceUnavailableError("overloaded")), True),
+            (_wrapped(httpx.ConnectError("refused")), True),
+            (BackendConnectionError("local"), True),
+            (_wrapped(BadRequestError("context length exceeded")), False),
+            (_wrapped(ValueError("content policy violation")), False),
+            (ValueError("bad prompt"), False),
+        ],
+    )
+    def test_is_health_error(self, error, expected):
+        """Test that only transport, timeout and 5xx failures are health errors."""
+        assert is_health_error(error) is expected
+
+    async def test_bad_requests_leave_the_circuit_closed(self, monkeypatch):
+        """Test that repeated 400-style errors do not take the backend out of routing."""
+        from ttt.core import api
+
+        health = HealthCache(failure_threshold=3, background_refresh=False)
+        monkeypatch.setattr(api.router, "health", health)
+        backend = MockBackend("cloud")
+
+        async def bad_request(prompt, **kwargs):
+            raise _wrapped(BadRequestError("maximum context length exceeded"))
+
+        backend.ask = bad_request
+        for _ in range(3):
+            with pytest.raises(BackendConnectionError):
+                await api._call_backend(backend, "hello")
+
+        assert health.snapshot().get("cloud", {}).get("circuit", CLOSED) == CLOSED
+        assert health.is_available("cloud", backend)
+
+        async def unavailable(prompt, **kwargs):
+            raise _wrapped(ServiceUnavailableError("service unavailable"))
+
+        backend.ask = unavailable
+        for _ in range(3):
+            with pytest.raises(BackendConnectionError):
+                await api._call_backend(backend, "hello")
+
+        assert health.snapshot()["cloud"]["circuit"] == OPEN
@@ -0,0 +1,178 @@
+"""Tests for request hedging across backends and models."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from ttt import AIResponse
+from ttt.core.api import _hedge_attempts, ask_async
+from ttt.core.hedging import ASK, LatencyTracker, race_ask, race_stream
+from ttt.core.routing import router
+from tests.utils import MockBackend
+
+
+class DelayedBackend(MockBackend):
+    """Backend that answers after a delay and records cancellation."""
+
+    def __init__(self, name, delay=0.0, error=None):
+        super().__init__(name, response_text=f"from {name}")
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.cancelled = False
+        self.closed = False
+
+    async def ask(self, prompt, **kwargs):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error:
+            raise self.error
+        return AIResponse(self.response_text, model=kwargs.get("model"), backend=self.name, cost=0.01)
+
+    async def astream(self, prompt, **kwargs):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+            if self.error:
+                raise self.error
+            for chunk in ["from ", self.name]:
+                yield chunk
+        finally:
+            self.closed = True
+
+
+@pytest.fixture
+def tracker():
+    """Provide a fresh latency tracker."""
+    return LatencyTracker(window=10)
+
+
+class TestRaceAsk:
+    """Test hedged ask() races."""
+
+    async def test_fast_primary_is_not_hedged(self, tracker):
+        """Test that the alternate is never called when the primary answers in time."""
+        primary, alternate = DelayedBackend("primary"), DelayedBackend("alternate")
+
+        response = await race_ask([(primary, "a"), (alternate, "b")], lambda b, m: b.ask("hi", model=m), 0.5, tracker)
+
+        assert str(response) == "from primary"
+        assert alternate.calls == 0
+        assert "hedge" not in response.metadata
+        assert tracker.sample_count(ASK, "primary", "a") == 1
+
+    async def test_slow_primary_is_hedged_and_cancelled(self, tracker):
+        """Test that a slow primary is raced, loses and is cancelled."""
+        primary, alternate = DelayedBackend("primary", delay=5), DelayedBackend("alternate")
+
+        response = await race_ask([(primary, "a"), (alternate, "b")], lambda b, m: b.ask("hi", model=m), 0.02, tracker)
+
+        assert str(response) == "from alternate"
+        assert primary.cancelled
+        assert response.metadata["hedge"]["winner"] == "alternate/b"
+        assert response.metadata["hedge"]["cancelled"] == 1
+        assert tracker.snapshot()["hedge_wins"] == 1
+
+    async def test_failed_primary_starts_alternate_immediately(self, tracker):
+        """Test that a failing primary falls through to the alternate without waiting."""
+        primary = DelayedBackend("primary", error=ConnectionError("overloaded"))
+        alternate = DelayedBackend("alternate")
+
+        response = await race_ask([(primary, "a"), (alternate, "b")], lambda b, m: b.ask("hi", model=m), 60, tracker)
+
+        assert str(response) == "from alternate"
+
+    async def test_all_attempts_failing_raises_last_error(self, tracker):
+        """Test that the error surfaces when no attempt succeeds."""
+        primary = DelayedBackend("primary", error=ConnectionError("down"))
+        alternate = DelayedBackend("alternate", error=TimeoutError("slow"))
+
+        with pytest.raises(TimeoutError):
+            await race_ask([(primary, "a"), (alternate, "b")], lambda b, m: b.ask("hi", model=m), 0.01, tracker)
+
+
+class TestRaceStream:
+    """Test first-token stream races."""
+
+    async def test_first_chunk_wins_and_loser_is_closed(self, tracker):
+        """Test that the stream producing a chunk first is used and the other is closed."""
+        primary, alternate = DelayedBackend("primary", delay=5), DelayedBackend("alternate")
+
+        chunks = [
+            chunk
+            async for chunk in race_stream(
+                [(primary, "a"), (alternate, "b")], lambda b, m: b.astream("hi", model=m), 0.02, tracker
+            )
+        ]
+
+        assert "".join(chunks) == "from alternate"
+        assert primary.closed
+        assert tracker.snapshot()["cancelled"] == 1
+
+
+class TestHedgeDelay:
+    """Test the latency threshold used for hedging."""
+
+    def test_default_delay_until_enough_samples(self, tracker):
+        """Test that the configured delay applies before min_samples latencies are seen."""
+        tracker.record(ASK, "cloud", "m", 0.5)
+
+        assert tracker.hedge_delay(ASK, "cloud", "m") == 2.0
+
+    def test_percentile_of_recent_latencies(self, tracker):
+        """Test that the threshold follows the latency percentile once samples exist."""
+        for i in range(1, 11):
+            tracker.record(ASK, "cloud", "m", i * 0.3)
+
+        with patch(
+            "ttt.core.hedging.get_config_value",
+            side_effect=lambda key, default=None: {
+                "routing.hedging.min_samples": 10,
+            }.get(key, default),
+        ):
+            assert tracker.hedge_delay(ASK, "cloud", "m") == pytest.approx(3.0)
+
+
+class TestHedgedApi:
+    """Test hedging through the public API."""
+
+    async def test_ask_async_hedges_with_alternate_backend(self):
+        """Test that ask_async(hedge=True) returns the faster alternate."""
+        primary, alternate = DelayedBackend("primary", delay=5), DelayedBackend("alternate")
+
+        with patch.object(router, "smart_route", return_value=(primary, "a")), patch.object(
+            router, "hedge_attempts", return_value=[(primary, "a"), (alternate, "b")]
+        ), patch.object(router.latency, "hedge_delay", return_value=0.02):
+            response = await ask_async("hi", hedge=True)
+
+        assert str(response) == "from alternate"
+        assert primary.cancelled
+
+    def test_requests_with_tools_are_not_hedged(self):
+        """Test that tool-calling requests are never duplicated."""
+        backend = DelayedBackend("primary")
+
+        with patch.object(router, "hedge_attempts") as hedge_attempts:
+            attempts = _hedge_attempts("hi", backend, "a", True, [lambda: None])
+
+        assert attempts == [(backend, "a")]
+        hedge_attempts.assert_not_called()
+
+    def test_router_uses_configured_alternate_models(self):
+        """Test that hedge_attempts() routes the alternates configured for the model."""
+        primary, alternate = DelayedBackend("primary"), DelayedBackend("alternate")
+        config = {"routing.hedging.alternates": {"a": ["b"]}, "routing.hedging.max_hedges": 1}
+
+        with patch(
+            "ttt.config.loader.get_config_value", side_effect=lambda key, default=None: config.get(key, default)
+        ), patch.object(router, "smart_route", return_value=(alternate, "b")), patch.object(
+            router, "is_backend_available", return_value=True
+        ):
+            attempts = router.hedge_attempts("hi", primary, "a")
+
+        assert attempts == [(primary, "a"), (alternate, "b")]
@@ -0,0 +1,144 @@
+"""Tests for the pooled HTTP client behind the web tools."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from ttt.tools import execute_tools
+from ttt.tools.http_pool import fetch, get_response_cache
+
+
+class TestResponseCache:
+    """Test reuse of GET responses."""
+
+    async def test_fresh_response_is_served_from_cache(self, mock_http):
+        """Test that a response within max-age is not requested again."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, content=b"hello", headers={"Cache-Control": "max-age=60"})
+
+        mock_http(handler)
+
+        first = await fetch("GET", "https://example.com/page")
+        second = await fetch("GET", "https://example.com/page")
+
+        assert len(requests) == 1
+        assert second.body == b"hello"
+        assert not first.from_cache and second.from_cache
+
+    async def test_stale_response_is_revalidated_with_etag(self, mock_http):
+        """Test that a stale response is revalidated and a 304 reuses the cached body."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=b"body", headers={"ETag": '"v1"', "Cache-Control": "no-cache"})
+
+        mock_http(handler)
+
+        await fetch("GET", "https://example.com/data")
+        response = await fetch("GET", "https://example.com/data")
+
+        assert len(requests) == 2
+        assert response.status_code == 200
+        assert response.body == b"body"
+        assert get_response_cache().stats["revalidated"] == 1
+
+    async def test_no_store_is_not_cached(self, mock_http):
+        """Test that no-store responses are always fetched."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, content=b"secret", headers={"Cache-Control": "no-store", "ETag": '"x"'})
+
+        mock_http(handler)
+
+        await fetch("GET", "https://example.com/private")
+        await fetch("GET", "https://example.com/private")
+
+        assert len(requests) == 2
+        assert "If-None-Match" not in requests[1].headers
+
+    async def test_post_is_not_cached(self, mock_http):
+        """Test that requests with a body bypass the cache."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, content=b"ok", headers={"Cache-Control": "max-age=60"})
+
+        mock_http(handler)
+
+        await fetch("POST", "https://example.com/items", content=b"{}")
+        await fetch("POST", "https://example.com/items", content=b"{}")
+
+        assert len(requests) == 2
+
+
+class TestFetch:
+    """Test streaming and connection limits."""
+
+    async def test_body_is_capped(self, mock_http):
+        """Test that reading stops at max_bytes."""
+        mock_http(lambda request: httpx.Response(200, content=b"a" * 10000))
+
+        response = await fetch("GET", "https://example.com/big", max_bytes=100)
+
+        assert response.body == b"a" * 100
+        assert response.truncated
+
+    async def test_parallel_tool_calls_overlap(self, mock_http):
+        """Test that parallel http_request calls do not wait for each other."""
+
+        async def slow(request):
+            await asyncio.sleep(0.3)
+            return httpx.Response(200, content=b"done")
+
+        mock_http(slow)
+        calls = [{"name": "http_request", "arguments": {"url": f"https://example.com/{i}"}} for i in range(4)]
+
+        started = time.monotonic()
+        result = await execute_tools(calls, parallel=True)
+
+        assert [call.result for call in result.calls] == ["done"] * 4
+        assert time.monotonic() - started < 0.9
+
+    async def test_connections_per_host_are_limited(self, mock_http, monkeypatch):
+        """Test that requests to one host beyond the limit wait for a free slot."""
+        active = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.05)
+            active -= 1
+            return httpx.Response(200)
+
+        mock_http(handler)
+        monkeypatch.setattr(
+            "ttt.tools.http_pool.get_config_value",
+            lambda key, default=None: 2 if key == "tools.http.max_connections_per_host" else default,
+        )
+
+        await asyncio.gather(*(fetch("GET", f"https://example.com/{i}") for i in range(6)))
+
+        assert peak == 2
+
+
+@pytest.mark.unit
+def test_sync_wrapper_uses_the_pool(mock_http):
+    """Test that the blocking http_request runs on the pooled client."""
+    from ttt.tools.builtins import http_request
+
+    mock_http(lambda request: httpx.Response(200, content=b"plain text"))
+
+    assert http_request("https://example.com/text") == "plain text"
@@ -122,7 +122,8 @@ class TestMultiModalAPI:
             # Test streaming with image
             chunks = list(stream(["Describe this image:", ImageInput(b"fake image data")]))
 
-            assert chunks == ["This ", "is ", "a ", "cat"]
+            # Chunks buffered while the consumer is busy may be coalesced
+            assert "".join(chunks) == "This is a cat"
 
 
 class TestCloudBackendMultiModal:
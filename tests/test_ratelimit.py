@@ -0,0 +1,151 @@
+"""Tests for the per-provider and per-model rate limit scheduler."""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from ttt import RateLimitError
+from ttt.core.ratelimit import RateLimiter, RateLimitScheduler, TokenBucket, parse_retry_after
+
+
+class TestTokenBucket:
+    """Test the per-minute token bucket."""
+
+    def test_wait_time_follows_refill_rate(self):
+        """Test that an empty bucket refills at its per-minute rate."""
+        bucket = TokenBucket(60)
+        now = time.monotonic()
+        bucket.take(60)
+
+        assert bucket.wait_time(1, now) == pytest.approx(1.0, abs=0.05)
+        assert bucket.wait_time(1, now + 1) == pytest.approx(0.0, abs=0.05)
+
+    def test_oversized_request_waits_for_full_bucket(self):
+        """Test that a request larger than the quota is let through once the bucket is full."""
+        bucket = TokenBucket(100)
+
+        assert bucket.wait_time(500, time.monotonic()) == 0.0
+
+
+class TestRateLimiter:
+    """Test queueing in front of the buckets."""
+
+    async def test_requests_queue_instead_of_failing(self):
+        """Test that requests beyond the quota wait for the bucket to refill."""
+        limiter = RateLimiter("openai", requests_per_minute=1200)  # One request every 50ms
+        limiter.requests.level = 1
+
+        started = time.monotonic()
+        await asyncio.gather(limiter.acquire(), limiter.acquire(), limiter.acquire())
+
+        assert time.monotonic() - started >= 0.09
+        assert limiter.snapshot()["queued"] == 2
+
+    async def test_higher_priority_leaves_queue_first(self):
+        """Test that queued requests are admitted by priority, then arrival."""
+        limiter = RateLimiter("openai", requests_per_minute=1200)
+        limiter.requests.level = 0
+        order = []
+
+        async def request(name, priority):
+            await limiter.acquire(priority=priority)
+            order.append(name)
+
+        await asyncio.gather(request("low", 0), request("high", 5), request("normal", 1))
+
+        assert order == ["high", "normal", "low"]
+
+    async def test_wait_beyond_max_wait_raises(self):
+        """Test that a request that would wait too long fails with RateLimitError."""
+        limiter = RateLimiter("anthropic/claude-3-opus", requests_per_minute=1)
+        limiter.requests.level = 0
+
+        with pytest.raises(RateLimitError) as exc_info:
+            await limiter.acquire(max_wait=0.1)
+
+        assert exc_info.value.details["provider"] == "anthropic"
+        assert limiter.snapshot()["waiting"] == 0
+
+    async def test_throttle_pauses_and_cuts_rate(self):
+        """Test that a 429 blocks the queue for retry-after and halves the request rate."""
+        limiter = RateLimiter("openai/gpt-4", requests_per_minute=600)
+
+        limiter.throttle(0.1)
+        started = time.monotonic()
+        await limiter.acquire()
+
+        assert time.monotonic() - started >= 0.09
+        assert limiter.snapshot()["requests_per_minute"] == 300
+
+    def test_limits_are_learned_from_headers(self):
+        """Test that rate limit headers set the buckets."""
+        limiter = RateLimiter("openai/gpt-4")
+
+        limiter.record(
+            100,
+            None,
+            {
+                "llm_provider-x-ratelimit-limit-requests": "500",
+                "llm_provider-x-ratelimit-remaining-requests": "499",
+                "llm_provider-x-ratelimit-limit-tokens": "30000",
+                "llm_provider-x-ratelimit-remaining-tokens": "29000",
+            },
+        )
+
+        snapshot = limiter.snapshot()
+        assert snapshot["requests_per_minute"] == 500
+        assert snapshot["tokens_per_minute"] == 30000
+        assert limiter.tokens.level == pytest.approx(29000, abs=1)
+
+
+class TestRateLimitScheduler:
+    """Test the scheduler combining model and provider limits."""
+
+    async def test_usage_is_reconciled_with_the_estimate(self):
+        """Test that the token bucket is charged the real usage."""
+        scheduler = RateLimitScheduler()
+        model_limiter, _ = scheduler.limiters("openai", "gpt-4")
+        model_limiter.tokens = TokenBucket(10000)
+
+        await scheduler.acquire("openai", "gpt-4", 1000)
+        scheduler.record("openai", "gpt-4", 1000, 3000)
+
+        assert model_limiter.tokens.level == pytest.approx(7000, abs=1)
+
+    async def test_model_quota_is_refunded_when_provider_wait_fails(self):
+        """Test that a request rejected by the provider limiter does not use up the model's quota."""
+        scheduler = RateLimitScheduler()
+        model_limiter, provider_limiter = scheduler.limiters("openai", "gpt-4")
+        model_limiter.requests = TokenBucket(60)
+        model_limiter.tokens = TokenBucket(10000)
+        provider_limiter.requests = TokenBucket(1)
+        provider_limiter.requests.level = 0
+
+        config = {"rate_limits.max_wait": 0.1}
+        with patch(
+            "ttt.core.ratelimit.get_config_value", side_effect=lambda key, default=None: config.get(key, default)
+        ):
+            with pytest.raises(RateLimitError):
+                await scheduler.acquire("openai", "gpt-4", 1000)
+
+        assert model_limiter.requests.level == pytest.approx(60, abs=0.1)
+        assert model_limiter.tokens.level == pytest.approx(10000, abs=1)
+        assert model_limiter.snapshot()["requests"] == 0
+
+    def test_estimate_counts_prompt_and_completion(self):
+        """Test the token estimate of a request."""
+        scheduler = RateLimitScheduler()
+
+        estimate = scheduler.estimate_tokens({"messages": [{"role": "user", "content": "x" * 400}], "max_tokens": 50})
+
+        assert estimate == 150
+
+
+def test_parse_retry_after():
+    """Test retry-after values in seconds and invalid values."""
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after("0.5") == 0.5
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
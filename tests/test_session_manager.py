@@ -0,0 +1,210 @@
+"""Tests for ChatSessionManager session persistence."""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from ttt.session.manager import ChatSessionManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Provide a session manager with an isolated sessions directory."""
+    return ChatSessionManager(sessions_dir=tmp_path, compact_threshold=3)
+
+
+def read_records(path):
+    """Read all JSONL records from a session log."""
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestAppendOnlyStorage:
+    """Test the JSONL session log format."""
+
+    def test_add_message_appends_instead_of_rewriting(self, manager):
+        """Test that each message adds one record to the log."""
+        session = manager.create_session(model="gpt-4")
+        log_file = manager.sessions_dir / f"{session.id}.jsonl"
+
+        manager.add_message(session, "user", "Hello")
+        content_after_first = log_file.read_bytes()
+        manager.add_message(session, "assistant", "Hi there", model="gpt-4")
+
+        records = read_records(log_file)
+        assert [r["type"] for r in records] == ["header", "message", "message"]
+        assert log_file.read_bytes().startswith(content_after_first)
+
+    def test_round_trip_through_fresh_manager(self, manager):
+        """Test that a log replays into the same session."""
+        session = manager.create_session(model="gpt-4", system_prompt="Be brief")
+        manager.add_message(session, "user", "Hello")
+        session.model = "claude"
+        manager.save_session(session)
+        manager.add_message(session, "assistant", "Hi")
+
+        loaded = ChatSessionManager(sessions_dir=manager.sessions_dir).load_session(session.id)
+
+        assert [m.content for m in loaded.messages] == ["Hello", "Hi"]
+        assert loaded.model == "claude"
+        assert loaded.system_prompt == "Be brief"
+        assert loaded.updated_at == session.updated_at
+
+    def test_clear_compacts_log(self, manager):
+        """Test that removing messages rewrites the log as a snapshot."""
+        session = manager.create_session()
+        manager.add_message(session, "user", "Hello")
+        manager.add_message(session, "assistant", "Hi")
+
+        session.messages = []
+        manager.save_session(session)
+
+        records = read_records(manager.sessions_dir / f"{session.id}.jsonl")
+        assert [r["type"] for r in records] == ["header"]
+        assert manager.load_session(session.id).messages == []
+
+    def test_periodic_compaction_of_header_updates(self, manager):
+        """Test that header updates are folded into the snapshot after the threshold."""
+        session = manager.create_session()
+        for _ in range(4):
+            manager.save_session(session)
+
+        records = read_records(manager.sessions_dir / f"{session.id}.jsonl")
+        assert len(records) <= manager.compact_threshold + 1
+
+    def test_corrupt_trailing_line_is_skipped(self, manager):
+        """Test that a torn final write does not lose the session."""
+        session = manager.create_session()
+        manager.add_message(session, "user", "Hello")
+        with open(manager.sessions_dir / f"{session.id}.jsonl", "a") as f:
+            f.write('{"type": "message", "role"')
+
+        fresh_manager = ChatSessionManager(sessions_dir=manager.sessions_dir)
+        loaded = fresh_manager.load_session(session.id)
+        assert [m.content for m in loaded.messages] == ["Hello"]
+
+        # The next save repairs the log so later appends are readable
+        fresh_manager.add_message(loaded, "assistant", "Hi")
+        reloaded = ChatSessionManager(sessions_dir=manager.sessions_dir).load_session(session.id)
+        assert [m.content for m in reloaded.messages] == ["Hello", "Hi"]
+
+
+class TestLegacyMigration:
+    """Test transparent migration from single-file JSON sessions."""
+
+    @pytest.fixture
+    def legacy_session(self, manager):
+        data = {
+            "id": "legacy",
+            "created_at": "2024-01-01T00:00:00",
+            "updated_at": "2024-01-01T00:05:00",
+            "messages": [{"role": "user", "content": "Old message", "timestamp": "2024-01-01T00:00:00"}],
+            "model": "gpt-4",
+            "system_prompt": None,
+            "tools": None,
+        }
+        (manager.sessions_dir / "legacy.json").write_text(json.dumps(data, indent=2))
+        return data
+
+    def test_legacy_session_is_listed_and_migrated_on_load(self, manager, legacy_session):
+        """Test that legacy sessions keep working and move to the log format."""
+        assert [s["id"] for s in manager.list_sessions()] == ["legacy"]
+
+        session = manager.load_session("legacy")
+
+        assert session.messages[0].content == "Old message"
+        assert not (manager.sessions_dir / "legacy.json").exists()
+        assert (manager.sessions_dir / "legacy.jsonl").exists()
+
+        manager.add_message(session, "assistant", "New reply")
+        reloaded = ChatSessionManager(sessions_dir=manager.sessions_dir).load_session("legacy")
+        assert [m.content for m in reloaded.messages] == ["Old message", "New reply"]
+
+    def test_delete_removes_session(self, manager, legacy_session):
+        """Test deleting sessions in either format."""
+        assert manager.delete_session("legacy") is True
+        assert manager.load_session("legacy") is None
+        assert manager.delete_session("legacy") is False
+
+
+class TestSessionIndex:
+    """Test the session index used for listing."""
+
+    @pytest.fixture
+    def populated(self, manager):
+        sessions = []
+        for number, model in enumerate(["gpt-4", "claude", "gpt-4", "claude", "gpt-4"]):
+            session = manager.create_session(model=model)
+            manager.add_message(session, "user", f"Message {number}")
+            sessions.append(session)
+        return sessions
+
+    def test_list_paging_and_filters(self, manager, populated):
+        """Test paging and model/date filtering."""
+        all_sessions = manager.list_sessions()
+        assert len(all_sessions) == 5
+        assert all_sessions[0]["id"] == populated[-1].id
+        assert all_sessions[0]["last_message"] == "Message 4..."
+
+        page = manager.list_sessions(limit=2, offset=2)
+        assert [s["id"] for s in page] == [s["id"] for s in all_sessions[2:4]]
+
+        assert manager.count_sessions(model="claude") == 2
+        assert {s["model"] for s in manager.list_sessions(model="claude")} == {"claude"}
+
+        since = all_sessions[1]["updated_at"]
+        assert len(manager.list_sessions(since=since)) == 2
+
+    def test_listing_does_not_read_session_files(self, manager, populated):
+        """Test that an up-to-date index answers listing on its own."""
+        with patch.object(manager, "_summarize_file", side_effect=AssertionError("file was read")):
+            assert len(manager.list_sessions()) == 5
+            assert manager.load_last_session().id == populated[-1].id
+
+    def test_saving_indexes_without_serializing_messages(self, manager, populated):
+        """Test that a save updates the index from the header and last message in one transaction."""
+        session = populated[0]
+        with patch.object(type(session), "to_dict", side_effect=AssertionError("session was serialized")), patch.object(
+            manager.index, "set_meta", side_effect=AssertionError("meta written separately")
+        ):
+            manager.add_message(session, "assistant", "Latest reply")
+
+        summary = next(s for s in manager.list_sessions() if s["id"] == session.id)
+        assert summary["message_count"] == 2
+        assert summary["last_message"] == "Latest reply..."
+        assert manager.index.get_meta("dir_mtime_ns") == str(manager.sessions_dir.stat().st_mtime_ns)
+
+    def test_index_repairs_drift(self, manager, populated):
+        """Test that files added or removed behind the index are picked up."""
+        os.remove(manager.sessions_dir / f"{populated[0].id}.jsonl")
+        legacy = {
+            "id": "external",
+            "created_at": "2030-01-01T00:00:00",
+            "updated_at": "2030-01-01T00:00:00",
+            "messages": [],
+            "model": "local",
+        }
+        (manager.sessions_dir / "external.json").write_text(json.dumps(legacy))
+
+        fresh_manager = ChatSessionManager(sessions_dir=manager.sessions_dir)
+        ids = [s["id"] for s in fresh_manager.list_sessions()]
+
+        assert populated[0].id not in ids
+        assert ids[0] == "external"
+        assert fresh_manager.load_last_session().id == "external"
+
+    def test_rebuild_index(self, manager, populated):
+        """Test rebuilding the index from scratch."""
+        manager.index.clear()
+
+        assert manager.rebuild_index() == 5
+        assert manager.count_sessions() == 5
+
+    def test_falls_back_to_scanning_without_index(self, manager, populated):
+        """Test listing when the index cannot be opened."""
+        manager._index = None
+        manager._index_unavailable = True
+
+        assert [s["id"] for s in manager.list_sessions(limit=2)] == [s.id for s in populated[::-1][:2]]
+        assert manager.count_sessions(model="gpt-4") == 3
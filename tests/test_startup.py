@@ -0,0 +1,81 @@
+"""Tests for lazy imports and startup profiling."""
+
+import subprocess
+import sys
+
+import ttt
+from ttt.plugins.loader import PluginRegistry
+from ttt.utils.startup import parse_importtime
+
+
+def imported_modules(code):
+    """Run code in a fresh interpreter and return the ttt/litellm modules it imported."""
+    script = f"{code}\nimport sys\nprint(' '.join(m for m in sys.modules if m.startswith(('ttt', 'litellm'))))"
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    return set(result.stdout.split())
+
+
+class TestLazyImports:
+    """Test that heavy modules are only imported on first use."""
+
+    def test_import_ttt_is_lazy(self):
+        """Test that the package import does not load the API, backends or tools."""
+        modules = imported_modules("import ttt")
+
+        assert "ttt.core.api" not in modules
+        assert "ttt.backends.cloud" not in modules
+        assert "ttt.tools.builtins" not in modules
+        assert "litellm" not in modules
+
+    def test_public_names_resolve(self):
+        """Test that every exported name is reachable and listed by dir()."""
+        for name in ttt.__all__:
+            assert getattr(ttt, name) is not None
+        assert set(ttt.__all__) <= set(dir(ttt))
+        assert ttt.ask is ttt.core.api.ask
+
+    def test_cloud_backend_imports_litellm_on_first_call(self):
+        """Test that creating a cloud backend does not import LiteLLM."""
+        modules = imported_modules("from ttt.backends import CloudBackend\nbackend = CloudBackend()")
+        assert "litellm" not in modules
+
+        modules = imported_modules("from ttt.backends import CloudBackend\nCloudBackend().litellm")
+        assert "litellm" in modules
+
+    def test_builtin_tools_register_on_lookup(self):
+        """Test that built-in tools are available without importing them explicitly."""
+        modules = imported_modules("from ttt.tools import get_tool\nassert get_tool('calculate') is not None")
+        assert "ttt.tools.builtins" in modules
+
+    def test_plugin_discovery_is_deferred(self, tmp_path):
+        """Test that plugins are discovered on the first lookup."""
+        (tmp_path / "echo_plugin.py").write_text(
+            "from ttt.backends.base import BaseBackend\n"
+            "class EchoBackend(BaseBackend):\n"
+            "    pass\n"
+            "def register_plugin(registry):\n"
+            "    registry.register_backend('echo', EchoBackend)\n"
+        )
+        registry = PluginRegistry()
+        registry._plugin_paths = [tmp_path]
+
+        assert registry.plugins == {}
+        assert registry.get_backend_class("echo").__name__ == "EchoBackend"
+
+
+class TestStartupProfile:
+    """Test parsing of -X importtime output."""
+
+    def test_parse_importtime(self):
+        output = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |   yaml.reader\n"
+            "import time:      2000 |       2120 | yaml\n"
+            "unrelated line\n"
+        )
+
+        timings = parse_importtime(output)
+
+        assert [t.module for t in timings] == ["yaml.reader", "yaml"]
+        assert timings[0].depth == 1 and timings[1].depth == 0
+        assert timings[1].cumulative_ms == 2.12
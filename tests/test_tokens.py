@@ -0,0 +1,127 @@
+"""Tests for the token counting service."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from ttt import ImageInput
+from ttt.core.tokens import FAMILIES, TokenCounter, model_family
+
+
+@pytest.fixture
+def counter():
+    """Provide a counter using the estimate so tests do not need tokenizer files."""
+    return TokenCounter(use_tokenizer=False, cache_size=4)
+
+
+class FakeEncoding:
+    """Encoding that produces one token per word."""
+
+    def __init__(self):
+        self.batches = []
+
+    def encode_ordinary(self, text):
+        self.batches.append([text])
+        return text.split()
+
+    def encode_ordinary_batch(self, texts):
+        self.batches.append(list(texts))
+        return [text.split() for text in texts]
+
+
+class TestModelFamily:
+    """Test mapping model names to tokenizer families."""
+
+    @pytest.mark.parametrize(
+        "model,family",
+        [
+            ("gpt-4", "openai"),
+            ("openrouter/openai/gpt-3.5-turbo", "openai"),
+            ("gpt-4o-mini", "openai-o200k"),
+            ("o1-preview", "openai-o200k"),
+            ("openrouter/anthropic/claude-3-sonnet-20240229", "anthropic"),
+            ("gemini-pro", "google"),
+            ("mixtral-8x7b", "mistral"),
+            ("llama2", "llama"),
+            ("something-else", "generic"),
+            (None, "generic"),
+        ],
+    )
+    def test_families(self, model, family):
+        assert model_family(model) == family
+
+
+class TestTokenCounter:
+    """Test counting, memoization and batching."""
+
+    def test_estimate_is_calibrated_per_family(self, counter):
+        """Test the character-based fallback."""
+        text = "This is a longer sentence with more words"
+
+        assert counter.count("", "gpt-4") == 0
+        assert counter.count(text, "gpt-4") == 11
+        assert counter.count(text, "claude-3-opus") == 12
+        assert counter.count("こんにちは", "gpt-4") == 5
+
+    def test_images_use_family_cost(self, counter):
+        """Test multi-modal content."""
+        content = ["What's in this image?", ImageInput("test.jpg")]
+
+        assert counter.count(content, "gpt-4") == counter.count(content[0], "gpt-4") + 765
+        assert counter.count(content, "gemini-pro") == counter.count(content[0], "gemini-pro") + 258
+        assert counter.count([]) == 0
+
+    def test_counts_are_memoized_by_content(self, counter):
+        """Test that repeated content is not re-counted and the cache is bounded."""
+        counter.count("hello there", "gpt-4")
+        counter.count("hello there", "gpt-4")
+        assert (counter.hits, counter.misses) == (1, 1)
+        assert all("hello there" not in key for key in counter._cache)
+
+        for number in range(10):
+            counter.count(f"text {number}", "gpt-4")
+        assert counter.stats()["entries"] == 4
+
+    def test_message_batch_includes_overhead(self, counter):
+        """Test counting a whole history at once."""
+        messages = [
+            {"role": "system", "content": "Be brief"},
+            {"role": "user", "content": ["Look", ImageInput("a.png")]},
+            {"role": "assistant", "content": None},
+        ]
+        overhead = FAMILIES["anthropic"].message_overhead
+
+        counts = counter.count_messages(messages, "claude-3-haiku")
+
+        assert counts == [
+            counter.count("Be brief", "claude-3-haiku") + overhead,
+            counter.count("Look", "claude-3-haiku") + 1600 + overhead,
+            overhead,
+        ]
+        assert counter.count_history(messages, "claude-3-haiku") == sum(counts)
+
+    def test_tokenizer_is_used_when_available(self):
+        """Test exact and proxy counting with a loaded encoding."""
+        encoding = FakeEncoding()
+        counter = TokenCounter(use_tokenizer=True)
+        with patch.object(counter, "_encoding", return_value=encoding):
+            counts = counter.count_messages(
+                [{"role": "user", "content": "one two three"}, {"role": "user", "content": "four five"}], "gpt-4"
+            )
+            assert counts == [3 + 3, 2 + 3]
+            assert encoding.batches == [["one two three", "four five"]]
+
+            # Families without their own tokenizer are scaled from the proxy encoding
+            assert counter.count("a " * 20, "claude-3-opus") == round(20 * FAMILIES["anthropic"].tokenizer_ratio)
+
+    def test_unavailable_tokenizer_falls_back_once(self):
+        """Test that a failing tokenizer load is remembered."""
+        fake_tiktoken = Mock()
+        fake_tiktoken.get_encoding.side_effect = OSError("offline")
+        counter = TokenCounter(use_tokenizer=True)
+
+        with patch.dict("sys.modules", {"tiktoken": fake_tiktoken}):
+            assert counter.count("abcdefgh", "gpt-4") == 2
+            assert counter.count("different text", "gpt-4") == 4
+
+        assert fake_tiktoken.get_encoding.call_count == 1
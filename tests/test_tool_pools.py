@@ -0,0 +1,172 @@
+"""Tests for running sync tools in thread and process pools."""
+
+import asyncio
+import os
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from ttt.tools import ExecutionMode, create_tool_definition
+from ttt.tools.executor import ExecutionConfig, ToolExecutor
+from ttt.tools.pools import ToolPools, _ProcessWorker
+
+
+# Process-mode tools must be importable by module and name from the worker
+def blocking_sleep(seconds: float) -> str:
+    """Sleep without yielding to the event loop."""
+    time.sleep(seconds)
+    return "slept"
+
+
+def worker_pid() -> int:
+    """Return the pid of the process running the tool."""
+    return os.getpid()
+
+
+def thread_id() -> int:
+    """Return the id of the thread running the tool."""
+    return threading.get_ident()
+
+
+def fail_with(message: str) -> str:
+    """Raise a ValueError."""
+    raise ValueError(message)
+
+
+@pytest.fixture
+def pools(monkeypatch):
+    """Give the test its own small pools."""
+    pools = ToolPools(thread_pool_size=2, process_pool_size=1)
+    monkeypatch.setattr("ttt.tools.pools._pools", pools)
+    yield pools
+    pools.shutdown()
+
+
+def make_executor(**config):
+    return ToolExecutor(ExecutionConfig(max_retries=1, enable_fallbacks=False, **config))
+
+
+class TestExecutionPolicy:
+    """Test where sync tools run."""
+
+    def test_tool_definition_carries_execution_mode(self):
+        """Test that the execution policy is parsed into ExecutionMode."""
+        assert create_tool_definition(blocking_sleep, execution="process").execution is ExecutionMode.PROCESS
+        assert create_tool_definition(blocking_sleep).execution is None
+        with pytest.raises(ValueError):
+            create_tool_definition(blocking_sleep, execution="gpu")
+
+    async def test_thread_tools_do_not_block_the_loop(self, pools):
+        """Test that a blocking thread-mode tool lets other coroutines run."""
+        executor = make_executor()
+        tool = create_tool_definition(blocking_sleep, execution="thread")
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticking = asyncio.create_task(ticker())
+        try:
+            call = await executor._execute_with_recovery(tool, {"seconds": 0.3}, "call_1")
+        finally:
+            ticking.cancel()
+
+        assert call.result == "slept"
+        assert ticks >= 10
+        assert pools.snapshot()["thread"]["completed"] == 1
+
+    async def test_inline_tools_run_on_the_loop_thread(self, pools):
+        """Test that inline tools are called directly."""
+        executor = make_executor()
+        tool = create_tool_definition(thread_id, execution="inline")
+
+        call = await executor._execute_with_recovery(tool, {}, "call_1")
+
+        assert call.result == threading.get_ident()
+        assert pools.snapshot()["inline"]["calls"] == 1
+
+    async def test_default_execution_from_config(self, pools):
+        """Test that tools without a policy use the configured default."""
+        executor = make_executor(default_execution="inline")
+        tool = create_tool_definition(thread_id)
+
+        call = await executor._execute_with_recovery(tool, {}, "call_1")
+
+        assert call.result == threading.get_ident()
+
+
+class TestProcessPool:
+    """Test process-mode tools."""
+
+    async def test_runs_in_a_reused_worker_process(self, pools):
+        """Test that process tools run outside this process, on a kept worker."""
+        first = await pools.run(ExecutionMode.PROCESS, worker_pid, {})
+        second = await pools.run(ExecutionMode.PROCESS, worker_pid, {})
+
+        assert first != os.getpid()
+        assert first == second
+
+    async def test_exceptions_are_raised_in_the_caller(self, pools):
+        """Test that the tool's exception comes back unchanged."""
+        with pytest.raises(ValueError, match="bad input"):
+            await pools.run(ExecutionMode.PROCESS, fail_with, {"message": "bad input"})
+
+        assert pools.snapshot()["process"]["failed"] == 1
+
+    async def test_timeout_kills_the_worker(self, pools):
+        """Test that a timed out process tool is killed and the next call gets a new worker."""
+        executor = make_executor()
+        tool = create_tool_definition(blocking_sleep, execution="process")
+        first_pid = await pools.run(ExecutionMode.PROCESS, worker_pid, {})
+
+        started = time.monotonic()
+        with patch("ttt.tools.executor.get_tool", return_value=tool):
+            call = await executor.execute_tool("blocking_sleep", {"seconds": 30}, timeout=1.0)
+
+        assert "timed out" in call.error
+        assert time.monotonic() - started < 5
+        stats = pools.snapshot()["process"]
+        assert stats["killed"] == 1
+        assert stats["cancelled"] == 1
+        assert stats["active"] == 0
+        assert await pools.run(ExecutionMode.PROCESS, worker_pid, {}) != first_pid
+
+    async def test_killed_worker_is_reaped_off_the_event_loop(self, pools):
+        """Test that cancelling a process tool does not join the worker on the event loop thread."""
+        closed_on = []
+        original_close = _ProcessWorker.close
+
+        def close(worker):
+            closed_on.append(threading.get_ident())
+            original_close(worker)
+
+        with patch.object(_ProcessWorker, "close", close):
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(pools.run(ExecutionMode.PROCESS, blocking_sleep, {"seconds": 30}), 1.0)
+            await pools.run(ExecutionMode.PROCESS, worker_pid, {})
+
+        assert closed_on
+        assert threading.get_ident() not in closed_on
+
+    async def test_local_functions_are_rejected(self, pools):
+        """Test that functions a worker cannot import fail clearly."""
+
+        def local_tool():
+            return "unreachable"
+
+        with pytest.raises(ValueError, match="module-level"):
+            await pools.run(ExecutionMode.PROCESS, local_tool, {})
+
+
+def test_execution_stats_report_each_pool(pools):
+    """Test that executor stats include per-pool counters."""
+    stats = make_executor().get_execution_stats()["pools"]
+
+    assert set(stats) == {"inline", "thread", "process"}
+    assert stats["thread"]["size"] == 2
+    assert stats["process"]["size"] == 1
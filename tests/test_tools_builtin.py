@@ -1,9 +1,9 @@
 """Tests for built-in tools."""
 
 import json
-import urllib.error
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
+import httpx
 import pytest
 
 from ttt.tools import get_tool, list_tools
@@ -17,29 +17,29 @@ from ttt.tools.builtins import (
     web_search,
     write_file,
 )
+from ttt.tools.sandbox import PythonWorkerPool, _python_executable
 
 
 class TestWebSearch:
     """Test web_search tool."""
 
     @pytest.mark.unit
-    @patch("urllib.request.urlopen")
-    def test_web_search_returns_formatted_answer_and_topics(self, mock_urlopen):
+    def test_web_search_returns_formatted_answer_and_topics(self, mock_http):
         """Test successful web search."""
-        # Mock response
-        mock_response = Mock()
-        mock_response.read.return_value = json.dumps(
-            {
-                "Answer": "Test answer",
-                "Abstract": "Test abstract",
-                "AbstractURL": "https://example.com",
-                "RelatedTopics": [
-                    {"Text": "Topic 1", "FirstURL": "https://example.com/1"},
-                    {"Text": "Topic 2", "FirstURL": "https://example.com/2"},
-                ],
-            }
-        ).encode("utf-8")
-        mock_urlopen.return_value.__enter__.return_value = mock_response
+        mock_http(
+            lambda request: httpx.Response(
+                200,
+                json={
+                    "Answer": "Test answer",
+                    "Abstract": "Test abstract",
+                    "AbstractURL": "https://example.com",
+                    "RelatedTopics": [
+                        {"Text": "Topic 1", "FirstURL": "https://example.com/1"},
+                        {"Text": "Topic 2", "FirstURL": "https://example.com/2"},
+                    ],
+                },
+            )
+        )
 
         result = web_search("test query")
 
@@ -56,21 +56,21 @@ class TestWebSearch:
         assert "Search query cannot be empty" in result
 
     @pytest.mark.unit
-    @patch("urllib.request.urlopen")
-    def test_web_search_no_results(self, mock_urlopen):
+    def test_web_search_no_results(self, mock_http):
         """Test web search with no results."""
-        mock_response = Mock()
-        mock_response.read.return_value = json.dumps({}).encode("utf-8")
-        mock_urlopen.return_value.__enter__.return_value = mock_response
+        mock_http(lambda request: httpx.Response(200, json={}))
 
         result = web_search("obscure query")
         assert "No results found" in result
 
     @pytest.mark.unit
-    @patch("urllib.request.urlopen")
-    def test_web_search_network_error(self, mock_urlopen):
+    def test_web_search_network_error(self, mock_http):
         """Test web search with network error."""
-        mock_urlopen.side_effect = urllib.error.URLError("Network error")
+
+        def fail(request):
+            raise httpx.ConnectError("Network error")
+
+        mock_http(fail)
 
         result = web_search("test query")
         assert "Network error" in result
@@ -115,6 +115,74 @@ class TestFileOperations:
         # File should either read successfully or report size limit
         assert "Error" not in result or "too large" in result.lower()
 
+    @pytest.mark.unit
+    def test_read_file_ranges(self, tmp_path):
+        """Test byte and line range reads."""
+        test_file = tmp_path / "lines.txt"
+        test_file.write_text("".join(f"line {i}\n" for i in range(1, 11)))
+
+        assert read_file(str(test_file), offset=7, length=6) == "line 2"
+        assert read_file(str(test_file), start_line=3, end_line=4) == "line 3\nline 4\n"
+        assert read_file(str(test_file), start_line=10) == "line 10\n"
+        assert read_file(str(test_file), mode="head", lines=2) == "line 1\nline 2\n"
+        assert read_file(str(test_file), mode="tail", lines=2) == "line 9\nline 10\n"
+
+    @pytest.mark.unit
+    def test_read_file_grep(self, tmp_path):
+        """Test that grep mode returns numbered matching lines."""
+        test_file = tmp_path / "app.log"
+        test_file.write_text("start\nERROR disk full\nok\nERROR timeout\n")
+
+        assert read_file(str(test_file), mode="grep", pattern=r"ERROR \w+") == "2: ERROR disk full\n4: ERROR timeout"
+        assert read_file(str(test_file), mode="grep", pattern="^ERROR") == "2: ERROR disk full\n4: ERROR timeout"
+        assert read_file(str(test_file), mode="grep", pattern="full$") == "2: ERROR disk full"
+        assert read_file(str(test_file), mode="grep", pattern="missing") == "No matching lines"
+        assert "Invalid pattern" in read_file(str(test_file), mode="grep", pattern="(")
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("mmap_threshold", [1 << 30, 1])
+    def test_read_file_chunks_with_continuation(self, tmp_path, monkeypatch, mmap_threshold):
+        """Test that long reads are chunked at line breaks and resumed with the token, mapped or not."""
+        from ttt.tools import file_reader
+
+        settings = {"tools.read_file.max_chunk_bytes": 100, "tools.read_file.mmap_threshold": mmap_threshold}
+        monkeypatch.setattr(file_reader, "get_config_value", lambda key, default=None: settings.get(key, default))
+        test_file = tmp_path / "big.log"
+        content = "".join(f"entry {i:04d}\n" for i in range(100))
+        test_file.write_text(content)
+
+        pieces = []
+        result = read_file(str(test_file))
+        while "continuation=" in result:
+            text, footer = result.split("\n\n[Showed bytes ")
+            assert len(text) <= 100 and text.endswith("\n")
+            pieces.append(text)
+            result = read_file(str(test_file), continuation=footer.split('continuation="')[1].split('"')[0])
+        pieces.append(result)
+
+        assert "".join(pieces) == content
+
+    @pytest.mark.unit
+    def test_read_file_grep_continuation(self, tmp_path):
+        """Test that grep pages through matches with the token and keeps line numbers."""
+        test_file = tmp_path / "app.log"
+        test_file.write_text("".join(f"{'ERROR' if i % 3 == 0 else 'ok'} {i}\n" for i in range(1, 11)))
+
+        first = read_file(str(test_file), mode="grep", pattern="ERROR", lines=2)
+        token = first.split('continuation="')[1].split('"')[0]
+        second = read_file(str(test_file), continuation=token)
+
+        assert first.startswith("3: ERROR 3\n6: ERROR 6\n\n[Stopped after 2 matches at line 7.")
+        assert second == "9: ERROR 9"
+
+    @pytest.mark.unit
+    def test_read_file_invalid_continuation(self, tmp_path):
+        """Test that a malformed token is reported."""
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("content")
+
+        assert "Invalid continuation token" in read_file(str(test_file), continuation="not-a-token")
+
     @pytest.mark.unit
     def test_write_file_creates_file_with_exact_content(self, tmp_path):
         """Test successful file writing."""
@@ -222,6 +290,79 @@ class TestCodeExecution:
         result = run_python("")
         assert "Code cannot be empty" in result
 
+    @pytest.mark.unit
+    def test_run_python_timeout_is_clamped_to_bounds(self):
+        """Test that the timeout is clamped to tools.timeout_bounds."""
+        with patch("ttt.tools.builtins.get_python_pool") as get_pool:
+            get_pool.return_value.run.return_value = (0, "ok\n", "")
+            run_python("print('ok')", timeout=999)
+
+        assert get_pool.return_value.run.call_args[0][1] == 30
+
+
+class TestPythonWorkerPool:
+    """Test the warm interpreter pool behind run_python."""
+
+    @pytest.fixture
+    def pool(self):
+        """Provide a pool with one spare worker."""
+        pool = PythonWorkerPool(size=1, memory_limit_mb=0)
+        yield pool
+        pool.shutdown()
+
+    @pytest.mark.unit
+    def test_runs_reuse_warm_workers(self, pool):
+        """Test that runs after the first start on an idle worker."""
+        for _ in range(3):
+            assert pool.run("print('hi')", 10) == (0, "hi\n", "")
+
+        snapshot = pool.snapshot()
+        assert snapshot["warm_starts"] == 2
+        assert snapshot["idle"] == 1
+
+    @pytest.mark.unit
+    def test_state_does_not_leak_between_runs(self, pool):
+        """Test that each run gets a fresh interpreter."""
+        pool.run("import builtins\nbuiltins.leaked = 1\nx = 1", 10)
+
+        returncode, stdout, _ = pool.run("import builtins\nprint(hasattr(builtins, 'leaked'), 'x' in globals())", 10)
+
+        assert returncode == 0
+        assert stdout == "False False\n"
+
+    @pytest.mark.unit
+    def test_traceback_shows_user_code(self, pool):
+        """Test that errors report the user's lines, not the worker's."""
+        returncode, _, stderr = pool.run("def f():\n    return 1 / 0\nf()", 10)
+
+        assert returncode == 1
+        assert 'File "<run_python>", line 2' in stderr
+        assert "return 1 / 0" in stderr
+        assert "ZeroDivisionError" in stderr
+
+    @pytest.mark.unit
+    def test_runs_in_requested_directory(self, pool, tmp_path):
+        """Test that the run uses the given working directory."""
+        _, stdout, _ = pool.run("import os\nprint(os.getcwd())", 10, cwd=str(tmp_path))
+
+        assert stdout.strip() == str(tmp_path)
+
+    @pytest.mark.unit
+    def test_timeout_kills_worker(self, pool):
+        """Test that a run past its timeout raises and counts as a timeout."""
+        with pytest.raises(TimeoutError, match="timed out"):
+            pool.run("import time\ntime.sleep(10)", 0.5)
+
+        assert pool.snapshot()["timeouts"] == 1
+
+    @pytest.mark.unit
+    def test_workers_run_interpreter_from_path(self):
+        """Test that workers use the configured interpreter as found on PATH, not ttt's own."""
+        with patch("ttt.tools.sandbox.get_config_value", return_value="python3"), patch(
+            "ttt.tools.sandbox.shutil.which", side_effect=lambda name: f"/opt/bin/{name}"
+        ):
+            assert _python_executable() == "/opt/bin/python3"
+
 
 class TestTimeOperations:
     """Test time-related tools."""
@@ -267,13 +408,9 @@ class TestHttpRequest:
     """Test HTTP request tool."""
 
     @pytest.mark.unit
-    @patch("urllib.request.urlopen")
-    def test_http_request_get(self, mock_urlopen):
+    def test_http_request_get(self, mock_http):
         """Test GET request."""
-        # Mock response
-        mock_response = Mock()
-        mock_response.read.return_value = b'{"status": "ok"}'
-        mock_urlopen.return_value.__enter__.return_value = mock_response
+        mock_http(lambda request: httpx.Response(200, content=b'{"status": "ok"}'))
 
         result = http_request("https://api.example.com/test")
 
@@ -281,24 +418,24 @@ class TestHttpRequest:
         assert '"status": "ok"' in result
 
     @pytest.mark.unit
-    @patch("urllib.request.urlopen")
-    def test_http_request_post_json(self, mock_urlopen):
+    def test_http_request_post_json(self, mock_http):
         """Test POST request with JSON data."""
-        mock_response = Mock()
-        mock_response.read.return_value = b'{"result": "created"}'
-        mock_urlopen.return_value.__enter__.return_value = mock_response
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, content=b'{"result": "created"}')
+
+        mock_http(handler)
 
         result = http_request("https://api.example.com/create", method="POST", data={"name": "test"})
 
         assert '"result": "created"' in result
 
         # Check request was made correctly
-        call_args = mock_urlopen.call_args[0][0]
-        assert call_args.method == "POST"
-        # Check Content-Type header (case-insensitive)
-        headers = call_args.headers
-        content_type = headers.get("Content-Type") or headers.get("Content-type")
-        assert content_type == "application/json"
+        assert requests[0].method == "POST"
+        assert requests[0].headers["Content-Type"] == "application/json"
+        assert json.loads(requests[0].content) == {"name": "test"}
 
     @pytest.mark.unit
     def test_http_request_invalid_url(self):
@@ -313,13 +450,26 @@ class TestHttpRequest:
         assert "Error: Only HTTP/HTTPS protocols are supported" in result
 
     @pytest.mark.unit
-    @patch("urllib.request.urlopen")
-    def test_http_request_http_error(self, mock_urlopen):
+    def test_http_request_http_error(self, mock_http):
         """Test HTTP error response."""
-        mock_urlopen.side_effect = urllib.error.HTTPError("https://api.example.com", 404, "Not Found", {}, None)
+        mock_http(lambda request: httpx.Response(404))
 
         result = http_request("https://api.example.com/missing")
-        assert "HTTP Error 404" in result
+        assert "HTTP Error 404: Not Found" in result
+
+    @pytest.mark.unit
+    def test_http_request_truncates_large_bodies(self, mock_http):
+        """Test that bodies past tools.http.max_response_bytes are cut off."""
+        mock_http(lambda request: httpx.Response(200, content=b"x" * 5000))
+
+        with patch(
+            "ttt.tools.http_pool.get_config_value",
+            side_effect=lambda key, default=None: 1000 if key == "tools.http.max_response_bytes" else default,
+        ):
+            result = http_request("https://api.example.com/large")
+
+        assert result.startswith("x" * 1000 + "\n")
+        assert "[Response truncated after 1000 bytes]" in result
 
 
 class TestCalculate:
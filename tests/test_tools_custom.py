@@ -315,8 +315,13 @@ class TestToolIntegration:
         mock_response.choices = [Mock(message=mock_message)]
         mock_response.usage = Mock(prompt_tokens=50, completion_tokens=30)
 
+        # The model answers once it has the tool results
+        final_message = Mock(content="It is sunny in NYC and 15 + 25 = 40.", tool_calls=None)
+        final_response = Mock(choices=[Mock(message=final_message, finish_reason="stop")])
+        final_response.usage = Mock(prompt_tokens=120, completion_tokens=15)
+
         with patch.object(backend, "litellm") as mock_litellm:
-            mock_litellm.acompletion = AsyncMock(return_value=mock_response)
+            mock_litellm.acompletion = AsyncMock(side_effect=[mock_response, final_response])
 
             response = await backend.ask(
                 "What's the weather in NYC and what's 15 + 25?",
@@ -324,8 +329,18 @@ class TestToolIntegration:
             )
 
             assert response.succeeded
+            assert str(response) == "It is sunny in NYC and 15 + 25 = 40."
             assert response.tools_called
             assert len(response.tool_calls) == 2
+            assert response.tokens_in == 170
+            assert response.tokens_out == 45
+            assert response.metadata["tool_steps"] == 1
+
+            # Results went back to the model as tool messages matching the call ids
+            followup = mock_litellm.acompletion.call_args_list[1].kwargs["messages"]
+            assert followup[-3]["role"] == "assistant"
+            assert [m["tool_call_id"] for m in followup[-2:]] == ["call_1", "call_2"]
+            assert followup[-1]["content"] == "40"
 
             # Check tool results
             weather_call = next(call for call in response.tool_calls if call.name == "get_weather")
@@ -343,6 +358,53 @@ class TestToolIntegration:
         except Exception:
             pass  # Tools might not be registered
 
+    @pytest.mark.asyncio
+    async def test_cloud_backend_tool_loop_budget(self):
+        """Test steps are reported and a final answer is forced once the step budget is used."""
+        backend = CloudBackend()
+
+        def echo_tool(text: str) -> str:
+            """Echo text."""
+            return f"echo: {text}"
+
+        from ttt.tools.registry import register_tool, unregister_tool
+
+        register_tool(echo_tool, "echo_tool", "Echo text", "test")
+
+        def tool_call_response(call_id):
+            call = Mock(id=call_id, type="function")
+            call.function = Mock(arguments='{"text": "hi"}')
+            call.function.name = "echo_tool"
+            message = Mock(content="", tool_calls=[call])
+            response = Mock(choices=[Mock(message=message, finish_reason="tool_calls")])
+            response.usage = Mock(prompt_tokens=10, completion_tokens=5)
+            return response
+
+        final_response = Mock(choices=[Mock(message=Mock(content="Done", tool_calls=None), finish_reason="stop")])
+        final_response.usage = Mock(prompt_tokens=30, completion_tokens=2)
+        steps = []
+
+        async def on_step(step):
+            steps.append(step)
+
+        try:
+            with patch.object(backend, "litellm") as mock_litellm:
+                mock_litellm.acompletion = AsyncMock(
+                    side_effect=[tool_call_response("a"), tool_call_response("b"), final_response]
+                )
+
+                response = await backend.ask("Echo forever", tools=[echo_tool], max_tool_steps=1, on_tool_step=on_step)
+
+                assert str(response) == "Done"
+                assert [step.index for step in steps] == [1]
+                assert steps[0].calls[0].result == "echo: hi"
+                assert response.metadata["tool_steps"] == 1
+                assert response.metadata["tool_budget_exhausted"] is True
+                assert mock_litellm.acompletion.call_args_list[2].kwargs["tool_choice"] == "none"
+                assert "on_tool_step" not in mock_litellm.acompletion.call_args_list[0].kwargs
+        finally:
+            unregister_tool("echo_tool")
+
     def test_api_function_with_tools(self):
         """Test the main ask() function with tools."""
 